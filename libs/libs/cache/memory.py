@@ -1,4 +1,4 @@
-from typing import Optional, Any, Dict, Type, Union, TypeVar
+from typing import Optional, Any, Dict, Iterable, Mapping, Type, Union, TypeVar
 from datetime import datetime, timedelta
 from .ports import CachePort
 
@@ -36,6 +36,19 @@ class InMemoryCacheAdapter(CachePort):
             self._expiry[key] = datetime.now() + timedelta(seconds=seconds)
         return True
 
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        values = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    async def set_many(self, values: Mapping[str, Any], ttl: Optional[Union[int, timedelta]] = None) -> bool:
+        for key, value in values.items():
+            await self.set(key, value, ttl=ttl)
+        return True
+
     async def delete(self, key: str) -> bool:
         if key in self._storage:
             del self._storage[key]
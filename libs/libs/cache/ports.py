@@ -1,4 +1,4 @@
-from typing import Protocol, Optional, Any, TypeVar, Union, Type
+from typing import Protocol, Optional, Any, Dict, Iterable, Mapping, TypeVar, Union, Type
 from datetime import timedelta
 
 T = TypeVar("T")
@@ -20,6 +20,18 @@ class CachePort(Protocol):
     ) -> bool:
         ...
 
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Значения нескольких ключей за один запрос; отсутствующие ключи в результат не попадают."""
+        ...
+
+    async def set_many(
+        self,
+        values: Mapping[str, Any],
+        ttl: Optional[Union[int, timedelta]] = None
+    ) -> bool:
+        """Запись нескольких ключей с общим TTL за один запрос."""
+        ...
+
     async def delete(self, key: str) -> bool:
         ...
 
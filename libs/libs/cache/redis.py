@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Optional, Any, Union, Type, TypeVar
+from typing import Optional, Any, Dict, Iterable, Mapping, Union, Type, TypeVar
 from datetime import timedelta
 
 import redis.asyncio as redis
@@ -38,10 +38,7 @@ class RedisCacheAdapter(CachePort):
             if value is None:
                 return None
 
-            try:
-                data = json.loads(value)
-            except json.JSONDecodeError:
-                return value
+            data = self._deserialize(value)
 
             if model and hasattr(model, "model_validate"):
                 return model.model_validate(data)
@@ -57,22 +54,60 @@ class RedisCacheAdapter(CachePort):
         expiry = ttl if ttl is not None else self._default_ttl
 
         try:
-            if hasattr(value, "model_dump"):
-                serialized_value = json.dumps(value.model_dump(), default=str)
-            elif hasattr(value, "dict"):
-                serialized_value = json.dumps(value.dict(), default=str)
-            elif isinstance(value, (dict, list)):
-                serialized_value = json.dumps(value, default=str)
-            else:
-                serialized_value = str(value)
-
-            await self._redis.set(full_key, serialized_value, ex=expiry)
+            await self._redis.set(full_key, self._serialize(value), ex=expiry)
             return True
 
         except Exception as e:
             logger.error(f"Redis SET error for key {full_key}: {e}", exc_info=True)
             return False
 
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        try:
+            values = await self._redis.mget([self._make_key(key) for key in keys])
+        except Exception as e:
+            logger.error(f"Redis MGET error for {len(keys)} keys: {e}", exc_info=True)
+            return {}
+
+        return {key: self._deserialize(value) for key, value in zip(keys, values) if value is not None}
+
+    async def set_many(self, values: Mapping[str, Any], ttl: Optional[Union[int, timedelta]] = None) -> bool:
+        if not values:
+            return True
+
+        expiry = ttl if ttl is not None else self._default_ttl
+        try:
+            # MSET не принимает TTL, поэтому SET EX уходят одним пайплайном без MULTI
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(self._make_key(key), self._serialize(value), ex=expiry)
+                await pipe.execute()
+            return True
+
+        except Exception as e:
+            logger.error(f"Redis pipelined SET error for {len(values)} keys: {e}", exc_info=True)
+            return False
+
+    @staticmethod
+    def _serialize(value: Any) -> str:
+        if hasattr(value, "model_dump"):
+            return json.dumps(value.model_dump(), default=str)
+        if hasattr(value, "dict"):
+            return json.dumps(value.dict(), default=str)
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, default=str)
+        return str(value)
+
+    @staticmethod
+    def _deserialize(value: str) -> Any:
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+
     async def delete(self, key: str) -> bool:
         full_key = self._make_key(key)
         try:
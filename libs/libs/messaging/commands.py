@@ -39,14 +39,24 @@ class ReleaseInventoryCommand(Command):
 @dataclass
 class AssignCourierCommand(Command):
     @staticmethod
-    def create(shipment_id: uuid.UUID, delivery_id: uuid.UUID, saga_id: uuid.UUID) -> "AssignCourierCommand":
+    def create(
+            shipment_id: uuid.UUID,
+            delivery_id: uuid.UUID,
+            saga_id: uuid.UUID,
+            pickup_latitude: Optional[float] = None,
+            pickup_longitude: Optional[float] = None,
+    ) -> "AssignCourierCommand":
+        payload = {
+            "delivery_id": str(delivery_id),
+            "shipment_id": str(shipment_id),
+        }
+        if pickup_latitude is not None and pickup_longitude is not None:
+            payload["pickup_latitude"] = pickup_latitude
+            payload["pickup_longitude"] = pickup_longitude
         return AssignCourierCommand(
             command_type="courier.assign",
             aggregate_id=delivery_id,
-            payload={
-                "delivery_id": str(delivery_id),
-                "shipment_id": str(shipment_id),
-            },
+            payload=payload,
             correlation_id=saga_id,
         )
 
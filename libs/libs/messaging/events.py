@@ -8,9 +8,14 @@ from .base import Event
 @dataclass
 class ShipmentCreated:
     shipment_id: uuid.UUID
-    origin: str
-    destination: str
+    origin: Dict
+    destination: Dict
     items: List[Dict]
+    departure_date: Optional[str] = None
+    status: Optional[str] = None
+    total_quantity: int = 0
+    total_weight: float = 0.0
+    created_at: Optional[datetime] = None
 
 
 @dataclass
@@ -42,6 +47,14 @@ class InventoryReserved:
     reserved_at: datetime
 
 
+@dataclass
+class InventoryReceived:
+    warehouse_id: uuid.UUID
+    shipment_id: uuid.UUID
+    records: List[Dict]
+    received_at: datetime
+
+
 @dataclass
 class InventoryReleased:
     warehouse_id: uuid.UUID
@@ -66,6 +79,25 @@ class InventoryUpdated:
     updated_at: datetime
 
 
+@dataclass
+class WarehouseCreated:
+    warehouse_id: uuid.UUID
+    name: str
+    created_at: datetime
+
+
+@dataclass
+class WarehouseUpdated:
+    warehouse_id: uuid.UUID
+    updated_at: datetime
+
+
+@dataclass
+class WarehouseDeleted:
+    warehouse_id: uuid.UUID
+    deleted_at: datetime
+
+
 @dataclass
 class CourierAssigned:
     delivery_id: uuid.UUID
@@ -174,10 +206,15 @@ class DomainEventConverter:
         ShipmentDispatched: ("shipment.dispatched", "shipment", "shipment_id"),
 
         InventoryReserved: ("inventory.reserved", "warehouse", "warehouse_id"),
+        InventoryReceived: ("inventory.received", "warehouse", "warehouse_id"),
         InventoryReleased: ("inventory.released", "warehouse", "warehouse_id"),
         InventoryInsufficient: ("inventory.insufficient", "warehouse", "warehouse_id"),
         InventoryUpdated: ("inventory.updated", "warehouse", "warehouse_id"),
 
+        WarehouseCreated: ("warehouse.created", "warehouse", "warehouse_id"),
+        WarehouseUpdated: ("warehouse.updated", "warehouse", "warehouse_id"),
+        WarehouseDeleted: ("warehouse.deleted", "warehouse", "warehouse_id"),
+
         CourierAssigned: ("courier.assigned", "delivery", "delivery_id"),
         CourierUnassigned: ("courier.unassigned", "delivery", "delivery_id"),
         DeliveryStarted: ("delivery.started", "delivery", "delivery_id"),
@@ -1,16 +1,19 @@
 import json
 import asyncio
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Iterable, Optional
 
 from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
 from aiokafka.errors import KafkaError
 
 from libs.observability.logger import get_json_logger
+from libs.observability.metrics import EVENTS_CONSUMED_TOTAL
 from .base import Event, Command
 from .ports import EventQueuePort
 
 logger = get_json_logger(__name__)
 
+EVENT_TYPE_HEADER = "event_type"
+
 
 class KafkaEventQueueAdapter(EventQueuePort):
 
@@ -48,12 +51,18 @@ class KafkaEventQueueAdapter(EventQueuePort):
             )
         return self._producer
 
-    async def _send_with_retry(self, topic: str, value: dict, key: str) -> None:
+    async def _send_with_retry(
+            self,
+            topic: str,
+            value: dict,
+            key: str,
+            headers: Optional[list[tuple[str, bytes]]] = None
+    ) -> None:
         producer = await self._get_producer()
 
         for attempt in range(1, self._max_retries + 1):
             try:
-                await producer.send_and_wait(topic, value=value, key=key)
+                await producer.send_and_wait(topic, value=value, key=key, headers=headers)
                 return
             except KafkaError as e:
                 if attempt == self._max_retries:
@@ -83,9 +92,10 @@ class KafkaEventQueueAdapter(EventQueuePort):
     async def publish_event(self, event: Event, *topics: str) -> None:
         key = str(event.aggregate_id)
         value = event.to_dict()
+        headers = [(EVENT_TYPE_HEADER, event.event_type.encode('utf-8'))]
 
         for topic in topics:
-            await self._send_with_retry(topic, value=value, key=key)
+            await self._send_with_retry(topic, value=value, key=key, headers=headers)
             logger.debug(
                 f"Event published: {event.event_type}",
                 extra={"topic": topic, "event_id": str(event.event_id)}
@@ -108,15 +118,33 @@ class KafkaEventQueueAdapter(EventQueuePort):
                 extra={"topic": topic, "command_id": str(command.command_id)}
             )
 
-    async def consume_event(self, *topics: str) -> AsyncIterator[Event]:
+    async def consume_event(
+            self,
+            *topics: str,
+            event_types: Optional[Iterable[str]] = None,
+            group_id: Optional[str] = None,
+            auto_offset_reset: str = "earliest"
+    ) -> AsyncIterator[Event]:
+        """
+        event_types: если задан, сообщения других типов отбрасываются по заголовку event_type
+        до декодирования JSON. Сообщения без заголовка (старые продюсеры) декодируются,
+        но Event для них строится только при совпадении типа.
+        group_id: своя группа вместо группы сервиса, например отдельная для каждой реплики,
+        чтобы каждая реплика получала все события (локальные кэши).
+        """
+        accepted_headers = (
+            frozenset(t.encode('utf-8') for t in event_types) if event_types is not None else None
+        )
+        accepted_types = frozenset(event_types) if event_types is not None else None
+
         consumer = AIOKafkaConsumer(
             *topics,
             bootstrap_servers=self._bootstrap_servers,
-            group_id=self._group_id,
+            group_id=group_id or self._group_id,
 
             key_deserializer=lambda k: k.decode('utf-8') if k else None,
 
-            auto_offset_reset='earliest',
+            auto_offset_reset=auto_offset_reset,
             enable_auto_commit=True,
             isolation_level="read_committed",
             session_timeout_ms=10000,
@@ -128,9 +156,20 @@ class KafkaEventQueueAdapter(EventQueuePort):
 
         try:
             async for message in consumer:
+                if accepted_headers is not None:
+                    header_type = self._get_header(message.headers, EVENT_TYPE_HEADER)
+                    if header_type is not None and header_type not in accepted_headers:
+                        EVENTS_CONSUMED_TOTAL.labels(topic=message.topic, outcome="discarded").inc()
+                        continue
+
                 try:
                     val = json.loads(message.value.decode('utf-8'))
+                    if accepted_types is not None and val.get('event_type') not in accepted_types:
+                        EVENTS_CONSUMED_TOTAL.labels(topic=message.topic, outcome="discarded").inc()
+                        continue
+
                     event = Event.from_dict(val)
+                    EVENTS_CONSUMED_TOTAL.labels(topic=message.topic, outcome="processed").inc()
                     yield event
                 except json.JSONDecodeError:
                     logger.error(
@@ -155,6 +194,13 @@ class KafkaEventQueueAdapter(EventQueuePort):
         finally:
             await consumer.stop()
 
+    @staticmethod
+    def _get_header(headers, name: str) -> Optional[bytes]:
+        for header_name, header_value in headers or ():
+            if header_name == name:
+                return header_value
+        return None
+
     async def consume_command(self, *topics: str) -> AsyncIterator[Command]:
         consumer = AIOKafkaConsumer(
             *topics,
@@ -1,4 +1,4 @@
-from typing import List, AsyncIterator, Dict, Any
+from typing import List, AsyncIterator, Dict, Any, Iterable, Optional
 import asyncio
 from collections import defaultdict
 from datetime import datetime
@@ -64,14 +64,24 @@ class InMemoryEventQueueAdapter(EventQueuePort):
             InMemoryEventQueueAdapter._commands_storage[topic].append(message)
             print(f"[MOCK] Published command to '{topic}': {command.command_type} (id={command.command_id})")
 
-    async def consume_event(self, *topics: str) -> AsyncIterator[Event]:
+    async def consume_event(
+            self,
+            *topics: str,
+            event_types: Optional[Iterable[str]] = None,
+            group_id: Optional[str] = None,
+            auto_offset_reset: str = "earliest"
+    ) -> AsyncIterator[Event]:
+        accepted_types = frozenset(event_types) if event_types is not None else None
         topics_str = ", ".join(topics)
         print(f"[MOCK] Consumer started for events topics: [{topics_str}]")
 
         consumer_key = f"event_consumer_{hash(topics)}"
         InMemoryEventQueueAdapter._consumers_running[consumer_key] = True
 
-        offsets = {topic: 0 for topic in topics}
+        if auto_offset_reset == "latest":
+            offsets = {topic: len(InMemoryEventQueueAdapter._events_storage.get(topic, [])) for topic in topics}
+        else:
+            offsets = {topic: 0 for topic in topics}
 
         try:
             while InMemoryEventQueueAdapter._consumers_running.get(consumer_key, False):
@@ -84,8 +94,10 @@ class InMemoryEventQueueAdapter(EventQueuePort):
                     if current_offset < len(messages):
                         for i in range(current_offset, len(messages)):
                             message = messages[i]
-                            event = Event.from_dict(message['value'])
                             offsets[topic] += 1
+                            if accepted_types is not None and message['value']['event_type'] not in accepted_types:
+                                continue
+                            event = Event.from_dict(message['value'])
                             print(f"[MOCK] Consumed event from '{topic}': {event.event_type}")
                             yield event
                             received_anything = True
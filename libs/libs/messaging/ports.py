@@ -1,4 +1,4 @@
-from typing import Protocol, AsyncIterator
+from typing import Protocol, AsyncIterator, Iterable, Optional
 
 from libs.messaging.base import Event, Command
 
@@ -11,7 +11,13 @@ class EventQueuePort(Protocol):
     async def publish_command(self, command: Command, *topics: str) -> None:
         ...
 
-    def consume_event(self, *topics: str) -> AsyncIterator[Event]:
+    def consume_event(
+            self,
+            *topics: str,
+            event_types: Optional[Iterable[str]] = None,
+            group_id: Optional[str] = None,
+            auto_offset_reset: str = "earliest"
+    ) -> AsyncIterator[Event]:
         ...
 
     def consume_command(self, *topics: str) -> AsyncIterator[Command]:
@@ -16,6 +16,17 @@ HTTP_REQUEST_DURATION_SECONDS = Histogram(
     ["service", "method", "path"],
     buckets=(0.01, 0.05, 0.1, 0.3, 0.5, 1, 2, 5),
 )
+EVENTS_CONSUMED_TOTAL = Counter(
+    "events_consumed_total",
+    "Consumed events by topic: processed or discarded by the event type filter",
+    ["topic", "outcome"],
+)
+
+WAREHOUSE_INVENTORY_RECORDS = Gauge(
+    "warehouse_inventory_records",
+    "Inventory records per warehouse and status",
+    ["warehouse_id", "status"],
+)
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: ASGIApp, service_name: str):
@@ -0,0 +1,35 @@
+from contextlib import asynccontextmanager
+from typing import Any, List, Tuple
+
+
+class RecordingConnection:
+    """
+    Заменитель asyncpg.Connection для тестов репозиториев: считает обращения к базе
+    (round-trip'ы) и запоминает запросы. Результаты запросов задают наследники.
+    """
+
+    def __init__(self):
+        self.round_trips = 0
+        self.queries: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def record(self, query: str, args: Tuple[Any, ...] = ()) -> None:
+        self.round_trips += 1
+        self.queries.append((query, args))
+
+    async def execute(self, query, *args):
+        self.record(query, args)
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+class FakePool:
+    """Пул из одного соединения с интерфейсом acquire() как у asyncpg.Pool."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
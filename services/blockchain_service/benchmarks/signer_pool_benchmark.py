@@ -0,0 +1,44 @@
+"""
+Замер пропускной способности отправки транзакций: пул из одного кошелька против пула из N.
+RPC заменен подписантом с фиксированной задержкой; отправки одного аккаунта сериализуются,
+как выдача nonce и подпись одним кошельком, поэтому цифры показывают предел очереди nonce.
+Запуск из каталога сервиса: python -m benchmarks.signer_pool_benchmark [transactions] [signers] [rpc_ms]
+"""
+import asyncio
+import sys
+import time
+
+from src.domain.ports.blockhain_gateway import SentTransaction
+from src.infra.mock_blockhain_gateway import MockBlockchainGateway
+from src.infra.signer_pool_gateway import SignerPoolGateway
+
+
+class LatencySigner(MockBlockchainGateway):
+
+    def __init__(self, address: str, rpc_seconds: float):
+        super().__init__(address=address)
+        self._lock = asyncio.Lock()
+        self._rpc_seconds = rpc_seconds
+
+    async def send_transaction(self, payload) -> SentTransaction:
+        async with self._lock:
+            await asyncio.sleep(self._rpc_seconds)
+            return await super().send_transaction(payload)
+
+
+async def main(transactions: int, signers: int, rpc_ms: float) -> None:
+    for size in sorted({1, signers}):
+        pool = SignerPoolGateway([LatencySigner(f"0x{i:040x}", rpc_ms / 1000) for i in range(1, size + 1)])
+        started = time.perf_counter()
+        sent = await asyncio.gather(*(pool.send_transaction({"i": i}) for i in range(transactions)))
+        elapsed = time.perf_counter() - started
+        print(f"{size:>3} signer(s): {transactions} tx in {elapsed * 1000:.1f} ms, "
+              f"{transactions / elapsed:,.0f} tx/s, {len({tx.sender for tx in sent})} sender(s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+        float(sys.argv[3]) if len(sys.argv) > 3 else 5.0,
+    ))
@@ -0,0 +1,43 @@
+
+from yoyo import step
+
+__depends__ = {'004_add_blockchain_statistics'}
+
+steps = [
+    step(
+        """
+        ALTER TABLE blockchain_records
+            ADD COLUMN IF NOT EXISTS nonce BIGINT,
+            ADD COLUMN IF NOT EXISTS submitted_at TIMESTAMPTZ,
+            ADD COLUMN IF NOT EXISTS replacement_count INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS replaced_tx_hashes TEXT[] NOT NULL DEFAULT '{}';
+
+        UPDATE blockchain_records SET submitted_at = created_at WHERE submitted_at IS NULL;
+
+        ALTER TABLE blockchain_records
+            ALTER COLUMN submitted_at SET NOT NULL,
+            ALTER COLUMN submitted_at SET DEFAULT NOW();
+
+        -- Частичный индекс: ConfirmationMonitor сканирует только PENDING,
+        -- поэтому хвост CONFIRMED/FAILED/DROPPED записей не влияет на стоимость выборки
+        CREATE INDEX IF NOT EXISTS idx_blockchain_records_pending_submitted
+            ON blockchain_records(submitted_at)
+            WHERE status = 'PENDING';
+
+        COMMENT ON COLUMN blockchain_records.nonce IS 'Nonce отправителя; замена (replace-by-fee) использует тот же nonce';
+        COMMENT ON COLUMN blockchain_records.submitted_at IS 'Время последней (пере)отправки транзакции';
+        COMMENT ON COLUMN blockchain_records.replacement_count IS 'Сколько раз транзакция переотправлялась с повышенным газом';
+        COMMENT ON COLUMN blockchain_records.replaced_tx_hashes IS 'Хеши замененных транзакций с тем же nonce';
+        """,
+
+        """
+        DROP INDEX IF EXISTS idx_blockchain_records_pending_submitted;
+
+        ALTER TABLE blockchain_records
+            DROP COLUMN IF EXISTS replaced_tx_hashes,
+            DROP COLUMN IF EXISTS replacement_count,
+            DROP COLUMN IF EXISTS submitted_at,
+            DROP COLUMN IF EXISTS nonce;
+        """
+    )
+]
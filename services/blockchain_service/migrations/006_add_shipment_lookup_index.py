@@ -0,0 +1,22 @@
+
+from yoyo import step
+
+__depends__ = {'005_add_transaction_replacement'}
+
+steps = [
+    step(
+        """
+        -- Выборка записей отгрузки сортируется по created_at: составной индекс
+        -- обслуживает и фильтр, и сортировку, поэтому одиночный индекс больше не нужен
+        CREATE INDEX IF NOT EXISTS idx_blockchain_records_shipment_created
+            ON blockchain_records(shipment_id, created_at);
+
+        DROP INDEX IF EXISTS idx_blockchain_records_shipment_id;
+        """,
+
+        """
+        CREATE INDEX IF NOT EXISTS idx_blockchain_records_shipment_id ON blockchain_records(shipment_id);
+        DROP INDEX IF EXISTS idx_blockchain_records_shipment_created;
+        """
+    )
+]
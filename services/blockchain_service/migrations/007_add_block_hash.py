@@ -0,0 +1,28 @@
+
+from yoyo import step
+
+__depends__ = {'006_add_shipment_lookup_index'}
+
+steps = [
+    step(
+        """
+        ALTER TABLE blockchain_records
+            ADD COLUMN IF NOT EXISTS block_hash VARCHAR(66);
+
+        -- Откат подтверждений при реорганизации цепочки идет по диапазону блоков,
+        -- частичный индекс покрывает только подтвержденные записи
+        CREATE INDEX IF NOT EXISTS idx_blockchain_records_confirmed_block
+            ON blockchain_records(block_number)
+            WHERE status = 'CONFIRMED';
+
+        COMMENT ON COLUMN blockchain_records.block_hash IS 'Хеш блока, в котором транзакция была подтверждена';
+        """,
+
+        """
+        DROP INDEX IF EXISTS idx_blockchain_records_confirmed_block;
+
+        ALTER TABLE blockchain_records
+            DROP COLUMN IF EXISTS block_hash;
+        """
+    )
+]
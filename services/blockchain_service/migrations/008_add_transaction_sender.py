@@ -0,0 +1,20 @@
+
+from yoyo import step
+
+__depends__ = {'007_add_block_hash'}
+
+steps = [
+    step(
+        """
+        ALTER TABLE blockchain_records
+            ADD COLUMN IF NOT EXISTS sender VARCHAR(42);
+
+        COMMENT ON COLUMN blockchain_records.sender IS 'Адрес кошелька из пула подписантов; замена транзакции подписывается им же';
+        """,
+
+        """
+        ALTER TABLE blockchain_records
+            DROP COLUMN IF EXISTS sender;
+        """
+    )
+]
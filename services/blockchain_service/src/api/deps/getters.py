@@ -0,0 +1,50 @@
+import asyncpg
+from fastapi import Depends
+
+from libs.auth import JWTAuthProvider
+from libs.cache.ports import CachePort
+from libs.deps.cache import CacheProvider
+from libs.deps.postgres_pool import PostgresPoolProvider
+
+from src.config import settings
+from src.app.services.blockhain_record import BlockchainRecordService
+from src.infra.cached_blockhain_repository import CachedBlockchainRepository
+from src.infra.db.blockhain_repository import AsyncPostgresBlockchainRepository
+
+
+db_provider = PostgresPoolProvider(
+    dsn=settings.DATABASE_URL,
+    min_size=settings.DB_POOL_MIN_SIZE,
+    max_size=settings.DB_POOL_MAX_SIZE,
+)
+
+cache_provider = CacheProvider(
+    redis_url=settings.REDIS_URL,
+    service_prefix=settings.SERVICE_NAME,
+    default_ttl=settings.RECORD_CACHE_TTL_SECONDS,
+)
+
+auth_provider = JWTAuthProvider(
+    secret_key=settings.JWT_SECRET_KEY,
+    algorithm=settings.JWT_ALGORITHM,
+    stateless=True,
+)
+
+get_current_user = auth_provider()
+
+
+async def get_record_repository(
+    pool: asyncpg.Pool = Depends(db_provider),
+    cache: CachePort = Depends(cache_provider),
+) -> CachedBlockchainRepository:
+    return CachedBlockchainRepository(
+        repository=AsyncPostgresBlockchainRepository(pool),
+        cache=cache,
+        ttl_seconds=settings.RECORD_CACHE_TTL_SECONDS,
+    )
+
+
+async def get_record_service(
+    repository: CachedBlockchainRepository = Depends(get_record_repository),
+) -> BlockchainRecordService:
+    return BlockchainRecordService(repository=repository)
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+
+@dataclass
+class BlockchainRecordDTO:
+    record_id: UUID
+    shipment_id: UUID
+    tx_hash: str
+    status: str
+    payload: Dict[str, Any]
+    created_at: datetime
+    confirmed_at: Optional[datetime] = None
+    block_number: Optional[int] = None
+    gas_used: Optional[int] = None
+    error_message: Optional[str] = None
@@ -0,0 +1,45 @@
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from starlette import status
+
+from src.api.deps.getters import get_record_service, get_current_user
+from src.api.dto.blockhain_record import BlockchainRecordDTO
+from src.api.mappers.blockhain_record import BlockchainRecordMapper
+from src.app.services.blockhain_record import BlockchainRecordService
+
+records_router = APIRouter(
+    prefix="/records",
+    tags=["blockchain records"],
+    dependencies=[Depends(get_current_user)],
+)
+
+
+@records_router.get(
+    "/by-shipment/{shipment_id}",
+    response_model=List[BlockchainRecordDTO],
+)
+async def list_records_for_shipment(
+    shipment_id: UUID,
+    service: BlockchainRecordService = Depends(get_record_service),
+):
+    records = await service.get_by_shipment(shipment_id)
+    return [BlockchainRecordMapper.entity_to_dto(r) for r in records]
+
+
+@records_router.get(
+    "/{tx_hash}",
+    response_model=BlockchainRecordDTO,
+)
+async def get_record(
+    tx_hash: str,
+    service: BlockchainRecordService = Depends(get_record_service),
+):
+    record = await service.get_by_tx_hash(tx_hash)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Blockchain record {tx_hash} not found",
+        )
+    return BlockchainRecordMapper.entity_to_dto(record)
@@ -0,0 +1,19 @@
+from src.api.dto.blockhain_record import BlockchainRecordDTO
+from src.domain.entities.blockhain_record import BlockchainRecord
+
+
+class BlockchainRecordMapper:
+    @staticmethod
+    def entity_to_dto(entity: BlockchainRecord) -> BlockchainRecordDTO:
+        return BlockchainRecordDTO(
+            record_id=entity.record_id,
+            shipment_id=entity.shipment_id,
+            tx_hash=entity.tx_hash,
+            status=entity.status.value,
+            payload=entity.payload,
+            created_at=entity.created_at,
+            confirmed_at=entity.confirmed_at,
+            block_number=entity.block_number,
+            gas_used=entity.gas_used,
+            error_message=entity.error_message,
+        )
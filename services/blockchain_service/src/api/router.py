@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+
+from libs.health.router import create_health_router
+from src.api.handlers.blockhain_record import records_router
+from src.config import settings
+
+health_router = create_health_router(
+    service_name=settings.SERVICE_NAME,
+    checks=[],
+)
+
+router = APIRouter(prefix="/api/v1")
+router.include_router(health_router)
+router.include_router(records_router)
@@ -1,11 +1,12 @@
 import logging
-from datetime import datetime
-from typing import Dict
+from datetime import datetime, timezone
+from typing import Dict, Optional
 from uuid import UUID
 
 from libs.messaging.events import DomainEventConverter, BlockchainVerified
 from libs.messaging.ports import EventQueuePort
 
+from src.app.services.reorg_detector import BlockHeaderRing
 from src.domain.entities.blockhain_record import BlockchainRecord, TransactionStatus
 from src.domain.ports.blockhain_gateway import BlockchainGatewayPort
 from src.domain.ports.blockhain_repository import BlockchainRepositoryPort
@@ -17,34 +18,49 @@ class BlockchainService:
             repository: BlockchainRepositoryPort,
             gateway: BlockchainGatewayPort,
             queue: EventQueuePort,
-            required_confirmations: int = 6
+            required_confirmations: int = 6,
+            stuck_after_seconds: int = 300,
+            max_replacements: int = 3,
+            gas_bump_percent: int = 15,
+            header_ring: Optional[BlockHeaderRing] = None
     ):
         self._repo = repository
         self._gateway = gateway
         self._queue = queue
         self._required_confirmations = required_confirmations
+        self._stuck_after_seconds = stuck_after_seconds
+        self._max_replacements = max_replacements
+        self._gas_bump_percent = gas_bump_percent
+        self._header_ring = header_ring
         self._logger = logging.getLogger(self.__class__.__name__)
 
     async def register_event(self, shipment_id: UUID, payload: Dict) -> str:
-        tx_hash = await self._gateway.send_transaction(payload)
+        sent = await self._gateway.send_transaction(payload)
 
         record = BlockchainRecord(
             shipment_id=shipment_id,
-            tx_hash=tx_hash,
+            tx_hash=sent.tx_hash,
             payload=payload,
-            status=TransactionStatus.PENDING
+            status=TransactionStatus.PENDING,
+            sender=sent.sender,
+            nonce=sent.nonce,
+            gas_price=sent.gas_price
         )
 
         await self._repo.save(record)
-        self._logger.info(f"Saved pending transaction {tx_hash} for {shipment_id}")
+        self._logger.info(f"Saved pending transaction {sent.tx_hash} for {shipment_id}")
 
-        return tx_hash
+        return sent.tx_hash
 
     async def update_confirmation(self, record: BlockchainRecord) -> None:
         try:
             receipt = await self._gateway.get_receipt(record.tx_hash)
 
             if not receipt:
+                receipt = await self._find_replaced_receipt(record)
+
+            if not receipt:
+                await self._handle_missing_receipt(record)
                 return
 
             confirmations = receipt.get("confirmations", 0)
@@ -54,7 +70,11 @@ class BlockchainService:
                 await self._fail_transaction(record, "Transaction reverted on chain")
 
             elif status_on_chain == "success":
-                if confirmations >= self._required_confirmations:
+                if not self._is_canonical(receipt):
+                    self._logger.debug(
+                        f"Tx {record.tx_hash} receipt points to orphaned block {receipt.get('block_number')}"
+                    )
+                elif confirmations >= self._required_confirmations:
                     await self._confirm_transaction(record, receipt)
                 else:
                     self._logger.debug(
@@ -64,11 +84,67 @@ class BlockchainService:
         except Exception as e:
             self._logger.error(f"Error updating confirmation for {record.tx_hash}: {e}")
 
+    def _is_canonical(self, receipt: dict) -> bool:
+        if self._header_ring is None or receipt.get("block_hash") is None:
+            return True
+        return self._header_ring.is_canonical(receipt["block_number"], receipt["block_hash"])
+
+    async def _find_replaced_receipt(self, record: BlockchainRecord) -> Optional[dict]:
+        """
+        Исходная транзакция может попасть в блок уже после отправки замены с тем же nonce.
+        Проверяются только записи, которые уже переотправлялись, и только когда основной хеш пуст.
+        """
+        for tx_hash in reversed(record.replaced_tx_hashes):
+            receipt = await self._gateway.get_receipt(tx_hash)
+            if receipt:
+                record.settle_on(tx_hash)
+                return receipt
+        return None
+
+    async def _handle_missing_receipt(self, record: BlockchainRecord) -> None:
+        now = datetime.now(timezone.utc)
+        if not record.is_stuck(now, self._stuck_after_seconds):
+            return
+
+        if record.nonce is None or record.replacement_count >= self._max_replacements:
+            await self._drop_transaction(
+                record,
+                f"No receipt after {record.replacement_count} replacements"
+            )
+            return
+
+        await self._replace_transaction(record, now)
+
+    async def _replace_transaction(self, record: BlockchainRecord, now: datetime) -> None:
+        min_gas_price = (record.gas_price or 0) * (100 + self._gas_bump_percent) // 100
+
+        try:
+            sent = await self._gateway.replace_transaction(
+                payload=record.payload,
+                nonce=record.nonce,
+                min_gas_price=min_gas_price,
+                sender=record.sender
+            )
+        except ValueError as e:
+            # Кошелек отправителя недоступен: повтор на каждом тике ничего не изменит
+            await self._drop_transaction(record, f"Cannot replace transaction: {e}")
+            return
+
+        old_tx_hash = record.tx_hash
+        record.replace(tx_hash=sent.tx_hash, gas_price=sent.gas_price, submitted_at=now)
+        await self._repo.save(record)
+
+        self._logger.warning(
+            f"Stuck transaction {old_tx_hash} replaced by {sent.tx_hash} "
+            f"(nonce={sent.nonce}, gas_price={sent.gas_price}, attempt={record.replacement_count})"
+        )
+
     async def _confirm_transaction(self, record: BlockchainRecord, receipt: dict) -> None:
         record.confirm(
             block_number=receipt["block_number"],
             gas_used=receipt["gas_used"],
-            timestamp=datetime.fromisoformat(receipt["timestamp"])
+            timestamp=datetime.fromisoformat(receipt["timestamp"]),
+            block_hash=receipt.get("block_hash")
         )
 
         await self._repo.save(record)
@@ -90,3 +166,8 @@ class BlockchainService:
         record.fail(reason)
         await self._repo.save(record)
         self._logger.warning(f"Transaction failed: {record.tx_hash}. Reason: {reason}")
+
+    async def _drop_transaction(self, record: BlockchainRecord, reason: str) -> None:
+        record.drop(reason)
+        await self._repo.save(record)
+        self._logger.warning(f"Transaction dropped: {record.tx_hash}. Reason: {reason}")
@@ -0,0 +1,17 @@
+from typing import List, Optional
+from uuid import UUID
+
+from src.domain.entities.blockhain_record import BlockchainRecord
+from src.domain.ports.blockhain_repository import BlockchainRepositoryPort
+
+
+class BlockchainRecordService:
+
+    def __init__(self, repository: BlockchainRepositoryPort):
+        self._repository = repository
+
+    async def get_by_tx_hash(self, tx_hash: str) -> Optional[BlockchainRecord]:
+        return await self._repository.get_by_tx_hash(tx_hash)
+
+    async def get_by_shipment(self, shipment_id: UUID) -> List[BlockchainRecord]:
+        return await self._repository.get_by_shipment_id(shipment_id)
@@ -0,0 +1,117 @@
+import logging
+from typing import List, Optional, Tuple
+
+from src.domain.ports.blockhain_gateway import BlockchainGatewayPort, BlockHeader
+from src.domain.ports.blockhain_repository import BlockchainRepositoryPort
+
+
+class BlockHeaderRing:
+    """
+    Кольцевой буфер хешей последних блоков: слот = number % depth.
+    Хранит только (number, hash), поэтому глубина в сотни блоков занимает килобайты.
+    """
+
+    def __init__(self, depth: int = 128):
+        self._depth = depth
+        self._slots: List[Optional[Tuple[int, str]]] = [None] * depth
+        self._head: Optional[int] = None
+
+    @property
+    def head(self) -> Optional[int]:
+        return self._head
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def get(self, number: int) -> Optional[str]:
+        slot = self._slots[number % self._depth]
+        if slot is not None and slot[0] == number:
+            return slot[1]
+        return None
+
+    def put(self, number: int, block_hash: str) -> None:
+        self._slots[number % self._depth] = (number, block_hash)
+        if self._head is None or number > self._head:
+            self._head = number
+
+    def truncate_above(self, number: int) -> None:
+        if self._head is None:
+            return
+        for n in range(number + 1, self._head + 1):
+            if self.get(n) is not None:
+                self._slots[n % self._depth] = None
+        self._head = number
+
+    def is_canonical(self, number: int, block_hash: str) -> bool:
+        """Неизвестные буферу блоки не считаются неканоническими."""
+        known = self.get(number)
+        return known is None or known == block_hash
+
+
+class ReorgDetector:
+    """
+    Раз в тик монитора запрашивает голову цепочки и идет назад по parent_hash,
+    пока не сойдется с буфером. В обычном случае это 1-2 RPC на тик, независимо
+    от количества записей. При расхождении все подтверждения начиная с точки форка
+    откатываются в PENDING одним UPDATE.
+    """
+
+    def __init__(
+            self,
+            gateway: BlockchainGatewayPort,
+            repository: BlockchainRepositoryPort,
+            ring: BlockHeaderRing
+    ):
+        self._gateway = gateway
+        self._repo = repository
+        self._ring = ring
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    async def check(self) -> Optional[int]:
+        head = await self._gateway.get_block_header("latest")
+        if head is None:
+            return None
+
+        fork_block = await self._sync(head)
+        if fork_block is None:
+            return None
+
+        reverted = await self._repo.revert_confirmations_from_block(fork_block)
+        self._logger.warning(
+            f"Chain reorg detected at block {fork_block}: "
+            f"{len(reverted)} confirmed records reverted to PENDING"
+        )
+        return fork_block
+
+    async def _sync(self, head: BlockHeader) -> Optional[int]:
+        fork_block: Optional[int] = None
+        previous_head = self._ring.head
+
+        if previous_head is not None and head.number < previous_head:
+            fork_block = head.number + 1
+            self._ring.truncate_above(head.number)
+
+        oldest_tracked = (previous_head or head.number) - self._ring.depth + 1
+        header = head
+
+        for _ in range(self._ring.depth):
+            known = self._ring.get(header.number)
+            if known == header.hash:
+                break
+            if known is not None:
+                fork_block = header.number
+
+            self._ring.put(header.number, header.hash)
+
+            if previous_head is None or header.number - 1 < oldest_tracked:
+                break
+            if self._ring.get(header.number - 1) == header.parent_hash:
+                break
+
+            parent = await self._gateway.get_block_header(header.number - 1)
+            if parent is None:
+                break
+            header = parent
+
+        return fork_block
@@ -1,7 +1,9 @@
 import asyncio
 import logging
+from typing import Optional
 
 from src.app.services.blockhain import BlockchainService
+from src.app.services.reorg_detector import ReorgDetector
 from src.domain.ports.blockhain_repository import BlockchainRepositoryPort
 
 
@@ -11,10 +13,12 @@ class ConfirmationMonitor:
             service: BlockchainService,
             repository: BlockchainRepositoryPort,
             interval_seconds: int = 15,
-            batch_size: int = 50
+            batch_size: int = 50,
+            reorg_detector: Optional[ReorgDetector] = None
     ):
         self._service = service
         self._repo = repository
+        self._reorg_detector = reorg_detector
         self._interval = interval_seconds
         self._batch_size = batch_size
         self._logger = logging.getLogger(self.__class__.__name__)
@@ -26,6 +30,9 @@ class ConfirmationMonitor:
 
         while self._is_running:
             try:
+                if self._reorg_detector is not None:
+                    await self._reorg_detector.check()
+
                 pending_records = await self._repo.get_pending_records(limit=self._batch_size)
 
                 if not pending_records:
@@ -1,6 +1,5 @@
 import logging
 from typing import List
-from uuid import UUID
 
 from libs.messaging.ports import EventQueuePort
 from libs.observability.logger import set_correlation_id
@@ -19,24 +18,24 @@ class BlockchainWorker:
         self._queue = queue
         self._service = service
         self._listen_topics = listen_topics
-        self._target_events = target_events
+        self._target_events = frozenset(target_events)
         self._logger = logging.getLogger(self.__class__.__name__)
 
     async def run(self) -> None:
         self._logger.info("Blockchain worker started")
 
-        async for event in self._queue.consume_event(*self._listen_topics):
-            if event.correlation_id:
-                set_correlation_id(str(event.correlation_id))
-
+        async for event in self._queue.consume_event(*self._listen_topics, event_types=self._target_events):
             if event.event_type not in self._target_events:
                 continue
 
+            if event.correlation_id:
+                set_correlation_id(str(event.correlation_id))
+
             try:
                 self._logger.info(f"Processing event: {event.event_type}")
 
                 await self._service.register_event(
-                    shipment_id=UUID(event.aggregate_id),
+                    shipment_id=event.aggregate_id,
                     payload=event.payload
                 )
             except Exception as e:
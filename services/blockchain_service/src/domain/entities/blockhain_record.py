@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from uuid import UUID, uuid4
 
 
@@ -9,6 +9,7 @@ class TransactionStatus(str, Enum):
     PENDING = "PENDING"
     CONFIRMED = "CONFIRMED"
     FAILED = "FAILED"
+    DROPPED = "DROPPED"
 
 
 @dataclass
@@ -23,12 +24,21 @@ class BlockchainRecord:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     confirmed_at: Optional[datetime] = None
     block_number: Optional[int] = None
+    block_hash: Optional[str] = None
     error_message: Optional[str] = None
     gas_used: Optional[int] = None
 
-    def confirm(self, block_number: int, gas_used: int, timestamp: datetime):
+    sender: Optional[str] = None
+    nonce: Optional[int] = None
+    gas_price: Optional[int] = None
+    submitted_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    replacement_count: int = 0
+    replaced_tx_hashes: List[str] = field(default_factory=list)
+
+    def confirm(self, block_number: int, gas_used: int, timestamp: datetime, block_hash: Optional[str] = None):
         self.status = TransactionStatus.CONFIRMED
         self.block_number = block_number
+        self.block_hash = block_hash
         self.gas_used = gas_used
         self.confirmed_at = timestamp
 
@@ -36,6 +46,30 @@ class BlockchainRecord:
         self.status = TransactionStatus.FAILED
         self.error_message = error
 
+    def replace(self, tx_hash: str, gas_price: int, submitted_at: datetime):
+        self.replaced_tx_hashes.append(self.tx_hash)
+        self.tx_hash = tx_hash
+        self.gas_price = gas_price
+        self.submitted_at = submitted_at
+        self.replacement_count += 1
+
+    def settle_on(self, tx_hash: str):
+        if tx_hash == self.tx_hash:
+            return
+        self.replaced_tx_hashes.remove(tx_hash)
+        self.replaced_tx_hashes.append(self.tx_hash)
+        self.tx_hash = tx_hash
+
+    def drop(self, error: str):
+        self.status = TransactionStatus.DROPPED
+        self.error_message = error
+
+    def is_stuck(self, now: datetime, stuck_after_seconds: int) -> bool:
+        return (
+            self.status == TransactionStatus.PENDING
+            and (now - self.submitted_at).total_seconds() >= stuck_after_seconds
+        )
+
     def to_dict(self) -> dict:
         return {
             "record_id": str(self.record_id),
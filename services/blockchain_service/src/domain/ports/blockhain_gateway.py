@@ -1,9 +1,41 @@
-from typing import Protocol, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Protocol, Dict, Any, Optional, Union
+
+
+@dataclass(frozen=True)
+class BlockHeader:
+    number: int
+    hash: str
+    parent_hash: str
+
+
+@dataclass(frozen=True)
+class SentTransaction:
+    tx_hash: str
+    nonce: int
+    gas_price: int
+    sender: Optional[str] = None
 
 
 class BlockchainGatewayPort(Protocol):
-    async def send_transaction(self, payload: Dict[str, Any]) -> str:
+    @property
+    def address(self) -> Optional[str]:
+        ...
+
+    async def send_transaction(self, payload: Dict[str, Any]) -> SentTransaction:
+        ...
+
+    async def replace_transaction(
+            self,
+            payload: Dict[str, Any],
+            nonce: int,
+            min_gas_price: int,
+            sender: Optional[str] = None
+    ) -> SentTransaction:
         ...
 
     async def get_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         ...
+
+    async def get_block_header(self, block: Union[int, str] = "latest") -> Optional[BlockHeader]:
+        ...
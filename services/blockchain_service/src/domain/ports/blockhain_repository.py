@@ -12,5 +12,11 @@ class BlockchainRepositoryPort(Protocol):
     async def get_by_tx_hash(self, tx_hash: str) -> Optional[BlockchainRecord]:
         ...
 
+    async def get_by_shipment_id(self, shipment_id: UUID) -> List[BlockchainRecord]:
+        ...
+
     async def get_pending_records(self, limit: int = 100) -> List[BlockchainRecord]:
         ...
+
+    async def revert_confirmations_from_block(self, block_number: int) -> List[BlockchainRecord]:
+        ...
@@ -0,0 +1,126 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from libs.cache.ports import CachePort
+
+from src.domain.entities.blockhain_record import BlockchainRecord, TransactionStatus
+from src.domain.ports.blockhain_repository import BlockchainRepositoryPort
+
+
+class CachedBlockchainRepository(BlockchainRepositoryPort):
+    """
+    Read-through кэш поверх репозитория. Кэшируются только подтвержденные записи:
+    после CONFIRMED запись меняется только при реорганизации цепочки, поэтому TTL может быть длинным.
+    Любое сохранение и откат подтверждений сбрасывают ключи записи и отгрузки.
+    """
+
+    def __init__(self, repository: BlockchainRepositoryPort, cache: CachePort, ttl_seconds: int = 7 * 24 * 3600):
+        self._repo = repository
+        self._cache = cache
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def _tx_key(tx_hash: str) -> str:
+        return f"record:tx:{tx_hash}"
+
+    @staticmethod
+    def _shipment_key(shipment_id: UUID) -> str:
+        return f"record:shipment:{shipment_id}"
+
+    async def save(self, record: BlockchainRecord) -> BlockchainRecord:
+        saved = await self._repo.save(record)
+
+        await self._cache.delete(self._shipment_key(saved.shipment_id))
+        for tx_hash in saved.replaced_tx_hashes:
+            await self._cache.delete(self._tx_key(tx_hash))
+
+        if saved.status == TransactionStatus.CONFIRMED:
+            await self._cache.set(self._tx_key(saved.tx_hash), self._to_cache(saved), ttl=self._ttl)
+        else:
+            await self._cache.delete(self._tx_key(saved.tx_hash))
+
+        return saved
+
+    async def get_by_tx_hash(self, tx_hash: str) -> Optional[BlockchainRecord]:
+        cached = await self._cache.get(self._tx_key(tx_hash))
+        if isinstance(cached, dict):
+            return self._from_cache(cached)
+
+        record = await self._repo.get_by_tx_hash(tx_hash)
+        if record is not None and record.status == TransactionStatus.CONFIRMED:
+            await self._cache.set(self._tx_key(tx_hash), self._to_cache(record), ttl=self._ttl)
+
+        return record
+
+    async def get_by_shipment_id(self, shipment_id: UUID) -> List[BlockchainRecord]:
+        cached = await self._cache.get(self._shipment_key(shipment_id))
+        if isinstance(cached, list):
+            return [self._from_cache(item) for item in cached]
+
+        records = await self._repo.get_by_shipment_id(shipment_id)
+        if records and all(r.status == TransactionStatus.CONFIRMED for r in records):
+            await self._cache.set(
+                self._shipment_key(shipment_id),
+                [self._to_cache(r) for r in records],
+                ttl=self._ttl
+            )
+
+        return records
+
+    async def get_pending_records(self, limit: int = 100) -> List[BlockchainRecord]:
+        return await self._repo.get_pending_records(limit=limit)
+
+    async def revert_confirmations_from_block(self, block_number: int) -> List[BlockchainRecord]:
+        reverted = await self._repo.revert_confirmations_from_block(block_number)
+
+        for record in reverted:
+            await self._cache.delete(self._tx_key(record.tx_hash))
+        for shipment_id in {record.shipment_id for record in reverted}:
+            await self._cache.delete(self._shipment_key(shipment_id))
+
+        return reverted
+
+    @staticmethod
+    def _to_cache(record: BlockchainRecord) -> dict:
+        return {
+            "record_id": str(record.record_id),
+            "shipment_id": str(record.shipment_id),
+            "tx_hash": record.tx_hash,
+            "status": record.status.value,
+            "payload": record.payload,
+            "created_at": record.created_at.isoformat(),
+            "confirmed_at": record.confirmed_at.isoformat() if record.confirmed_at else None,
+            "block_number": record.block_number,
+            "block_hash": record.block_hash,
+            "error_message": record.error_message,
+            "gas_used": record.gas_used,
+            "sender": record.sender,
+            "nonce": record.nonce,
+            "gas_price": record.gas_price,
+            "submitted_at": record.submitted_at.isoformat(),
+            "replacement_count": record.replacement_count,
+            "replaced_tx_hashes": record.replaced_tx_hashes,
+        }
+
+    @staticmethod
+    def _from_cache(data: dict) -> BlockchainRecord:
+        return BlockchainRecord(
+            record_id=UUID(data["record_id"]),
+            shipment_id=UUID(data["shipment_id"]),
+            tx_hash=data["tx_hash"],
+            status=TransactionStatus(data["status"]),
+            payload=data["payload"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            confirmed_at=datetime.fromisoformat(data["confirmed_at"]) if data["confirmed_at"] else None,
+            block_number=data["block_number"],
+            block_hash=data.get("block_hash"),
+            error_message=data["error_message"],
+            gas_used=data["gas_used"],
+            sender=data.get("sender"),
+            nonce=data["nonce"],
+            gas_price=data["gas_price"],
+            submitted_at=datetime.fromisoformat(data["submitted_at"]),
+            replacement_count=data["replacement_count"],
+            replaced_tx_hashes=list(data["replaced_tx_hashes"]),
+        )
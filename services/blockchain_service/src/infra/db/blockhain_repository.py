@@ -1,5 +1,7 @@
 import json
 from typing import List, Optional
+from uuid import UUID
+
 import asyncpg
 
 from src.domain.entities.blockhain_record import BlockchainRecord, TransactionStatus
@@ -18,16 +20,24 @@ class AsyncPostgresBlockchainRepository(BlockchainRepositoryPort):
             row = await conn.fetchrow("""
                 INSERT INTO blockchain_records (
                     record_id, shipment_id, tx_hash, status, payload, 
-                    created_at, confirmed_at, block_number, error_message, gas_used
+                    created_at, confirmed_at, block_number, error_message, gas_used,
+                    nonce, gas_price, submitted_at, replacement_count, replaced_tx_hashes,
+                    block_hash, sender
                 )
-                VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7, $8, $9, $10)
+                VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
                 ON CONFLICT (record_id)
                 DO UPDATE SET
+                    tx_hash = EXCLUDED.tx_hash,
                     status = EXCLUDED.status,
                     confirmed_at = EXCLUDED.confirmed_at,
                     block_number = EXCLUDED.block_number,
+                    block_hash = EXCLUDED.block_hash,
                     error_message = EXCLUDED.error_message,
-                    gas_used = EXCLUDED.gas_used
+                    gas_used = EXCLUDED.gas_used,
+                    gas_price = EXCLUDED.gas_price,
+                    submitted_at = EXCLUDED.submitted_at,
+                    replacement_count = EXCLUDED.replacement_count,
+                    replaced_tx_hashes = EXCLUDED.replaced_tx_hashes
                 RETURNING *
             """,
                                       record.record_id,
@@ -39,7 +49,14 @@ class AsyncPostgresBlockchainRepository(BlockchainRepositoryPort):
                                       record.confirmed_at,
                                       record.block_number,
                                       record.error_message,
-                                      record.gas_used
+                                      record.gas_used,
+                                      record.nonce,
+                                      record.gas_price,
+                                      record.submitted_at,
+                                      record.replacement_count,
+                                      record.replaced_tx_hashes,
+                                      record.block_hash,
+                                      record.sender
                                       )
 
             return self._row_to_entity(row)
@@ -53,17 +70,48 @@ class AsyncPostgresBlockchainRepository(BlockchainRepositoryPort):
 
             return self._row_to_entity(row) if row else None
 
+    async def get_by_shipment_id(self, shipment_id: UUID) -> List[BlockchainRecord]:
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT * FROM blockchain_records
+                WHERE shipment_id = $1
+                ORDER BY created_at ASC
+            """, shipment_id)
+
+            return [self._row_to_entity(row) for row in rows]
+
     async def get_pending_records(self, limit: int = 100) -> List[BlockchainRecord]:
         async with self._pool.acquire() as conn:
             rows = await conn.fetch("""
                 SELECT * FROM blockchain_records 
                 WHERE status = 'PENDING'
-                ORDER BY created_at ASC
+                ORDER BY submitted_at ASC
                 LIMIT $1
             """, limit)
 
             return [self._row_to_entity(row) for row in rows]
 
+    async def revert_confirmations_from_block(self, block_number: int) -> List[BlockchainRecord]:
+        """
+        Возвращает в PENDING все подтверждения из блоков, начиная с точки форка, одним запросом.
+        submitted_at сбрасывается, чтобы вернувшиеся в мемпул транзакции не считались зависшими сразу.
+        """
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch("""
+                UPDATE blockchain_records
+                SET status = 'PENDING',
+                    confirmed_at = NULL,
+                    block_number = NULL,
+                    block_hash = NULL,
+                    gas_used = NULL,
+                    submitted_at = NOW()
+                WHERE status = 'CONFIRMED'
+                  AND block_number >= $1
+                RETURNING *
+            """, block_number)
+
+            return [self._row_to_entity(row) for row in rows]
+
     @staticmethod
     def _row_to_entity(row) -> BlockchainRecord:
         payload = row['payload']
@@ -79,6 +127,13 @@ class AsyncPostgresBlockchainRepository(BlockchainRepositoryPort):
             created_at=row['created_at'],
             confirmed_at=row['confirmed_at'],
             block_number=row['block_number'],
+            block_hash=row['block_hash'],
             error_message=row['error_message'],
-            gas_used=row['gas_used']
+            gas_used=row['gas_used'],
+            sender=row['sender'],
+            nonce=row['nonce'],
+            gas_price=row['gas_price'],
+            submitted_at=row['submitted_at'],
+            replacement_count=row['replacement_count'],
+            replaced_tx_hashes=list(row['replaced_tx_hashes'] or [])
         )
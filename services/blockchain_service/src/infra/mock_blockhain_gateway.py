@@ -1,16 +1,66 @@
-from typing import Dict, Any, Optional
+from itertools import count
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 
-from src.domain.ports.blockhain_gateway import BlockchainGatewayPort
+from src.domain.ports.blockhain_gateway import BlockchainGatewayPort, BlockHeader, SentTransaction
 
 
 class MockBlockchainGateway(BlockchainGatewayPort):
-    async def send_transaction(self, payload: Dict[str, Any]) -> str:
-        return f"0xmock{hash(str(payload)) & 0xFFFFFFFF:x}"
+    def __init__(
+            self,
+            gas_price: int = 1_000_000_000,
+            block_number: int = 123456,
+            address: str = "0x" + "0" * 40
+    ):
+        self._nonces = count()
+        self._gas_price = gas_price
+        self._block_number = block_number
+        self._address = address
+
+    @property
+    def address(self) -> str:
+        return self._address
+
+    async def send_transaction(self, payload: Dict[str, Any]) -> SentTransaction:
+        nonce = next(self._nonces)
+        return SentTransaction(
+            tx_hash=f"0xmock{hash((self._address, str(payload), nonce)) & 0xFFFFFFFF:x}",
+            nonce=nonce,
+            gas_price=self._gas_price,
+            sender=self._address
+        )
+
+    async def replace_transaction(
+            self,
+            payload: Dict[str, Any],
+            nonce: int,
+            min_gas_price: int,
+            sender: Optional[str] = None
+    ) -> SentTransaction:
+        gas_price = max(self._gas_price, min_gas_price)
+        return SentTransaction(
+            tx_hash=f"0xmock{hash((self._address, str(payload), nonce, gas_price)) & 0xFFFFFFFF:x}",
+            nonce=nonce,
+            gas_price=gas_price,
+            sender=self._address
+        )
 
     async def get_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         return {
-            "block_number": 123456,
+            "block_number": self._block_number,
+            "block_hash": self._block_hash(self._block_number),
             "confirmations": 6,
             "timestamp": datetime.utcnow().isoformat(),
         }
+
+    async def get_block_header(self, block: Union[int, str] = "latest") -> Optional[BlockHeader]:
+        number = self._block_number + 6 if block == "latest" else int(block)
+        return BlockHeader(
+            number=number,
+            hash=self._block_hash(number),
+            parent_hash=self._block_hash(number - 1)
+        )
+
+    @staticmethod
+    def _block_hash(number: int) -> str:
+        return f"0x{number:064x}"
@@ -0,0 +1,129 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.domain.ports.blockhain_gateway import BlockchainGatewayPort, BlockHeader, SentTransaction
+
+Slot = Tuple[str, int]
+
+
+class SignerPoolGateway(BlockchainGatewayPort):
+    """
+    Распределяет транзакции между несколькими кошельками. У каждого кошелька своя
+    очередь nonce, поэтому пропускная способность растет с числом подписантов.
+
+    Нагрузка кошелька = число занятых слотов (address, nonce), которые еще не попали в блок.
+    Слот освобождается, когда get_receipt впервые возвращает квитанцию по любому из его хешей,
+    либо по истечении slot_ttl_seconds (транзакция выброшена из мемпула).
+    """
+
+    def __init__(
+            self,
+            signers: List[BlockchainGatewayPort],
+            slot_ttl_seconds: int = 3600,
+            legacy_signer: Optional[BlockchainGatewayPort] = None
+    ):
+        if not signers:
+            raise ValueError("Signer pool requires at least one signer")
+
+        self._signers: Dict[str, BlockchainGatewayPort] = {s.address.lower(): s for s in signers}
+        if len(self._signers) != len(signers):
+            raise ValueError("Signer pool addresses must be unique")
+
+        self._default = signers[0]
+        # Кошелек, подписывавший записи до появления пула (у них нет sender)
+        self._legacy = legacy_signer
+        self._slot_ttl = slot_ttl_seconds
+        self._load: Dict[str, int] = {address: 0 for address in self._signers}
+        self._slots: "OrderedDict[Slot, Tuple[float, List[str]]]" = OrderedDict()
+        self._hash_slot: Dict[str, Slot] = {}
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def address(self) -> Optional[str]:
+        return None
+
+    @property
+    def loads(self) -> Dict[str, int]:
+        return dict(self._load)
+
+    async def send_transaction(self, payload: Dict[str, Any]) -> SentTransaction:
+        address = self._acquire()
+        try:
+            sent = await self._signers[address].send_transaction(payload)
+        except Exception:
+            self._load[address] -= 1
+            raise
+
+        slot = (address, sent.nonce)
+        if slot in self._slots:
+            self._close_slot(slot)
+        self._open_slot(slot, sent.tx_hash)
+        return sent
+
+    async def replace_transaction(
+            self,
+            payload: Dict[str, Any],
+            nonce: int,
+            min_gas_price: int,
+            sender: Optional[str] = None
+    ) -> SentTransaction:
+        if sender:
+            signer = self._signers.get(sender.lower())
+            if signer is None:
+                raise ValueError(f"Sender {sender} is not part of the signer pool")
+        elif self._legacy is not None:
+            signer = self._legacy
+        else:
+            # Чужой кошелек с тем же nonce заменил бы несвязанную транзакцию
+            raise ValueError("Transaction has no sender and no legacy signer is configured")
+
+        sent = await signer.replace_transaction(payload, nonce, min_gas_price, signer.address)
+
+        slot = (signer.address.lower(), nonce)
+        if slot in self._slots:
+            self._slots[slot][1].append(sent.tx_hash)
+            self._hash_slot[sent.tx_hash] = slot
+        return sent
+
+    async def get_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        slot = self._hash_slot.get(tx_hash)
+        signer = self._signers[slot[0]] if slot else self._default
+
+        receipt = await signer.get_receipt(tx_hash)
+        if receipt and slot:
+            self._close_slot(slot)
+        return receipt
+
+    async def get_block_header(self, block: Union[int, str] = "latest") -> Optional[BlockHeader]:
+        return await self._default.get_block_header(block)
+
+    def _acquire(self) -> str:
+        """Резервирует слот до await, чтобы параллельные отправки не выбрали один кошелек."""
+        self._expire_slots()
+        address = min(self._load, key=self._load.__getitem__)
+        self._load[address] += 1
+        return address
+
+    def _open_slot(self, slot: Slot, tx_hash: str) -> None:
+        """Слот открывается под нагрузку, уже зарезервированную в _acquire."""
+        self._slots[slot] = (time.monotonic(), [tx_hash])
+        self._hash_slot[tx_hash] = slot
+
+    def _close_slot(self, slot: Slot) -> None:
+        entry = self._slots.pop(slot, None)
+        if entry is None:
+            return
+        self._load[slot[0]] -= 1
+        for tx_hash in entry[1]:
+            self._hash_slot.pop(tx_hash, None)
+
+    def _expire_slots(self) -> None:
+        deadline = time.monotonic() - self._slot_ttl
+        while self._slots:
+            slot, (opened_at, _) = next(iter(self._slots.items()))
+            if opened_at > deadline:
+                break
+            self._logger.warning(f"Signer slot {slot} expired without receipt")
+            self._close_slot(slot)
@@ -1,13 +1,13 @@
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 
 from web3 import AsyncWeb3, AsyncHTTPProvider
 from web3.exceptions import TransactionNotFound
 from eth_account import Account
 
-from src.domain.ports.blockhain_gateway import BlockchainGatewayPort
+from src.domain.ports.blockhain_gateway import BlockchainGatewayPort, BlockHeader, SentTransaction
 from src.domain.ports.nonce_manager import NonceManagerPort
 
 
@@ -31,7 +31,11 @@ class Web3BlockchainGateway(BlockchainGatewayPort):
         self._chain_id = chain_id
         self._logger = logging.getLogger(self.__class__.__name__)
 
-    async def send_transaction(self, payload: Dict[str, Any]) -> str:
+    @property
+    def address(self) -> str:
+        return self._account.address
+
+    async def send_transaction(self, payload: Dict[str, Any]) -> SentTransaction:
         """
         Отправляет транзакцию с данными payload.
         Включает механизм автоматического восстановления nonce (Retry).
@@ -61,9 +65,31 @@ class Web3BlockchainGateway(BlockchainGatewayPort):
             self._logger.error(f"Failed to send transaction: {e}")
             raise
 
-    async def _execute_tx(self, data_hex: str, gas_price: int) -> str:
+    async def replace_transaction(
+            self,
+            payload: Dict[str, Any],
+            nonce: int,
+            min_gas_price: int,
+            sender: Optional[str] = None
+    ) -> SentTransaction:
+        """
+        Переотправляет зависшую транзакцию с тем же nonce и повышенной ценой газа (replace-by-fee).
+        Nonce не берется из менеджера: замена должна занять слот исходной транзакции.
+        """
+        if sender is not None and sender.lower() != self._account.address.lower():
+            raise ValueError(f"Transaction from {sender} cannot be replaced by {self._account.address}")
+
+        payload_json = json.dumps(payload)
+        data_hex = self._w3.to_hex(text=payload_json)
+
+        gas_price = max(await self._w3.eth.gas_price, min_gas_price)
+
+        return await self._execute_tx(data_hex, gas_price, nonce=nonce)
+
+    async def _execute_tx(self, data_hex: str, gas_price: int, nonce: Optional[int] = None) -> SentTransaction:
         """Внутренний метод: получить nonce -> подписать -> отправить"""
-        nonce = await self._nonce_manager.get_next_nonce(self._account.address)
+        if nonce is None:
+            nonce = await self._nonce_manager.get_next_nonce(self._account.address)
 
         tx_params = {
             'nonce': nonce,
@@ -81,7 +107,7 @@ class Web3BlockchainGateway(BlockchainGatewayPort):
         tx_hash = self._w3.to_hex(tx_hash_bytes)
 
         self._logger.info(f"Transaction sent: {tx_hash} | Nonce: {nonce}")
-        return tx_hash
+        return SentTransaction(tx_hash=tx_hash, nonce=nonce, gas_price=gas_price, sender=self._account.address)
 
     async def get_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         """
@@ -97,6 +123,7 @@ class Web3BlockchainGateway(BlockchainGatewayPort):
 
             return {
                 "block_number": receipt['blockNumber'],
+                "block_hash": self._w3.to_hex(receipt['blockHash']),
                 "confirmations": confirmations,
                 "timestamp": datetime.fromtimestamp(block['timestamp']).isoformat(),
                 "status": "success" if receipt['status'] == 1 else "failed",
@@ -107,3 +134,18 @@ class Web3BlockchainGateway(BlockchainGatewayPort):
         except Exception as e:
             self._logger.error(f"Error fetching receipt: {e}")
             return None
+
+    async def get_block_header(self, block: Union[int, str] = "latest") -> Optional[BlockHeader]:
+        """
+        Возвращает номер, хеш и родителя блока без списка транзакций.
+        """
+        try:
+            data = await self._w3.eth.get_block(block, full_transactions=False)
+            return BlockHeader(
+                number=data['number'],
+                hash=self._w3.to_hex(data['hash']),
+                parent_hash=self._w3.to_hex(data['parentHash'])
+            )
+        except Exception as e:
+            self._logger.error(f"Error fetching block {block}: {e}")
+            return None
@@ -1,30 +1,50 @@
 import asyncio
 import uuid
 import uvicorn
-import asyncpg
 import redis.asyncio as redis
 from fastapi import FastAPI
 from eth_account import Account
 from web3 import AsyncWeb3, AsyncHTTPProvider
 
 from libs.messaging.kafka import KafkaEventQueueAdapter
+from libs.middlewares.logger import HttpLoggingMiddleware
 from libs.observability.logger import set_environment, set_correlation_id, set_service_name, get_json_logger
-from libs.observability.metrics import metrics_endpoint
+from libs.observability.metrics import PrometheusMiddleware, metrics_endpoint
 
+from src.api.deps.getters import db_provider, cache_provider
+from src.api.router import router
 from src.app.services.blockhain import BlockchainService
+from src.app.services.reorg_detector import BlockHeaderRing, ReorgDetector
 from src.app.workers.confirmation_monitor import ConfirmationMonitor
 from src.config import settings
 from src.app.workers.worker import BlockchainWorker
+from src.infra.cached_blockhain_repository import CachedBlockchainRepository
 from src.infra.db.blockhain_repository import AsyncPostgresBlockchainRepository
 from src.infra.mock_blockhain_gateway import MockBlockchainGateway
 from src.infra.redis_nonse_manager import RedisNonceManager
+from src.infra.signer_pool_gateway import SignerPoolGateway
 from src.infra.web3_blockhain_gateway import Web3BlockchainGateway
 
 logger = get_json_logger("main", level=settings.LOG_LEVEL)
 
 
-def create_metrics_app() -> FastAPI:
-    app = FastAPI()
+def create_app() -> FastAPI:
+    app = FastAPI(
+        title="Blockchain Service API",
+        version="1.0.0",
+        docs_url="/docs" if settings.ENVIRONMENT in ("local", "development") else None,
+        redoc_url=None,
+    )
+
+    app.include_router(router)
+
+    app.add_middleware(
+        HttpLoggingMiddleware,
+        service_name=settings.SERVICE_NAME,
+        log_request_body=False,
+        log_response_body=False,
+    )
+    app.add_middleware(PrometheusMiddleware, service_name=settings.SERVICE_NAME)
     app.add_api_route("/metrics", metrics_endpoint, methods=["GET"])
     return app
 
@@ -37,11 +57,12 @@ async def main():
     logger.info("Starting Blockchain Service...")
 
     redis_client = redis.from_url(settings.REDIS_URL)
-    pg_pool = await asyncpg.create_pool(dsn=settings.DATABASE_URL)
+    await db_provider.startup()
+    cache = await cache_provider()
 
-    metrics_app = create_metrics_app()
-    metrics_config = uvicorn.Config(metrics_app, host=settings.HOST, port=settings.PORT, log_config=None)
-    metrics_server = uvicorn.Server(metrics_config)
+    app = create_app()
+    server_config = uvicorn.Config(app, host=settings.HOST, port=settings.PORT, log_config=None)
+    server = uvicorn.Server(server_config)
 
     try:
         if settings.USE_MOCK_BLOCKCHAIN:
@@ -54,26 +75,60 @@ async def main():
                 w3=w3_provider,
                 key_prefix=settings.REDIS_NONCE_KEY_PREFIX
             )
-            account = Account.from_key(settings.BLOCKCHAIN_PRIVATE_KEY.get_secret_value())
-            await nonce_manager.sync_from_chain(account.address)
-            gateway = Web3BlockchainGateway(
-                node_url=settings.BLOCKCHAIN_RPC_URL,
-                private_key=settings.BLOCKCHAIN_PRIVATE_KEY.get_secret_value(),
-                nonce_manager=nonce_manager,
-                chain_id=settings.BLOCKCHAIN_CHAIN_ID
+            signers = []
+            for private_key in settings.signer_keys:
+                account = Account.from_key(private_key)
+                await nonce_manager.sync_from_chain(account.address)
+                signers.append(Web3BlockchainGateway(
+                    node_url=settings.BLOCKCHAIN_RPC_URL,
+                    private_key=private_key,
+                    nonce_manager=nonce_manager,
+                    chain_id=settings.BLOCKCHAIN_CHAIN_ID
+                ))
+            logger.info(f"Signer pool initialized with {len(signers)} wallets")
+
+            legacy_signer = None
+            legacy_key = settings.legacy_signer_key
+            if legacy_key is not None:
+                legacy_address = Account.from_key(legacy_key).address.lower()
+                legacy_signer = next((s for s in signers if s.address.lower() == legacy_address), None)
+                if legacy_signer is None:
+                    legacy_signer = Web3BlockchainGateway(
+                        node_url=settings.BLOCKCHAIN_RPC_URL,
+                        private_key=legacy_key,
+                        nonce_manager=nonce_manager,
+                        chain_id=settings.BLOCKCHAIN_CHAIN_ID
+                    )
+            else:
+                logger.warning("BLOCKCHAIN_PRIVATE_KEY is not set: transactions without sender will be dropped")
+
+            gateway = SignerPoolGateway(
+                signers=signers,
+                slot_ttl_seconds=settings.BLOCKCHAIN_SIGNER_SLOT_TTL_SECONDS,
+                legacy_signer=legacy_signer
             )
 
-        repository = AsyncPostgresBlockchainRepository(pg_pool)
+        repository = CachedBlockchainRepository(
+            repository=AsyncPostgresBlockchainRepository(db_provider._pool),
+            cache=cache,
+            ttl_seconds=settings.RECORD_CACHE_TTL_SECONDS
+        )
 
         async with KafkaEventQueueAdapter(
                 bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
                 group_id=settings.KAFKA_GROUP_ID
         ) as queue:
 
+            header_ring = BlockHeaderRing(depth=settings.BLOCKCHAIN_REORG_DEPTH)
+
             service = BlockchainService(
                 repository=repository,
                 gateway=gateway,
-                queue=queue
+                queue=queue,
+                stuck_after_seconds=settings.BLOCKCHAIN_STUCK_TX_SECONDS,
+                max_replacements=settings.BLOCKCHAIN_MAX_REPLACEMENTS,
+                gas_bump_percent=settings.BLOCKCHAIN_GAS_BUMP_PERCENT,
+                header_ring=header_ring
             )
 
             worker = BlockchainWorker(
@@ -86,15 +141,20 @@ async def main():
             monitor = ConfirmationMonitor(
                 service=service,
                 repository=repository,
-                interval_seconds=10
+                interval_seconds=10,
+                reorg_detector=ReorgDetector(
+                    gateway=gateway,
+                    repository=repository,
+                    ring=header_ring
+                )
             )
 
-            logger.info("Service initialized. Starting workers and metrics server...")
+            logger.info("Service initialized. Starting workers and API server...")
 
             await asyncio.gather(
                 worker.run(),
                 monitor.run(),
-                metrics_server.serve()
+                server.serve()
             )
 
     except Exception:
@@ -102,7 +162,8 @@ async def main():
         raise
     finally:
         await redis_client.aclose()
-        await pg_pool.close()
+        await cache.close()
+        await db_provider.shutdown()
 
 
 if __name__ == "__main__":
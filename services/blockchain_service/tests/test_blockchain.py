@@ -0,0 +1,322 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from libs.cache.memory import InMemoryCacheAdapter
+from libs.messaging.base import Event
+
+from src.app.services.blockhain import BlockchainService
+from src.app.services.reorg_detector import BlockHeaderRing, ReorgDetector
+from src.app.workers.worker import BlockchainWorker
+from src.domain.entities.blockhain_record import BlockchainRecord, TransactionStatus
+from src.domain.ports.blockhain_gateway import BlockHeader, SentTransaction
+from src.infra.cached_blockhain_repository import CachedBlockchainRepository
+
+
+@pytest.fixture
+def mock_repository():
+    repo = AsyncMock()
+    repo.save.side_effect = lambda record: record
+    return repo
+
+
+@pytest.fixture
+def mock_gateway():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_queue():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(mock_repository, mock_gateway, mock_queue):
+    return BlockchainService(
+        repository=mock_repository,
+        gateway=mock_gateway,
+        queue=mock_queue,
+        stuck_after_seconds=300,
+        max_replacements=2,
+        gas_bump_percent=15
+    )
+
+
+def make_record(age_seconds: int = 0, **kwargs) -> BlockchainRecord:
+    submitted_at = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+    return BlockchainRecord(
+        tx_hash=kwargs.pop("tx_hash", "0xoriginal"),
+        shipment_id=uuid4(),
+        payload={"event": "shipment.created"},
+        nonce=kwargs.pop("nonce", 7),
+        gas_price=kwargs.pop("gas_price", 1_000),
+        submitted_at=submitted_at,
+        **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_register_event_stores_nonce_and_gas_price(service, mock_gateway, mock_repository):
+    mock_gateway.send_transaction.return_value = SentTransaction(tx_hash="0xabc", nonce=3, gas_price=2_000)
+
+    tx_hash = await service.register_event(shipment_id=uuid4(), payload={"a": 1})
+
+    assert tx_hash == "0xabc"
+    saved = mock_repository.save.call_args[0][0]
+    assert saved.nonce == 3
+    assert saved.gas_price == 2_000
+    assert saved.status == TransactionStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_fresh_pending_transaction_is_left_alone(service, mock_gateway, mock_repository):
+    record = make_record(age_seconds=10)
+    mock_gateway.get_receipt.return_value = None
+
+    await service.update_confirmation(record)
+
+    mock_gateway.replace_transaction.assert_not_called()
+    mock_repository.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stuck_transaction_is_replaced_with_same_nonce(service, mock_gateway, mock_repository):
+    record = make_record(age_seconds=600)
+    mock_gateway.get_receipt.return_value = None
+    mock_gateway.replace_transaction.return_value = SentTransaction(tx_hash="0xreplacement", nonce=7, gas_price=1_150)
+
+    await service.update_confirmation(record)
+
+    mock_gateway.replace_transaction.assert_awaited_once_with(
+        payload=record.payload,
+        nonce=7,
+        min_gas_price=1_150,
+        sender=None
+    )
+    assert record.tx_hash == "0xreplacement"
+    assert record.replaced_tx_hashes == ["0xoriginal"]
+    assert record.replacement_count == 1
+    assert record.status == TransactionStatus.PENDING
+    mock_repository.save.assert_awaited_once_with(record)
+
+
+@pytest.mark.asyncio
+async def test_stuck_transaction_with_unknown_sender_is_dropped(service, mock_gateway, mock_repository):
+    record = make_record(age_seconds=600)
+    mock_gateway.get_receipt.return_value = None
+    mock_gateway.replace_transaction.side_effect = ValueError("Sender 0xdead is not part of the signer pool")
+
+    await service.update_confirmation(record)
+
+    assert record.status == TransactionStatus.DROPPED
+    assert "0xdead" in record.error_message
+    mock_repository.save.assert_awaited_once_with(record)
+
+
+@pytest.mark.asyncio
+async def test_stuck_transaction_is_dropped_after_max_replacements(service, mock_gateway, mock_repository):
+    record = make_record(age_seconds=600, replacement_count=2, replaced_tx_hashes=["0xa", "0xb"])
+    mock_gateway.get_receipt.return_value = None
+
+    await service.update_confirmation(record)
+
+    mock_gateway.replace_transaction.assert_not_called()
+    assert record.status == TransactionStatus.DROPPED
+    assert record.error_message
+    mock_repository.save.assert_awaited_once_with(record)
+
+
+@pytest.mark.asyncio
+async def test_mined_replaced_hash_is_confirmed(service, mock_gateway, mock_queue):
+    record = make_record(age_seconds=600, tx_hash="0xreplacement", replacement_count=1, replaced_tx_hashes=["0xoriginal"])
+    receipt = {
+        "status": "success",
+        "confirmations": 6,
+        "block_number": 100,
+        "gas_used": 21_000,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+    mock_gateway.get_receipt.side_effect = lambda tx_hash: receipt if tx_hash == "0xoriginal" else None
+
+    await service.update_confirmation(record)
+
+    assert record.status == TransactionStatus.CONFIRMED
+    assert record.tx_hash == "0xoriginal"
+    assert record.replaced_tx_hashes == ["0xreplacement"]
+    mock_gateway.replace_transaction.assert_not_called()
+    mock_queue.publish_event.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_worker_passes_target_events_to_consumer_filter(mock_queue):
+    shipment_id = uuid4()
+    events = [
+        Event(event_type="shipment.created", aggregate_id=shipment_id, aggregate_type="shipment", payload={"a": 1}),
+        Event(event_type="delivery.started", aggregate_id=uuid4(), aggregate_type="delivery", payload={}),
+    ]
+    received_filters = {}
+
+    async def consume_event(*topics, event_types=None):
+        received_filters["event_types"] = event_types
+        for event in events:
+            yield event
+
+    mock_queue.consume_event = consume_event
+    service = AsyncMock()
+    worker = BlockchainWorker(
+        queue=mock_queue,
+        service=service,
+        listen_topics=["shipment_service"],
+        target_events=["shipment.created"]
+    )
+
+    await worker.run()
+
+    assert received_filters["event_types"] == frozenset({"shipment.created"})
+    service.register_event.assert_awaited_once_with(shipment_id=shipment_id, payload={"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_serves_confirmed_record_from_cache(mock_repository):
+    record = make_record()
+    record.confirm(block_number=10, gas_used=21_000, timestamp=datetime.now(timezone.utc))
+    mock_repository.get_by_tx_hash.return_value = record
+    cached_repo = CachedBlockchainRepository(mock_repository, InMemoryCacheAdapter())
+
+    first = await cached_repo.get_by_tx_hash(record.tx_hash)
+    second = await cached_repo.get_by_tx_hash(record.tx_hash)
+
+    assert first.record_id == second.record_id == record.record_id
+    assert second.status == TransactionStatus.CONFIRMED
+    assert second.confirmed_at == record.confirmed_at
+    mock_repository.get_by_tx_hash.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_does_not_cache_pending_shipment_records(mock_repository):
+    record = make_record()
+    mock_repository.get_by_shipment_id.return_value = [record]
+    cached_repo = CachedBlockchainRepository(mock_repository, InMemoryCacheAdapter())
+
+    await cached_repo.get_by_shipment_id(record.shipment_id)
+    await cached_repo.get_by_shipment_id(record.shipment_id)
+
+    assert mock_repository.get_by_shipment_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_save_invalidates_shipment_list(mock_repository):
+    record = make_record()
+    record.confirm(block_number=10, gas_used=21_000, timestamp=datetime.now(timezone.utc))
+    mock_repository.get_by_shipment_id.return_value = [record]
+    cached_repo = CachedBlockchainRepository(mock_repository, InMemoryCacheAdapter())
+
+    await cached_repo.get_by_shipment_id(record.shipment_id)
+    await cached_repo.get_by_shipment_id(record.shipment_id)
+    assert mock_repository.get_by_shipment_id.await_count == 1
+
+    new_record = make_record(tx_hash="0xnew")
+    new_record.shipment_id = record.shipment_id
+    await cached_repo.save(new_record)
+    await cached_repo.get_by_shipment_id(record.shipment_id)
+
+    assert mock_repository.get_by_shipment_id.await_count == 2
+
+
+class FakeChain:
+    def __init__(self, head: int, fork: str = "a"):
+        self.blocks = {}
+        self.head = head
+        self.calls = 0
+        for number in range(head + 1):
+            self.set_block(number, fork)
+
+    def set_block(self, number: int, fork: str):
+        parent = self.blocks.get(number - 1)
+        self.blocks[number] = BlockHeader(
+            number=number,
+            hash=f"0x{fork}{number}",
+            parent_hash=parent.hash if parent else "0x0"
+        )
+
+    async def get_block_header(self, block="latest"):
+        self.calls += 1
+        return self.blocks[self.head if block == "latest" else block]
+
+
+def test_block_header_ring_overwrites_oldest_slot():
+    ring = BlockHeaderRing(depth=4)
+    for number in range(10, 15):
+        ring.put(number, f"0x{number}")
+
+    assert ring.get(10) is None
+    assert ring.get(14) == "0x14"
+    assert ring.head == 14
+    assert ring.is_canonical(14, "0x14")
+    assert not ring.is_canonical(14, "0xother")
+    assert ring.is_canonical(10, "0xunknown")
+
+
+@pytest.mark.asyncio
+async def test_reorg_detector_without_reorg_makes_single_rpc(mock_repository):
+    chain = FakeChain(head=101)
+    chain.head = 100
+    detector = ReorgDetector(gateway=chain, repository=mock_repository, ring=BlockHeaderRing(depth=16))
+    await detector.check()
+
+    chain.head = 101
+    chain.calls = 0
+    fork = await detector.check()
+
+    assert fork is None
+    assert chain.calls == 1
+    mock_repository.revert_confirmations_from_block.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_reorg_detector_reverts_records_from_fork_block(mock_repository):
+    chain = FakeChain(head=100)
+    ring = BlockHeaderRing(depth=16)
+    detector = ReorgDetector(gateway=chain, repository=mock_repository, ring=ring)
+    for number in range(95, 101):
+        chain.head = number
+        await detector.check()
+
+    for number in range(98, 102):
+        chain.set_block(number, "b")
+    chain.head = 101
+    mock_repository.revert_confirmations_from_block.return_value = [make_record()]
+
+    fork = await detector.check()
+
+    assert fork == 98
+    mock_repository.revert_confirmations_from_block.assert_awaited_once_with(98)
+    assert ring.get(98) == "0xb98"
+    assert ring.get(97) == "0xa97"
+
+
+@pytest.mark.asyncio
+async def test_receipt_from_orphaned_block_is_not_confirmed(mock_gateway, mock_repository, mock_queue):
+    ring = BlockHeaderRing(depth=16)
+    ring.put(100, "0xcanonical")
+    service = BlockchainService(
+        repository=mock_repository,
+        gateway=mock_gateway,
+        queue=mock_queue,
+        header_ring=ring
+    )
+    record = make_record()
+    mock_gateway.get_receipt.return_value = {
+        "status": "success",
+        "confirmations": 10,
+        "block_number": 100,
+        "block_hash": "0xorphaned",
+        "gas_used": 21_000,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+    await service.update_confirmation(record)
+
+    assert record.status == TransactionStatus.PENDING
+    mock_repository.save.assert_not_called()
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from src.domain.ports.blockhain_gateway import SentTransaction
+from src.infra.mock_blockhain_gateway import MockBlockchainGateway
+from src.infra.signer_pool_gateway import SignerPoolGateway
+
+
+def make_signers(n: int):
+    return [MockBlockchainGateway(address=f"0x{i:040x}") for i in range(1, n + 1)]
+
+
+class DevChainSigner(MockBlockchainGateway):
+    """
+    Заменитель локальной dev-сети: отправки одного аккаунта сериализуются,
+    как при выдаче nonce и подписи транзакций одним кошельком.
+    """
+
+    def __init__(self, address: str, latency: float):
+        super().__init__(address=address)
+        self._lock = asyncio.Lock()
+        self._latency = latency
+
+    async def send_transaction(self, payload) -> SentTransaction:
+        async with self._lock:
+            await asyncio.sleep(self._latency)
+            return await super().send_transaction(payload)
+
+
+@pytest.mark.asyncio
+async def test_pool_spreads_transactions_across_least_loaded_signers():
+    pool = SignerPoolGateway(make_signers(4))
+
+    sent = await asyncio.gather(*(pool.send_transaction({"i": i}) for i in range(8)))
+
+    assert set(pool.loads.values()) == {2}
+    assert len({tx.sender for tx in sent}) == 4
+
+
+@pytest.mark.asyncio
+async def test_receipt_releases_signer_slot():
+    pool = SignerPoolGateway(make_signers(2))
+    sent = await pool.send_transaction({"a": 1})
+
+    await pool.get_receipt(sent.tx_hash)
+
+    assert sum(pool.loads.values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_replacement_is_signed_by_original_sender():
+    pool = SignerPoolGateway(make_signers(3))
+    sent = await pool.send_transaction({"a": 1})
+
+    replacement = await pool.replace_transaction({"a": 1}, sent.nonce, sent.gas_price * 2, sender=sent.sender)
+
+    assert replacement.sender == sent.sender
+    assert replacement.nonce == sent.nonce
+    await pool.get_receipt(replacement.tx_hash)
+    assert sum(pool.loads.values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_replacement_from_unknown_sender_is_rejected():
+    pool = SignerPoolGateway(make_signers(2))
+
+    with pytest.raises(ValueError):
+        await pool.replace_transaction({"a": 1}, 0, 1, sender="0x" + "f" * 40)
+
+
+@pytest.mark.asyncio
+async def test_legacy_replacement_without_sender_uses_legacy_signer():
+    legacy = MockBlockchainGateway(address="0x" + "a" * 40)
+    pool = SignerPoolGateway(make_signers(2), legacy_signer=legacy)
+
+    replacement = await pool.replace_transaction({"a": 1}, 5, 1, sender=None)
+
+    assert replacement.sender == legacy.address
+    assert replacement.nonce == 5
+    assert set(pool.loads.values()) == {0}
+
+
+@pytest.mark.asyncio
+async def test_legacy_replacement_without_legacy_signer_is_rejected():
+    pool = SignerPoolGateway(make_signers(2))
+
+    with pytest.raises(ValueError):
+        await pool.replace_transaction({"a": 1}, 5, 1, sender=None)
+
+
+@pytest.mark.asyncio
+async def test_failed_send_does_not_leak_load():
+    failing = MockBlockchainGateway(address="0x" + "1" * 40)
+
+    async def fail(payload):
+        raise RuntimeError("rpc down")
+
+    failing.send_transaction = fail
+    pool = SignerPoolGateway([failing])
+
+    with pytest.raises(RuntimeError):
+        await pool.send_transaction({"a": 1})
+
+    assert pool.loads == {failing.address.lower(): 0}
+
+
+def test_duplicate_signer_addresses_are_rejected():
+    with pytest.raises(ValueError):
+        SignerPoolGateway([MockBlockchainGateway(), MockBlockchainGateway()])
+
+
+@pytest.mark.asyncio
+async def test_load_pool_spreads_serialized_sends_across_signers():
+    signers = [DevChainSigner(f"0x{i:040x}", latency=0.001) for i in range(1, 5)]
+    pool = SignerPoolGateway(signers)
+
+    sent = await asyncio.gather(*(pool.send_transaction({"i": i}) for i in range(200)))
+
+    per_signer = {signer.address: 0 for signer in signers}
+    for tx in sent:
+        per_signer[tx.sender] += 1
+    assert set(per_signer.values()) == {50}
+    assert set(pool.loads.values()) == {50}
@@ -0,0 +1,85 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.deps.getters import get_record_service, get_current_user
+from src.api.handlers.blockhain_record import records_router
+from src.domain.entities.blockhain_record import BlockchainRecord, TransactionStatus
+
+app = FastAPI()
+app.include_router(records_router)
+
+
+@pytest.fixture
+def mock_record_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def client(mock_record_service):
+    app.dependency_overrides[get_record_service] = lambda: mock_record_service
+    app.dependency_overrides[get_current_user] = lambda: MagicMock()
+
+    with TestClient(app) as c:
+        yield c
+
+    app.dependency_overrides.clear()
+
+
+def create_record(shipment_id=None, tx_hash="0xabc", status=TransactionStatus.CONFIRMED):
+    return BlockchainRecord(
+        tx_hash=tx_hash,
+        shipment_id=shipment_id or uuid4(),
+        payload={"event_type": "shipment.created"},
+        status=status,
+        confirmed_at=datetime.now(timezone.utc),
+        block_number=100,
+        gas_used=21_000,
+    )
+
+
+def test_get_record_by_tx_hash(client, mock_record_service):
+    record = create_record()
+    mock_record_service.get_by_tx_hash.return_value = record
+
+    response = client.get("/records/0xabc")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["tx_hash"] == "0xabc"
+    assert data["status"] == "CONFIRMED"
+    assert data["block_number"] == 100
+    mock_record_service.get_by_tx_hash.assert_awaited_once_with("0xabc")
+
+
+def test_get_record_not_found(client, mock_record_service):
+    mock_record_service.get_by_tx_hash.return_value = None
+
+    response = client.get("/records/0xmissing")
+
+    assert response.status_code == 404
+
+
+def test_list_records_for_shipment(client, mock_record_service):
+    shipment_id = uuid4()
+    mock_record_service.get_by_shipment.return_value = [
+        create_record(shipment_id=shipment_id, tx_hash="0x1"),
+        create_record(shipment_id=shipment_id, tx_hash="0x2", status=TransactionStatus.PENDING),
+    ]
+
+    response = client.get(f"/records/by-shipment/{shipment_id}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["tx_hash"] for r in data] == ["0x1", "0x2"]
+    assert data[1]["status"] == "PENDING"
+    mock_record_service.get_by_shipment.assert_awaited_once_with(shipment_id)
+
+
+def test_list_records_invalid_shipment_id(client):
+    response = client.get("/records/by-shipment/not-a-uuid")
+
+    assert response.status_code == 422
@@ -0,0 +1,46 @@
+"""
+Замер назначения курьеров: N доставок × N курьеров в одном городе.
+Запуск из каталога сервиса: python -m benchmarks.assignment_benchmark [N]
+"""
+import sys
+import time
+from uuid import uuid4
+
+import numpy as np
+
+from src.app.services.assignment_solver import solve_greedy, solve_hungarian
+from src.app.services.courier_assignment import CourierAssignmentEngine
+from src.domain.value_objects import AssignmentRequest, CourierCandidate
+
+
+def main(size: int = 1000) -> None:
+    rng = np.random.default_rng(42)
+    requests = [
+        AssignmentRequest(uuid4(), uuid4(), float(lat), float(lon))
+        for lat, lon in zip(55.75 + rng.uniform(-0.2, 0.2, size), 37.61 + rng.uniform(-0.3, 0.3, size))
+    ]
+    couriers = [
+        CourierCandidate(uuid4(), int(active), float(lat), float(lon))
+        for active, lat, lon in zip(
+            rng.integers(0, 4, size), 55.75 + rng.uniform(-0.2, 0.2, size), 37.61 + rng.uniform(-0.3, 0.3, size)
+        )
+    ]
+    engine = CourierAssignmentEngine()
+
+    started = time.perf_counter()
+    distances = engine.distance_matrix(requests, couriers)
+    cost = engine.cost_matrix(distances, np.array([c.active_deliveries for c in couriers], dtype=np.float64))
+    matrix_seconds = time.perf_counter() - started
+    print(f"cost matrix {size}x{size}: {matrix_seconds * 1000:.1f} ms")
+
+    for name, solver in (("hungarian", solve_hungarian), ("greedy", solve_greedy)):
+        started = time.perf_counter()
+        pairs = solver(cost)
+        seconds = time.perf_counter() - started
+        total = sum(cost[r, c] for r, c in pairs)
+        print(f"{name:>9}: {len(pairs)} assigned in {seconds:.2f} s, "
+              f"{len(pairs) / seconds:,.0f} assignments/s, total cost {total:,.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
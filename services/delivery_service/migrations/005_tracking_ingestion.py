@@ -0,0 +1,30 @@
+from yoyo import step
+
+__depends__ = {'004_add_delivery_status_history'}
+
+steps = [
+    step(
+        """
+        -- Повторная отправка пачки с устройства не должна плодить точки:
+        -- одна точка на (доставка, момент фиксации)
+        DELETE FROM delivery_tracking_points t
+        USING delivery_tracking_points d
+        WHERE t.delivery_id = d.delivery_id
+          AND t.recorded_at = d.recorded_at
+          AND t.tracking_id > d.tracking_id;
+
+        -- Уникальный индекс заменяет idx_tracking_delivery и служит целью ON CONFLICT при загрузке
+        CREATE UNIQUE INDEX uq_tracking_delivery_recorded
+        ON delivery_tracking_points(delivery_id, recorded_at DESC);
+
+        DROP INDEX IF EXISTS idx_tracking_delivery;
+        """,
+
+        """
+        CREATE INDEX IF NOT EXISTS idx_tracking_delivery
+        ON delivery_tracking_points(delivery_id, recorded_at DESC);
+
+        DROP INDEX IF EXISTS uq_tracking_delivery_recorded;
+        """
+    )
+]
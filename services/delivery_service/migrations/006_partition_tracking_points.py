@@ -0,0 +1,176 @@
+from yoyo import step
+
+__depends__ = {'005_tracking_ingestion'}
+
+steps = [
+    step(
+        """
+        -- Таблица точек трекинга переходит на дневные RANGE-партиции по recorded_at (UTC).
+        -- Имена индексов глобальны в схеме, поэтому индексы старой таблицы удаляются заранее
+        ALTER TABLE delivery_tracking_points RENAME TO delivery_tracking_points_old;
+        ALTER TABLE delivery_tracking_points_old
+            RENAME CONSTRAINT delivery_tracking_points_pkey TO delivery_tracking_points_old_pkey;
+        DROP INDEX IF EXISTS uq_tracking_delivery_recorded;
+        DROP INDEX IF EXISTS idx_tracking_recorded_at;
+        DROP INDEX IF EXISTS idx_tracking_location;
+
+        CREATE TABLE delivery_tracking_points (
+            tracking_id UUID NOT NULL DEFAULT gen_random_uuid(),
+            delivery_id UUID NOT NULL REFERENCES deliveries(delivery_id) ON DELETE CASCADE,
+            latitude DECIMAL(10, 8) NOT NULL,
+            longitude DECIMAL(11, 8) NOT NULL,
+            accuracy_meters INTEGER,
+            recorded_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+            notes TEXT,
+
+            PRIMARY KEY (tracking_id, recorded_at),
+            CONSTRAINT ck_latitude CHECK (latitude >= -90 AND latitude <= 90),
+            CONSTRAINT ck_longitude CHECK (longitude >= -180 AND longitude <= 180),
+            CONSTRAINT ck_accuracy CHECK (accuracy_meters IS NULL OR accuracy_meters > 0)
+        ) PARTITION BY RANGE (recorded_at);
+
+        -- Поиск по времени покрывает отсечение партиций; индекс по (latitude, longitude)
+        -- для геопоиска бесполезен и не переносится
+        CREATE UNIQUE INDEX uq_tracking_delivery_recorded
+        ON delivery_tracking_points(delivery_id, recorded_at DESC);
+
+        -- Точки вне созданных партиций (часы устройства ушли вперед, поздняя выгрузка)
+        CREATE TABLE delivery_tracking_points_default
+        PARTITION OF delivery_tracking_points DEFAULT;
+
+        -- Дни, уже прореженные Douglas–Peucker
+        CREATE TABLE tracking_compactions (
+            day DATE PRIMARY KEY,
+            points_before BIGINT NOT NULL,
+            points_after BIGINT NOT NULL,
+            compacted_at TIMESTAMPTZ DEFAULT NOW() NOT NULL
+        );
+
+        -- Партиция одного дня; точки этого дня из DEFAULT переносятся в нее перед ATTACH
+        CREATE OR REPLACE FUNCTION create_tracking_partition(partition_day DATE) RETURNS VOID AS $$
+        DECLARE
+            partition_name TEXT := 'delivery_tracking_points_p' || to_char(partition_day, 'YYYYMMDD');
+            lower_bound TIMESTAMPTZ := partition_day::timestamp AT TIME ZONE 'UTC';
+            upper_bound TIMESTAMPTZ := (partition_day + 1)::timestamp AT TIME ZONE 'UTC';
+        BEGIN
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN;
+            END IF;
+
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE delivery_tracking_points INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                partition_name
+            );
+            EXECUTE format(
+                'WITH moved AS (
+                    DELETE FROM delivery_tracking_points_default
+                    WHERE recorded_at >= %L AND recorded_at < %L
+                    RETURNING *
+                ) INSERT INTO %I SELECT * FROM moved',
+                lower_bound, upper_bound, partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE delivery_tracking_points ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, lower_bound, upper_bound
+            );
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE FUNCTION ensure_tracking_partitions(from_day DATE, days INTEGER) RETURNS VOID AS $$
+        BEGIN
+            FOR offset_days IN 0..days - 1 LOOP
+                PERFORM create_tracking_partition(from_day + offset_days);
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        -- Retention: партиции старше before_day удаляются целиком, без DELETE и VACUUM
+        CREATE OR REPLACE FUNCTION drop_tracking_partitions(before_day DATE) RETURNS INTEGER AS $$
+        DECLARE
+            partition_name TEXT;
+            dropped INTEGER := 0;
+        BEGIN
+            FOR partition_name IN
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'delivery_tracking_points'::regclass
+                  AND c.relname ~ '^delivery_tracking_points_p[0-9]{8}$'
+                  AND to_date(right(c.relname, 8), 'YYYYMMDD') < before_day
+            LOOP
+                EXECUTE format('DROP TABLE %I', partition_name);
+                dropped := dropped + 1;
+            END LOOP;
+
+            DELETE FROM delivery_tracking_points_default
+            WHERE recorded_at < before_day::timestamp AT TIME ZONE 'UTC';
+            DELETE FROM tracking_compactions WHERE day < before_day;
+
+            RETURN dropped;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        -- Партиции под накопленные точки и на несколько дней вперед
+        DO $$
+        DECLARE
+            first_day DATE;
+        BEGIN
+            SELECT COALESCE(MIN((recorded_at AT TIME ZONE 'UTC')::date), CURRENT_DATE)
+            INTO first_day
+            FROM delivery_tracking_points_old;
+
+            PERFORM ensure_tracking_partitions(first_day, (CURRENT_DATE - first_day) + 3);
+        END $$;
+
+        INSERT INTO delivery_tracking_points (
+            tracking_id, delivery_id, latitude, longitude, accuracy_meters, recorded_at, notes
+        )
+        SELECT tracking_id, delivery_id, latitude, longitude, accuracy_meters, recorded_at, notes
+        FROM delivery_tracking_points_old;
+
+        DROP TABLE delivery_tracking_points_old;
+
+        COMMENT ON TABLE delivery_tracking_points IS 'Точки геолокации доставок, дневные партиции по recorded_at (UTC)';
+        COMMENT ON COLUMN delivery_tracking_points.latitude IS 'Широта (-90 до 90)';
+        COMMENT ON COLUMN delivery_tracking_points.longitude IS 'Долгота (-180 до 180)';
+        COMMENT ON COLUMN delivery_tracking_points.accuracy_meters IS 'Точность позиции в метрах';
+        """,
+
+        """
+        CREATE TABLE delivery_tracking_points_plain (
+            tracking_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            delivery_id UUID NOT NULL REFERENCES deliveries(delivery_id) ON DELETE CASCADE,
+            latitude DECIMAL(10, 8) NOT NULL,
+            longitude DECIMAL(11, 8) NOT NULL,
+            accuracy_meters INTEGER,
+            recorded_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+            notes TEXT,
+
+            CONSTRAINT ck_latitude CHECK (latitude >= -90 AND latitude <= 90),
+            CONSTRAINT ck_longitude CHECK (longitude >= -180 AND longitude <= 180),
+            CONSTRAINT ck_accuracy CHECK (accuracy_meters IS NULL OR accuracy_meters > 0)
+        );
+
+        INSERT INTO delivery_tracking_points_plain (
+            tracking_id, delivery_id, latitude, longitude, accuracy_meters, recorded_at, notes
+        )
+        SELECT tracking_id, delivery_id, latitude, longitude, accuracy_meters, recorded_at, notes
+        FROM delivery_tracking_points;
+
+        DROP TABLE delivery_tracking_points CASCADE;
+        DROP FUNCTION IF EXISTS drop_tracking_partitions(DATE);
+        DROP FUNCTION IF EXISTS ensure_tracking_partitions(DATE, INTEGER);
+        DROP FUNCTION IF EXISTS create_tracking_partition(DATE);
+        DROP TABLE IF EXISTS tracking_compactions;
+
+        ALTER TABLE delivery_tracking_points_plain RENAME TO delivery_tracking_points;
+        ALTER TABLE delivery_tracking_points
+            RENAME CONSTRAINT delivery_tracking_points_plain_pkey TO delivery_tracking_points_pkey;
+
+        CREATE UNIQUE INDEX uq_tracking_delivery_recorded
+        ON delivery_tracking_points(delivery_id, recorded_at DESC);
+        CREATE INDEX idx_tracking_recorded_at ON delivery_tracking_points(recorded_at DESC);
+        CREATE INDEX idx_tracking_location ON delivery_tracking_points(latitude, longitude);
+        """
+    )
+]
@@ -12,9 +12,12 @@ from src.infra.db.courier_repository import (
 from src.infra.db.delivery_repository import (
     AsyncPostgresDeliveryRepository
 )
+from src.infra.db.tracking_repository import AsyncPostgresTrackingRepository
 
 from src.app.services.courier import CourierService
 from src.app.services.delivery import DeliveryService
+from src.app.services.courier_locator import CourierLocator
+from src.app.services.tracking import TrackingBuffer, TrackingService
 
 event_queue_provider = EventQueueProvider(
     use_kafka=settings.USE_KAFKA,
@@ -30,6 +33,13 @@ db_provider = PostgresPoolProvider(
 
 get_event_queue = event_queue_provider
 
+tracking_buffer = TrackingBuffer(
+    flush_size=settings.TRACKING_FLUSH_SIZE,
+    max_points=settings.TRACKING_MAX_BUFFERED_POINTS,
+)
+
+courier_locator = CourierLocator(ttl_seconds=settings.COURIER_POSITION_TTL_SECONDS)
+
 auth_provider = JWTAuthProvider(
     secret_key=settings.JWT_SECRET_KEY,
     algorithm=settings.JWT_ALGORITHM,
@@ -61,3 +71,19 @@ async def get_delivery_service(
     repository: AsyncPostgresDeliveryRepository = Depends(get_delivery_repository)
 ) -> DeliveryService:
     return DeliveryService(repository=repository)
+
+
+async def get_tracking_repository(
+    pool: asyncpg.Pool = Depends(db_provider)
+) -> AsyncPostgresTrackingRepository:
+    return AsyncPostgresTrackingRepository(pool)
+
+
+async def get_tracking_service(
+    repository: AsyncPostgresTrackingRepository = Depends(get_tracking_repository)
+) -> TrackingService:
+    return TrackingService(repository=repository, buffer=tracking_buffer)
+
+
+def get_courier_locator() -> CourierLocator:
+    return courier_locator
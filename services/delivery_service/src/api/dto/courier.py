@@ -1,4 +1,5 @@
 from uuid import UUID
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -20,3 +21,12 @@ class CourierDTO(BaseModel):
 class CourierUpdateDTO(BaseModel):
     name: Optional[str] = Field(None, min_length=2, max_length=100)
     contact_info: Optional[str] = Field(None, min_length=5)
+
+
+class CourierNearbyDTO(BaseModel):
+    courier_id: UUID
+    delivery_id: UUID
+    latitude: float
+    longitude: float
+    recorded_at: datetime
+    distance_meters: float
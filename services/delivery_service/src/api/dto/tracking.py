@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class TrackingPointDTO(BaseModel):
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+    recorded_at: datetime
+    accuracy_meters: Optional[int] = Field(default=None, gt=0)
+
+
+class TrackingIngestResultDTO(BaseModel):
+    accepted: int
+    duplicates: int
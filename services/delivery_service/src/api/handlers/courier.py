@@ -5,14 +5,17 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from starlette import status
 
 from libs.auth import require_role
-from src.api.deps.getters import get_courier_service, get_current_user
+from src.api.deps.getters import get_courier_service, get_current_user, get_courier_locator
 from src.api.dto.courier import (
     CourierDTO,
     CourierCreateDTO,
-    CourierUpdateDTO
+    CourierUpdateDTO,
+    CourierNearbyDTO
 )
 from src.api.mappers.courier import CourierMapper
 from src.app.services.courier import CourierService
+from src.app.services.courier_locator import CourierLocator
+from src.config import settings
 
 courier_router = APIRouter(
     prefix="/couriers",
@@ -37,6 +40,24 @@ async def create_courier(
     return CourierMapper.entity_to_dto(created)
 
 
+@courier_router.get(
+    "/nearby",
+    response_model=List[CourierNearbyDTO],
+)
+async def get_nearby_couriers(
+        lat: float = Query(..., ge=-90, le=90),
+        lon: float = Query(..., ge=-180, le=180),
+        radius: float = Query(..., gt=0, le=settings.COURIER_NEARBY_MAX_RADIUS_METERS, description="Радиус в метрах"),
+        limit: int = Query(20, ge=1, le=500),
+        locator: CourierLocator = Depends(get_courier_locator),
+):
+    """Курьеры со свежей позицией в радиусе от точки, ближайшие первыми. Отвечает из памяти, без БД."""
+    return [
+        CourierMapper.position_to_nearby_dto(position, distance)
+        for position, distance in locator.nearby(lat, lon, radius, limit)
+    ]
+
+
 @courier_router.get(
     "/{courier_id}",
     response_model=CourierDTO,
@@ -1,8 +1,10 @@
+import json
 from uuid import UUID
-from typing import List
+from typing import Any, List
 from datetime import datetime, timezone, date
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import ValidationError
 from starlette import status
 
 from libs.auth import require_role
@@ -13,18 +15,24 @@ from src.api.deps.getters import (
     get_courier_service,
     get_current_user,
     get_event_queue,
+    get_tracking_service,
 )
+from src.config import settings
 
 from src.api.dto.delivery import (
     DeliveryDTO,
     DeliveryCreateDTO,
     DeliveryUpdateDTO
 )
+from src.api.dto.tracking import TrackingPointDTO, TrackingIngestResultDTO
 from src.api.mappers.delivery import DeliveryMapper
+from src.api.mappers.tracking import TrackingMapper
 
 from src.app.services.courier import CourierService
 from src.app.services.delivery import DeliveryService
+from src.app.services.tracking import TrackingService
 from src.domain.entities.delivery import Delivery, DeliveryStatus
+from src.domain.errors.tracking import TrackingBufferFullError
 
 delivery_router = APIRouter(
     prefix="/deliveries",
@@ -169,6 +177,7 @@ async def delete_delivery(
 async def mark_delivery_in_transit(
         delivery_id: UUID,
         service: DeliveryService = Depends(get_delivery_service),
+        tracking_service: TrackingService = Depends(get_tracking_service),
         event_queue: EventQueuePort = Depends(get_event_queue),
 ):
     delivery = await service.get(delivery_id)
@@ -178,9 +187,13 @@ async def mark_delivery_in_transit(
     await service.mark_as_in_transit(delivery_id)
     saved = await service.get(delivery_id)
 
+    # До первого GPS-пинга курьер считается на складе
+    position = await tracking_service.get_latest(delivery_id)
     domain_event = DeliveryInTransit(
         delivery_id=saved.delivery_id,
-        current_location="Warehouse",
+        current_location=position.location if position else "Warehouse",
+        latitude=position.latitude if position else None,
+        longitude=position.longitude if position else None,
         updated_at=datetime.now(timezone.utc)
     )
     await event_queue.publish_event(DomainEventConverter.to_event(domain_event), topic="delivery-events")
@@ -188,6 +201,46 @@ async def mark_delivery_in_transit(
     return DeliveryMapper.entity_to_dto(saved)
 
 
+@delivery_router.post(
+    "/{delivery_id}/tracking",
+    response_model=TrackingIngestResultDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def ingest_tracking_points(
+        delivery_id: UUID,
+        request: Request,
+        service: TrackingService = Depends(get_tracking_service),
+):
+    """
+    Пачка GPS-точек с устройства: JSON-массив или NDJSON (application/x-ndjson).
+    Точки копятся в памяти и пишутся в БД фоновым сбросом; точки неизвестной доставки отбрасываются при записи.
+    """
+    raw_points = _parse_tracking_body(await request.body(), request.headers.get("content-type", ""))
+
+    points = []
+    for index, raw in enumerate(raw_points, start=1):
+        try:
+            if isinstance(raw, (str, bytes)):
+                raw = json.loads(raw)
+            points.append(TrackingMapper.dto_to_point(delivery_id, TrackingPointDTO.model_validate(raw)))
+        except (ValidationError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid point {index}",
+            )
+
+    try:
+        accepted, duplicates = service.ingest(points)
+    except TrackingBufferFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+
+    return TrackingIngestResultDTO(accepted=accepted, duplicates=duplicates)
+
+
 @delivery_router.post(
     "/{delivery_id}/complete",
     response_model=DeliveryDTO,
@@ -214,3 +267,22 @@ async def complete_delivery(
     await event_queue.publish_event(DomainEventConverter.to_event(domain_event), topic="delivery-events")
 
     return DeliveryMapper.entity_to_dto(saved)
+
+
+def _parse_tracking_body(body: bytes, content_type: str) -> List[Any]:
+    """Строки NDJSON разбираются по одной при валидации, чтобы ошибка указывала номер точки."""
+    if "ndjson" in content_type:
+        raw_points: List[Any] = [line for line in body.splitlines() if line.strip()]
+    else:
+        try:
+            data = json.loads(body or b"[]")
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid JSON body")
+        raw_points = data if isinstance(data, list) else [data]
+
+    if len(raw_points) > settings.TRACKING_MAX_POINTS_PER_REQUEST:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Tracking batch is limited to {settings.TRACKING_MAX_POINTS_PER_REQUEST} points",
+        )
+    return raw_points
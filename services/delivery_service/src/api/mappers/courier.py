@@ -1,6 +1,6 @@
-from src.api.dto.courier import CourierCreateDTO, CourierUpdateDTO, CourierDTO
+from src.api.dto.courier import CourierCreateDTO, CourierUpdateDTO, CourierDTO, CourierNearbyDTO
 from src.domain.entities import Courier
-from src.domain.value_objects import FullName, ContactInfo
+from src.domain.value_objects import FullName, ContactInfo, CourierPosition
 
 
 class CourierMapper:
@@ -29,3 +29,14 @@ class CourierMapper:
             name=entity.name.value,
             contact_info=entity.contact_info.value
         )
+
+    @staticmethod
+    def position_to_nearby_dto(position: CourierPosition, distance_meters: float) -> CourierNearbyDTO:
+        return CourierNearbyDTO(
+            courier_id=position.courier_id,
+            delivery_id=position.delivery_id,
+            latitude=position.latitude,
+            longitude=position.longitude,
+            recorded_at=position.recorded_at,
+            distance_meters=round(distance_meters, 1)
+        )
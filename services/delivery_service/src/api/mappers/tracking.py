@@ -0,0 +1,22 @@
+from datetime import timezone
+from uuid import UUID
+
+from src.api.dto.tracking import TrackingPointDTO
+from src.domain.value_objects import TrackingPoint
+
+
+class TrackingMapper:
+    @staticmethod
+    def dto_to_point(delivery_id: UUID, dto: TrackingPointDTO) -> TrackingPoint:
+        # Устройства без часового пояса шлют UTC
+        recorded_at = dto.recorded_at
+        if recorded_at.tzinfo is None:
+            recorded_at = recorded_at.replace(tzinfo=timezone.utc)
+
+        return TrackingPoint(
+            delivery_id=delivery_id,
+            latitude=dto.latitude,
+            longitude=dto.longitude,
+            recorded_at=recorded_at,
+            accuracy_meters=dto.accuracy_meters,
+        )
@@ -0,0 +1,89 @@
+from typing import List, Tuple
+
+import numpy as np
+
+# Стоимость недопустимой пары: конечная, чтобы не ломать арифметику потенциалов
+INFEASIBLE = 1e12
+
+Pairs = List[Tuple[int, int]]
+
+
+def solve_hungarian(cost: np.ndarray) -> Pairs:
+    """
+    Оптимальное назначение строк столбцам (венгерский алгоритм, кратчайшие увеличивающие пути, O(n²·m)).
+    Внутренний проход по столбцам векторизован. Пары с недопустимой стоимостью не возвращаются.
+    """
+    rows, cols = cost.shape
+    if rows == 0 or cols == 0:
+        return []
+    if rows > cols:
+        return [(row, col) for col, row in solve_hungarian(cost.T)]
+
+    # Индексация с 1: столбец 0 — фиктивный корень увеличивающего пути
+    u = np.zeros(rows + 1)
+    v = np.zeros(cols + 1)
+    owner = np.zeros(cols + 1, dtype=np.int64)
+    way = np.zeros(cols + 1, dtype=np.int64)
+
+    for row in range(1, rows + 1):
+        owner[0] = row
+        col0 = 0
+        min_slack = np.full(cols + 1, np.inf)
+        used = np.zeros(cols + 1, dtype=bool)
+
+        while True:
+            used[col0] = True
+            row0 = owner[col0]
+            free = ~used[1:]
+
+            slack = cost[row0 - 1] - u[row0] - v[1:]
+            improved = free & (slack < min_slack[1:])
+            min_slack[1:][improved] = slack[improved]
+            way[1:][improved] = col0
+
+            candidates = np.where(free, min_slack[1:], np.inf)
+            col1 = int(np.argmin(candidates)) + 1
+            delta = candidates[col1 - 1]
+
+            u[owner[used]] += delta
+            v[used] -= delta
+            min_slack[1:][free] -= delta
+
+            col0 = col1
+            if owner[col0] == 0:
+                break
+
+        while col0:
+            col1 = way[col0]
+            owner[col0] = owner[col1]
+            col0 = col1
+
+    return [
+        (int(owner[col]) - 1, col - 1)
+        for col in range(1, cols + 1)
+        if owner[col] and cost[owner[col] - 1, col - 1] < INFEASIBLE
+    ]
+
+
+def solve_greedy(cost: np.ndarray) -> Pairs:
+    """Жадное назначение: пары по возрастанию стоимости, пока есть свободные строка и столбец. O(n·m·log(n·m))."""
+    rows, cols = cost.shape
+    if rows == 0 or cols == 0:
+        return []
+
+    order = np.argsort(cost, axis=None, kind="stable")
+    feasible = int(np.searchsorted(cost.ravel()[order], INFEASIBLE))
+    order_rows, order_cols = np.divmod(order[:feasible], cols)
+
+    row_taken = np.zeros(rows, dtype=bool)
+    col_taken = np.zeros(cols, dtype=bool)
+    limit = min(rows, cols)
+    pairs: Pairs = []
+    for row, col in zip(order_rows.tolist(), order_cols.tolist()):
+        if row_taken[row] or col_taken[col]:
+            continue
+        row_taken[row] = col_taken[col] = True
+        pairs.append((row, col))
+        if len(pairs) == limit:
+            break
+    return pairs
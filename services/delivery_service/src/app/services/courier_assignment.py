@@ -0,0 +1,183 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from src.app.services.assignment_solver import INFEASIBLE, solve_greedy, solve_hungarian
+from src.app.services.courier_locator import CourierLocator
+from src.domain.entities import Delivery
+from src.domain.entities.delivery import DeliveryStatus
+from src.domain.ports import DeliveryRepositoryPort
+from src.domain.ports.courier_repository import CourierRepositoryPort
+from src.domain.value_objects import AssignmentRequest, CourierCandidate
+from src.domain.value_objects.courier_position import EARTH_RADIUS_METERS
+
+ACTIVE_STATUSES = (DeliveryStatus.ASSIGNED, DeliveryStatus.IN_TRANSIT)
+
+
+class CourierAssignmentEngine:
+    """
+    Назначение курьеров пачке доставок. Стоимость пары — взвешенная сумма расстояния до точки забора,
+    текущей загрузки курьера и ETA (дорога плюс время на уже взятые доставки); матрица стоимостей
+    считается NumPy целиком. За раунд курьер получает не больше одной доставки, загрузка растет между раундами.
+    Матрицы крупнее hungarian_max_size решаются жадно: венгерский алгоритм кубический по размеру.
+    """
+
+    def __init__(
+            self,
+            max_active_deliveries: int = 5,
+            average_speed_kmh: float = 25.0,
+            minutes_per_active_delivery: float = 20.0,
+            distance_weight: float = 1.0,
+            load_weight: float = 2.0,
+            eta_weight: float = 0.5,
+            unknown_distance_km: float = 20.0,
+            max_distance_km: float = 50.0,
+            hungarian_max_size: int = 300,
+    ):
+        self._max_active = max_active_deliveries
+        self._speed_kmh = average_speed_kmh
+        self._minutes_per_active = minutes_per_active_delivery
+        self._distance_weight = distance_weight
+        self._load_weight = load_weight
+        self._eta_weight = eta_weight
+        self._unknown_distance_km = unknown_distance_km
+        self._max_distance_km = max_distance_km
+        self._hungarian_max_size = hungarian_max_size
+
+    def assign(
+            self,
+            requests: Sequence[AssignmentRequest],
+            couriers: Sequence[CourierCandidate],
+    ) -> Dict[UUID, Tuple[UUID, float]]:
+        """delivery_id -> (courier_id, ETA в минутах); доставки без допустимого курьера в результат не попадают."""
+        if not requests or not couriers:
+            return {}
+
+        distances = self.distance_matrix(requests, couriers)
+        loads = np.array([c.active_deliveries for c in couriers], dtype=np.float64)
+
+        assignment: Dict[UUID, Tuple[UUID, float]] = {}
+        remaining = np.arange(len(requests))
+        while remaining.size:
+            cost = self.cost_matrix(distances[remaining], loads)
+            pairs = self._solve(cost)
+            if not pairs:
+                break
+
+            assigned_rows = np.zeros(remaining.size, dtype=bool)
+            for row, col in pairs:
+                eta = self.estimated_minutes(float(distances[remaining[row], col]), loads[col])
+                assignment[requests[remaining[row]].delivery_id] = (couriers[col].courier_id, eta)
+                loads[col] += 1
+                assigned_rows[row] = True
+            remaining = remaining[~assigned_rows]
+
+        return assignment
+
+    def distance_matrix(
+            self,
+            requests: Sequence[AssignmentRequest],
+            couriers: Sequence[CourierCandidate],
+    ) -> np.ndarray:
+        """Расстояния в км (доставки × курьеры). Без точки забора расстояние не учитывается, без позиции курьера — штраф."""
+        req_lat = np.array([r.pickup_latitude if r.has_pickup else np.nan for r in requests], dtype=np.float64)
+        req_lon = np.array([r.pickup_longitude if r.has_pickup else np.nan for r in requests], dtype=np.float64)
+        cour_lat = np.array([np.nan if c.latitude is None else c.latitude for c in couriers], dtype=np.float64)
+        cour_lon = np.array([np.nan if c.longitude is None else c.longitude for c in couriers], dtype=np.float64)
+
+        phi1, phi2 = np.radians(req_lat)[:, None], np.radians(cour_lat)[None, :]
+        d_lambda = np.radians(cour_lon[None, :] - req_lon[:, None])
+        a = np.sin((phi2 - phi1) / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+        distances = 2 * EARTH_RADIUS_METERS / 1000 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+        distances = np.where(np.isnan(cour_lat)[None, :], self._unknown_distance_km, distances)
+        return np.where(np.isnan(req_lat)[:, None], 0.0, distances)
+
+    def cost_matrix(self, distances: np.ndarray, loads: np.ndarray) -> np.ndarray:
+        eta_minutes = distances / self._speed_kmh * 60 + loads[None, :] * self._minutes_per_active
+        cost = (
+            self._distance_weight * distances
+            + self._load_weight * loads[None, :]
+            + self._eta_weight * eta_minutes
+        )
+        cost[distances > self._max_distance_km] = INFEASIBLE
+        cost[:, loads >= self._max_active] = INFEASIBLE
+        return cost
+
+    @property
+    def max_active_deliveries(self) -> int:
+        return self._max_active
+
+    def estimated_minutes(self, distance_km: float, active_deliveries: float) -> float:
+        return distance_km / self._speed_kmh * 60 + active_deliveries * self._minutes_per_active
+
+    def _solve(self, cost: np.ndarray) -> List[Tuple[int, int]]:
+        if min(cost.shape) <= self._hungarian_max_size:
+            return solve_hungarian(cost)
+        return solve_greedy(cost)
+
+
+class CourierAssignmentService:
+
+    def __init__(
+            self,
+            delivery_repository: DeliveryRepositoryPort,
+            courier_repository: CourierRepositoryPort,
+            locator: CourierLocator,
+            engine: CourierAssignmentEngine,
+    ):
+        self._deliveries = delivery_repository
+        self._couriers = courier_repository
+        self._locator = locator
+        self._engine = engine
+
+    async def assign(self, requests: Sequence[AssignmentRequest]) -> Tuple[List[Delivery], List[AssignmentRequest]]:
+        """
+        Создает доставки с подобранными курьерами. Повторная команда для существующей доставки пропускается.
+        Возвращает (созданные доставки, запросы без свободного курьера).
+        """
+        unique = list({request.delivery_id: request for request in requests}.values())
+        existing = await self._deliveries.get_courier_ids([r.delivery_id for r in unique])
+        pending = [r for r in unique if r.delivery_id not in existing]
+        if not pending:
+            return [], []
+
+        available = await self._couriers.get_available(
+            [status.value for status in ACTIVE_STATUSES],
+            self._engine.max_active_deliveries,
+        )
+        couriers = {courier.courier_id: courier for courier, _ in available}
+        candidates = [self._candidate(courier.courier_id, active) for courier, active in available]
+
+        # Решение CPU-bound (венгерский алгоритм на тысячах пар — секунды), поэтому не на event loop
+        assignment = await asyncio.to_thread(self._engine.assign, pending, candidates)
+
+        now = datetime.now(timezone.utc)
+        deliveries = []
+        for request in pending:
+            if request.delivery_id not in assignment:
+                continue
+            courier_id, eta_minutes = assignment[request.delivery_id]
+            deliveries.append(Delivery(
+                delivery_id=request.delivery_id,
+                shipment_id=request.shipment_id,
+                courier=couriers[courier_id],
+                status=DeliveryStatus.ASSIGNED,
+                estimated_arrival=(now + timedelta(minutes=eta_minutes)).date(),
+            ))
+
+        created = await self._deliveries.create_many(deliveries)
+        unassigned = [r for r in pending if r.delivery_id not in assignment]
+        return created, unassigned
+
+    def _candidate(self, courier_id: UUID, active_deliveries: int) -> CourierCandidate:
+        position = self._locator.get(courier_id)
+        return CourierCandidate(
+            courier_id=courier_id,
+            active_deliveries=active_deliveries,
+            latitude=position.latitude if position else None,
+            longitude=position.longitude if position else None,
+        )
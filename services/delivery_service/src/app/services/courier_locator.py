@@ -0,0 +1,116 @@
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.domain.value_objects import CourierPosition
+from src.domain.value_objects.courier_position import EARTH_RADIUS_METERS
+
+Cell = Tuple[int, int]
+
+
+class CourierLocator:
+    """
+    Последние позиции курьеров в памяти с индексом по сетке cell_degrees × cell_degrees.
+    Поиск рядом обходит только ячейки, покрывающие круг заданного радиуса; если таких ячеек
+    больше, чем курьеров, дешевле просмотреть всех курьеров подряд.
+    """
+
+    def __init__(self, cell_degrees: float = 0.01, ttl_seconds: int = 300):
+        self._cell = cell_degrees
+        # Число столбцов сетки по долготе: индекс столбца сворачивается через 180-й меридиан
+        self._columns = round(360 / cell_degrees)
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._positions: Dict[UUID, CourierPosition] = {}
+        self._cells: Dict[Cell, Set[UUID]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def get(self, courier_id: UUID) -> Optional[CourierPosition]:
+        return self._positions.get(courier_id)
+
+    def update(self, positions: Iterable[CourierPosition]) -> List[CourierPosition]:
+        """Применяет позиции новее уже известных. Возвращает примененные."""
+        applied = []
+        for position in positions:
+            current = self._positions.get(position.courier_id)
+            if current is not None and current.recorded_at >= position.recorded_at:
+                continue
+
+            if current is not None:
+                self._unlink(current)
+            self._positions[position.courier_id] = position
+            self._cells.setdefault(self._cell_of(position.latitude, position.longitude), set()).add(position.courier_id)
+            applied.append(position)
+        return applied
+
+    def prune(self, now: Optional[datetime] = None) -> List[UUID]:
+        """Забывает курьеров без пингов дольше ttl. Возвращает их ID."""
+        threshold = (now or datetime.now(timezone.utc)) - self._ttl
+        stale = [courier_id for courier_id, p in self._positions.items() if p.recorded_at < threshold]
+        for courier_id in stale:
+            self._unlink(self._positions.pop(courier_id))
+        return stale
+
+    def nearby(
+            self,
+            latitude: float,
+            longitude: float,
+            radius_meters: float,
+            limit: int = 20,
+            now: Optional[datetime] = None,
+    ) -> List[Tuple[CourierPosition, float]]:
+        """Свежие позиции в радиусе с расстоянием в метрах, по возрастанию расстояния."""
+        threshold = (now or datetime.now(timezone.utc)) - self._ttl
+
+        found = []
+        for position in self._candidates(latitude, longitude, radius_meters):
+            if position.recorded_at < threshold:
+                continue
+            distance = position.distance_to(latitude, longitude)
+            if distance <= radius_meters:
+                found.append((position, distance))
+
+        found.sort(key=lambda entry: entry[1])
+        return found[:limit]
+
+    def _candidates(self, latitude: float, longitude: float, radius_meters: float) -> Iterable[CourierPosition]:
+        lat_delta = math.degrees(radius_meters / EARTH_RADIUS_METERS)
+        lat_min, lat_max = max(-90.0, latitude - lat_delta), min(90.0, latitude + lat_delta)
+
+        # Ширина круга по долготе максимальна на самой удаленной от экватора широте круга
+        widest = max(abs(lat_min), abs(lat_max))
+        if widest >= 90.0:
+            lon_delta = 180.0
+        else:
+            lon_delta = min(180.0, math.degrees(radius_meters / (EARTH_RADIUS_METERS * math.cos(math.radians(widest)))))
+
+        row_min, row_max = math.floor(lat_min / self._cell), math.floor(lat_max / self._cell)
+        col_min, col_max = math.floor((longitude - lon_delta) / self._cell), math.floor((longitude + lon_delta) / self._cell)
+        columns = min(col_max - col_min + 1, self._columns)
+
+        if (row_max - row_min + 1) * columns > len(self._positions):
+            return list(self._positions.values())
+
+        candidates = []
+        for row in range(row_min, row_max + 1):
+            for col in range(col_min, col_min + columns):
+                for courier_id in self._cells.get((row, self._wrap(col)), ()):
+                    candidates.append(self._positions[courier_id])
+        return candidates
+
+    def _cell_of(self, latitude: float, longitude: float) -> Cell:
+        return math.floor(latitude / self._cell), self._wrap(math.floor(longitude / self._cell))
+
+    def _wrap(self, column: int) -> int:
+        half = self._columns // 2
+        return (column + half) % self._columns - half
+
+    def _unlink(self, position: CourierPosition) -> None:
+        cell = self._cell_of(position.latitude, position.longitude)
+        members = self._cells.get(cell)
+        if members is not None:
+            members.discard(position.courier_id)
+            if not members:
+                del self._cells[cell]
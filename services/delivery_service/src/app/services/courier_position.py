@@ -0,0 +1,49 @@
+from typing import Optional, Sequence
+
+from src.app.services.courier_locator import CourierLocator
+from src.app.services.tracking import latest_by_delivery
+from src.domain.ports import CourierPositionMirrorPort, DeliveryRepositoryPort
+from src.domain.value_objects import CourierPosition, TrackingPoint
+
+
+class CourierPositionService:
+
+    def __init__(
+            self,
+            repository: DeliveryRepositoryPort,
+            locator: CourierLocator,
+            mirror: Optional[CourierPositionMirrorPort] = None,
+    ):
+        self._repository = repository
+        self._locator = locator
+        self._mirror = mirror
+
+    async def record(self, points: Sequence[TrackingPoint]) -> int:
+        """Обновляет позиции курьеров по последним точкам их доставок. Возвращает число обновленных курьеров."""
+        latest = latest_by_delivery(points)
+        courier_ids = await self._repository.get_courier_ids(list(latest))
+
+        applied = self._locator.update(
+            CourierPosition(
+                courier_id=courier_ids[delivery_id],
+                delivery_id=delivery_id,
+                latitude=point.latitude,
+                longitude=point.longitude,
+                recorded_at=point.recorded_at,
+            )
+            for delivery_id, point in latest.items()
+            if delivery_id in courier_ids
+        )
+
+        if self._mirror is not None and applied:
+            await self._mirror.publish(applied)
+        return len(applied)
+
+    async def sync(self) -> None:
+        """Подтягивает позиции других реплик из зеркала и забывает устаревшие."""
+        if self._mirror is not None:
+            self._locator.update(await self._mirror.load())
+
+        stale = self._locator.prune()
+        if self._mirror is not None and stale:
+            await self._mirror.remove(stale)
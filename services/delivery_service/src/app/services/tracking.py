@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from src.domain.errors.tracking import TrackingBufferFullError
+from src.domain.ports import TrackingRepositoryPort
+from src.domain.value_objects import TrackingPoint
+
+
+def latest_by_delivery(points: Iterable[TrackingPoint]) -> Dict[UUID, TrackingPoint]:
+    """Самая поздняя точка каждой доставки."""
+    latest: Dict[UUID, TrackingPoint] = {}
+    for point in points:
+        current = latest.get(point.delivery_id)
+        if current is None or point.recorded_at > current.recorded_at:
+            latest[point.delivery_id] = point
+    return latest
+
+
+class TrackingBuffer:
+    """
+    Точки трекинга в памяти между приемом по HTTP и загрузкой в БД.
+    Повтор (доставка, момент фиксации) отбрасывается еще до записи. Последняя точка
+    каждой доставки хранится отдельно и переживает сброс буфера.
+    """
+
+    def __init__(self, flush_size: int = 5000, max_points: int = 100_000, latest_ttl_seconds: int = 3600):
+        self._flush_size = flush_size
+        self._max_points = max_points
+        self._latest_ttl = timedelta(seconds=latest_ttl_seconds)
+        self._points: Dict[Tuple[UUID, datetime], TrackingPoint] = {}
+        self._latest: Dict[UUID, TrackingPoint] = {}
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def add(self, points: Sequence[TrackingPoint]) -> Tuple[int, int]:
+        """Возвращает (принято, повторов). Переполненный буфер не принимает пачку целиком."""
+        fresh: Dict[Tuple[UUID, datetime], TrackingPoint] = {}
+        for point in points:
+            if point.key in self._points or self._is_latest(point):
+                continue
+            fresh.setdefault(point.key, point)
+
+        if len(self._points) + len(fresh) > self._max_points:
+            raise TrackingBufferFullError(
+                f"Tracking buffer is full ({len(self._points)} of {self._max_points} points)"
+            )
+
+        self._store(fresh.values())
+        return len(fresh), len(points) - len(fresh)
+
+    def drain(self) -> List[TrackingPoint]:
+        points = list(self._points.values())
+        self._points = {}
+        self._ready.clear()
+        return points
+
+    def restore(self, points: Iterable[TrackingPoint]) -> int:
+        """Возвращает в буфер точки неудачного сброса, пока есть место. Возвращает число возвращенных точек."""
+        restored = 0
+        for point in points:
+            if len(self._points) >= self._max_points:
+                break
+            if point.key not in self._points:
+                self._points[point.key] = point
+                restored += 1
+        if len(self._points) >= self._flush_size:
+            self._ready.set()
+        return restored
+
+    async def wait_ready(self, timeout: float) -> None:
+        """Ждет накопления flush_size точек, но не дольше timeout секунд."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def latest(self, delivery_id: UUID) -> Optional[TrackingPoint]:
+        return self._latest.get(delivery_id)
+
+    def prune_latest(self, now: Optional[datetime] = None) -> None:
+        """Забывает последние точки доставок, по которым давно не было пингов."""
+        threshold = (now or datetime.now(timezone.utc)) - self._latest_ttl
+        self._latest = {
+            delivery_id: point
+            for delivery_id, point in self._latest.items()
+            if point.recorded_at >= threshold
+        }
+
+    def _store(self, points: Iterable[TrackingPoint]) -> None:
+        for point in points:
+            self._points[point.key] = point
+            current = self._latest.get(point.delivery_id)
+            if current is None or point.recorded_at > current.recorded_at:
+                self._latest[point.delivery_id] = point
+
+        if len(self._points) >= self._flush_size:
+            self._ready.set()
+
+    def _is_latest(self, point: TrackingPoint) -> bool:
+        current = self._latest.get(point.delivery_id)
+        return current is not None and current.recorded_at == point.recorded_at
+
+
+class TrackingService:
+
+    def __init__(self, repository: TrackingRepositoryPort, buffer: TrackingBuffer):
+        self._repository = repository
+        self._buffer = buffer
+
+    def ingest(self, points: Sequence[TrackingPoint]) -> Tuple[int, int]:
+        return self._buffer.add(points)
+
+    async def get_latest(self, delivery_id: UUID) -> Optional[TrackingPoint]:
+        """Последняя позиция из памяти; после рестарта сервиса — из БД."""
+        point = self._buffer.latest(delivery_id)
+        if point is not None:
+            return point
+        return await self._repository.get_latest(delivery_id)
@@ -0,0 +1,97 @@
+import math
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from typing import List, Optional, Sequence, Tuple
+
+from src.domain.ports import TrackingRepositoryPort
+from src.domain.value_objects.courier_position import EARTH_RADIUS_METERS
+
+Coordinate = Tuple[float, float]
+
+
+def simplify_track(coordinates: Sequence[Coordinate], tolerance_meters: float) -> List[int]:
+    """
+    Douglas–Peucker по координатам (широта, долгота) в порядке времени.
+    Возвращает индексы сохраняемых точек; первая и последняя точка остаются всегда.
+    """
+    if len(coordinates) <= 2:
+        return list(range(len(coordinates)))
+
+    keep = [False] * len(coordinates)
+    keep[0] = keep[-1] = True
+
+    # Итеративно, без рекурсии: трек за день может содержать десятки тысяч точек
+    stack = [(0, len(coordinates) - 1)]
+    while stack:
+        start, end = stack.pop()
+        farthest, max_distance = start, 0.0
+        for index in range(start + 1, end):
+            distance = _distance_to_segment(coordinates[index], coordinates[start], coordinates[end])
+            if distance > max_distance:
+                farthest, max_distance = index, distance
+
+        if max_distance > tolerance_meters:
+            keep[farthest] = True
+            stack.append((start, farthest))
+            stack.append((farthest, end))
+
+    return [index for index, kept in enumerate(keep) if kept]
+
+
+def _distance_to_segment(point: Coordinate, start: Coordinate, end: Coordinate) -> float:
+    """Расстояние в метрах в локальной равнопромежуточной проекции вокруг начала отрезка."""
+    cos_lat = math.cos(math.radians(start[0]))
+
+    def project(coordinate: Coordinate) -> Tuple[float, float]:
+        return (
+            math.radians(coordinate[1] - start[1]) * cos_lat * EARTH_RADIUS_METERS,
+            math.radians(coordinate[0] - start[0]) * EARTH_RADIUS_METERS,
+        )
+
+    px, py = project(point)
+    ex, ey = project(end)
+    length_sq = ex * ex + ey * ey
+    if length_sq == 0:
+        return math.hypot(px, py)
+
+    t = max(0.0, min(1.0, (px * ex + py * ey) / length_sq))
+    return math.hypot(px - t * ex, py - t * ey)
+
+
+class TrackingMaintenanceService:
+    """
+    Обслуживание партиций delivery_tracking_points: создание партиций на дни вперед,
+    удаление дней старше retention_days и прореживание дней старше compact_after_days.
+    """
+
+    def __init__(
+            self,
+            repository: TrackingRepositoryPort,
+            partitions_ahead_days: int = 3,
+            retention_days: int = 90,
+            compact_after_days: int = 7,
+            tolerance_meters: float = 10.0,
+    ):
+        self._repository = repository
+        self._partitions_ahead_days = partitions_ahead_days
+        self._retention_days = retention_days
+        self._compact_after_days = compact_after_days
+        self._tolerance_meters = tolerance_meters
+
+    async def rollover(self, today: Optional[date] = None) -> int:
+        """Создает партиции на сегодня и вперед, удаляет просроченные. Возвращает число удаленных партиций."""
+        today = today or datetime.now(timezone.utc).date()
+        await self._repository.ensure_partitions(today, self._partitions_ahead_days + 1)
+        return await self._repository.drop_partitions_before(today - timedelta(days=self._retention_days))
+
+    async def compact(self, today: Optional[date] = None) -> List[Tuple[date, int, int]]:
+        """Прореживает непрореженные дни старше compact_after_days. Возвращает (день, было, стало)."""
+        today = today or datetime.now(timezone.utc).date()
+        days = await self._repository.get_uncompacted_days(today - timedelta(days=self._compact_after_days))
+
+        simplify = partial(simplify_track, tolerance_meters=self._tolerance_meters)
+        results = []
+        for day in days:
+            before, after = await self._repository.compact_day(day, simplify)
+            results.append((day, before, after))
+        return results
@@ -1,51 +1,178 @@
+import asyncio
 import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
 from libs.messaging.base import Command
+from libs.messaging.events import CourierAssigned, DeliveryFailed, DomainEventConverter
 from libs.messaging.ports import EventQueuePort
 from libs.observability.logger import get_json_logger, set_correlation_id
 
+from src.app.services.courier_assignment import CourierAssignmentService
 from src.app.services.delivery import DeliveryService
 from src.domain.errors.delivery import DeliveryNotFoundError
+from src.domain.value_objects import AssignmentRequest
 
 COMMAND_TOPIC = "delivery.commands"
+DELIVERY_TOPIC = "delivery-events"
+
+_END = object()
 
 
 class DeliveryCommandWorker:
+    """
+    Обработчик команд саги. Команды courier.assign копятся в пачку (до batch_size штук
+    или batch_window_seconds ожидания) и назначаются совместно: курьеры распределяются
+    по всей пачке сразу, а не первому пришедшему.
+    """
 
-    def __init__(self, event_queue: EventQueuePort, delivery_service: DeliveryService):
+    def __init__(
+            self,
+            event_queue: EventQueuePort,
+            delivery_service: DeliveryService,
+            assignment_service: Optional[CourierAssignmentService] = None,
+            batch_size: int = 200,
+            batch_window_seconds: float = 0.05,
+    ):
         self.queue = event_queue
         self.service = delivery_service
+        self.assignment = assignment_service
+        self.batch_size = batch_size
+        self.batch_window = batch_window_seconds
         self.logger = get_json_logger("delivery_command_worker")
 
     async def run(self):
         self.logger.info("Delivery Command Worker running", extra={"topic": COMMAND_TOPIC})
 
-        async for command in self.queue.consume_command(COMMAND_TOPIC):
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=self.batch_size * 2)
+        reader = asyncio.create_task(self._read_commands(buffer))
+        try:
+            while True:
+                batch, finished = await self._next_batch(buffer)
+                if batch:
+                    try:
+                        await self._handle_batch(batch)
+                    except Exception as e:
+                        self.logger.error(
+                            "Error handling command batch",
+                            exc_info=e,
+                            extra={"command_ids": [str(c.command_id) for c in batch]},
+                        )
+                if finished:
+                    break
+        finally:
+            reader.cancel()
+
+    async def _read_commands(self, buffer: asyncio.Queue) -> None:
+        try:
+            async for command in self.queue.consume_command(COMMAND_TOPIC):
+                await buffer.put(command)
+        except Exception as e:
+            self.logger.error("Command consumer failed", exc_info=e)
+        await buffer.put(_END)
+
+    async def _next_batch(self, buffer: asyncio.Queue):
+        """Первая команда ждется без таймаута, остальные — не дольше окна пачки."""
+        first = await buffer.get()
+        if first is _END:
+            return [], True
+
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_window
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            try:
+                command = buffer.get_nowait() if timeout <= 0 else await asyncio.wait_for(buffer.get(), timeout)
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+            if command is _END:
+                return batch, True
+            batch.append(command)
+
+        return batch, False
+
+    async def _handle_batch(self, commands: List[Command]) -> None:
+        requests: List[AssignmentRequest] = []
+        correlations: Dict[uuid.UUID, Optional[uuid.UUID]] = {}
+
+        for command in commands:
             if command.correlation_id:
                 set_correlation_id(str(command.correlation_id))
 
-            try:
-                await self._handle_command(command)
-            except Exception as e:
-                self.logger.error(
-                    f"Error handling command {command.command_type}",
-                    exc_info=e,
-                    extra={"command_id": str(command.command_id)},
+            self.logger.info(
+                "Processing command",
+                extra={"command_type": command.command_type, "aggregate_id": str(command.aggregate_id)},
+            )
+
+            if command.command_type == "courier.assign" and self.assignment is not None:
+                request = self._parse_assign_request(command)
+                if request is not None:
+                    requests.append(request)
+                    correlations[request.delivery_id] = command.correlation_id
+            elif command.command_type == "courier.unassign":
+                try:
+                    await self._handle_unassign_courier(command)
+                except Exception as e:
+                    self.logger.error(
+                        f"Error handling command {command.command_type}",
+                        exc_info=e,
+                        extra={"command_id": str(command.command_id)},
+                    )
+            else:
+                self.logger.warning(
+                    "Unknown command type — skipping",
+                    extra={"command_type": command.command_type},
                 )
 
-    async def _handle_command(self, command: Command) -> None:
+        if requests:
+            await self._assign_couriers(requests, correlations)
+
+    def _parse_assign_request(self, command: Command) -> Optional[AssignmentRequest]:
+        payload = command.payload
+        try:
+            return AssignmentRequest(
+                delivery_id=uuid.UUID(str(payload.get("delivery_id") or command.aggregate_id)),
+                shipment_id=uuid.UUID(str(payload["shipment_id"])),
+                pickup_latitude=_optional_float(payload.get("pickup_latitude")),
+                pickup_longitude=_optional_float(payload.get("pickup_longitude")),
+            )
+        except (KeyError, TypeError, ValueError):
+            self.logger.error("Invalid courier.assign payload", extra={"payload": payload})
+            return None
+
+    async def _assign_couriers(
+            self,
+            requests: List[AssignmentRequest],
+            correlations: Dict[uuid.UUID, Optional[uuid.UUID]],
+    ) -> None:
+        created, unassigned = await self.assignment.assign(requests)
+        now = datetime.now(timezone.utc)
+
         self.logger.info(
-            "Processing command",
-            extra={"command_type": command.command_type, "aggregate_id": str(command.aggregate_id)},
+            "Couriers assigned",
+            extra={"requested": len(requests), "assigned": len(created), "unassigned": len(unassigned)},
         )
 
-        if command.command_type == "courier.unassign":
-            await self._handle_unassign_courier(command)
-        else:
-            self.logger.warning(
-                "Unknown command type — skipping",
-                extra={"command_type": command.command_type},
+        for delivery in created:
+            domain_event = CourierAssigned(
+                delivery_id=delivery.delivery_id,
+                courier_id=delivery.courier.courier_id,
+                shipment_id=delivery.shipment_id,
+                estimated_delivery=datetime.combine(delivery.estimated_arrival, datetime.min.time(), tzinfo=timezone.utc),
+                assigned_at=now,
+            )
+            event = DomainEventConverter.to_event(domain_event, correlations.get(delivery.delivery_id))
+            await self.queue.publish_event(event, DELIVERY_TOPIC)
+
+        for request in unassigned:
+            domain_event = DeliveryFailed(
+                delivery_id=request.delivery_id,
+                reason="No available courier",
+                failed_at=now,
             )
+            event = DomainEventConverter.to_event(domain_event, correlations.get(request.delivery_id))
+            await self.queue.publish_event(event, DELIVERY_TOPIC)
 
     async def _handle_unassign_courier(self, command: Command) -> None:
         delivery_id_raw = command.payload.get("delivery_id") or str(command.aggregate_id)
@@ -68,3 +195,7 @@ class DeliveryCommandWorker:
                 "Delivery not found during compensation — already deleted?",
                 extra={"delivery_id": str(delivery_id)},
             )
+
+
+def _optional_float(value) -> Optional[float]:
+    return None if value is None else float(value)
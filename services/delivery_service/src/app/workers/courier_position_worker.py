@@ -0,0 +1,27 @@
+import asyncio
+
+from libs.observability.logger import get_json_logger
+
+from src.app.services.courier_position import CourierPositionService
+
+
+class CourierPositionSyncWorker:
+    """
+    Раз в interval_seconds подтягивает в локальный индекс позиции курьеров,
+    принятые другими репликами, и забывает курьеров без свежих пингов.
+    """
+
+    def __init__(self, service: CourierPositionService, interval_seconds: float = 2.0):
+        self.service = service
+        self.interval = interval_seconds
+        self.logger = get_json_logger("courier_position_sync_worker")
+
+    async def run(self):
+        self.logger.info("Courier Position Sync Worker running", extra={"interval_seconds": self.interval})
+
+        while True:
+            try:
+                await self.service.sync()
+            except Exception as e:
+                self.logger.error("Error syncing courier positions", exc_info=e)
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,41 @@
+import asyncio
+
+from libs.observability.logger import get_json_logger
+
+from src.app.services.tracking_maintenance import TrackingMaintenanceService
+
+
+class TrackingMaintenanceWorker:
+    """
+    Раз в interval_seconds создает партиции точек трекинга на дни вперед, удаляет просроченные
+    и прореживает старые дни. Первый проход — сразу при старте сервиса.
+    """
+
+    def __init__(self, service: TrackingMaintenanceService, interval_seconds: int = 3600):
+        self.service = service
+        self.interval = interval_seconds
+        self.logger = get_json_logger("tracking_maintenance_worker")
+
+    async def run(self):
+        self.logger.info("Tracking Maintenance Worker running", extra={"interval_seconds": self.interval})
+
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> None:
+        try:
+            dropped = await self.service.rollover()
+            if dropped:
+                self.logger.info("Expired tracking partitions dropped", extra={"partitions": dropped})
+        except Exception as e:
+            self.logger.error("Error rolling over tracking partitions", exc_info=e)
+
+        try:
+            for day, before, after in await self.service.compact():
+                self.logger.info(
+                    "Tracking day compacted",
+                    extra={"day": day.isoformat(), "points_before": before, "points_after": after},
+                )
+        except Exception as e:
+            self.logger.error("Error compacting tracking points", exc_info=e)
@@ -0,0 +1,117 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from libs.messaging.events import DeliveryInTransit, DomainEventConverter
+from libs.messaging.ports import EventQueuePort
+from libs.observability.logger import get_json_logger
+
+from src.app.services.courier_position import CourierPositionService
+from src.app.services.tracking import TrackingBuffer, latest_by_delivery
+from src.domain.ports import TrackingRepositoryPort
+from src.domain.value_objects import TrackingPoint
+
+DELIVERY_TOPIC = "delivery-events"
+
+
+class TrackingFlushWorker:
+    """
+    Сбрасывает буфер точек трекинга в БД по размеру (flush_size буфера) или по времени.
+    После сброса обновляет позиции курьеров и публикует DeliveryInTransit с последней
+    позицией доставки, но не чаще одного раза в event_interval_seconds на доставку.
+    """
+
+    def __init__(
+            self,
+            buffer: TrackingBuffer,
+            repository: TrackingRepositoryPort,
+            event_queue: EventQueuePort,
+            flush_interval_seconds: float = 1.0,
+            event_interval_seconds: float = 30.0,
+            positions: Optional[CourierPositionService] = None,
+    ):
+        self.buffer = buffer
+        self.repository = repository
+        self.queue = event_queue
+        self.flush_interval = flush_interval_seconds
+        self.event_interval = event_interval_seconds
+        self.positions = positions
+        self._published_at: Dict[UUID, float] = {}
+        self.logger = get_json_logger("tracking_flush_worker")
+
+    async def run(self):
+        self.logger.info("Tracking Flush Worker running", extra={"topic": DELIVERY_TOPIC})
+
+        try:
+            while True:
+                await self.buffer.wait_ready(self.flush_interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            # Остаток буфера не должен пропасть при остановке сервиса
+            await self.flush()
+            raise
+
+    async def flush(self) -> None:
+        points = self.buffer.drain()
+        if not points:
+            return
+
+        try:
+            inserted = await self.repository.save_points(points)
+        except Exception as e:
+            restored = self.buffer.restore(points)
+            self.logger.error(
+                "Error flushing tracking points",
+                exc_info=e,
+                extra={"points": len(points), "restored": restored},
+            )
+            return
+
+        self.logger.info(
+            "Tracking points flushed",
+            extra={"points": len(points), "inserted": inserted},
+        )
+        self.buffer.prune_latest()
+        await self._update_courier_positions(points)
+        await self._publish_positions(points)
+
+    async def _update_courier_positions(self, points: List[TrackingPoint]) -> None:
+        if self.positions is None:
+            return
+        try:
+            await self.positions.record(points)
+        except Exception as e:
+            self.logger.error("Error updating courier positions", exc_info=e)
+
+    async def _publish_positions(self, points: List[TrackingPoint]) -> None:
+        latest = latest_by_delivery(points)
+
+        now = time.monotonic()
+        self._published_at = {
+            delivery_id: published_at
+            for delivery_id, published_at in self._published_at.items()
+            if now - published_at < self.event_interval
+        }
+
+        for delivery_id, point in latest.items():
+            if delivery_id in self._published_at:
+                continue
+
+            domain_event = DeliveryInTransit(
+                delivery_id=delivery_id,
+                current_location=point.location,
+                latitude=point.latitude,
+                longitude=point.longitude,
+                updated_at=point.recorded_at,
+            )
+            try:
+                await self.queue.publish_event(DomainEventConverter.to_event(domain_event), DELIVERY_TOPIC)
+            except Exception as e:
+                self.logger.error(
+                    "Error publishing delivery position",
+                    exc_info=e,
+                    extra={"delivery_id": str(delivery_id)},
+                )
+                continue
+            self._published_at[delivery_id] = now
@@ -22,6 +22,31 @@ class Settings(BaseSettings):
     KAFKA_BOOTSTRAP_SERVERS: str = "kafka:9092"
     KAFKA_GROUP_ID: str = "delivery-service"
 
+    USE_REDIS: bool = False
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    COURIER_POSITION_TTL_SECONDS: int = 300
+    COURIER_POSITION_SYNC_SECONDS: float = 2.0
+    COURIER_NEARBY_MAX_RADIUS_METERS: int = 50_000
+
+    ASSIGNMENT_BATCH_SIZE: int = 200
+    ASSIGNMENT_BATCH_WINDOW_MS: int = 50
+    ASSIGNMENT_MAX_ACTIVE_DELIVERIES: int = 5
+    ASSIGNMENT_MAX_DISTANCE_KM: float = 50.0
+    ASSIGNMENT_HUNGARIAN_MAX_SIZE: int = 300
+    COURIER_AVERAGE_SPEED_KMH: float = 25.0
+
+    TRACKING_FLUSH_SIZE: int = 5000
+    TRACKING_FLUSH_INTERVAL_MS: int = 1000
+    TRACKING_MAX_BUFFERED_POINTS: int = 100_000
+    TRACKING_MAX_POINTS_PER_REQUEST: int = 1000
+    TRACKING_EVENT_INTERVAL_SECONDS: int = 30
+    TRACKING_PARTITIONS_AHEAD_DAYS: int = 3
+    TRACKING_RETENTION_DAYS: int = 90
+    TRACKING_COMPACT_AFTER_DAYS: int = 7
+    TRACKING_SIMPLIFY_TOLERANCE_METERS: float = 10.0
+    TRACKING_MAINTENANCE_INTERVAL_SECONDS: int = 3600
+
     JWT_SECRET_KEY: str = Field(default="dev-secret-key-change-in-production")
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
@@ -0,0 +1,5 @@
+class TrackingError(Exception):
+    pass
+
+class TrackingBufferFullError(TrackingError):
+    pass
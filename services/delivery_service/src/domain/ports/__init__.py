@@ -1 +1,3 @@
+from .courier_position_mirror import CourierPositionMirrorPort
 from .delivery_repository import DeliveryRepositoryPort
+from .tracking_repository import TrackingRepositoryPort
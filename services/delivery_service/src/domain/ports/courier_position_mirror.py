@@ -0,0 +1,19 @@
+from typing import List, Protocol, Sequence
+from uuid import UUID
+
+from src.domain.value_objects import CourierPosition
+
+
+class CourierPositionMirrorPort(Protocol):
+
+    async def publish(self, positions: Sequence[CourierPosition]) -> None:
+        ...
+
+    async def load(self) -> List[CourierPosition]:
+        ...
+
+    async def remove(self, courier_ids: Sequence[UUID]) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
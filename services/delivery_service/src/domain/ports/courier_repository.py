@@ -1,4 +1,4 @@
-from typing import Protocol, List, Optional
+from typing import Protocol, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from src.domain.entities import Courier
@@ -17,3 +17,6 @@ class CourierRepositoryPort(Protocol):
 
     async def delete(self, courier_id: UUID) -> None:
         ...
+
+    async def get_available(self, active_statuses: Sequence[str], max_active: int) -> List[Tuple[Courier, int]]:
+        ...
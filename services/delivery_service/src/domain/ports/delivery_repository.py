@@ -1,4 +1,4 @@
-from typing import Protocol, List, Optional
+from typing import Dict, Protocol, List, Optional, Sequence
 from uuid import UUID
 
 from src.domain.entities import Delivery
@@ -27,3 +27,9 @@ class DeliveryRepositoryPort(Protocol):
 
     async def delete(self, delivery_id: UUID) -> None:
         ...
+
+    async def create_many(self, deliveries: Sequence[Delivery]) -> List[Delivery]:
+        ...
+
+    async def get_courier_ids(self, delivery_ids: Sequence[UUID]) -> Dict[UUID, UUID]:
+        ...
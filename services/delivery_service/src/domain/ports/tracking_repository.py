@@ -0,0 +1,29 @@
+from datetime import date
+from typing import Callable, List, Optional, Protocol, Sequence, Tuple
+from uuid import UUID
+
+from src.domain.value_objects import TrackingPoint
+
+# Упрощение трека: координаты (широта, долгота) по времени -> индексы сохраняемых точек
+TrackSimplifier = Callable[[Sequence[Tuple[float, float]]], List[int]]
+
+
+class TrackingRepositoryPort(Protocol):
+
+    async def save_points(self, points: Sequence[TrackingPoint]) -> int:
+        ...
+
+    async def get_latest(self, delivery_id: UUID) -> Optional[TrackingPoint]:
+        ...
+
+    async def ensure_partitions(self, from_day: date, days: int) -> None:
+        ...
+
+    async def drop_partitions_before(self, day: date) -> int:
+        ...
+
+    async def get_uncompacted_days(self, before: date) -> List[date]:
+        ...
+
+    async def compact_day(self, day: date, simplify: TrackSimplifier) -> Tuple[int, int]:
+        ...
@@ -1,2 +1,6 @@
+from .assignment_request import AssignmentRequest
 from .contact_info import ContactInfo
-from .full_name import FullName
\ No newline at end of file
+from .courier_candidate import CourierCandidate
+from .courier_position import CourierPosition
+from .full_name import FullName
+from .tracking_point import TrackingPoint
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class AssignmentRequest:
+    delivery_id: UUID
+    shipment_id: UUID
+    pickup_latitude: Optional[float] = None
+    pickup_longitude: Optional[float] = None
+
+    @property
+    def has_pickup(self) -> bool:
+        return self.pickup_latitude is not None and self.pickup_longitude is not None
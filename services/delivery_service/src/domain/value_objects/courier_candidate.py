@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class CourierCandidate:
+    courier_id: UUID
+    active_deliveries: int
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
@@ -0,0 +1,27 @@
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+EARTH_RADIUS_METERS = 6_371_000
+
+
+def distance_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Расстояние по дуге большого круга (haversine)."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * math.asin(min(1.0, math.sqrt(a)))
+
+
+@dataclass(frozen=True)
+class CourierPosition:
+    courier_id: UUID
+    delivery_id: UUID
+    latitude: float
+    longitude: float
+    recorded_at: datetime
+
+    def distance_to(self, latitude: float, longitude: float) -> float:
+        return distance_meters(self.latitude, self.longitude, latitude, longitude)
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+class TrackingPointError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class TrackingPoint:
+    delivery_id: UUID
+    latitude: float
+    longitude: float
+    recorded_at: datetime
+    accuracy_meters: Optional[int] = None
+
+    def __post_init__(self):
+        if not -90 <= self.latitude <= 90:
+            raise TrackingPointError(f"Latitude must be between -90 and 90, got {self.latitude}")
+
+        if not -180 <= self.longitude <= 180:
+            raise TrackingPointError(f"Longitude must be between -180 and 180, got {self.longitude}")
+
+        if self.accuracy_meters is not None and self.accuracy_meters <= 0:
+            raise TrackingPointError(f"Accuracy must be positive, got {self.accuracy_meters}")
+
+        if self.recorded_at.tzinfo is None:
+            raise TrackingPointError("recorded_at must be timezone-aware")
+
+    @property
+    def key(self):
+        """Ключ дедупликации: одна точка на доставку и момент фиксации."""
+        return self.delivery_id, self.recorded_at
+
+    @property
+    def location(self) -> str:
+        return f"{self.latitude:.6f},{self.longitude:.6f}"
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 import asyncpg
 
@@ -58,6 +58,24 @@ class AsyncPostgresCourierRepository(CourierRepositoryPort):
                 courier_id
             )
 
+    async def get_available(self, active_statuses: Sequence[str], max_active: int) -> List[Tuple[Courier, int]]:
+        """
+        Курьеры, у которых активных доставок меньше max_active, вместе с их числом.
+        Подсчет идет по idx_deliveries_courier_status без чтения строк доставок.
+        """
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT c.courier_id, c.name, c.contact_info, COALESCE(a.active, 0) AS active_deliveries
+                FROM couriers c
+                LEFT JOIN (
+                    SELECT courier_id, COUNT(*) AS active
+                    FROM deliveries
+                    WHERE status = ANY($1::text[])
+                    GROUP BY courier_id
+                ) a ON a.courier_id = c.courier_id
+                WHERE COALESCE(a.active, 0) < $2
+            """, list(active_statuses), max_active)
+            return [(self._row_to_entity(row), row['active_deliveries']) for row in rows]
 
     @staticmethod
     def _row_to_entity(row) -> Courier:
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 import asyncpg
 
@@ -102,6 +102,40 @@ class AsyncPostgresDeliveryRepository(DeliveryRepositoryPort):
                 delivery_id
             )
 
+    async def create_many(self, deliveries: Sequence[Delivery]) -> List[Delivery]:
+        """Вставка пачки одним INSERT. Уже существующие доставки не трогаются и не возвращаются"""
+        if not deliveries:
+            return []
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch("""
+                INSERT INTO deliveries (delivery_id, shipment_id, courier_id, status, estimated_arrival)
+                SELECT * FROM unnest($1::uuid[], $2::uuid[], $3::uuid[], $4::text[], $5::date[])
+                ON CONFLICT (delivery_id) DO NOTHING
+                RETURNING delivery_id
+            """,
+                                    [d.delivery_id for d in deliveries],
+                                    [d.shipment_id for d in deliveries],
+                                    [d.courier.courier_id for d in deliveries],
+                                    [d.status.value for d in deliveries],
+                                    [d.estimated_arrival for d in deliveries]
+                                    )
+
+            inserted = {row['delivery_id'] for row in rows}
+            return [d for d in deliveries if d.delivery_id in inserted]
+
+    async def get_courier_ids(self, delivery_ids: Sequence[UUID]) -> Dict[UUID, UUID]:
+        """Курьеры доставок одним запросом по первичному ключу"""
+        if not delivery_ids:
+            return {}
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT delivery_id, courier_id FROM deliveries WHERE delivery_id = ANY($1::uuid[])",
+                list(delivery_ids)
+            )
+            return {row['delivery_id']: row['courier_id'] for row in rows}
+
     @staticmethod
     def _row_to_entity(row) -> Delivery:
         """
@@ -0,0 +1,217 @@
+import asyncio
+from datetime import date, timedelta
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+import asyncpg
+
+from src.domain.ports import TrackingRepositoryPort
+from src.domain.ports.tracking_repository import TrackSimplifier
+from src.domain.value_objects import TrackingPoint
+
+
+class AsyncPostgresTrackingRepository(TrackingRepositoryPort):
+    """Асинхронный репозиторий точек трекинга"""
+
+    _STAGING_TABLE = "tracking_points_staging"
+
+    # Временная таблица живет в сессии соединения пула и очищается на каждом COMMIT
+    _CREATE_STAGING_QUERY = f"""
+        CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+            delivery_id UUID NOT NULL,
+            latitude DOUBLE PRECISION NOT NULL,
+            longitude DOUBLE PRECISION NOT NULL,
+            accuracy_meters INTEGER,
+            recorded_at TIMESTAMPTZ NOT NULL
+        ) ON COMMIT DELETE ROWS
+    """
+
+    _STAGING_COLUMNS = ["delivery_id", "latitude", "longitude", "accuracy_meters", "recorded_at"]
+
+    # Точки удаленных доставок и повторы отбрасываются, не ломая пачку
+    _MERGE_QUERY = f"""
+        INSERT INTO delivery_tracking_points (
+            delivery_id, latitude, longitude, accuracy_meters, recorded_at
+        )
+        SELECT DISTINCT ON (s.delivery_id, s.recorded_at)
+            s.delivery_id, s.latitude, s.longitude, s.accuracy_meters, s.recorded_at
+        FROM {_STAGING_TABLE} s
+        JOIN deliveries d ON d.delivery_id = s.delivery_id
+        ORDER BY s.delivery_id, s.recorded_at
+        ON CONFLICT (delivery_id, recorded_at) DO NOTHING
+    """
+
+    _COLUMNS = ["tracking_id", "delivery_id", "latitude", "longitude", "accuracy_meters", "recorded_at", "notes"]
+
+    # Треки прореживаемого дня упрощаются и уходят в новую таблицу порциями, не накапливаясь в памяти
+    _COMPACT_CHUNK_SIZE = 10_000
+
+    def __init__(self, pool: asyncpg.Pool):
+        self._pool = pool
+
+    async def save_points(self, points: Sequence[TrackingPoint]) -> int:
+        """Загружает пачку через COPY во временную таблицу и переносит ее одним INSERT. Возвращает число новых точек."""
+        if not points:
+            return 0
+
+        records = [
+            (p.delivery_id, p.latitude, p.longitude, p.accuracy_meters, p.recorded_at)
+            for p in points
+        ]
+
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(self._CREATE_STAGING_QUERY)
+                await conn.copy_records_to_table(
+                    self._STAGING_TABLE,
+                    records=records,
+                    columns=self._STAGING_COLUMNS,
+                )
+                status = await conn.execute(self._MERGE_QUERY)
+
+        return int(status.split()[-1])
+
+    async def get_latest(self, delivery_id: UUID) -> Optional[TrackingPoint]:
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow("""
+                SELECT delivery_id, latitude, longitude, accuracy_meters, recorded_at
+                FROM delivery_tracking_points
+                WHERE delivery_id = $1
+                ORDER BY recorded_at DESC
+                LIMIT 1
+            """, delivery_id)
+
+        return self._row_to_point(row) if row else None
+
+    async def ensure_partitions(self, from_day: date, days: int) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute("SELECT ensure_tracking_partitions($1, $2)", from_day, days)
+
+    async def drop_partitions_before(self, day: date) -> int:
+        async with self._pool.acquire() as conn:
+            return await conn.fetchval("SELECT drop_tracking_partitions($1)", day)
+
+    async def get_uncompacted_days(self, before: date) -> List[date]:
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT to_date(right(c.relname, 8), 'YYYYMMDD') AS day
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'delivery_tracking_points'::regclass
+                  AND c.relname ~ '^delivery_tracking_points_p[0-9]{8}$'
+                  AND to_date(right(c.relname, 8), 'YYYYMMDD') < $1
+                  AND NOT EXISTS (
+                      SELECT 1 FROM tracking_compactions tc
+                      WHERE tc.day = to_date(right(c.relname, 8), 'YYYYMMDD')
+                  )
+                ORDER BY day
+            """, before)
+
+        return [row["day"] for row in rows]
+
+    async def compact_day(self, day: date, simplify: TrackSimplifier) -> Tuple[int, int]:
+        """
+        Прореживает дневную партицию: треки каждой доставки упрощаются, сохраненные точки
+        копируются в новую таблицу, которая подменяет партицию. Место освобождается сразу, без VACUUM FULL.
+        Возвращает (точек было, точек осталось).
+        """
+        partition = self._partition_name(day)
+        compacted = f"{partition}_compact"
+        columns = ", ".join(self._COLUMNS)
+
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                # Поздние точки этого дня ждут окончания пересборки, а не теряются
+                await conn.execute(f"LOCK TABLE {partition} IN SHARE MODE")
+                await conn.execute(f"""
+                    CREATE TABLE {compacted}
+                    (LIKE delivery_tracking_points INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+                """)
+
+                total, kept = 0, 0
+                track: List[asyncpg.Record] = []
+                tracks: List[List[asyncpg.Record]] = []
+                buffered = 0
+
+                async for row in conn.cursor(f"SELECT {columns} FROM {partition} ORDER BY delivery_id, recorded_at"):
+                    total += 1
+                    if track and track[0]["delivery_id"] != row["delivery_id"]:
+                        tracks.append(track)
+                        buffered += len(track)
+                        track = []
+                        if buffered >= self._COMPACT_CHUNK_SIZE:
+                            kept += await self._compact_tracks(conn, compacted, tracks, simplify)
+                            tracks, buffered = [], 0
+                    track.append(row)
+
+                if track:
+                    tracks.append(track)
+                kept += await self._compact_tracks(conn, compacted, tracks, simplify)
+
+                if kept < total:
+                    lower = day.isoformat()
+                    upper = (day + timedelta(days=1)).isoformat()
+                    bounds = f"{partition}_bounds"
+                    # CHECK по границам партиции проверяется до DETACH, пока родитель не заблокирован;
+                    # с ним ATTACH не сканирует таблицу под ACCESS EXCLUSIVE
+                    await conn.execute(f"""
+                        ALTER TABLE {compacted} ADD CONSTRAINT {bounds}
+                        CHECK (recorded_at IS NOT NULL
+                               AND recorded_at >= '{lower} 00:00:00+00'
+                               AND recorded_at < '{upper} 00:00:00+00')
+                    """)
+                    await conn.execute(f"ALTER TABLE delivery_tracking_points DETACH PARTITION {partition}")
+                    await conn.execute(f"DROP TABLE {partition}")
+                    await conn.execute(f"ALTER TABLE {compacted} RENAME TO {partition}")
+                    await conn.execute(f"""
+                        ALTER TABLE delivery_tracking_points ATTACH PARTITION {partition}
+                        FOR VALUES FROM ('{lower} 00:00:00+00') TO ('{upper} 00:00:00+00')
+                    """)
+                    await conn.execute(f"ALTER TABLE {partition} DROP CONSTRAINT {bounds}")
+                else:
+                    await conn.execute(f"DROP TABLE {compacted}")
+
+                await conn.execute("""
+                    INSERT INTO tracking_compactions (day, points_before, points_after)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (day) DO NOTHING
+                """, day, total, kept)
+
+        return total, kept
+
+    async def _compact_tracks(
+            self,
+            conn: asyncpg.Connection,
+            table: str,
+            tracks: List[List[asyncpg.Record]],
+            simplify: TrackSimplifier,
+    ) -> int:
+        """Упрощение CPU-bound (Douglas-Peucker на чистом Python), поэтому пачка треков считается вне event loop."""
+        records = await asyncio.to_thread(self._simplified_batch, tracks, simplify)
+        if records:
+            await conn.copy_records_to_table(table, records=records, columns=self._COLUMNS)
+        return len(records)
+
+    @classmethod
+    def _simplified_batch(cls, tracks: List[List[asyncpg.Record]], simplify: TrackSimplifier) -> List[tuple]:
+        return [record for track in tracks for record in cls._simplified(track, simplify)]
+
+    @staticmethod
+    def _simplified(track: List[asyncpg.Record], simplify: TrackSimplifier) -> List[tuple]:
+        if not track:
+            return []
+        indexes = simplify([(float(row["latitude"]), float(row["longitude"])) for row in track])
+        return [tuple(track[index]) for index in indexes]
+
+    @staticmethod
+    def _partition_name(day: date) -> str:
+        return f"delivery_tracking_points_p{day:%Y%m%d}"
+
+    @staticmethod
+    def _row_to_point(row: asyncpg.Record) -> TrackingPoint:
+        return TrackingPoint(
+            delivery_id=row["delivery_id"],
+            latitude=float(row["latitude"]),
+            longitude=float(row["longitude"]),
+            recorded_at=row["recorded_at"],
+            accuracy_meters=row["accuracy_meters"],
+        )
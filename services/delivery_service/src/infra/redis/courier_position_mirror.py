@@ -0,0 +1,59 @@
+import json
+from datetime import datetime
+from typing import List, Sequence
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from src.domain.ports import CourierPositionMirrorPort
+from src.domain.value_objects import CourierPosition
+
+
+class RedisCourierPositionMirror(CourierPositionMirrorPort):
+    """
+    Позиции курьеров в общем Redis-хэше: поле — courier_id, значение — JSON позиции.
+    Каждая реплика пишет позиции из своего приема и перечитывает хэш целиком.
+    """
+
+    def __init__(self, redis_url: str, key: str = "delivery_service:courier-positions"):
+        self._redis = redis.from_url(redis_url, encoding="utf-8", decode_responses=True)
+        self._key = key
+
+    async def publish(self, positions: Sequence[CourierPosition]) -> None:
+        if not positions:
+            return
+        await self._redis.hset(
+            self._key,
+            mapping={str(p.courier_id): json.dumps(self._to_dict(p)) for p in positions},
+        )
+
+    async def load(self) -> List[CourierPosition]:
+        raw = await self._redis.hgetall(self._key)
+        return [self._from_dict(json.loads(value)) for value in raw.values()]
+
+    async def remove(self, courier_ids: Sequence[UUID]) -> None:
+        if courier_ids:
+            await self._redis.hdel(self._key, *[str(courier_id) for courier_id in courier_ids])
+
+    async def close(self) -> None:
+        await self._redis.close()
+
+    @staticmethod
+    def _to_dict(position: CourierPosition) -> dict:
+        return {
+            "courier_id": str(position.courier_id),
+            "delivery_id": str(position.delivery_id),
+            "latitude": position.latitude,
+            "longitude": position.longitude,
+            "recorded_at": position.recorded_at.isoformat(),
+        }
+
+    @staticmethod
+    def _from_dict(data: dict) -> CourierPosition:
+        return CourierPosition(
+            courier_id=UUID(data["courier_id"]),
+            delivery_id=UUID(data["delivery_id"]),
+            latitude=data["latitude"],
+            longitude=data["longitude"],
+            recorded_at=datetime.fromisoformat(data["recorded_at"]),
+        )
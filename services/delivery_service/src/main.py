@@ -10,13 +10,22 @@ from libs.observability.logger import set_service_name, set_environment, get_jso
 from libs.observability.metrics import PrometheusMiddleware, metrics_endpoint
 
 from src.api.router import router
-from src.api.deps.getters import db_provider, event_queue_provider
+from src.api.deps.getters import db_provider, event_queue_provider, tracking_buffer, courier_locator
+from src.app.services.courier_assignment import CourierAssignmentEngine, CourierAssignmentService
+from src.app.services.courier_position import CourierPositionService
 from src.app.services.delivery import DeliveryService
+from src.app.services.tracking_maintenance import TrackingMaintenanceService
 from src.app.workers.command_worker import DeliveryCommandWorker
+from src.app.workers.courier_position_worker import CourierPositionSyncWorker
+from src.app.workers.tracking_maintenance_worker import TrackingMaintenanceWorker
+from src.app.workers.tracking_worker import TrackingFlushWorker
 from src.config import settings
 from src.domain.errors.courier import CourierNotFoundError, CourierAlreadyExistsError
 from src.domain.errors.delivery import DeliveryNotFoundError
+from src.infra.db.courier_repository import AsyncPostgresCourierRepository
 from src.infra.db.delivery_repository import AsyncPostgresDeliveryRepository
+from src.infra.db.tracking_repository import AsyncPostgresTrackingRepository
+from src.infra.redis.courier_position_mirror import RedisCourierPositionMirror
 
 set_service_name(settings.SERVICE_NAME)
 set_environment(settings.ENVIRONMENT)
@@ -32,23 +41,74 @@ async def lifespan(app: FastAPI):
 
     delivery_repo = AsyncPostgresDeliveryRepository(db_provider._pool)
     delivery_service = DeliveryService(repository=delivery_repo)
+    assignment_service = CourierAssignmentService(
+        delivery_repository=delivery_repo,
+        courier_repository=AsyncPostgresCourierRepository(db_provider._pool),
+        locator=courier_locator,
+        engine=CourierAssignmentEngine(
+            max_active_deliveries=settings.ASSIGNMENT_MAX_ACTIVE_DELIVERIES,
+            average_speed_kmh=settings.COURIER_AVERAGE_SPEED_KMH,
+            max_distance_km=settings.ASSIGNMENT_MAX_DISTANCE_KM,
+            hungarian_max_size=settings.ASSIGNMENT_HUNGARIAN_MAX_SIZE,
+        ),
+    )
     command_worker = DeliveryCommandWorker(
         event_queue=event_queue_provider._adapter,
         delivery_service=delivery_service,
+        assignment_service=assignment_service,
+        batch_size=settings.ASSIGNMENT_BATCH_SIZE,
+        batch_window_seconds=settings.ASSIGNMENT_BATCH_WINDOW_MS / 1000,
+    )
+
+    position_mirror = RedisCourierPositionMirror(settings.REDIS_URL) if settings.USE_REDIS else None
+    courier_positions = CourierPositionService(
+        repository=delivery_repo,
+        locator=courier_locator,
+        mirror=position_mirror,
+    )
+    position_worker = CourierPositionSyncWorker(
+        service=courier_positions,
+        interval_seconds=settings.COURIER_POSITION_SYNC_SECONDS,
+    )
+
+    tracking_repo = AsyncPostgresTrackingRepository(db_provider._pool)
+    tracking_worker = TrackingFlushWorker(
+        buffer=tracking_buffer,
+        repository=tracking_repo,
+        event_queue=event_queue_provider._adapter,
+        flush_interval_seconds=settings.TRACKING_FLUSH_INTERVAL_MS / 1000,
+        event_interval_seconds=settings.TRACKING_EVENT_INTERVAL_SECONDS,
+        positions=courier_positions,
+    )
+    maintenance_worker = TrackingMaintenanceWorker(
+        service=TrackingMaintenanceService(
+            repository=tracking_repo,
+            partitions_ahead_days=settings.TRACKING_PARTITIONS_AHEAD_DAYS,
+            retention_days=settings.TRACKING_RETENTION_DAYS,
+            compact_after_days=settings.TRACKING_COMPACT_AFTER_DAYS,
+            tolerance_meters=settings.TRACKING_SIMPLIFY_TOLERANCE_METERS,
+        ),
+        interval_seconds=settings.TRACKING_MAINTENANCE_INTERVAL_SECONDS,
     )
 
     worker_task = asyncio.create_task(command_worker.run(), name="delivery_command_worker")
+    tracking_task = asyncio.create_task(tracking_worker.run(), name="tracking_flush_worker")
+    maintenance_task = asyncio.create_task(maintenance_worker.run(), name="tracking_maintenance_worker")
+    position_task = asyncio.create_task(position_worker.run(), name="courier_position_sync_worker")
 
     logger.info(f"Service '{settings.SERVICE_NAME}' ready on port {settings.PORT}.")
     yield
 
     logger.info("Shutting down Delivery Service...")
-    worker_task.cancel()
-    try:
-        await worker_task
-    except asyncio.CancelledError:
-        logger.info("Command worker stopped gracefully.")
-
+    for task in (worker_task, tracking_task, maintenance_task, position_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            logger.info(f"{task.get_name()} stopped gracefully.")
+
+    if position_mirror is not None:
+        await position_mirror.close()
     await event_queue_provider.shutdown()
     await db_provider.shutdown()
     logger.info("Shutdown complete.")
@@ -1,13 +1,16 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
+from datetime import datetime, timezone
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from libs.auth.models import UserInDB
-from src.api.deps.getters import get_courier_service, get_current_user
+from src.api.deps.getters import get_courier_service, get_current_user, get_courier_locator
 from src.api.dto.courier import CourierDTO
 from src.api.handlers.courier import courier_router
+from src.app.services.courier_locator import CourierLocator
+from src.domain.value_objects import CourierPosition
 
 _ADMIN_USER = UserInDB(username="admin", hashed_password="", role="admin")
 
@@ -21,8 +24,14 @@ def mock_courier_service():
 
 
 @pytest.fixture
-def client(mock_courier_service):
+def courier_locator():
+    return CourierLocator()
+
+
+@pytest.fixture
+def client(mock_courier_service, courier_locator):
     app.dependency_overrides[get_courier_service] = lambda: mock_courier_service
+    app.dependency_overrides[get_courier_locator] = lambda: courier_locator
     app.dependency_overrides[get_current_user] = lambda: MagicMock()
 
     with TestClient(app) as c:
@@ -338,3 +347,26 @@ def test_delete_courier_not_found(mock_mapper, client, mock_courier_service):
     assert "not found" in data["detail"].lower()
 
     mock_courier_service.delete.assert_not_awaited()
+
+
+def test_get_nearby_couriers(client, courier_locator, mock_courier_service):
+    now = datetime.now(timezone.utc)
+    near, far = uuid4(), uuid4()
+    courier_locator.update([
+        CourierPosition(courier_id=near, delivery_id=uuid4(), latitude=55.7530, longitude=37.6200, recorded_at=now),
+        CourierPosition(courier_id=far, delivery_id=uuid4(), latitude=55.9000, longitude=37.6200, recorded_at=now),
+    ])
+
+    response = client.get("/couriers/nearby", params={"lat": 55.7522, "lon": 37.6156, "radius": 1000})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [entry["courier_id"] for entry in data] == [str(near)]
+    assert 0 < data[0]["distance_meters"] < 1000
+    mock_courier_service.get.assert_not_called()
+
+
+def test_get_nearby_couriers_validates_radius(client):
+    response = client.get("/couriers/nearby", params={"lat": 55.75, "lon": 37.61, "radius": 10_000_000})
+
+    assert response.status_code == 422
@@ -5,9 +5,13 @@ from datetime import date, datetime, timezone
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from src.api.deps.getters import get_delivery_service, get_courier_service, get_current_user, get_event_queue
+from src.api.deps.getters import (
+    get_delivery_service, get_courier_service, get_current_user, get_event_queue, get_tracking_service
+)
 from src.api.dto.delivery import DeliveryDTO
 from src.domain.entities.delivery import DeliveryStatus
+from src.domain.errors.tracking import TrackingBufferFullError
+from src.domain.value_objects import TrackingPoint
 from src.api.handlers.delivery import delivery_router
 
 app = FastAPI()
@@ -30,8 +34,16 @@ def mock_event_queue():
 
 
 @pytest.fixture
-def client(mock_delivery_service, mock_courier_service, mock_event_queue):
+def mock_tracking_service():
+    service = MagicMock()
+    service.get_latest = AsyncMock(return_value=None)
+    return service
+
+
+@pytest.fixture
+def client(mock_delivery_service, mock_courier_service, mock_event_queue, mock_tracking_service):
     app.dependency_overrides[get_delivery_service] = lambda: mock_delivery_service
+    app.dependency_overrides[get_tracking_service] = lambda: mock_tracking_service
     app.dependency_overrides[get_courier_service] = lambda: mock_courier_service
     app.dependency_overrides[get_event_queue] = lambda: mock_event_queue
     app.dependency_overrides[get_current_user] = lambda: MagicMock()
@@ -398,6 +410,121 @@ def test_mark_delivery_in_transit(mock_mapper, client, mock_delivery_service, mo
     mock_event_queue.publish_event.assert_called_once()
 
 
+@patch("src.api.handlers.delivery.DeliveryMapper")
+def test_mark_delivery_in_transit_uses_last_position(
+        mock_mapper, client, mock_delivery_service, mock_tracking_service, mock_event_queue
+):
+    delivery_id = uuid4()
+    delivery = create_fake_delivery_entity(delivery_id=delivery_id, status=DeliveryStatus.IN_TRANSIT)
+    mock_delivery_service.get.return_value = delivery
+    mock_tracking_service.get_latest.return_value = TrackingPoint(
+        delivery_id=delivery_id,
+        latitude=55.751244,
+        longitude=37.618423,
+        recorded_at=datetime.now(timezone.utc),
+    )
+    mock_mapper.entity_to_dto.return_value = DeliveryDTO(
+        delivery_id=delivery_id,
+        shipment_id=delivery.shipment_id,
+        courier_id=delivery.courier.courier_id,
+        status=DeliveryStatus.IN_TRANSIT,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc)
+    )
+
+    response = client.post(f"/deliveries/{delivery_id}/start")
+
+    assert response.status_code == 200
+    event = mock_event_queue.publish_event.call_args.args[0]
+    assert event.payload["current_location"] == "55.751244,37.618423"
+    assert event.payload["latitude"] == 55.751244
+
+
+def test_ingest_tracking_ndjson(client, mock_tracking_service):
+    delivery_id = uuid4()
+    mock_tracking_service.ingest.return_value = (2, 1)
+    body = "\n".join([
+        '{"latitude": 55.75, "longitude": 37.61, "recorded_at": "2024-05-01T10:00:00Z"}',
+        '{"latitude": 55.76, "longitude": 37.62, "recorded_at": "2024-05-01T10:00:05Z", "accuracy_meters": 8}',
+        '{"latitude": 55.76, "longitude": 37.62, "recorded_at": "2024-05-01T10:00:05Z"}',
+        "",
+    ])
+
+    response = client.post(
+        f"/deliveries/{delivery_id}/tracking",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 202
+    assert response.json() == {"accepted": 2, "duplicates": 1}
+
+    points = mock_tracking_service.ingest.call_args.args[0]
+    assert len(points) == 3
+    assert all(point.delivery_id == delivery_id for point in points)
+    assert points[1].accuracy_meters == 8
+
+
+def test_ingest_tracking_json_array_assumes_utc(client, mock_tracking_service):
+    mock_tracking_service.ingest.return_value = (1, 0)
+
+    response = client.post(
+        f"/deliveries/{uuid4()}/tracking",
+        json=[{"latitude": 10, "longitude": 20, "recorded_at": "2024-05-01T10:00:00"}],
+    )
+
+    assert response.status_code == 202
+    point = mock_tracking_service.ingest.call_args.args[0][0]
+    assert point.recorded_at == datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def test_ingest_tracking_invalid_line(client, mock_tracking_service):
+    body = '{"latitude": 10, "longitude": 20, "recorded_at": "2024-05-01T10:00:00Z"}\nnot json\n'
+
+    response = client.post(
+        f"/deliveries/{uuid4()}/tracking",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Invalid point 2"
+    mock_tracking_service.ingest.assert_not_called()
+
+
+def test_ingest_tracking_out_of_range(client, mock_tracking_service):
+    response = client.post(
+        f"/deliveries/{uuid4()}/tracking",
+        json=[{"latitude": 91, "longitude": 20, "recorded_at": "2024-05-01T10:00:00Z"}],
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Invalid point 1"
+
+
+@patch("src.api.handlers.delivery.settings")
+def test_ingest_tracking_too_many_points(mock_settings, client, mock_tracking_service):
+    mock_settings.TRACKING_MAX_POINTS_PER_REQUEST = 2
+    point = {"latitude": 10, "longitude": 20, "recorded_at": "2024-05-01T10:00:00Z"}
+
+    response = client.post(f"/deliveries/{uuid4()}/tracking", json=[point] * 3)
+
+    assert response.status_code == 413
+    mock_tracking_service.ingest.assert_not_called()
+
+
+def test_ingest_tracking_buffer_full(client, mock_tracking_service):
+    mock_tracking_service.ingest.side_effect = TrackingBufferFullError("Tracking buffer is full")
+
+    response = client.post(
+        f"/deliveries/{uuid4()}/tracking",
+        json=[{"latitude": 10, "longitude": 20, "recorded_at": "2024-05-01T10:00:00Z"}],
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
 @patch("src.api.handlers.delivery.DeliveryMapper")
 def test_complete_delivery(mock_mapper, client, mock_delivery_service, mock_event_queue):
     delivery_id = uuid4()
@@ -271,3 +271,20 @@ class TestAsyncPostgresCourierRepository:
 
         with pytest.raises(Exception, match="Connection failed"):
             await repository.get(courier_id)
+
+    @pytest.mark.asyncio
+    async def test_get_available(self, repository, mock_connection, sample_courier):
+        mock_connection.fetch.return_value = [{
+            'courier_id': sample_courier.courier_id,
+            'name': sample_courier.name,
+            'contact_info': sample_courier.contact_info,
+            'active_deliveries': 2,
+        }]
+
+        result = await repository.get_available(('assigned', 'in_transit'), 5)
+
+        assert len(result) == 1
+        courier, active = result[0]
+        assert courier.courier_id == sample_courier.courier_id
+        assert active == 2
+        assert mock_connection.fetch.call_args[0][1:] == (['assigned', 'in_transit'], 5)
@@ -461,3 +461,42 @@ class TestAsyncPostgresDeliveryRepository:
         assert result.estimated_arrival == date(2025, 12, 15)
         assert result.actual_arrival == date(2025, 12, 14)
         assert result.status == DeliveryStatus.DELIVERED
+
+    @pytest.mark.asyncio
+    async def test_get_courier_ids(self, repository, mock_connection):
+        delivery_id, courier_id = uuid4(), uuid4()
+        mock_connection.fetch.return_value = [{'delivery_id': delivery_id, 'courier_id': courier_id}]
+
+        result = await repository.get_courier_ids([delivery_id])
+
+        assert result == {delivery_id: courier_id}
+        assert mock_connection.fetch.call_args[0][1] == [delivery_id]
+
+    @pytest.mark.asyncio
+    async def test_get_courier_ids_empty(self, repository, mock_pool):
+        assert await repository.get_courier_ids([]) == {}
+        mock_pool.acquire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_many_returns_only_inserted(self, repository, mock_connection, sample_delivery, sample_courier):
+        existing = Delivery(
+            delivery_id=uuid4(),
+            shipment_id=uuid4(),
+            courier=sample_courier,
+            status=DeliveryStatus.ASSIGNED,
+            estimated_arrival=date(2025, 12, 16),
+        )
+        mock_connection.fetch.return_value = [{'delivery_id': sample_delivery.delivery_id}]
+
+        result = await repository.create_many([sample_delivery, existing])
+
+        assert result == [sample_delivery]
+        args = mock_connection.fetch.call_args[0]
+        assert "ON CONFLICT (delivery_id) DO NOTHING" in args[0]
+        assert args[1] == [sample_delivery.delivery_id, existing.delivery_id]
+        assert args[4] == ['assigned', 'assigned']
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self, repository, mock_pool):
+        assert await repository.create_many([]) == []
+        mock_pool.acquire.assert_not_called()
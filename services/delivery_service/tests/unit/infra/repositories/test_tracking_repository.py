@@ -0,0 +1,202 @@
+import threading
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from datetime import date, datetime, timezone
+
+from src.infra.db.tracking_repository import AsyncPostgresTrackingRepository
+from src.domain.value_objects import TrackingPoint
+
+
+@pytest.fixture
+def mock_connection():
+    """Мок для asyncpg.Connection с транзакцией"""
+    connection = AsyncMock()
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock(return_value=None)
+    transaction.__aexit__ = AsyncMock(return_value=None)
+    connection.transaction = MagicMock(return_value=transaction)
+    return connection
+
+
+@pytest.fixture
+def mock_pool(mock_connection):
+    pool = MagicMock()
+
+    acquire_context = MagicMock()
+    acquire_context.__aenter__ = AsyncMock(return_value=mock_connection)
+    acquire_context.__aexit__ = AsyncMock(return_value=None)
+
+    pool.acquire.return_value = acquire_context
+
+    return pool
+
+
+@pytest.fixture
+def repository(mock_pool):
+    return AsyncPostgresTrackingRepository(mock_pool)
+
+
+class TestAsyncPostgresTrackingRepository:
+
+    @pytest.mark.asyncio
+    async def test_save_points_copies_into_staging_and_merges(self, repository, mock_connection):
+        delivery_id = uuid4()
+        recorded_at = datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+        points = [
+            TrackingPoint(delivery_id=delivery_id, latitude=55.75, longitude=37.61, recorded_at=recorded_at),
+            TrackingPoint(delivery_id=delivery_id, latitude=55.76, longitude=37.62,
+                          recorded_at=recorded_at.replace(second=5), accuracy_meters=10),
+        ]
+        mock_connection.execute.side_effect = ["CREATE TABLE", "INSERT 0 2"]
+
+        inserted = await repository.save_points(points)
+
+        assert inserted == 2
+        mock_connection.transaction.assert_called_once()
+
+        copy_call = mock_connection.copy_records_to_table.call_args
+        assert copy_call.args[0] == "tracking_points_staging"
+        assert copy_call.kwargs["records"][1] == (delivery_id, 55.76, 37.62, 10, recorded_at.replace(second=5))
+
+        merge_query = mock_connection.execute.call_args_list[1].args[0]
+        assert "JOIN deliveries" in merge_query
+        assert "ON CONFLICT (delivery_id, recorded_at) DO NOTHING" in merge_query
+
+    @pytest.mark.asyncio
+    async def test_save_points_empty_skips_database(self, repository, mock_pool):
+        assert await repository.save_points([]) == 0
+        mock_pool.acquire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_latest(self, repository, mock_connection):
+        delivery_id = uuid4()
+        recorded_at = datetime.now(timezone.utc)
+        mock_connection.fetchrow.return_value = {
+            "delivery_id": delivery_id,
+            "latitude": Decimal("55.75124400"),
+            "longitude": Decimal("37.61842300"),
+            "accuracy_meters": None,
+            "recorded_at": recorded_at,
+        }
+
+        point = await repository.get_latest(delivery_id)
+
+        assert point.latitude == 55.751244
+        assert point.recorded_at == recorded_at
+        assert mock_connection.fetchrow.call_args.args[1] == delivery_id
+
+    @pytest.mark.asyncio
+    async def test_get_latest_missing(self, repository, mock_connection):
+        mock_connection.fetchrow.return_value = None
+
+        assert await repository.get_latest(uuid4()) is None
+
+
+class FakeCursor:
+    """Асинхронный итератор строк вместо серверного курсора asyncpg"""
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeRecord(dict):
+    """dict с порядком колонок asyncpg.Record при tuple()"""
+
+    def __iter__(self):
+        return iter(self.values())
+
+
+def make_row(delivery_id, latitude, second):
+    return FakeRecord(
+        tracking_id=uuid4(),
+        delivery_id=delivery_id,
+        latitude=Decimal(str(latitude)),
+        longitude=Decimal("37.0"),
+        accuracy_meters=None,
+        recorded_at=datetime(2024, 5, 1, 10, 0, second, tzinfo=timezone.utc),
+        notes=None,
+    )
+
+
+class TestTrackingPartitions:
+
+    @pytest.mark.asyncio
+    async def test_ensure_partitions(self, repository, mock_connection):
+        await repository.ensure_partitions(date(2024, 5, 1), 4)
+
+        mock_connection.execute.assert_awaited_once_with(
+            "SELECT ensure_tracking_partitions($1, $2)", date(2024, 5, 1), 4
+        )
+
+    @pytest.mark.asyncio
+    async def test_drop_partitions_before(self, repository, mock_connection):
+        mock_connection.fetchval.return_value = 3
+
+        assert await repository.drop_partitions_before(date(2024, 2, 1)) == 3
+        assert mock_connection.fetchval.call_args.args[1] == date(2024, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_uncompacted_days(self, repository, mock_connection):
+        mock_connection.fetch.return_value = [{"day": date(2024, 5, 1)}]
+
+        assert await repository.get_uncompacted_days(date(2024, 5, 3)) == [date(2024, 5, 1)]
+        assert "tracking_compactions" in mock_connection.fetch.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_compact_day_swaps_partition(self, repository, mock_connection):
+        first, second = uuid4(), uuid4()
+        rows = [make_row(first, 55.0 + i * 0.0001, i) for i in range(5)] + [make_row(second, 56.0, 0)]
+        mock_connection.cursor = MagicMock(return_value=FakeCursor(rows))
+
+        before, after = await repository.compact_day(date(2024, 5, 1), lambda coords: [0, len(coords) - 1][:len(coords)])
+
+        assert (before, after) == (6, 3)
+        copied = mock_connection.copy_records_to_table.call_args
+        assert copied.args[0] == "delivery_tracking_points_p20240501_compact"
+        assert [record[1] for record in copied.kwargs["records"]] == [first, first, second]
+
+        statements = [call.args[0] for call in mock_connection.execute.call_args_list]
+        assert "LOCK TABLE delivery_tracking_points_p20240501 IN SHARE MODE" in statements[0]
+        assert any("DETACH PARTITION delivery_tracking_points_p20240501" in s for s in statements)
+        attach = next(s for s in statements if "ATTACH PARTITION" in s)
+        assert "FROM ('2024-05-01 00:00:00+00') TO ('2024-05-02 00:00:00+00')" in attach
+        bounds = next(i for i, s in enumerate(statements) if "ADD CONSTRAINT delivery_tracking_points_p20240501_bounds" in s)
+        detach = next(i for i, s in enumerate(statements) if "DETACH PARTITION" in s)
+        assert "recorded_at < '2024-05-02 00:00:00+00'" in statements[bounds]
+        assert bounds < detach
+        assert mock_connection.execute.call_args.args[1:] == (date(2024, 5, 1), 6, 3)
+
+    @pytest.mark.asyncio
+    async def test_compact_day_simplifies_off_the_event_loop(self, repository, mock_connection):
+        delivery_id = uuid4()
+        mock_connection.cursor = MagicMock(return_value=FakeCursor([make_row(delivery_id, 55.0, i) for i in range(3)]))
+        simplify_threads = []
+
+        def simplify(coords):
+            simplify_threads.append(threading.get_ident())
+            return [0, len(coords) - 1]
+
+        assert await repository.compact_day(date(2024, 5, 1), simplify) == (3, 2)
+        assert simplify_threads and threading.get_ident() not in simplify_threads
+
+    @pytest.mark.asyncio
+    async def test_compact_day_keeps_partition_when_nothing_removed(self, repository, mock_connection):
+        delivery_id = uuid4()
+        mock_connection.cursor = MagicMock(return_value=FakeCursor([make_row(delivery_id, 55.0, 0)]))
+
+        assert await repository.compact_day(date(2024, 5, 1), lambda coords: list(range(len(coords)))) == (1, 1)
+
+        statements = [call.args[0] for call in mock_connection.execute.call_args_list]
+        assert not any("DETACH PARTITION" in s or "ADD CONSTRAINT" in s for s in statements)
+        assert "DROP TABLE delivery_tracking_points_p20240501_compact" in statements
@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from datetime import date
+
+from libs.messaging.base import Command
+
+from src.app.workers.command_worker import DeliveryCommandWorker
+from src.domain.value_objects import AssignmentRequest
+
+
+def make_queue(commands):
+    queue = MagicMock()
+    queue.publish_event = AsyncMock()
+
+    async def consume_command(*topics):
+        for command in commands:
+            yield command
+
+    queue.consume_command = consume_command
+    return queue
+
+
+def assign_command(delivery_id, shipment_id, **payload):
+    return Command(
+        command_type="courier.assign",
+        aggregate_id=delivery_id,
+        payload={"delivery_id": str(delivery_id), "shipment_id": str(shipment_id), **payload},
+        correlation_id=uuid4(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_assign_commands_are_solved_in_one_batch():
+    assigned_id, failed_id, shipment_id = uuid4(), uuid4(), uuid4()
+    commands = [
+        assign_command(assigned_id, shipment_id, pickup_latitude=55.75, pickup_longitude=37.61),
+        assign_command(failed_id, shipment_id),
+    ]
+    created = MagicMock(
+        delivery_id=assigned_id,
+        shipment_id=shipment_id,
+        courier=MagicMock(courier_id=uuid4()),
+        estimated_arrival=date(2025, 12, 15),
+    )
+    assignment = AsyncMock()
+    assignment.assign.side_effect = lambda requests: ([created], [requests[1]])
+    queue = make_queue(commands)
+    worker = DeliveryCommandWorker(event_queue=queue, delivery_service=AsyncMock(), assignment_service=assignment)
+
+    await worker.run()
+
+    requests = assignment.assign.await_args.args[0]
+    assert requests == [
+        AssignmentRequest(assigned_id, shipment_id, 55.75, 37.61),
+        AssignmentRequest(failed_id, shipment_id),
+    ]
+    events = [call.args for call in queue.publish_event.await_args_list]
+    assert [(e.event_type, topic) for e, topic in events] == [
+        ("courier.assigned", "delivery-events"),
+        ("delivery.failed", "delivery-events"),
+    ]
+    assert events[0][0].correlation_id == commands[0].correlation_id
+    assert events[1][0].payload["reason"] == "No available courier"
+
+
+@pytest.mark.asyncio
+async def test_unassign_and_invalid_commands_do_not_break_batch():
+    delivery_id = uuid4()
+    service = AsyncMock()
+    assignment = AsyncMock()
+    commands = [
+        Command(command_type="courier.assign", aggregate_id=uuid4(), payload={"shipment_id": "not-a-uuid"}),
+        Command(command_type="courier.unassign", aggregate_id=delivery_id, payload={"delivery_id": str(delivery_id)}),
+    ]
+    worker = DeliveryCommandWorker(event_queue=make_queue(commands), delivery_service=service, assignment_service=assignment)
+
+    await worker.run()
+
+    service.delete.assert_awaited_once_with(delivery_id)
+    assignment.assign.assert_not_called()
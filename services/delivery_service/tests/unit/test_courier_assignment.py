@@ -0,0 +1,181 @@
+import itertools
+import threading
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import datetime, timezone
+
+from src.app.services.assignment_solver import INFEASIBLE, solve_greedy, solve_hungarian
+from src.app.services.courier_assignment import CourierAssignmentEngine, CourierAssignmentService
+from src.app.services.courier_locator import CourierLocator
+from src.domain.entities import Courier
+from src.domain.entities.delivery import DeliveryStatus
+from src.domain.value_objects import AssignmentRequest, CourierCandidate, CourierPosition
+
+
+def brute_force(cost):
+    rows, cols = cost.shape
+    best = None
+    if rows <= cols:
+        for perm in itertools.permutations(range(cols), rows):
+            pairs = [(r, c) for r, c in enumerate(perm) if cost[r, c] < INFEASIBLE]
+            key = (-len(pairs), sum(cost[r, c] for r, c in pairs))
+            best = key if best is None or key < best else best
+    else:
+        for perm in itertools.permutations(range(rows), cols):
+            pairs = [(r, c) for c, r in enumerate(perm) if cost[r, c] < INFEASIBLE]
+            key = (-len(pairs), sum(cost[r, c] for r, c in pairs))
+            best = key if best is None or key < best else best
+    return best
+
+
+def make_request(lat=None, lon=None):
+    return AssignmentRequest(delivery_id=uuid4(), shipment_id=uuid4(), pickup_latitude=lat, pickup_longitude=lon)
+
+
+def make_candidate(lat=None, lon=None, active=0):
+    return CourierCandidate(courier_id=uuid4(), active_deliveries=active, latitude=lat, longitude=lon)
+
+
+class TestSolvers:
+
+    def test_hungarian_matches_brute_force(self):
+        rng = np.random.default_rng(3)
+        for _ in range(100):
+            rows, cols = int(rng.integers(1, 6)), int(rng.integers(1, 6))
+            cost = rng.uniform(0, 100, size=(rows, cols))
+            cost[rng.random((rows, cols)) < 0.2] = INFEASIBLE
+
+            pairs = solve_hungarian(cost)
+
+            assert len({r for r, _ in pairs}) == len(pairs) == len({c for _, c in pairs})
+            assert all(cost[r, c] < INFEASIBLE for r, c in pairs)
+            count, total = brute_force(cost)
+            assert len(pairs) == -count
+            assert sum(cost[r, c] for r, c in pairs) == pytest.approx(total)
+
+    def test_greedy_is_feasible_and_not_better_than_optimum(self):
+        rng = np.random.default_rng(5)
+        cost = rng.uniform(0, 100, size=(30, 20))
+
+        greedy = solve_greedy(cost)
+        optimal = solve_hungarian(cost)
+
+        assert len(greedy) == len(optimal) == 20
+        assert len({c for _, c in greedy}) == 20
+        assert sum(cost[r, c] for r, c in greedy) >= sum(cost[r, c] for r, c in optimal)
+
+    def test_empty_matrix(self):
+        assert solve_hungarian(np.zeros((0, 3))) == []
+        assert solve_greedy(np.zeros((2, 0))) == []
+
+
+class TestCourierAssignmentEngine:
+
+    def test_prefers_nearest_courier(self):
+        engine = CourierAssignmentEngine()
+        near, far = make_candidate(55.751, 37.61), make_candidate(55.80, 37.61)
+        request = make_request(55.75, 37.61)
+
+        result = engine.assign([request], [far, near])
+
+        courier_id, eta = result[request.delivery_id]
+        assert courier_id == near.courier_id
+        assert eta < 1
+
+    def test_rounds_spread_load_and_respect_cap(self):
+        engine = CourierAssignmentEngine(max_active_deliveries=2)
+        couriers = [make_candidate(55.75, 37.61), make_candidate(55.75, 37.62, active=1)]
+        requests = [make_request(55.75, 37.61) for _ in range(5)]
+
+        result = engine.assign(requests, couriers)
+
+        per_courier = [courier_id for courier_id, _ in result.values()]
+        assert per_courier.count(couriers[0].courier_id) == 2
+        assert per_courier.count(couriers[1].courier_id) == 1
+        assert len(result) == 3
+
+    def test_distant_couriers_are_infeasible(self):
+        engine = CourierAssignmentEngine(max_distance_km=10)
+        request = make_request(55.75, 37.61)
+
+        assert engine.assign([request], [make_candidate(59.93, 30.31)]) == {}
+
+    def test_unknown_positions_are_penalized_not_excluded(self):
+        engine = CourierAssignmentEngine()
+        request, no_pickup = make_request(55.75, 37.61), make_request()
+        courier = make_candidate()
+
+        distances = engine.distance_matrix([request, no_pickup], [courier])
+
+        assert distances.tolist() == [[20.0], [0.0]]
+        assert engine.assign([request], [courier])[request.delivery_id][0] == courier.courier_id
+
+
+class TestCourierAssignmentService:
+
+    def make_service(self, couriers, existing=None):
+        deliveries = AsyncMock()
+        deliveries.get_courier_ids.return_value = existing or {}
+        deliveries.create_many.side_effect = lambda items: list(items)
+        courier_repository = AsyncMock()
+        courier_repository.get_available.return_value = couriers
+        locator = CourierLocator()
+        service = CourierAssignmentService(deliveries, courier_repository, locator, CourierAssignmentEngine())
+        return service, deliveries, courier_repository, locator
+
+    @pytest.mark.asyncio
+    async def test_creates_assigned_deliveries_using_live_positions(self):
+        near = Courier(name="Near", contact_info="+79000000001")
+        far = Courier(name="Far", contact_info="+79000000002")
+        service, deliveries, couriers, locator = self.make_service([(far, 0), (near, 0)])
+        locator.update([
+            CourierPosition(near.courier_id, uuid4(), 55.751, 37.61, datetime.now(timezone.utc)),
+            CourierPosition(far.courier_id, uuid4(), 55.85, 37.61, datetime.now(timezone.utc)),
+        ])
+        request = make_request(55.75, 37.61)
+
+        created, unassigned = await service.assign([request])
+
+        assert unassigned == []
+        assert [(d.delivery_id, d.courier.courier_id, d.status) for d in created] == [
+            (request.delivery_id, near.courier_id, DeliveryStatus.ASSIGNED)
+        ]
+        assert couriers.get_available.call_args[0] == (["assigned", "in_transit"], 5)
+
+    @pytest.mark.asyncio
+    async def test_existing_deliveries_are_skipped(self):
+        request = make_request()
+        service, deliveries, couriers, _ = self.make_service([], existing={request.delivery_id: uuid4()})
+
+        assert await service.assign([request, request]) == ([], [])
+        couriers.get_available.assert_not_called()
+        deliveries.create_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_requests_without_courier_are_unassigned(self):
+        service, deliveries, _, _ = self.make_service([])
+        request = make_request()
+
+        created, unassigned = await service.assign([request])
+
+        assert created == []
+        assert unassigned == [request]
+
+    @pytest.mark.asyncio
+    async def test_solve_runs_off_the_event_loop(self):
+        courier = Courier(name="Solo", contact_info="+79000000003")
+        service, _, _, _ = self.make_service([(courier, 0)])
+        solver_threads = []
+        engine_assign = service._engine.assign
+
+        def recording_assign(requests, couriers):
+            solver_threads.append(threading.get_ident())
+            return engine_assign(requests, couriers)
+
+        service._engine.assign = recording_assign
+        created, _ = await service.assign([make_request()])
+
+        assert len(created) == 1
+        assert solver_threads and solver_threads[0] != threading.get_ident()
@@ -0,0 +1,116 @@
+import random
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+
+from src.app.services.courier_locator import CourierLocator
+from src.app.services.courier_position import CourierPositionService
+from src.domain.value_objects import CourierPosition, TrackingPoint
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_position(latitude, longitude, courier_id=None, recorded_at=NOW):
+    return CourierPosition(
+        courier_id=courier_id or uuid4(),
+        delivery_id=uuid4(),
+        latitude=latitude,
+        longitude=longitude,
+        recorded_at=recorded_at,
+    )
+
+
+class TestCourierLocator:
+
+    def test_nearby_matches_brute_force(self):
+        rng = random.Random(7)
+        locator = CourierLocator()
+        positions = [make_position(55.75 + rng.uniform(-0.3, 0.3), 37.61 + rng.uniform(-0.5, 0.5)) for _ in range(3000)]
+        locator.update(positions)
+
+        for _ in range(20):
+            lat, lon = 55.75 + rng.uniform(-0.3, 0.3), 37.61 + rng.uniform(-0.5, 0.5)
+            radius = rng.uniform(200, 5000)
+
+            found = locator.nearby(lat, lon, radius, limit=10_000, now=NOW)
+
+            expected = sorted(p.courier_id for p in positions if p.distance_to(lat, lon) <= radius)
+            assert sorted(p.courier_id for p, _ in found) == expected
+            assert [d for _, d in found] == sorted(d for _, d in found)
+
+    def test_nearby_across_antimeridian(self):
+        locator = CourierLocator()
+        east = make_position(0.0, 179.999)
+        locator.update([east, make_position(0.0, 170.0)])
+
+        found = locator.nearby(0.0, -179.999, 1000, now=NOW)
+
+        assert [p.courier_id for p, _ in found] == [east.courier_id]
+
+    def test_nearby_near_pole(self):
+        locator = CourierLocator()
+        polar = make_position(89.9999, 100.0)
+        locator.update([polar])
+
+        found = locator.nearby(89.9999, -80.0, 100, now=NOW)
+
+        assert [p.courier_id for p, _ in found] == [polar.courier_id]
+
+    def test_update_moves_courier_between_cells_and_ignores_older(self):
+        locator = CourierLocator()
+        courier_id = uuid4()
+        locator.update([make_position(55.75, 37.61, courier_id)])
+        locator.update([make_position(55.85, 37.61, courier_id, NOW + timedelta(seconds=10))])
+        assert locator.update([make_position(55.75, 37.61, courier_id, NOW + timedelta(seconds=5))]) == []
+
+        assert locator.nearby(55.75, 37.61, 500, now=NOW) == []
+        assert len(locator.nearby(55.85, 37.61, 500, now=NOW)) == 1
+        assert len(locator) == 1
+
+    def test_stale_positions_are_hidden_and_pruned(self):
+        locator = CourierLocator(ttl_seconds=60)
+        stale = make_position(55.75, 37.61, recorded_at=NOW - timedelta(minutes=5))
+        fresh = make_position(55.75, 37.611)
+        locator.update([stale, fresh])
+
+        assert [p.courier_id for p, _ in locator.nearby(55.75, 37.61, 500, now=NOW)] == [fresh.courier_id]
+        assert locator.prune(now=NOW) == [stale.courier_id]
+        assert locator.get(stale.courier_id) is None
+
+
+class TestCourierPositionService:
+
+    @pytest.mark.asyncio
+    async def test_record_uses_latest_point_per_delivery(self):
+        delivery_id, courier_id = uuid4(), uuid4()
+        repository = AsyncMock()
+        repository.get_courier_ids.return_value = {delivery_id: courier_id}
+        mirror = AsyncMock()
+        locator = CourierLocator()
+        service = CourierPositionService(repository, locator, mirror)
+
+        recorded = await service.record([
+            TrackingPoint(delivery_id=delivery_id, latitude=55.75, longitude=37.61, recorded_at=NOW),
+            TrackingPoint(delivery_id=delivery_id, latitude=55.76, longitude=37.62, recorded_at=NOW + timedelta(seconds=5)),
+            TrackingPoint(delivery_id=uuid4(), latitude=10.0, longitude=10.0, recorded_at=NOW),
+        ])
+
+        assert recorded == 1
+        assert locator.get(courier_id).latitude == 55.76
+        assert mirror.publish.await_args.args[0] == [locator.get(courier_id)]
+
+    @pytest.mark.asyncio
+    async def test_sync_loads_mirror_and_removes_stale(self):
+        locator = CourierLocator(ttl_seconds=60)
+        stale = make_position(55.75, 37.61, recorded_at=datetime.now(timezone.utc) - timedelta(minutes=10))
+        remote = make_position(55.75, 37.61, recorded_at=datetime.now(timezone.utc))
+        mirror = AsyncMock()
+        mirror.load.return_value = [stale, remote]
+        service = CourierPositionService(AsyncMock(), locator, mirror)
+
+        await service.sync()
+
+        assert locator.get(remote.courier_id) == remote
+        assert locator.get(stale.courier_id) is None
+        mirror.remove.assert_awaited_once_with([stale.courier_id])
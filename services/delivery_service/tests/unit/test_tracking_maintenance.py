@@ -0,0 +1,83 @@
+import math
+import random
+import pytest
+from unittest.mock import AsyncMock
+from datetime import date
+
+from src.app.services.tracking_maintenance import TrackingMaintenanceService, simplify_track
+
+# ~1 м по широте
+METER = 1 / 111_195
+
+
+def test_simplify_keeps_endpoints_of_short_tracks():
+    assert simplify_track([], 10) == []
+    assert simplify_track([(55.0, 37.0)], 10) == [0]
+    assert simplify_track([(55.0, 37.0), (55.1, 37.1)], 10) == [0, 1]
+
+
+def test_simplify_collapses_straight_line():
+    track = [(55.0 + i * 10 * METER, 37.0) for i in range(100)]
+
+    assert simplify_track(track, 5) == [0, 99]
+
+
+def test_simplify_keeps_corner():
+    north = [(55.0 + i * 20 * METER, 37.0) for i in range(50)]
+    east = [(north[-1][0], 37.0 + i * 0.0005) for i in range(1, 50)]
+
+    assert simplify_track(north + east, 5) == [0, 49, 98]
+
+
+def test_simplify_collapses_stationary_courier():
+    track = [(55.0, 37.0)] * 30 + [(55.0 + 2 * METER, 37.0)] * 30
+
+    assert simplify_track(track, 10) == [0, 59]
+
+
+def test_simplify_keeps_shape_and_shrinks_noisy_route():
+    rng = random.Random(42)
+    track = []
+    for i in range(2000):
+        # Плавный поворот с GPS-шумом до 3 м
+        angle = i / 2000 * math.pi / 2
+        track.append((
+            55.0 + math.sin(angle) * 0.05 + rng.uniform(-3, 3) * METER,
+            37.0 + (1 - math.cos(angle)) * 0.05 + rng.uniform(-3, 3) * METER,
+        ))
+
+    kept = simplify_track(track, 10)
+
+    assert kept[0] == 0 and kept[-1] == len(track) - 1
+    assert len(kept) * 10 <= len(track)
+    assert len(kept) > 2
+
+
+class TestTrackingMaintenanceService:
+
+    @pytest.mark.asyncio
+    async def test_rollover_creates_future_partitions_and_drops_expired(self):
+        repository = AsyncMock()
+        repository.drop_partitions_before.return_value = 2
+        service = TrackingMaintenanceService(repository, partitions_ahead_days=3, retention_days=30)
+
+        dropped = await service.rollover(today=date(2024, 5, 31))
+
+        assert dropped == 2
+        repository.ensure_partitions.assert_awaited_once_with(date(2024, 5, 31), 4)
+        repository.drop_partitions_before.assert_awaited_once_with(date(2024, 5, 1))
+
+    @pytest.mark.asyncio
+    async def test_compact_processes_old_days_with_tolerance(self):
+        repository = AsyncMock()
+        repository.get_uncompacted_days.return_value = [date(2024, 5, 1), date(2024, 5, 2)]
+        repository.compact_day.return_value = (1000, 80)
+        service = TrackingMaintenanceService(repository, compact_after_days=7, tolerance_meters=5)
+
+        results = await service.compact(today=date(2024, 5, 10))
+
+        assert results == [(date(2024, 5, 1), 1000, 80), (date(2024, 5, 2), 1000, 80)]
+        repository.get_uncompacted_days.assert_awaited_once_with(date(2024, 5, 3))
+
+        simplify = repository.compact_day.await_args.args[1]
+        assert simplify([(55.0, 37.0), (55.0 + 3 * METER, 37.0), (55.0, 37.0 + 0.01)]) == [0, 2]
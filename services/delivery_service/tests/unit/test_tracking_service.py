@@ -0,0 +1,161 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+
+from src.app.services.tracking import TrackingBuffer, TrackingService
+from src.app.workers.tracking_worker import TrackingFlushWorker
+from src.domain.errors.tracking import TrackingBufferFullError
+from src.domain.value_objects import TrackingPoint
+
+BASE_TIME = datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def make_point(delivery_id, seconds=0, latitude=55.75, longitude=37.61):
+    return TrackingPoint(
+        delivery_id=delivery_id,
+        latitude=latitude,
+        longitude=longitude,
+        recorded_at=BASE_TIME + timedelta(seconds=seconds),
+    )
+
+
+class TestTrackingBuffer:
+
+    def test_add_dedupes_by_delivery_and_timestamp(self):
+        buffer = TrackingBuffer()
+        delivery_id = uuid4()
+
+        assert buffer.add([make_point(delivery_id, 0), make_point(delivery_id, 0), make_point(delivery_id, 5)]) == (2, 1)
+        assert buffer.add([make_point(delivery_id, 5), make_point(uuid4(), 5)]) == (1, 1)
+        assert len(buffer) == 3
+
+    def test_repeat_of_flushed_latest_point_is_duplicate(self):
+        buffer = TrackingBuffer()
+        delivery_id = uuid4()
+        buffer.add([make_point(delivery_id, 0), make_point(delivery_id, 10)])
+        buffer.drain()
+
+        assert buffer.add([make_point(delivery_id, 10)]) == (0, 1)
+        assert buffer.latest(delivery_id).recorded_at == BASE_TIME + timedelta(seconds=10)
+
+    def test_full_buffer_rejects_whole_batch(self):
+        buffer = TrackingBuffer(max_points=2)
+        delivery_id = uuid4()
+        buffer.add([make_point(delivery_id, 0)])
+
+        with pytest.raises(TrackingBufferFullError):
+            buffer.add([make_point(delivery_id, 1), make_point(delivery_id, 2)])
+        assert len(buffer) == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_ready_returns_when_flush_size_reached(self):
+        buffer = TrackingBuffer(flush_size=2)
+        delivery_id = uuid4()
+        buffer.add([make_point(delivery_id, 0), make_point(delivery_id, 1)])
+
+        await buffer.wait_ready(timeout=10)
+
+        assert len(buffer.drain()) == 2
+        assert len(buffer) == 0
+
+    def test_prune_latest_forgets_silent_deliveries(self):
+        buffer = TrackingBuffer(latest_ttl_seconds=60)
+        stale, active = uuid4(), uuid4()
+        buffer.add([make_point(stale, 0), make_point(active, 120)])
+
+        buffer.prune_latest(now=BASE_TIME + timedelta(seconds=150))
+
+        assert buffer.latest(stale) is None
+        assert buffer.latest(active) is not None
+
+
+class TestTrackingService:
+
+    @pytest.mark.asyncio
+    async def test_get_latest_falls_back_to_repository(self):
+        repository = AsyncMock()
+        stored = make_point(uuid4())
+        repository.get_latest.return_value = stored
+        service = TrackingService(repository=repository, buffer=TrackingBuffer())
+
+        assert await service.get_latest(stored.delivery_id) is stored
+        repository.get_latest.assert_awaited_once_with(stored.delivery_id)
+
+    @pytest.mark.asyncio
+    async def test_get_latest_prefers_buffer(self):
+        repository = AsyncMock()
+        service = TrackingService(repository=repository, buffer=TrackingBuffer())
+        delivery_id = uuid4()
+        service.ingest([make_point(delivery_id, 0), make_point(delivery_id, 30, latitude=56.0)])
+
+        latest = await service.get_latest(delivery_id)
+
+        assert latest.latitude == 56.0
+        repository.get_latest.assert_not_awaited()
+
+
+class TestTrackingFlushWorker:
+
+    @pytest.mark.asyncio
+    async def test_flush_saves_points_and_publishes_latest_position_once(self):
+        buffer = TrackingBuffer()
+        repository = AsyncMock()
+        repository.save_points.return_value = 3
+        event_queue = AsyncMock()
+        worker = TrackingFlushWorker(buffer, repository, event_queue, event_interval_seconds=30)
+        delivery_id = uuid4()
+        buffer.add([make_point(delivery_id, 0), make_point(delivery_id, 10, latitude=56.0), make_point(uuid4(), 0)])
+
+        await worker.flush()
+
+        assert len(repository.save_points.call_args.args[0]) == 3
+        assert event_queue.publish_event.await_count == 2
+        payloads = {e.args[0].payload["delivery_id"]: e.args[0].payload for e in event_queue.publish_event.await_args_list}
+        assert payloads[str(delivery_id)]["latitude"] == 56.0
+        assert payloads[str(delivery_id)]["current_location"] == "56.000000,37.610000"
+
+    @pytest.mark.asyncio
+    async def test_flush_throttles_events_per_delivery(self):
+        buffer = TrackingBuffer()
+        repository = AsyncMock()
+        event_queue = AsyncMock()
+        worker = TrackingFlushWorker(buffer, repository, event_queue, event_interval_seconds=30)
+        delivery_id = uuid4()
+
+        buffer.add([make_point(delivery_id, 0)])
+        await worker.flush()
+        buffer.add([make_point(delivery_id, 5)])
+        await worker.flush()
+
+        assert repository.save_points.await_count == 2
+        event_queue.publish_event.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_returns_points_to_buffer(self):
+        buffer = TrackingBuffer()
+        repository = AsyncMock()
+        repository.save_points.side_effect = RuntimeError("db down")
+        event_queue = AsyncMock()
+        worker = TrackingFlushWorker(buffer, repository, event_queue)
+        buffer.add([make_point(uuid4(), 0), make_point(uuid4(), 0)])
+
+        await worker.flush()
+
+        assert len(buffer) == 2
+        event_queue.publish_event.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_flush_updates_courier_positions(self):
+        buffer = TrackingBuffer()
+        positions = AsyncMock()
+        positions.record.side_effect = RuntimeError("redis down")
+        event_queue = AsyncMock()
+        worker = TrackingFlushWorker(buffer, AsyncMock(), event_queue, positions=positions)
+        point = make_point(uuid4(), 0)
+        buffer.add([point])
+
+        await worker.flush()
+
+        positions.record.assert_awaited_once_with([point])
+        event_queue.publish_event.assert_awaited_once()
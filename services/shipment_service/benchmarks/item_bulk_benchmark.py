@@ -0,0 +1,79 @@
+"""
+Замер пропускной способности записи items: по одному save на item против одного save_many.
+База заменена соединением с фиксированной задержкой на каждый запрос, поэтому
+цифры показывают цену round-trip'ов, а не работу Postgres.
+Запуск из каталога сервиса: python -m benchmarks.item_bulk_benchmark [N] [round_trip_ms]
+"""
+import asyncio
+import sys
+import time
+from uuid import uuid4
+
+from libs.testing.postgres import FakePool, RecordingConnection
+
+from src.domain.entities.item import Item
+from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.weight import Weight
+from src.infra.db.item_repository import AsyncPostgresItemRepository
+
+ITEM_COLUMNS = ["item_id", "shipment_id", "name", "quantity", "weight"]
+
+
+class LatencyConnection(RecordingConnection):
+
+    def __init__(self, round_trip_seconds: float):
+        super().__init__()
+        self.round_trip_seconds = round_trip_seconds
+        self.copied = []
+
+    async def _round_trip(self, query, args=()):
+        self.record(query, args)
+        await asyncio.sleep(self.round_trip_seconds)
+
+    async def execute(self, query, *args):
+        await self._round_trip(query, args)
+
+    async def fetchrow(self, query, *args):
+        await self._round_trip(query, args)
+        return dict(zip(ITEM_COLUMNS, args))
+
+    async def fetch(self, query, *args):
+        await self._round_trip(query, args)
+        rows = zip(*args) if args else self.copied
+        return [dict(zip(ITEM_COLUMNS, row)) for row in rows]
+
+    async def copy_records_to_table(self, table, records, columns):
+        await self._round_trip(table)
+        self.copied = list(records)
+
+
+async def main(count: int, round_trip_ms: float) -> None:
+    shipment_id = uuid4()
+    items = [
+        Item(name=f"SKU-{n}", quantity=Quantity(n % 10 + 1), weight=Weight(1.5), shipment_id=shipment_id)
+        for n in range(count)
+    ]
+
+    for name, write in (
+        ("single", lambda repo: _save_one_by_one(repo, items)),
+        ("bulk", lambda repo: repo.save_many(items)),
+    ):
+        conn = LatencyConnection(round_trip_ms / 1000)
+        repository = AsyncPostgresItemRepository(FakePool(conn))
+        started = time.perf_counter()
+        await write(repository)
+        elapsed = time.perf_counter() - started
+        print(f"{name:>6}: {count} items in {elapsed * 1000:.1f} ms, "
+              f"{count / elapsed:,.0f} items/s, {conn.round_trips} round-trip(s)")
+
+
+async def _save_one_by_one(repository: AsyncPostgresItemRepository, items) -> None:
+    for item in items:
+        await repository.save(item)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 2.0,
+    ))
@@ -0,0 +1,84 @@
+from yoyo import step
+
+__depends__ = {'004_add_tracking_history'}
+
+steps = [
+    step(
+        """
+        -- Статусы приводятся к значениям ShipmentStatus; старые записи не блокируют миграцию.
+        -- CANCELLED среди них нет — такие строки не трогаются, пока статус не появится в CHECK
+        ALTER TABLE shipments DROP CONSTRAINT IF EXISTS ck_shipment_status;
+        ALTER TABLE shipment_status_history DROP CONSTRAINT IF EXISTS ck_status_history_status;
+
+        -- Переименование статусов — не смена статуса: триггер истории не должен писать фиктивные строки
+        ALTER TABLE shipments DISABLE TRIGGER track_shipment_status_changes;
+
+        UPDATE shipments
+        SET status = CASE status
+            WHEN 'PENDING' THEN 'created'
+            WHEN 'DELAYED' THEN 'in_transit'
+            ELSE lower(status)
+        END
+        WHERE status <> lower(status) AND status <> 'CANCELLED';
+
+        ALTER TABLE shipments ENABLE TRIGGER track_shipment_status_changes;
+
+        UPDATE shipment_status_history
+        SET old_status = CASE old_status
+                WHEN 'PENDING' THEN 'created'
+                WHEN 'DELAYED' THEN 'in_transit'
+                WHEN 'CANCELLED' THEN old_status
+                ELSE lower(old_status)
+            END,
+            new_status = CASE new_status
+                WHEN 'PENDING' THEN 'created'
+                WHEN 'DELAYED' THEN 'in_transit'
+                WHEN 'CANCELLED' THEN new_status
+                ELSE lower(new_status)
+            END
+        WHERE new_status <> lower(new_status) OR old_status <> lower(old_status);
+
+        ALTER TABLE shipments ADD CONSTRAINT ck_shipment_status
+        CHECK (status IN (
+            'created', 'received', 'ready_for_delivery', 'in_transit', 'delivered', 'completed'
+        )) NOT VALID;
+
+        ALTER TABLE shipment_status_history ADD CONSTRAINT ck_status_history_status
+        CHECK (new_status IN (
+            'created', 'received', 'ready_for_delivery', 'in_transit', 'delivered', 'completed'
+        )) NOT VALID;
+
+        COMMENT ON COLUMN shipments.status IS
+            'Статус отгрузки: created, received, ready_for_delivery, in_transit, delivered, completed';
+
+        -- Частичный индекс по активным отгрузкам в порядке keyset-пагинации
+        DROP INDEX IF EXISTS idx_shipments_active;
+        CREATE INDEX idx_shipments_active
+        ON shipments(created_at DESC, shipment_id DESC)
+        WHERE status <> 'completed';
+
+        -- Фильтр по одному статусу; shipment_id разрешает равные created_at
+        DROP INDEX IF EXISTS idx_shipments_status_created;
+        CREATE INDEX idx_shipments_status_created
+        ON shipments(status, created_at DESC, shipment_id DESC);
+        """,
+
+        """
+        DROP INDEX IF EXISTS idx_shipments_status_created;
+        CREATE INDEX idx_shipments_status_created ON shipments(status, created_at DESC);
+
+        DROP INDEX IF EXISTS idx_shipments_active;
+        CREATE INDEX idx_shipments_active
+        ON shipments(shipment_id, status, created_at)
+        WHERE status IN ('PENDING', 'IN_TRANSIT');
+
+        ALTER TABLE shipment_status_history DROP CONSTRAINT IF EXISTS ck_status_history_status;
+        ALTER TABLE shipment_status_history ADD CONSTRAINT ck_status_history_status
+        CHECK (new_status IN ('PENDING', 'IN_TRANSIT', 'DELIVERED', 'CANCELLED', 'DELAYED')) NOT VALID;
+
+        ALTER TABLE shipments DROP CONSTRAINT IF EXISTS ck_shipment_status;
+        ALTER TABLE shipments ADD CONSTRAINT ck_shipment_status
+        CHECK (status IN ('PENDING', 'IN_TRANSIT', 'DELIVERED', 'CANCELLED', 'DELAYED')) NOT VALID;
+        """
+    )
+]
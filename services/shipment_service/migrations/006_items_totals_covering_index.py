@@ -0,0 +1,19 @@
+from yoyo import step
+
+__depends__ = {'005_shipment_status_keyset'}
+
+steps = [
+    step(
+        """
+        -- Покрывающий индекс: SUM(weight * quantity) и COUNT(*) по отгрузке считаются index-only scan
+        DROP INDEX IF EXISTS idx_items_shipment_weight;
+        CREATE INDEX idx_items_shipment_totals
+        ON items(shipment_id) INCLUDE (quantity, weight);
+        """,
+
+        """
+        DROP INDEX IF EXISTS idx_items_shipment_totals;
+        CREATE INDEX idx_items_shipment_weight ON items(shipment_id, weight);
+        """
+    )
+]
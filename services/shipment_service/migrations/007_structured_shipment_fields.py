@@ -0,0 +1,149 @@
+from yoyo import step
+
+__depends__ = {'006_items_totals_covering_index'}
+
+steps = [
+    step(
+        """
+        ALTER TABLE shipments
+            ADD COLUMN origin_country VARCHAR(100),
+            ADD COLUMN origin_city VARCHAR(100),
+            ADD COLUMN origin_address TEXT NOT NULL DEFAULT '',
+            ADD COLUMN destination_country VARCHAR(100),
+            ADD COLUMN destination_city VARCHAR(100),
+            ADD COLUMN destination_address TEXT NOT NULL DEFAULT '',
+            ADD COLUMN departure_date DATE,
+            ADD COLUMN arrival_date DATE;
+
+        -- В TEXT-колонках лежит то, что давал str(Location): JSON или repr dataclass.
+        -- Поле извлекается без исключений; нераспознанное значение дает NULL
+        CREATE FUNCTION pg_temp.location_part(raw TEXT, part TEXT) RETURNS TEXT AS $$
+        BEGIN
+            IF raw ~ '^[[:space:]]*[{]' THEN
+                BEGIN
+                    RETURN raw::jsonb ->> part;
+                EXCEPTION WHEN invalid_text_representation THEN
+                    RETURN NULL;
+                END;
+            END IF;
+            RETURN substring(raw FROM part || '=''([^'']*)''');
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE;
+
+        -- Перенос адресов в колонки. Нераспознанная строка целиком уходит в address,
+        -- страна и город помечаются 'Unknown'. Дата отправления ранее не сохранялась
+        UPDATE shipments
+        SET origin_country = COALESCE(NULLIF(pg_temp.location_part(origin, 'country'), ''), 'Unknown'),
+            origin_city = COALESCE(NULLIF(pg_temp.location_part(origin, 'city'), ''), 'Unknown'),
+            origin_address = CASE
+                WHEN pg_temp.location_part(origin, 'city') IS NULL THEN origin
+                ELSE COALESCE(pg_temp.location_part(origin, 'address'), '')
+            END,
+            destination_country = COALESCE(NULLIF(pg_temp.location_part(destination, 'country'), ''), 'Unknown'),
+            destination_city = COALESCE(NULLIF(pg_temp.location_part(destination, 'city'), ''), 'Unknown'),
+            destination_address = CASE
+                WHEN pg_temp.location_part(destination, 'city') IS NULL THEN destination
+                ELSE COALESCE(pg_temp.location_part(destination, 'address'), '')
+            END,
+            departure_date = created_at::date;
+
+        DROP FUNCTION pg_temp.location_part(TEXT, TEXT);
+
+        -- Представление ссылается на старые колонки и пересоздается поверх новых
+        DROP MATERIALIZED VIEW IF EXISTS shipment_statistics;
+
+        ALTER TABLE shipments
+            ALTER COLUMN origin_country SET NOT NULL,
+            ALTER COLUMN origin_city SET NOT NULL,
+            ALTER COLUMN destination_country SET NOT NULL,
+            ALTER COLUMN destination_city SET NOT NULL,
+            ALTER COLUMN departure_date SET NOT NULL,
+            ADD CONSTRAINT ck_shipments_arrival_after_departure
+                CHECK (arrival_date IS NULL OR arrival_date >= departure_date),
+            DROP COLUMN origin,
+            DROP COLUMN destination;
+
+        -- Аналитика маршрутов: город отправления/назначения и диапазон дат отправления
+        CREATE INDEX idx_shipments_origin_departure ON shipments(origin_city, departure_date);
+        CREATE INDEX idx_shipments_destination_departure ON shipments(destination_city, departure_date);
+        CREATE INDEX idx_shipments_departure_date ON shipments(departure_date);
+
+        CREATE MATERIALIZED VIEW shipment_statistics AS
+        SELECT
+            s.shipment_id,
+            s.status,
+            s.origin_city,
+            s.destination_city,
+            COUNT(i.item_id) as total_items,
+            COALESCE(SUM(i.quantity), 0) as total_quantity,
+            COALESCE(SUM(i.weight), 0) as total_weight,
+            s.created_at,
+            s.updated_at
+        FROM shipments s
+        LEFT JOIN items i ON s.shipment_id = i.shipment_id
+        GROUP BY s.shipment_id;
+
+        CREATE UNIQUE INDEX idx_shipment_stats_id ON shipment_statistics(shipment_id);
+        CREATE INDEX idx_shipment_stats_status ON shipment_statistics(status);
+
+        COMMENT ON COLUMN shipments.departure_date IS 'Плановая дата отправления';
+        COMMENT ON COLUMN shipments.arrival_date IS 'Фактическая дата доставки (NULL до доставки)';
+        """,
+
+        """
+        DROP MATERIALIZED VIEW IF EXISTS shipment_statistics;
+
+        ALTER TABLE shipments
+            ADD COLUMN origin TEXT,
+            ADD COLUMN destination TEXT;
+
+        UPDATE shipments
+        SET origin = json_build_object(
+                'country', origin_country, 'city', origin_city, 'address', origin_address
+            )::text,
+            destination = json_build_object(
+                'country', destination_country, 'city', destination_city, 'address', destination_address
+            )::text;
+
+        ALTER TABLE shipments
+            ALTER COLUMN origin SET NOT NULL,
+            ALTER COLUMN destination SET NOT NULL;
+
+        DROP INDEX IF EXISTS idx_shipments_origin_departure;
+        DROP INDEX IF EXISTS idx_shipments_destination_departure;
+        DROP INDEX IF EXISTS idx_shipments_departure_date;
+
+        ALTER TABLE shipments
+            DROP CONSTRAINT IF EXISTS ck_shipments_arrival_after_departure,
+            DROP COLUMN origin_country,
+            DROP COLUMN origin_city,
+            DROP COLUMN origin_address,
+            DROP COLUMN destination_country,
+            DROP COLUMN destination_city,
+            DROP COLUMN destination_address,
+            DROP COLUMN departure_date,
+            DROP COLUMN arrival_date;
+
+        CREATE INDEX idx_shipments_origin_gin ON shipments USING GIN(to_tsvector('english', origin));
+        CREATE INDEX idx_shipments_destination_gin ON shipments USING GIN(to_tsvector('english', destination));
+
+        CREATE MATERIALIZED VIEW shipment_statistics AS
+        SELECT
+            s.shipment_id,
+            s.status,
+            s.origin,
+            s.destination,
+            COUNT(i.item_id) as total_items,
+            COALESCE(SUM(i.quantity), 0) as total_quantity,
+            COALESCE(SUM(i.weight), 0) as total_weight,
+            s.created_at,
+            s.updated_at
+        FROM shipments s
+        LEFT JOIN items i ON s.shipment_id = i.shipment_id
+        GROUP BY s.shipment_id, s.status, s.origin, s.destination, s.created_at, s.updated_at;
+
+        CREATE INDEX idx_shipment_stats_id ON shipment_statistics(shipment_id);
+        CREATE INDEX idx_shipment_stats_status ON shipment_statistics(status);
+        """
+    )
+]
@@ -0,0 +1,20 @@
+from yoyo import step
+
+__depends__ = {'007_structured_shipment_fields'}
+
+steps = [
+    step(
+        """
+        -- Покрывающий индекс: история отгрузки читается index-only scan в хронологическом порядке
+        DROP INDEX IF EXISTS idx_status_history_shipment;
+        CREATE INDEX idx_status_history_shipment
+        ON shipment_status_history(shipment_id, changed_at)
+        INCLUDE (old_status, new_status, changed_by);
+        """,
+
+        """
+        DROP INDEX IF EXISTS idx_status_history_shipment;
+        CREATE INDEX idx_status_history_shipment ON shipment_status_history(shipment_id, changed_at DESC);
+        """
+    )
+]
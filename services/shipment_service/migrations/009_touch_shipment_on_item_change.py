@@ -0,0 +1,53 @@
+from yoyo import step
+
+__depends__ = {'008_status_history_covering_index'}
+
+steps = [
+    step(
+        """
+        -- updated_at отгрузки меняется и при записи ее items: на нем строится ETag агрегата.
+        -- Statement-level триггеры: bulk-UPSERT items обновляет каждую отгрузку один раз
+        CREATE OR REPLACE FUNCTION touch_shipments_from_items() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE shipments SET updated_at = NOW()
+                WHERE shipment_id IN (SELECT shipment_id FROM new_rows);
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE shipments SET updated_at = NOW()
+                WHERE shipment_id IN (SELECT shipment_id FROM old_rows);
+            ELSE
+                UPDATE shipments SET updated_at = NOW()
+                WHERE shipment_id IN (
+                    SELECT shipment_id FROM new_rows
+                    UNION
+                    SELECT shipment_id FROM old_rows
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER trg_items_touch_shipment_insert
+        AFTER INSERT ON items
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION touch_shipments_from_items();
+
+        CREATE TRIGGER trg_items_touch_shipment_update
+        AFTER UPDATE ON items
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION touch_shipments_from_items();
+
+        CREATE TRIGGER trg_items_touch_shipment_delete
+        AFTER DELETE ON items
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION touch_shipments_from_items();
+        """,
+
+        """
+        DROP TRIGGER IF EXISTS trg_items_touch_shipment_insert ON items;
+        DROP TRIGGER IF EXISTS trg_items_touch_shipment_update ON items;
+        DROP TRIGGER IF EXISTS trg_items_touch_shipment_delete ON items;
+        DROP FUNCTION IF EXISTS touch_shipments_from_items();
+        """
+    )
+]
@@ -0,0 +1,181 @@
+from yoyo import step
+
+__depends__ = {'009_touch_shipment_on_item_change'}
+
+steps = [
+    step(
+        """
+        -- Материализованное представление требовало полного REFRESH и не обновлялось.
+        -- Вместо него таблица, которую триггеры поддерживают дельтами при записи shipments и items
+        DROP MATERIALIZED VIEW IF EXISTS shipment_statistics;
+
+        -- Записи между заполнением таблицы и созданием триггеров потерялись бы навсегда:
+        -- до конца миграции shipments и items доступны только на чтение
+        LOCK TABLE shipments, items IN SHARE ROW EXCLUSIVE MODE;
+
+        CREATE TABLE shipment_statistics (
+            shipment_id UUID PRIMARY KEY REFERENCES shipments(shipment_id) ON DELETE CASCADE,
+            status VARCHAR(50) NOT NULL,
+            origin_city VARCHAR(100) NOT NULL,
+            destination_city VARCHAR(100) NOT NULL,
+            total_items INTEGER NOT NULL DEFAULT 0,
+            total_quantity BIGINT NOT NULL DEFAULT 0,
+            total_weight NUMERIC NOT NULL DEFAULT 0,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL
+        );
+
+        INSERT INTO shipment_statistics (
+            shipment_id, status, origin_city, destination_city,
+            total_items, total_quantity, total_weight, created_at, updated_at
+        )
+        SELECT
+            s.shipment_id,
+            s.status,
+            s.origin_city,
+            s.destination_city,
+            COUNT(i.item_id),
+            COALESCE(SUM(i.quantity), 0),
+            COALESCE(SUM(i.weight * i.quantity), 0),
+            s.created_at,
+            s.updated_at
+        FROM shipments s
+        LEFT JOIN items i ON i.shipment_id = s.shipment_id
+        GROUP BY s.shipment_id;
+
+        -- Сводка для дашбордов группирует по статусу и маршруту
+        CREATE INDEX idx_shipment_stats_status ON shipment_statistics(status)
+            INCLUDE (total_items, total_quantity, total_weight);
+        CREATE INDEX idx_shipment_stats_route ON shipment_statistics(origin_city, destination_city);
+
+        -- Атрибуты отгрузки: строка создается вместе с отгрузкой, удаляется каскадом
+        CREATE OR REPLACE FUNCTION shipment_statistics_from_shipments() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO shipment_statistics (
+                    shipment_id, status, origin_city, destination_city, created_at, updated_at
+                )
+                SELECT shipment_id, status, origin_city, destination_city, created_at, updated_at
+                FROM new_rows
+                ON CONFLICT (shipment_id) DO NOTHING;
+            ELSE
+                UPDATE shipment_statistics st
+                SET status = n.status,
+                    origin_city = n.origin_city,
+                    destination_city = n.destination_city,
+                    updated_at = n.updated_at
+                FROM new_rows n
+                WHERE st.shipment_id = n.shipment_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER trg_shipments_statistics_insert
+        AFTER INSERT ON shipments
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION shipment_statistics_from_shipments();
+
+        CREATE TRIGGER trg_shipments_statistics_update
+        AFTER UPDATE ON shipments
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION shipment_statistics_from_shipments();
+
+        -- Агрегаты items: дельта (новые строки минус старые) по каждой затронутой отгрузке.
+        -- Одна строка статистики обновляется один раз на оператор, в том числе для bulk-UPSERT
+        CREATE OR REPLACE FUNCTION shipment_statistics_from_items() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE shipment_statistics st
+                SET total_items = st.total_items + d.items,
+                    total_quantity = st.total_quantity + d.quantity,
+                    total_weight = st.total_weight + d.weight
+                FROM (
+                    SELECT shipment_id, COUNT(*) AS items, SUM(quantity) AS quantity,
+                           SUM(weight * quantity) AS weight
+                    FROM new_rows
+                    GROUP BY shipment_id
+                ) d
+                WHERE st.shipment_id = d.shipment_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE shipment_statistics st
+                SET total_items = st.total_items - d.items,
+                    total_quantity = st.total_quantity - d.quantity,
+                    total_weight = st.total_weight - d.weight
+                FROM (
+                    SELECT shipment_id, COUNT(*) AS items, SUM(quantity) AS quantity,
+                           SUM(weight * quantity) AS weight
+                    FROM old_rows
+                    GROUP BY shipment_id
+                ) d
+                WHERE st.shipment_id = d.shipment_id;
+            ELSE
+                UPDATE shipment_statistics st
+                SET total_items = st.total_items + d.items,
+                    total_quantity = st.total_quantity + d.quantity,
+                    total_weight = st.total_weight + d.weight
+                FROM (
+                    SELECT shipment_id, SUM(items) AS items, SUM(quantity) AS quantity,
+                           SUM(weight) AS weight
+                    FROM (
+                        SELECT shipment_id, 1 AS items, quantity, weight * quantity AS weight
+                        FROM new_rows
+                        UNION ALL
+                        SELECT shipment_id, -1, -quantity, -(weight * quantity)
+                        FROM old_rows
+                    ) changes
+                    GROUP BY shipment_id
+                ) d
+                WHERE st.shipment_id = d.shipment_id
+                  AND (d.items <> 0 OR d.quantity <> 0 OR d.weight <> 0);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER trg_items_statistics_insert
+        AFTER INSERT ON items
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION shipment_statistics_from_items();
+
+        CREATE TRIGGER trg_items_statistics_update
+        AFTER UPDATE ON items
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION shipment_statistics_from_items();
+
+        CREATE TRIGGER trg_items_statistics_delete
+        AFTER DELETE ON items
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION shipment_statistics_from_items();
+        """,
+
+        """
+        DROP TRIGGER IF EXISTS trg_items_statistics_insert ON items;
+        DROP TRIGGER IF EXISTS trg_items_statistics_update ON items;
+        DROP TRIGGER IF EXISTS trg_items_statistics_delete ON items;
+        DROP TRIGGER IF EXISTS trg_shipments_statistics_insert ON shipments;
+        DROP TRIGGER IF EXISTS trg_shipments_statistics_update ON shipments;
+        DROP FUNCTION IF EXISTS shipment_statistics_from_items();
+        DROP FUNCTION IF EXISTS shipment_statistics_from_shipments();
+        DROP TABLE IF EXISTS shipment_statistics;
+
+        CREATE MATERIALIZED VIEW shipment_statistics AS
+        SELECT
+            s.shipment_id,
+            s.status,
+            s.origin_city,
+            s.destination_city,
+            COUNT(i.item_id) as total_items,
+            COALESCE(SUM(i.quantity), 0) as total_quantity,
+            COALESCE(SUM(i.weight), 0) as total_weight,
+            s.created_at,
+            s.updated_at
+        FROM shipments s
+        LEFT JOIN items i ON s.shipment_id = i.shipment_id
+        GROUP BY s.shipment_id;
+
+        CREATE UNIQUE INDEX idx_shipment_stats_id ON shipment_statistics(shipment_id);
+        CREATE INDEX idx_shipment_stats_status ON shipment_statistics(status);
+        """
+    )
+]
@@ -0,0 +1,89 @@
+from yoyo import step
+
+__depends__ = {'010_incremental_shipment_statistics'}
+
+steps = [
+    step(
+        """
+        -- Компенсация саги отменяет отгрузку вместо каскадного DELETE
+        ALTER TABLE shipments
+            ADD COLUMN cancelled_reason TEXT,
+            ADD COLUMN cancelled_at TIMESTAMP WITH TIME ZONE;
+
+        ALTER TABLE shipments DROP CONSTRAINT IF EXISTS ck_shipment_status;
+        ALTER TABLE shipments ADD CONSTRAINT ck_shipment_status
+        CHECK (status IN (
+            'created', 'received', 'ready_for_delivery', 'in_transit', 'delivered', 'completed', 'cancelled'
+        )) NOT VALID;
+
+        ALTER TABLE shipment_status_history DROP CONSTRAINT IF EXISTS ck_status_history_status;
+        ALTER TABLE shipment_status_history ADD CONSTRAINT ck_status_history_status
+        CHECK (new_status IN (
+            'created', 'received', 'ready_for_delivery', 'in_transit', 'delivered', 'completed', 'cancelled'
+        )) NOT VALID;
+
+        -- Унаследованные CANCELLED, оставленные миграцией 005, получают значение ShipmentStatus
+        ALTER TABLE shipments DISABLE TRIGGER track_shipment_status_changes;
+        UPDATE shipments SET status = 'cancelled' WHERE status = 'CANCELLED';
+        ALTER TABLE shipments ENABLE TRIGGER track_shipment_status_changes;
+
+        UPDATE shipment_status_history SET old_status = 'cancelled' WHERE old_status = 'CANCELLED';
+        UPDATE shipment_status_history SET new_status = 'cancelled' WHERE new_status = 'CANCELLED';
+
+        COMMENT ON COLUMN shipments.status IS
+            'Статус отгрузки: created, received, ready_for_delivery, in_transit, delivered, completed, cancelled';
+        COMMENT ON COLUMN shipments.cancelled_reason IS 'Причина отмены (NULL, если отгрузка не отменена)';
+
+        -- Отмененные отгрузки больше не активны
+        DROP INDEX IF EXISTS idx_shipments_active;
+        CREATE INDEX idx_shipments_active
+        ON shipments(created_at DESC, shipment_id DESC)
+        WHERE status NOT IN ('completed', 'cancelled');
+
+        -- Очередь архивации: отмененные отгрузки в порядке отмены
+        CREATE INDEX idx_shipments_cancelled
+        ON shipments(cancelled_at)
+        WHERE status = 'cancelled';
+
+        -- Архив: отгрузка вместе с items и историей статусов одним документом
+        CREATE TABLE shipments_archive (
+            shipment_id UUID PRIMARY KEY,
+            cancelled_reason TEXT,
+            cancelled_at TIMESTAMP WITH TIME ZONE,
+            archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            payload JSONB NOT NULL
+        );
+
+        CREATE INDEX idx_shipments_archive_cancelled_at ON shipments_archive(cancelled_at);
+        """,
+
+        """
+        DROP TABLE IF EXISTS shipments_archive;
+        DROP INDEX IF EXISTS idx_shipments_cancelled;
+
+        DROP INDEX IF EXISTS idx_shipments_active;
+        CREATE INDEX idx_shipments_active
+        ON shipments(created_at DESC, shipment_id DESC)
+        WHERE status <> 'completed';
+
+        ALTER TABLE shipment_status_history DROP CONSTRAINT IF EXISTS ck_status_history_status;
+        ALTER TABLE shipment_status_history ADD CONSTRAINT ck_status_history_status
+        CHECK (new_status IN (
+            'created', 'received', 'ready_for_delivery', 'in_transit', 'delivered', 'completed'
+        )) NOT VALID;
+
+        ALTER TABLE shipments DROP CONSTRAINT IF EXISTS ck_shipment_status;
+        ALTER TABLE shipments ADD CONSTRAINT ck_shipment_status
+        CHECK (status IN (
+            'created', 'received', 'ready_for_delivery', 'in_transit', 'delivered', 'completed'
+        )) NOT VALID;
+
+        COMMENT ON COLUMN shipments.status IS
+            'Статус отгрузки: created, received, ready_for_delivery, in_transit, delivered, completed';
+
+        ALTER TABLE shipments
+            DROP COLUMN IF EXISTS cancelled_reason,
+            DROP COLUMN IF EXISTS cancelled_at;
+        """
+    )
+]
@@ -1,6 +1,8 @@
 import asyncpg
 from fastapi import Depends
 
+from libs.cache.ports import CachePort
+from libs.deps.cache import CacheProvider
 from libs.deps.postgres_pool import PostgresPoolProvider
 from libs.deps.queue import EventQueueProvider
 from libs.auth import JWTAuthProvider
@@ -8,6 +10,8 @@ from libs.auth import JWTAuthProvider
 from src.config import settings
 from src.app.services.item import ItemService
 from src.app.services.shipment import ShipmentService
+from src.infra.cached_item_repository import CachedItemRepository
+from src.infra.cached_shipment_repository import CachedShipmentRepository
 from src.infra.db.item_repository import AsyncPostgresItemRepository
 from src.infra.db.shipment_repository import PostgresShipmentRepository
 
@@ -24,6 +28,13 @@ db_provider = PostgresPoolProvider(
     max_size=settings.DB_POOL_MAX_SIZE,
 )
 
+cache_provider = CacheProvider(
+    redis_url=settings.REDIS_URL,
+    service_prefix=settings.SERVICE_NAME,
+    use_redis=settings.USE_REDIS,
+    default_ttl=settings.ITEM_TOTALS_CACHE_TTL_SECONDS,
+)
+
 get_event_queue = event_queue_provider
 
 auth_provider = JWTAuthProvider(
@@ -36,24 +47,34 @@ get_current_user = auth_provider()
 
 
 async def get_item_repository(
-    pool: asyncpg.Pool = Depends(db_provider)
-) -> AsyncPostgresItemRepository:
-    return AsyncPostgresItemRepository(pool)
+    pool: asyncpg.Pool = Depends(db_provider),
+    cache: CachePort = Depends(cache_provider),
+) -> CachedItemRepository:
+    return CachedItemRepository(
+        repository=AsyncPostgresItemRepository(pool),
+        cache=cache,
+        ttl_seconds=settings.ITEM_TOTALS_CACHE_TTL_SECONDS,
+    )
 
 
 async def get_shipment_repository(
-    pool: asyncpg.Pool = Depends(db_provider)
-) -> PostgresShipmentRepository:
-    return PostgresShipmentRepository(pool)
+    pool: asyncpg.Pool = Depends(db_provider),
+    cache: CachePort = Depends(cache_provider),
+) -> CachedShipmentRepository:
+    return CachedShipmentRepository(
+        repository=PostgresShipmentRepository(pool),
+        cache=cache,
+        ttl_seconds=settings.SHIPMENT_HISTORY_CACHE_TTL_SECONDS,
+    )
 
 
 async def get_item_service(
-    repository: AsyncPostgresItemRepository = Depends(get_item_repository)
+    repository: CachedItemRepository = Depends(get_item_repository)
 ) -> ItemService:
     return ItemService(repository=repository)
 
 
 async def get_shipment_service(
-    repository: PostgresShipmentRepository = Depends(get_shipment_repository)
+    repository: CachedShipmentRepository = Depends(get_shipment_repository)
 ) -> ShipmentService:
     return ShipmentService(repository=repository)
@@ -1,2 +1,12 @@
-from .item import ItemDTO, ItemCreateDTO, ItemUpdateDTO
-from .shipment import ShipmentDTO, ShipmentCreateDTO, ShipmentUpdateDTO
\ No newline at end of file
+from .item import ItemDTO, ItemBulkDTO, ItemCreateDTO, ItemUpdateDTO, ShipmentTotalsDTO, ShipmentTotalsRequestDTO
+from .shipment import (
+    ShipmentAggregateDTO,
+    ShipmentCancelDTO,
+    ShipmentDTO,
+    ShipmentCreateDTO,
+    ShipmentUpdateDTO,
+    ShipmentHistoryDTO,
+    ShipmentHistoryRequestDTO,
+    StatusChangeDTO,
+    StatusStatisticsDTO,
+)
\ No newline at end of file
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 
 @dataclass
 class ItemCreateDTO:
@@ -8,6 +8,13 @@ class ItemCreateDTO:
     quantity: int
     weight: float
 
+@dataclass
+class ItemBulkDTO:
+    name: str
+    quantity: int
+    weight: float
+    item_id: Optional[UUID] = None
+
 @dataclass
 class ItemDTO:
     item_id: UUID
@@ -21,3 +28,14 @@ class ItemUpdateDTO:
     name: Optional[str] = None
     quantity: Optional[int] = None
     weight: Optional[float] = None
+
+@dataclass
+class ShipmentTotalsRequestDTO:
+    shipment_ids: List[UUID]
+
+@dataclass
+class ShipmentTotalsDTO:
+    shipment_id: UUID
+    items_count: int
+    total_quantity: int
+    total_weight: float
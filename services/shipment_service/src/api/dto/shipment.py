@@ -1,8 +1,10 @@
-from dataclasses import dataclass
-from datetime import date
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional
 from uuid import UUID
 
+from .item import ItemCreateDTO, ItemDTO, ShipmentTotalsDTO
+
 @dataclass
 class LocationDTO:
     country: str
@@ -14,6 +16,11 @@ class ShipmentCreateDTO:
     origin: LocationDTO
     destination: LocationDTO
     departure_date: date
+    items: List[ItemCreateDTO] = field(default_factory=list)
+
+@dataclass
+class ShipmentCancelDTO:
+    reason: str
 
 @dataclass
 class ShipmentUpdateDTO:
@@ -33,3 +40,34 @@ class ShipmentDTO:
     status: str
     created_at: str
     updated_at: str
+    cancelled_reason: Optional[str] = None
+
+@dataclass
+class StatusChangeDTO:
+    old_status: Optional[str]
+    new_status: str
+    changed_at: datetime
+    changed_by: Optional[str] = None
+
+@dataclass
+class ShipmentHistoryDTO:
+    shipment_id: UUID
+    changes: List[StatusChangeDTO]
+
+@dataclass
+class ShipmentHistoryRequestDTO:
+    shipment_ids: List[UUID]
+
+@dataclass
+class ShipmentAggregateDTO:
+    shipment: ShipmentDTO
+    items: List[ItemDTO]
+    totals: ShipmentTotalsDTO
+
+@dataclass
+class StatusStatisticsDTO:
+    status: str
+    shipments_count: int
+    total_items: int
+    total_quantity: int
+    total_weight: float
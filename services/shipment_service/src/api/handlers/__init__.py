@@ -1,2 +1,2 @@
-from .item import items_router
+from .item import items_router, shipment_items_router
 from .shipment import shipments_router
\ No newline at end of file
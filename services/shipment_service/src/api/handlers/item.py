@@ -2,7 +2,7 @@ from uuid import UUID
 from typing import List
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from starlette import status
 
 from src.api.deps.getters import (
@@ -12,13 +12,17 @@ from src.api.deps.getters import (
 )
 from src.api.dto.item import (
     ItemDTO,
+    ItemBulkDTO,
     ItemCreateDTO,
     ItemUpdateDTO,
+    ShipmentTotalsDTO,
+    ShipmentTotalsRequestDTO,
 )
 from src.api.mappers import ItemMapper
 from src.app.services.item import ItemService
+from src.config import settings
 from src.domain.entities.item import Item
-from src.domain.errors import ItemNotFoundError
+from src.domain.errors import ItemNotFoundError, QuantityError, WeightError
 from libs.messaging.ports import EventQueuePort
 from libs.messaging.events import (
     ShipmentUpdated,
@@ -63,6 +67,51 @@ async def create_item(
     return ItemMapper.entity_to_dto(created)
 
 
+@shipment_items_router.post(
+    "/bulk",
+    response_model=List[ItemDTO],
+    status_code=status.HTTP_201_CREATED,
+)
+async def upsert_items_bulk(
+        shipment_id: UUID,
+        dtos: List[ItemBulkDTO],
+        service: ItemService = Depends(get_item_service),
+        event_queue: EventQueuePort = Depends(get_event_queue),
+):
+    """
+    Создание и обновление партии items одной транзакцией; строки с item_id обновляют существующие.
+    Публикуется одно ShipmentUpdated на всю партию.
+    """
+    if len(dtos) > settings.ITEM_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Bulk upsert is limited to {settings.ITEM_BULK_MAX_ITEMS} items",
+        )
+
+    entities: List[Item] = []
+    for number, dto in enumerate(dtos, start=1):
+        try:
+            entities.append(ItemMapper.bulk_dto_to_entity(dto, shipment_id))
+        except (QuantityError, WeightError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid item {number}: {e}",
+            )
+
+    saved = await service.create_many(entities)
+
+    if saved:
+        domain_event = ShipmentUpdated(
+            shipment_id=shipment_id,
+            status="items_updated",
+            updated_at=datetime.now(timezone.utc)
+        )
+        event = DomainEventConverter.to_event(domain_event)
+        await event_queue.publish_event(event, "shipment-events")
+
+    return [ItemMapper.entity_to_dto(i) for i in saved]
+
+
 @shipment_items_router.get(
     "",
     response_model=List[ItemDTO],
@@ -242,3 +291,22 @@ async def get_shipment_items_count(
         "shipment_id": str(shipment_id),
         "items_count": count
     }
+
+
+@items_router.post(
+    "/totals",
+    response_model=List[ShipmentTotalsDTO],
+)
+async def get_shipments_totals(
+        dto: ShipmentTotalsRequestDTO,
+        service: ItemService = Depends(get_item_service),
+):
+    """Вес и количество items по нескольким отгрузкам за один запрос."""
+    if len(dto.shipment_ids) > settings.ITEM_TOTALS_MAX_SHIPMENTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.ITEM_TOTALS_MAX_SHIPMENTS} shipment ids per request",
+        )
+
+    totals = await service.get_totals(dto.shipment_ids)
+    return [ItemMapper.totals_to_dto(t) for t in totals]
@@ -1,8 +1,8 @@
 from uuid import UUID
-from typing import List
-from datetime import datetime, timezone
+from typing import List, Optional
+from datetime import date, datetime, timezone
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from starlette import status
 
 from libs.auth import require_role
@@ -11,15 +11,23 @@ from src.api.deps.getters import (
     get_current_user,
     get_event_queue,
 )
-from src.api.dto import ShipmentCreateDTO, ShipmentUpdateDTO
-from src.api.dto.shipment import ShipmentDTO
-from src.api.mappers import ShipmentMapper
+from src.api.dto import ShipmentCancelDTO, ShipmentCreateDTO, ShipmentUpdateDTO
+from src.api.dto.shipment import (
+    ShipmentAggregateDTO,
+    ShipmentDTO,
+    ShipmentHistoryDTO,
+    ShipmentHistoryRequestDTO,
+    StatusStatisticsDTO,
+)
+from src.api.mappers import ItemMapper, ShipmentMapper
 from src.app.services.shipment import ShipmentService
+from src.config import settings
 from src.domain.entities.shipment import Shipment
-from src.domain.errors import ShipmentNotFoundError
+from src.domain.entities.item import Item
+from src.domain.value_objects.shipment_status import ShipmentStatus
+from src.domain.errors import QuantityError, ShipmentNotFoundError, WeightError
 from libs.messaging.ports import EventQueuePort
 from libs.messaging.events import (
-    ShipmentCreated,
     ShipmentUpdated,
     ShipmentCancelled,
     DomainEventConverter
@@ -42,19 +50,92 @@ async def create_shipment(
         service: ShipmentService = Depends(get_shipment_service),
         event_queue: EventQueuePort = Depends(get_event_queue),
 ):
+    """
+    Отгрузка создается вместе с items одной транзакцией.
+    ShipmentCreated несет полный снимок: адреса, items, количества и вес.
+    """
+    if len(dto.items) > settings.ITEM_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Shipment is limited to {settings.ITEM_BULK_MAX_ITEMS} items",
+        )
+
     entity: Shipment = ShipmentMapper.create_dto_to_entity(dto)
-    created: Shipment = await service.create(entity)
+    items: List[Item] = []
+    for number, item_dto in enumerate(dto.items, start=1):
+        try:
+            items.append(ItemMapper.create_dto_to_entity(item_dto, entity.shipment_id))
+        except (QuantityError, WeightError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid item {number}: {e}",
+            )
+
+    aggregate = await service.create_with_items(entity, items)
+
+    event = DomainEventConverter.to_event(ShipmentMapper.aggregate_to_created_event(aggregate))
+    await event_queue.publish_event(event, "shipment-events")
+
+    return ShipmentMapper.entity_to_dto(aggregate.shipment)
 
-    domain_event = ShipmentCreated(
-        shipment_id=created.shipment_id,
-        origin=created.origin.city if hasattr(created.origin, 'city') else str(created.origin),
-        destination=created.destination.city if hasattr(created.destination, 'city') else str(created.destination),
-        items=[]
+
+@shipments_router.get(
+    "/routes",
+    response_model=List[ShipmentDTO],
+)
+async def list_route_shipments(
+        response: Response,
+        origin_city: Optional[str] = None,
+        destination_city: Optional[str] = None,
+        departure_from: Optional[date] = None,
+        departure_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = Query(50, ge=1, le=500),
+        service: ShipmentService = Depends(get_shipment_service),
+):
+    """Отгрузки по маршруту и диапазону дат отправления; следующая страница — в X-Next-Cursor."""
+    shipments = await service.find(
+        origin_city=origin_city,
+        destination_city=destination_city,
+        departure_from=departure_from,
+        departure_to=departure_to,
+        after=_decode_cursor(cursor),
+        limit=limit,
     )
-    event = DomainEventConverter.to_event(domain_event)
-    await event_queue.publish_event(event, topic="shipment-events")
+    return _page(response, shipments, limit)
 
-    return ShipmentMapper.entity_to_dto(created)
+
+@shipments_router.get(
+    "/statistics",
+    response_model=List[StatusStatisticsDTO],
+)
+async def get_shipment_statistics(
+        origin_city: Optional[str] = None,
+        destination_city: Optional[str] = None,
+        service: ShipmentService = Depends(get_shipment_service),
+):
+    """Количество отгрузок, items, штук и вес по статусам; опционально по маршруту."""
+    statistics = await service.get_statistics(origin_city=origin_city, destination_city=destination_city)
+    return [ShipmentMapper.statistics_to_dto(row) for row in statistics]
+
+
+@shipments_router.post(
+    "/history",
+    response_model=List[ShipmentHistoryDTO],
+)
+async def get_shipments_history(
+        dto: ShipmentHistoryRequestDTO,
+        service: ShipmentService = Depends(get_shipment_service),
+):
+    """История статусов нескольких отгрузок за один запрос; неизвестные отгрузки — с пустой историей."""
+    if len(dto.shipment_ids) > settings.SHIPMENT_HISTORY_MAX_SHIPMENTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.SHIPMENT_HISTORY_MAX_SHIPMENTS} shipment ids per request",
+        )
+
+    history = await service.get_histories(dto.shipment_ids)
+    return [ShipmentMapper.history_to_dto(shipment_id, changes) for shipment_id, changes in history.items()]
 
 
 @shipments_router.get(
@@ -71,6 +152,46 @@ async def get_shipment(
     return ShipmentMapper.entity_to_dto(shipment)
 
 
+@shipments_router.get(
+    "/{shipment_id}/aggregate",
+    response_model=ShipmentAggregateDTO,
+    responses={304: {"description": "Not Modified"}},
+)
+async def get_shipment_aggregate(
+        shipment_id: UUID,
+        request: Request,
+        response: Response,
+        service: ShipmentService = Depends(get_shipment_service),
+):
+    """
+    Отгрузка, items и агрегаты за один запрос к БД.
+    При совпадении If-None-Match отвечает 304 после проверки только updated_at.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        version = await service.get_version(shipment_id)
+        if version is not None:
+            etag = ShipmentMapper.etag(version)
+            if _etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    aggregate = await service.get_aggregate(shipment_id)
+    response.headers["ETag"] = ShipmentMapper.etag(aggregate.shipment.updated_at.value)
+    return ShipmentMapper.aggregate_to_dto(aggregate)
+
+
+@shipments_router.get(
+    "/{shipment_id}/history",
+    response_model=ShipmentHistoryDTO,
+)
+async def get_shipment_history(
+        shipment_id: UUID,
+        service: ShipmentService = Depends(get_shipment_service),
+):
+    changes = await service.get_history(shipment_id)
+    return ShipmentMapper.history_to_dto(shipment_id, changes)
+
+
 @shipments_router.get(
     "",
     response_model=List[ShipmentDTO],
@@ -94,6 +215,17 @@ async def update_shipment(
         service: ShipmentService = Depends(get_shipment_service),
         event_queue: EventQueuePort = Depends(get_event_queue),
 ):
+    if dto.status is not None:
+        try:
+            new_status = ShipmentStatus(dto.status)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Unknown shipment status: {dto.status}",
+            )
+        # Статус меняется только через VALID_TRANSITIONS и до записи полей: при 409 отгрузка не тронута
+        await service.update_status(shipment_id, new_status, arrival_date=dto.arrival_date)
+
     shipment = await service.get(shipment_id)
     if shipment is None:
         raise ShipmentNotFoundError(f"Shipment {shipment_id} not found")
@@ -214,8 +346,6 @@ async def mark_shipment_delivered(
         service: ShipmentService = Depends(get_shipment_service),
         event_queue: EventQueuePort = Depends(get_event_queue),
 ):
-    from datetime import date
-
     shipment = await service.mark_as_delivered(shipment_id, arrival_date=date.today())
 
     domain_event = ShipmentUpdated(
@@ -251,15 +381,50 @@ async def mark_shipment_completed(
     return ShipmentMapper.entity_to_dto(shipment)
 
 
+@shipments_router.post(
+    "/{shipment_id}/cancel",
+    response_model=ShipmentDTO,
+)
+async def cancel_shipment(
+        shipment_id: UUID,
+        dto: ShipmentCancelDTO,
+        service: ShipmentService = Depends(get_shipment_service),
+        event_queue: EventQueuePort = Depends(get_event_queue),
+):
+    """Мягкая отмена: отгрузка остается с причиной отмены и позже уходит в архив."""
+    shipment = await service.cancel(shipment_id, dto.reason)
+
+    domain_event = ShipmentCancelled(
+        shipment_id=shipment.shipment_id,
+        reason=dto.reason,
+        cancelled_at=shipment.updated_at.value
+    )
+    event = DomainEventConverter.to_event(domain_event)
+    await event_queue.publish_event(event, "shipment-events")
+
+    return ShipmentMapper.entity_to_dto(shipment)
+
+
 @shipments_router.get(
     "/status/active",
     response_model=List[ShipmentDTO],
 )
 async def list_active_shipments(
+        response: Response,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = Query(50, ge=1, le=500),
         service: ShipmentService = Depends(get_shipment_service),
 ):
-    shipments = await service.get_active_shipments()
-    return [ShipmentMapper.entity_to_dto(s) for s in shipments]
+    """Следующая страница передается через заголовок X-Next-Cursor."""
+    shipments = await service.get_active_shipments(
+        created_from=created_from,
+        created_to=created_to,
+        after=_decode_cursor(cursor),
+        limit=limit,
+    )
+    return _page(response, shipments, limit)
 
 
 @shipments_router.get(
@@ -267,7 +432,36 @@ async def list_active_shipments(
     response_model=List[ShipmentDTO],
 )
 async def list_in_transit_shipments(
+        response: Response,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = Query(50, ge=1, le=500),
         service: ShipmentService = Depends(get_shipment_service),
 ):
-    shipments = await service.get_in_transit_shipments()
+    """Следующая страница передается через заголовок X-Next-Cursor."""
+    shipments = await service.get_in_transit_shipments(
+        created_from=created_from,
+        created_to=created_to,
+        after=_decode_cursor(cursor),
+        limit=limit,
+    )
+    return _page(response, shipments, limit)
+
+
+def _decode_cursor(cursor: Optional[str]):
+    try:
+        return ShipmentMapper.decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _page(response: Response, shipments: List[Shipment], limit: int) -> List[ShipmentDTO]:
+    if len(shipments) == limit:
+        response.headers["X-Next-Cursor"] = ShipmentMapper.encode_cursor(shipments[-1])
     return [ShipmentMapper.entity_to_dto(s) for s in shipments]
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
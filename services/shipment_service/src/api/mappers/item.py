@@ -2,8 +2,9 @@ from uuid import UUID
 
 from src.domain.entities import Item
 from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.shipment_totals import ShipmentTotals
 from src.domain.value_objects.weight import Weight
-from src.api.dto.item import ItemDTO, ItemCreateDTO, ItemUpdateDTO
+from src.api.dto.item import ItemDTO, ItemBulkDTO, ItemCreateDTO, ItemUpdateDTO, ShipmentTotalsDTO
 
 class ItemMapper:
     @staticmethod
@@ -15,6 +16,14 @@ class ItemMapper:
             weight=Weight(dto.weight)
         )
 
+    @staticmethod
+    def bulk_dto_to_entity(dto: ItemBulkDTO, shipment_id: UUID) -> Item:
+        """Строка без item_id создает новый item, с item_id — обновляет существующий."""
+        item = ItemMapper.create_dto_to_entity(dto, shipment_id)
+        if dto.item_id is not None:
+            item.item_id = dto.item_id
+        return item
+
     @staticmethod
     def update_entity_from_dto(entity: Item, dto: ItemUpdateDTO):
         if dto.name is not None:
@@ -34,3 +43,12 @@ class ItemMapper:
             quantity=entity.quantity.value,
             weight=entity.weight.value
         )
+
+    @staticmethod
+    def totals_to_dto(totals: ShipmentTotals) -> ShipmentTotalsDTO:
+        return ShipmentTotalsDTO(
+            shipment_id=totals.shipment_id,
+            items_count=totals.items_count,
+            total_quantity=totals.total_quantity,
+            total_weight=totals.total_weight
+        )
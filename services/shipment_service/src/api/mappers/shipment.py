@@ -1,37 +1,47 @@
-from datetime import datetime
+import base64
+from datetime import datetime, timezone
+from typing import List, Tuple
+from uuid import UUID
 
 from libs.value_objects.location import Location
+from libs.messaging.events import ShipmentCreated
 from libs.value_objects.timestamp import Timestamp
-from src.domain.value_objects.shipment_status import ShipmentStatus
+from src.domain.value_objects.status_change import StatusChange
+from src.domain.value_objects.status_statistics import StatusStatistics
 from src.api.dto.shipment import ShipmentDTO, ShipmentCreateDTO, ShipmentUpdateDTO, \
-    LocationDTO
+    LocationDTO, ShipmentAggregateDTO, ShipmentHistoryDTO, StatusChangeDTO, StatusStatisticsDTO
+from src.api.mappers.item import ItemMapper
 
-from ...domain.entities import Shipment
+from ...domain.entities import Shipment, ShipmentAggregate
 
 
 class ShipmentMapper:
 
+    @staticmethod
+    def location_from_dto(dto) -> Location:
+        if isinstance(dto, dict):
+            return Location(**dto)
+        return Location(country=dto.country, city=dto.city, address=dto.address)
+
     @staticmethod
     def create_dto_to_entity(dto: ShipmentCreateDTO) -> Shipment:
         return Shipment(
-            origin=Location(**dto.origin) if isinstance(dto.origin, dict) else dto.origin,
-            destination=Location(**dto.destination) if isinstance(dto.destination, dict) else dto.destination,
+            origin=ShipmentMapper.location_from_dto(dto.origin),
+            destination=ShipmentMapper.location_from_dto(dto.destination),
             departure_date=dto.departure_date,
         )
 
     @staticmethod
     def update_entity_from_dto(entity: Shipment, dto: ShipmentUpdateDTO) -> Shipment:
         if dto.origin is not None:
-            entity.origin = Location(**dto.origin) if isinstance(dto.origin, dict) else dto.origin
+            entity.origin = ShipmentMapper.location_from_dto(dto.origin)
         if dto.destination is not None:
-            entity.destination = Location(**dto.destination) if isinstance(dto.destination, dict) else dto.destination
+            entity.destination = ShipmentMapper.location_from_dto(dto.destination)
         if dto.departure_date is not None:
             entity.departure_date = dto.departure_date
         if dto.arrival_date is not None:
             entity.arrival_date = dto.arrival_date
-        if dto.status is not None:
-            entity.status = ShipmentStatus(dto.status)
-        entity.updated_at = Timestamp(value=datetime.utcnow())
+        entity.updated_at = Timestamp(value=datetime.now(timezone.utc))
         return entity
 
     @staticmethod
@@ -52,5 +62,82 @@ class ShipmentMapper:
             arrival_date=entity.arrival_date,
             status=entity.status.value,
             created_at=entity.created_at.isoformat(),
-            updated_at=entity.updated_at.isoformat()
-        )
\ No newline at end of file
+            updated_at=entity.updated_at.isoformat(),
+            cancelled_reason=entity.cancelled_reason
+        )
+
+    @staticmethod
+    def aggregate_to_dto(aggregate: ShipmentAggregate) -> ShipmentAggregateDTO:
+        return ShipmentAggregateDTO(
+            shipment=ShipmentMapper.entity_to_dto(aggregate.shipment),
+            items=[ItemMapper.entity_to_dto(i) for i in aggregate.items],
+            totals=ItemMapper.totals_to_dto(aggregate.totals)
+        )
+
+    @staticmethod
+    def aggregate_to_created_event(aggregate: ShipmentAggregate) -> ShipmentCreated:
+        """Компактный снимок отгрузки с items для ShipmentCreated."""
+        shipment = aggregate.shipment
+        return ShipmentCreated(
+            shipment_id=shipment.shipment_id,
+            origin=dict(shipment.origin.__dict__),
+            destination=dict(shipment.destination.__dict__),
+            items=[
+                {
+                    "item_id": item.item_id,
+                    "name": item.name,
+                    "quantity": item.quantity.value,
+                    "weight": item.weight.value,
+                }
+                for item in aggregate.items
+            ],
+            departure_date=shipment.departure_date.isoformat(),
+            status=shipment.status.value,
+            total_quantity=aggregate.totals.total_quantity,
+            total_weight=aggregate.totals.total_weight,
+            created_at=shipment.created_at.value,
+        )
+
+    @staticmethod
+    def etag(updated_at: datetime) -> str:
+        """ETag агрегата: updated_at отгрузки меняется и при записи ее items."""
+        return f'"{int(updated_at.timestamp() * 1_000_000):x}"'
+
+    @staticmethod
+    def history_to_dto(shipment_id: UUID, changes: List[StatusChange]) -> ShipmentHistoryDTO:
+        return ShipmentHistoryDTO(
+            shipment_id=shipment_id,
+            changes=[
+                StatusChangeDTO(
+                    old_status=c.old_status.value if c.old_status else None,
+                    new_status=c.new_status.value,
+                    changed_at=c.changed_at,
+                    changed_by=c.changed_by
+                )
+                for c in changes
+            ]
+        )
+
+    @staticmethod
+    def statistics_to_dto(statistics: StatusStatistics) -> StatusStatisticsDTO:
+        return StatusStatisticsDTO(
+            status=statistics.status.value,
+            shipments_count=statistics.shipments_count,
+            total_items=statistics.total_items,
+            total_quantity=statistics.total_quantity,
+            total_weight=statistics.total_weight,
+        )
+
+    @staticmethod
+    def encode_cursor(entity: Shipment) -> str:
+        raw = f"{entity.created_at.isoformat()}|{entity.shipment_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        """Поднимает ValueError, если курсор поврежден."""
+        try:
+            created_at, shipment_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        except (UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+        return datetime.fromisoformat(created_at), UUID(shipment_id)
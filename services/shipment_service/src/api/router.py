@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 
 from libs.health.router import create_health_router
-from src.api.handlers import items_router, shipments_router
+from src.api.handlers import items_router, shipment_items_router, shipments_router
 from src.config import settings
 
 health_router = create_health_router(
@@ -12,4 +12,5 @@ health_router = create_health_router(
 router = APIRouter(prefix="/api/v1")
 router.include_router(health_router)
 router.include_router(items_router)
+router.include_router(shipment_items_router)
 router.include_router(shipments_router)
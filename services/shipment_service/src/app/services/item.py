@@ -1,9 +1,10 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from src.domain.entities.item import Item
 from src.domain.ports import ItemRepositoryPort
 from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.shipment_totals import ShipmentTotals
 from src.domain.value_objects.weight import Weight
 from src.domain.errors import ItemNotFoundError
 
@@ -20,6 +21,9 @@ class ItemService:
     async def create(self, item: Item) -> Item:
         return await self._repository.save(item)
 
+    async def create_many(self, items: List[Item]) -> List[Item]:
+        return await self._repository.save_many(items)
+
     async def get(self, item_id: UUID) -> Optional[Item]:
         return await self._repository.get(item_id)
 
@@ -76,10 +80,16 @@ class ItemService:
 
         return await self._repository.save(item)
 
+    async def get_totals(self, shipment_ids: Sequence[UUID]) -> List[ShipmentTotals]:
+        """Агрегаты в порядке запроса, без повторов; отгрузки без items получают нули."""
+        unique_ids = list(dict.fromkeys(shipment_ids))
+        totals = await self._repository.get_totals(unique_ids)
+        return [totals.get(shipment_id, ShipmentTotals(shipment_id)) for shipment_id in unique_ids]
+
     async def calculate_total_weight(self, shipment_id: UUID) -> float:
-        items = await self._repository.get_by_shipment(shipment_id)
-        return sum(item.weight.value * item.quantity.value for item in items)
+        totals, = await self.get_totals([shipment_id])
+        return totals.total_weight
 
     async def get_items_count(self, shipment_id: UUID) -> int:
-        items = await self._repository.get_by_shipment(shipment_id)
-        return len(items)
+        totals, = await self.get_totals([shipment_id])
+        return totals.items_count
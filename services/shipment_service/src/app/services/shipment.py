@@ -1,11 +1,21 @@
 from uuid import UUID
-from typing import List, Optional
-from datetime import date
+from typing import Collection, Dict, List, Mapping, Optional, Sequence, Tuple
+from datetime import date, datetime
 
+from src.domain.entities.item import Item
 from src.domain.entities.shipment import Shipment
+from src.domain.entities.shipment_aggregate import ShipmentAggregate
 from src.domain.ports import ShipmentRepositoryPort
-from src.domain.value_objects.shipment_status import ShipmentStatus
-from src.domain.errors import ShipmentNotFoundError
+from src.domain.value_objects.shipment_status import (
+    ACTIVE_STATUSES,
+    PENDING_STATUSES,
+    VALID_TRANSITIONS,
+    ShipmentStatus,
+    allowed_sources,
+)
+from src.domain.value_objects.status_change import StatusChange
+from src.domain.value_objects.status_statistics import StatusStatistics
+from src.domain.errors import ShipmentNotFoundError, ShipmentStatusTransitionError
 
 
 class ShipmentService:
@@ -20,6 +30,9 @@ class ShipmentService:
     async def create(self, shipment: Shipment) -> Shipment:
         return await self._repository.save(shipment)
 
+    async def create_with_items(self, shipment: Shipment, items: Sequence[Item] = ()) -> ShipmentAggregate:
+        return await self._repository.create_with_items(shipment, list(items))
+
     async def get(self, shipment_id: UUID) -> Optional[Shipment]:
         return await self._repository.get(shipment_id)
 
@@ -40,14 +53,28 @@ class ShipmentService:
     async def update_status(
             self,
             shipment_id: UUID,
-            new_status: ShipmentStatus
+            new_status: ShipmentStatus,
+            arrival_date: Optional[date] = None
     ) -> Shipment:
+        """
+        Атомарный переход по VALID_TRANSITIONS: проверка и запись в одном UPDATE.
+        Повторное чтение только при отказе — чтобы отличить 404 от конфликта.
+        """
+        updated = await self._repository.transition_status(
+            shipment_id,
+            new_status,
+            from_statuses=allowed_sources(new_status),
+            arrival_date=arrival_date,
+        )
+        if updated is not None:
+            return updated
+
         shipment = await self._repository.get(shipment_id)
         if shipment is None:
             raise ShipmentNotFoundError(f"Shipment {shipment_id} not found")
-
-        shipment.update_status(new_status)
-        return await self._repository.save(shipment)
+        raise ShipmentStatusTransitionError(
+            f"Shipment {shipment_id} cannot move from {shipment.status.value} to {ShipmentStatus(new_status).value}"
+        )
 
     async def mark_as_received(self, shipment_id: UUID) -> Shipment:
         return await self.update_status(shipment_id, ShipmentStatus.RECEIVED)
@@ -63,52 +90,120 @@ class ShipmentService:
             shipment_id: UUID,
             arrival_date: date
     ) -> Shipment:
-        shipment = await self._repository.get(shipment_id)
-        if shipment is None:
-            raise ShipmentNotFoundError(f"Shipment {shipment_id} not found")
-
-        shipment.mark_delivered(arrival_date)
-        return await self._repository.save(shipment)
+        return await self.update_status(shipment_id, ShipmentStatus.DELIVERED, arrival_date=arrival_date)
 
     async def mark_as_completed(self, shipment_id: UUID) -> Shipment:
         return await self.update_status(shipment_id, ShipmentStatus.COMPLETED)
 
+    async def cancel(self, shipment_id: UUID, reason: str) -> Shipment:
+        cancelled = await self._repository.cancel_many({shipment_id: reason})
+        if cancelled:
+            return cancelled[0]
 
-    async def get_by_status(self, status: ShipmentStatus) -> List[Shipment]:
-        all_shipments = await self._repository.get_all()
-        return [s for s in all_shipments if s.status == status]
-
-    async def get_created_shipments(self) -> List[Shipment]:
-        return await self.get_by_status(ShipmentStatus.CREATED)
+        shipment = await self._repository.get(shipment_id)
+        if shipment is None:
+            raise ShipmentNotFoundError(f"Shipment {shipment_id} not found")
+        raise ShipmentStatusTransitionError(
+            f"Shipment {shipment_id} cannot be cancelled from {shipment.status.value}"
+        )
 
-    async def get_received_shipments(self) -> List[Shipment]:
-        return await self.get_by_status(ShipmentStatus.RECEIVED)
+    async def cancel_many(self, reasons: Mapping[UUID, str]) -> List[Shipment]:
+        """
+        Мягкая отмена пачки отгрузок одним запросом.
+        Возвращает только отмененные; отсутствующие и уже завершенные пропускаются.
+        """
+        return await self._repository.cancel_many(reasons)
 
-    async def get_ready_for_delivery_shipments(self) -> List[Shipment]:
-        return await self.get_by_status(ShipmentStatus.READY_FOR_DELIVERY)
+    async def archive_cancelled(self, cancelled_before: datetime, limit: int = 200) -> List[UUID]:
+        return await self._repository.archive_cancelled(cancelled_before, limit=limit)
 
-    async def get_in_transit_shipments(self) -> List[Shipment]:
-        return await self.get_by_status(ShipmentStatus.IN_TRANSIT)
 
-    async def get_delivered_shipments(self) -> List[Shipment]:
-        return await self.get_by_status(ShipmentStatus.DELIVERED)
+    async def find(
+            self,
+            status_in: Optional[Collection[ShipmentStatus]] = None,
+            created_from: Optional[datetime] = None,
+            created_to: Optional[datetime] = None,
+            origin_city: Optional[str] = None,
+            destination_city: Optional[str] = None,
+            departure_from: Optional[date] = None,
+            departure_to: Optional[date] = None,
+            after: Optional[Tuple[datetime, UUID]] = None,
+            limit: int = 50,
+    ) -> List[Shipment]:
+        return await self._repository.find(
+            status_in=status_in,
+            created_from=created_from,
+            created_to=created_to,
+            origin_city=origin_city,
+            destination_city=destination_city,
+            departure_from=departure_from,
+            departure_to=departure_to,
+            after=after,
+            limit=limit,
+        )
+
+    async def get_by_status(self, status: ShipmentStatus, **filters) -> List[Shipment]:
+        return await self.find(status_in=[status], **filters)
+
+    async def get_created_shipments(self, **filters) -> List[Shipment]:
+        return await self.get_by_status(ShipmentStatus.CREATED, **filters)
+
+    async def get_received_shipments(self, **filters) -> List[Shipment]:
+        return await self.get_by_status(ShipmentStatus.RECEIVED, **filters)
+
+    async def get_ready_for_delivery_shipments(self, **filters) -> List[Shipment]:
+        return await self.get_by_status(ShipmentStatus.READY_FOR_DELIVERY, **filters)
+
+    async def get_in_transit_shipments(self, **filters) -> List[Shipment]:
+        return await self.get_by_status(ShipmentStatus.IN_TRANSIT, **filters)
+
+    async def get_delivered_shipments(self, **filters) -> List[Shipment]:
+        return await self.get_by_status(ShipmentStatus.DELIVERED, **filters)
+
+    async def get_completed_shipments(self, **filters) -> List[Shipment]:
+        return await self.get_by_status(ShipmentStatus.COMPLETED, **filters)
+
+    async def get_active_shipments(self, **filters) -> List[Shipment]:
+        return await self.find(status_in=ACTIVE_STATUSES, **filters)
+
+    async def get_pending_shipments(self, **filters) -> List[Shipment]:
+        return await self.find(status_in=PENDING_STATUSES, **filters)
+
+
+    async def get_version(self, shipment_id: UUID) -> Optional[datetime]:
+        return await self._repository.get_updated_at(shipment_id)
+
+    async def get_aggregate(self, shipment_id: UUID) -> ShipmentAggregate:
+        aggregate = await self._repository.get_aggregate(shipment_id)
+        if aggregate is None:
+            raise ShipmentNotFoundError(f"Shipment {shipment_id} not found")
+        return aggregate
 
-    async def get_completed_shipments(self) -> List[Shipment]:
-        return await self.get_by_status(ShipmentStatus.COMPLETED)
+    async def get_history(self, shipment_id: UUID) -> List[StatusChange]:
+        history = await self._repository.get_history([shipment_id])
+        changes = history.get(shipment_id, [])
+        if not changes and await self._repository.get(shipment_id) is None:
+            raise ShipmentNotFoundError(f"Shipment {shipment_id} not found")
+        return changes
 
-    async def get_active_shipments(self) -> List[Shipment]:
-        all_shipments = await self._repository.get_all()
-        return [
-            s for s in all_shipments
-            if s.status != ShipmentStatus.COMPLETED
-        ]
+    async def get_histories(self, shipment_ids: Sequence[UUID]) -> Dict[UUID, List[StatusChange]]:
+        """История в порядке запроса; неизвестные отгрузки получают пустой список."""
+        unique_ids = list(dict.fromkeys(shipment_ids))
+        history = await self._repository.get_history(unique_ids)
+        return {shipment_id: history.get(shipment_id, []) for shipment_id in unique_ids}
 
-    async def get_pending_shipments(self) -> List[Shipment]:
-        all_shipments = await self._repository.get_all()
-        return [
-            s for s in all_shipments
-            if s.status in [ShipmentStatus.CREATED, ShipmentStatus.RECEIVED]
-        ]
+    async def get_statistics(
+            self,
+            origin_city: Optional[str] = None,
+            destination_city: Optional[str] = None,
+    ) -> List[StatusStatistics]:
+        """Сводка по всем статусам в порядке жизненного цикла; статусы без отгрузок — с нулями."""
+        rows = await self._repository.get_statistics(
+            origin_city=origin_city,
+            destination_city=destination_city,
+        )
+        by_status = {row.status: row for row in rows}
+        return [by_status.get(s, StatusStatistics(status=s)) for s in ShipmentStatus]
 
 
     async def can_transition_to(
@@ -120,19 +215,7 @@ class ShipmentService:
         if shipment is None:
             raise ShipmentNotFoundError(f"Shipment {shipment_id} not found")
 
-        valid_transitions = {
-            ShipmentStatus.CREATED: [ShipmentStatus.RECEIVED],
-            ShipmentStatus.RECEIVED: [ShipmentStatus.READY_FOR_DELIVERY],
-            ShipmentStatus.READY_FOR_DELIVERY: [ShipmentStatus.IN_TRANSIT],
-            ShipmentStatus.IN_TRANSIT: [ShipmentStatus.DELIVERED],
-            ShipmentStatus.DELIVERED: [ShipmentStatus.COMPLETED],
-            ShipmentStatus.COMPLETED: [],
-        }
-
-        current_status = shipment.status
-        allowed_statuses = valid_transitions.get(current_status, [])
-
-        return target_status in allowed_statuses
+        return target_status in VALID_TRANSITIONS.get(shipment.status, frozenset())
 
     async def get_shipment_lifecycle(self, shipment_id: UUID) -> dict:
         shipment = await self._repository.get(shipment_id)
@@ -147,6 +230,8 @@ class ShipmentService:
             "departure_date": str(shipment.departure_date),
             "arrival_date": str(shipment.arrival_date) if shipment.arrival_date else None,
             "is_completed": shipment.status == ShipmentStatus.COMPLETED,
+            "is_cancelled": shipment.status == ShipmentStatus.CANCELLED,
+            "cancelled_reason": shipment.cancelled_reason,
             "is_in_progress": shipment.status in [
                 ShipmentStatus.READY_FOR_DELIVERY,
                 ShipmentStatus.IN_TRANSIT
@@ -0,0 +1,53 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from libs.observability.logger import get_json_logger
+
+from src.app.services.shipment import ShipmentService
+
+
+class CancelledShipmentArchiver:
+    """
+    Фоновый перенос отмененных отгрузок в shipments_archive.
+    Работает короткими пачками: пока есть что архивировать — без пауз, затем спит interval_seconds.
+    """
+
+    def __init__(
+            self,
+            shipment_service: ShipmentService,
+            retention: timedelta = timedelta(days=7),
+            interval_seconds: int = 300,
+            batch_size: int = 200,
+    ):
+        self._service = shipment_service
+        self._retention = retention
+        self._interval = interval_seconds
+        self._batch_size = batch_size
+        self._logger = get_json_logger("cancelled_shipment_archiver")
+        self._is_running = False
+
+    async def run(self) -> None:
+        self._is_running = True
+        self._logger.info("Cancelled shipment archiver started")
+
+        while self._is_running:
+            try:
+                archived = await self.archive_once()
+                if archived < self._batch_size:
+                    await asyncio.sleep(self._interval)
+            except asyncio.CancelledError:
+                self._logger.info("Archiver stopping...")
+                break
+            except Exception as e:
+                self._logger.error(f"Archiver loop failed: {e}", exc_info=True)
+                await asyncio.sleep(self._interval)
+
+    async def archive_once(self) -> int:
+        cancelled_before = datetime.now(timezone.utc) - self._retention
+        archived = await self._service.archive_cancelled(cancelled_before, limit=self._batch_size)
+        if archived:
+            self._logger.info("Cancelled shipments archived", extra={"count": len(archived)})
+        return len(archived)
+
+    async def stop(self) -> None:
+        self._is_running = False
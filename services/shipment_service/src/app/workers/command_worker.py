@@ -1,70 +1,134 @@
+import asyncio
 import uuid
+from typing import Dict, List, Optional
 
 from libs.messaging.base import Command
 from libs.messaging.ports import EventQueuePort
 from libs.observability.logger import get_json_logger, set_correlation_id
 
 from src.app.services.shipment import ShipmentService
-from src.domain.errors import ShipmentNotFoundError
 
 COMMAND_TOPIC = "shipment.commands"
 
+_END = object()
+
 
 class ShipmentCommandWorker:
+    """
+    Обработчик команд саги. Команды shipment.cancel копятся в пачку (до batch_size штук
+    или batch_window_seconds ожидания) и отменяются одним UPDATE: при шторме компенсаций
+    нагрузка на shipments не растет линейно с числом команд.
+    """
 
-    def __init__(self, event_queue: EventQueuePort, shipment_service: ShipmentService):
+    def __init__(
+            self,
+            event_queue: EventQueuePort,
+            shipment_service: ShipmentService,
+            batch_size: int = 500,
+            batch_window_seconds: float = 0.05,
+    ):
         self.queue = event_queue
         self.service = shipment_service
+        self.batch_size = batch_size
+        self.batch_window = batch_window_seconds
         self.logger = get_json_logger("shipment_command_worker")
 
     async def run(self):
         self.logger.info("Shipment Command Worker running", extra={"topic": COMMAND_TOPIC})
 
-        async for command in self.queue.consume_command(COMMAND_TOPIC):
-            if command.correlation_id:
-                set_correlation_id(str(command.correlation_id))
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=self.batch_size * 2)
+        reader = asyncio.create_task(self._read_commands(buffer))
+        try:
+            while True:
+                batch, finished = await self._next_batch(buffer)
+                if batch:
+                    try:
+                        await self._handle_batch(batch)
+                    except Exception as e:
+                        self.logger.error(
+                            "Error handling command batch",
+                            exc_info=e,
+                            extra={"command_ids": [str(c.command_id) for c in batch]},
+                        )
+                if finished:
+                    break
+        finally:
+            reader.cancel()
+
+    async def _read_commands(self, buffer: asyncio.Queue) -> None:
+        try:
+            async for command in self.queue.consume_command(COMMAND_TOPIC):
+                await buffer.put(command)
+        except Exception as e:
+            self.logger.error("Command consumer failed", exc_info=e)
+        await buffer.put(_END)
+
+    async def _next_batch(self, buffer: asyncio.Queue):
+        """Первая команда ждется без таймаута, остальные — не дольше окна пачки."""
+        first = await buffer.get()
+        if first is _END:
+            return [], True
 
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_window
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
             try:
-                await self._handle_command(command)
-            except Exception as e:
-                self.logger.error(
-                    f"Error handling command {command.command_type}",
-                    exc_info=e,
-                    extra={"command_id": str(command.command_id)},
-                )
+                command = buffer.get_nowait() if timeout <= 0 else await asyncio.wait_for(buffer.get(), timeout)
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+            if command is _END:
+                return batch, True
+            batch.append(command)
 
-    async def _handle_command(self, command: Command) -> None:
-        self.logger.info(
-            "Processing command",
-            extra={"command_type": command.command_type, "aggregate_id": str(command.aggregate_id)},
-        )
+        return batch, False
 
-        if command.command_type == "shipment.cancel":
-            await self._handle_cancel_shipment(command)
-        else:
-            self.logger.warning(
-                "Unknown command type — skipping",
-                extra={"command_type": command.command_type},
+    async def _handle_batch(self, commands: List[Command]) -> None:
+        reasons: Dict[uuid.UUID, str] = {}
+
+        for command in commands:
+            if command.correlation_id:
+                set_correlation_id(str(command.correlation_id))
+
+            self.logger.info(
+                "Processing command",
+                extra={"command_type": command.command_type, "aggregate_id": str(command.aggregate_id)},
             )
 
-    async def _handle_cancel_shipment(self, command: Command) -> None:
-        shipment_id_raw = command.payload.get("shipment_id") or str(command.aggregate_id)
-        reason = command.payload.get("reason", "Saga compensation")
+            if command.command_type == "shipment.cancel":
+                shipment_id = self._parse_shipment_id(command)
+                if shipment_id is not None:
+                    reasons[shipment_id] = command.payload.get("reason", "Saga compensation")
+            else:
+                self.logger.warning(
+                    "Unknown command type — skipping",
+                    extra={"command_type": command.command_type},
+                )
 
+        if reasons:
+            await self._cancel_shipments(reasons)
+
+    def _parse_shipment_id(self, command: Command) -> Optional[uuid.UUID]:
+        shipment_id_raw = command.payload.get("shipment_id") or str(command.aggregate_id)
         try:
-            shipment_id = uuid.UUID(str(shipment_id_raw))
+            return uuid.UUID(str(shipment_id_raw))
         except ValueError:
             self.logger.error("Invalid shipment_id in command payload", extra={"payload": command.payload})
-            return
+            return None
 
-        try:
-            await self.service.delete(shipment_id)
-            self.logger.info(
-                "Shipment cancelled (deleted) as compensation",
-                extra={"shipment_id": str(shipment_id), "reason": reason},
-            )
-        except ShipmentNotFoundError:
+    async def _cancel_shipments(self, reasons: Dict[uuid.UUID, str]) -> None:
+        cancelled = await self.service.cancel_many(reasons)
+        cancelled_ids = {shipment.shipment_id for shipment in cancelled}
+
+        self.logger.info(
+            "Shipments cancelled as compensation",
+            extra={"requested": len(reasons), "cancelled": len(cancelled_ids)},
+        )
+
+        skipped = [str(shipment_id) for shipment_id in reasons if shipment_id not in cancelled_ids]
+        if skipped:
             self.logger.warning(
-                "Shipment not found during compensation — already deleted?",
-                extra={"shipment_id": str(shipment_id)},
+                "Shipments not cancelled during compensation — missing or already final",
+                extra={"shipment_ids": skipped},
             )
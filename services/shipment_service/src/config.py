@@ -22,6 +22,20 @@ class Settings(BaseSettings):
     KAFKA_BOOTSTRAP_SERVERS: str = "kafka:9092"
     KAFKA_GROUP_ID: str = "shipment-service"
 
+    USE_REDIS: bool = False
+    REDIS_URL: str = "redis://localhost:6379/0"
+    ITEM_TOTALS_CACHE_TTL_SECONDS: int = 300
+    ITEM_TOTALS_MAX_SHIPMENTS: int = 1000
+    ITEM_BULK_MAX_ITEMS: int = 10_000
+    SHIPMENT_HISTORY_CACHE_TTL_SECONDS: int = 3600
+    SHIPMENT_HISTORY_MAX_SHIPMENTS: int = 500
+
+    CANCEL_BATCH_SIZE: int = 500
+    CANCEL_BATCH_WINDOW_MS: int = 50
+    CANCELLED_RETENTION_HOURS: int = 7 * 24
+    ARCHIVE_INTERVAL_SECONDS: int = 300
+    ARCHIVE_BATCH_SIZE: int = 200
+
     JWT_SECRET_KEY: str = Field(default="dev-secret-key-change-in-production")
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
@@ -1,2 +1,3 @@
 from .item import Item
-from .shipment import Shipment
\ No newline at end of file
+from .shipment import Shipment
+from .shipment_aggregate import ShipmentAggregate
\ No newline at end of file
@@ -16,6 +16,7 @@ class Shipment:
     arrival_date: Optional[date] = None
     shipment_id: UUID = field(default_factory=uuid4)
     status: ShipmentStatus = ShipmentStatus.CREATED
+    cancelled_reason: Optional[str] = None
 
     created_at: Timestamp = field(
         default_factory=lambda: Timestamp(datetime.now(timezone.utc))
@@ -35,6 +36,10 @@ class Shipment:
         self.arrival_date = arrival_date
         self.update_status(ShipmentStatus.DELIVERED)
 
+    def cancel(self, reason: str):
+        self.cancelled_reason = reason
+        self.update_status(ShipmentStatus.CANCELLED)
+
     def to_dict(self) -> dict:
         return {
             "shipment_id": str(self.shipment_id),
@@ -43,6 +48,7 @@ class Shipment:
             "departure_date": str(self.departure_date),
             "arrival_date": str(self.arrival_date) if self.arrival_date else None,
             "status": self.status.value,
+            "cancelled_reason": self.cancelled_reason,
             "created_at": self.created_at.value.isoformat(),
             "updated_at": self.updated_at.value.isoformat(),
         }
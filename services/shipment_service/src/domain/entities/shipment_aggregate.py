@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from ..value_objects.shipment_totals import ShipmentTotals
+from .item import Item
+from .shipment import Shipment
+
+
+@dataclass(frozen=True)
+class ShipmentAggregate:
+    """Отгрузка вместе с items и агрегатами — модель чтения для страниц отслеживания."""
+    shipment: Shipment
+    totals: ShipmentTotals
+    items: List[Item] = field(default_factory=list)
@@ -1,7 +1,8 @@
-from typing import Protocol, List, Optional
+from typing import Dict, Protocol, List, Optional, Sequence
 from uuid import UUID
 
 from src.domain.entities.item import Item
+from src.domain.value_objects.shipment_totals import ShipmentTotals
 
 
 class ItemRepositoryPort(Protocol):
@@ -9,14 +10,21 @@ class ItemRepositoryPort(Protocol):
     async def save(self, item: Item) -> Item:
         ...
 
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        ...
+
     async def get(self, item_id: UUID) -> Optional[Item]:
         ...
 
     async def get_by_shipment(self, shipment_id: UUID) -> List[Item]:
         ...
 
-    async def delete(self, item_id: UUID) -> None:
+    async def delete(self, item_id: UUID) -> UUID:
+        """Возвращает shipment_id удаленного item."""
         ...
 
     async def get_all(self) -> List[Item]:
         ...
+
+    async def get_totals(self, shipment_ids: Sequence[UUID]) -> Dict[UUID, ShipmentTotals]:
+        ...
@@ -1,11 +1,20 @@
-from typing import Protocol, List
+from datetime import date, datetime
+from typing import Collection, Dict, Protocol, List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
+from src.domain.entities.item import Item
 from src.domain.entities.shipment import Shipment
+from src.domain.entities.shipment_aggregate import ShipmentAggregate
+from src.domain.value_objects.shipment_status import ShipmentStatus
+from src.domain.value_objects.status_change import StatusChange
+from src.domain.value_objects.status_statistics import StatusStatistics
 
 class ShipmentRepositoryPort(Protocol):
     async def save(self, shipment: Shipment) -> Shipment:
         ...
 
+    async def create_with_items(self, shipment: Shipment, items: Sequence[Item]) -> ShipmentAggregate:
+        ...
+
     async def get(self, shipment_id: UUID) -> Shipment:
         ...
 
@@ -14,3 +23,48 @@ class ShipmentRepositoryPort(Protocol):
 
     async def get_all(self, limit: int = 50, offset: int = 0) -> List[Shipment]:
         ...
+
+    async def find(
+        self,
+        status_in: Optional[Collection[ShipmentStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        origin_city: Optional[str] = None,
+        destination_city: Optional[str] = None,
+        departure_from: Optional[date] = None,
+        departure_to: Optional[date] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50,
+    ) -> List[Shipment]:
+        ...
+
+    async def get_history(self, shipment_ids: Sequence[UUID]) -> Dict[UUID, List[StatusChange]]:
+        ...
+
+    async def get_updated_at(self, shipment_id: UUID) -> Optional[datetime]:
+        ...
+
+    async def get_aggregate(self, shipment_id: UUID) -> Optional[ShipmentAggregate]:
+        ...
+
+    async def get_statistics(
+        self,
+        origin_city: Optional[str] = None,
+        destination_city: Optional[str] = None,
+    ) -> List[StatusStatistics]:
+        ...
+
+    async def transition_status(
+        self,
+        shipment_id: UUID,
+        new_status: ShipmentStatus,
+        from_statuses: Collection[ShipmentStatus],
+        arrival_date: Optional[date] = None,
+    ) -> Optional[Shipment]:
+        ...
+
+    async def cancel_many(self, reasons: Mapping[UUID, str]) -> List[Shipment]:
+        ...
+
+    async def archive_cancelled(self, cancelled_before: datetime, limit: int = 200) -> List[UUID]:
+        ...
@@ -1,3 +1,6 @@
 from .quantity import Quantity
 from .shipment_status import ShipmentStatus
-from .weight import Weight
+from .shipment_totals import ShipmentTotals
+from .status_change import StatusChange
+from .status_statistics import StatusStatistics
+from .weight import Weight
\ No newline at end of file
@@ -8,3 +8,26 @@ class ShipmentStatus(str, Enum):
     IN_TRANSIT = "in_transit"
     DELIVERED = "delivered"
     COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+TERMINAL_STATUSES = frozenset({ShipmentStatus.COMPLETED, ShipmentStatus.CANCELLED})
+# Покрываются частичным индексом idx_shipments_active
+ACTIVE_STATUSES = frozenset(s for s in ShipmentStatus if s not in TERMINAL_STATUSES)
+PENDING_STATUSES = frozenset({ShipmentStatus.CREATED, ShipmentStatus.RECEIVED})
+
+# Допустимые переходы жизненного цикла
+VALID_TRANSITIONS = {
+    ShipmentStatus.CREATED: frozenset({ShipmentStatus.RECEIVED, ShipmentStatus.CANCELLED}),
+    ShipmentStatus.RECEIVED: frozenset({ShipmentStatus.READY_FOR_DELIVERY, ShipmentStatus.CANCELLED}),
+    ShipmentStatus.READY_FOR_DELIVERY: frozenset({ShipmentStatus.IN_TRANSIT, ShipmentStatus.CANCELLED}),
+    ShipmentStatus.IN_TRANSIT: frozenset({ShipmentStatus.DELIVERED, ShipmentStatus.CANCELLED}),
+    ShipmentStatus.DELIVERED: frozenset({ShipmentStatus.COMPLETED}),
+    ShipmentStatus.COMPLETED: frozenset(),
+    ShipmentStatus.CANCELLED: frozenset(),
+}
+
+
+def allowed_sources(target: ShipmentStatus) -> frozenset:
+    """Статусы, из которых разрешен переход в target."""
+    return frozenset(source for source, targets in VALID_TRANSITIONS.items() if target in targets)
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class ShipmentTotals:
+    shipment_id: UUID
+    items_count: int = 0
+    total_quantity: int = 0
+    total_weight: float = 0.0
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from .shipment_status import ShipmentStatus
+
+
+@dataclass(frozen=True)
+class StatusChange:
+    shipment_id: UUID
+    new_status: ShipmentStatus
+    changed_at: datetime
+    old_status: Optional[ShipmentStatus] = None
+    changed_by: Optional[str] = None
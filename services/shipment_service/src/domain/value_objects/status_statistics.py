@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from .shipment_status import ShipmentStatus
+
+
+@dataclass(frozen=True)
+class StatusStatistics:
+    status: ShipmentStatus
+    shipments_count: int = 0
+    total_items: int = 0
+    total_quantity: int = 0
+    total_weight: float = 0.0
@@ -0,0 +1,91 @@
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from libs.cache.ports import CachePort
+
+from src.domain.entities.item import Item
+from src.domain.ports import ItemRepositoryPort
+from src.domain.value_objects.shipment_totals import ShipmentTotals
+
+
+class CachedItemRepository(ItemRepositoryPort):
+    """
+    Кэш агрегатов по отгрузке поверх репозитория items.
+    Любая запись item (save, save_many, delete) сбрасывает ключ его отгрузки, поэтому TTL только страхует
+    от гонки, когда чтение успело положить в кэш значение, посчитанное до записи.
+    """
+
+    def __init__(self, repository: ItemRepositoryPort, cache: CachePort, ttl_seconds: int = 300):
+        self._repo = repository
+        self._cache = cache
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def _totals_key(shipment_id: UUID) -> str:
+        return f"items:totals:{shipment_id}"
+
+    async def save(self, item: Item) -> Item:
+        saved = await self._repo.save(item)
+        await self._cache.delete(self._totals_key(saved.shipment_id))
+        return saved
+
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        saved = await self._repo.save_many(items)
+        for shipment_id in {item.shipment_id for item in items}:
+            await self._cache.delete(self._totals_key(shipment_id))
+        return saved
+
+    async def get(self, item_id: UUID) -> Optional[Item]:
+        return await self._repo.get(item_id)
+
+    async def get_by_shipment(self, shipment_id: UUID) -> List[Item]:
+        return await self._repo.get_by_shipment(shipment_id)
+
+    async def delete(self, item_id: UUID) -> UUID:
+        shipment_id = await self._repo.delete(item_id)
+        await self._cache.delete(self._totals_key(shipment_id))
+        return shipment_id
+
+    async def get_all(self) -> List[Item]:
+        return await self._repo.get_all()
+
+    async def get_totals(self, shipment_ids: Sequence[UUID]) -> Dict[UUID, ShipmentTotals]:
+        """Кэш читается одним MGET, промахи — одним запросом к базе и одной пачкой записей в кэш."""
+        keys = {shipment_id: self._totals_key(shipment_id) for shipment_id in dict.fromkeys(shipment_ids)}
+        cached = await self._cache.get_many(keys.values())
+
+        totals: Dict[UUID, ShipmentTotals] = {}
+        missing: List[UUID] = []
+        for shipment_id, key in keys.items():
+            value = cached.get(key)
+            if isinstance(value, dict):
+                totals[shipment_id] = self._from_cache(shipment_id, value)
+            else:
+                missing.append(shipment_id)
+
+        if missing:
+            loaded = await self._repo.get_totals(missing)
+            await self._cache.set_many(
+                {keys[shipment_id]: self._to_cache(value) for shipment_id, value in loaded.items()},
+                ttl=self._ttl,
+            )
+            totals.update(loaded)
+
+        return totals
+
+    @staticmethod
+    def _to_cache(totals: ShipmentTotals) -> dict:
+        return {
+            "items_count": totals.items_count,
+            "total_quantity": totals.total_quantity,
+            "total_weight": totals.total_weight,
+        }
+
+    @staticmethod
+    def _from_cache(shipment_id: UUID, data: dict) -> ShipmentTotals:
+        return ShipmentTotals(
+            shipment_id=shipment_id,
+            items_count=data["items_count"],
+            total_quantity=data["total_quantity"],
+            total_weight=data["total_weight"],
+        )
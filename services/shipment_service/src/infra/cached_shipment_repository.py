@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Dict, List, Mapping, Optional, Sequence
+from uuid import UUID
+
+from libs.cache.ports import CachePort
+
+from src.domain.entities.item import Item
+from src.domain.entities.shipment import Shipment
+from src.domain.entities.shipment_aggregate import ShipmentAggregate
+from src.domain.ports import ShipmentRepositoryPort
+from src.domain.value_objects.shipment_status import ShipmentStatus
+from src.domain.value_objects.status_change import StatusChange
+from src.domain.value_objects.status_statistics import StatusStatistics
+
+
+class CachedShipmentRepository(ShipmentRepositoryPort):
+    """
+    Кэш истории статусов поверх репозитория отгрузок.
+    История пополняется только триггером на shipments, поэтому save и delete отгрузки
+    сбрасывают ее ключ; пустая история не кэшируется — отгрузка может появиться позже.
+    """
+
+    def __init__(self, repository: ShipmentRepositoryPort, cache: CachePort, ttl_seconds: int = 3600):
+        self._repo = repository
+        self._cache = cache
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def _history_key(shipment_id: UUID) -> str:
+        return f"shipment:history:{shipment_id}"
+
+    async def save(self, shipment: Shipment) -> Shipment:
+        saved = await self._repo.save(shipment)
+        await self._cache.delete(self._history_key(saved.shipment_id))
+        return saved
+
+    async def create_with_items(self, shipment: Shipment, items: Sequence[Item]) -> ShipmentAggregate:
+        return await self._repo.create_with_items(shipment, items)
+
+    async def get(self, shipment_id: UUID) -> Optional[Shipment]:
+        return await self._repo.get(shipment_id)
+
+    async def transition_status(self, shipment_id: UUID, new_status: ShipmentStatus, **kwargs) -> Optional[Shipment]:
+        updated = await self._repo.transition_status(shipment_id, new_status, **kwargs)
+        if updated is not None:
+            await self._cache.delete(self._history_key(shipment_id))
+        return updated
+
+    async def delete(self, shipment_id: UUID) -> None:
+        await self._repo.delete(shipment_id)
+        await self._cache.delete(self._history_key(shipment_id))
+
+    async def cancel_many(self, reasons: Mapping[UUID, str]) -> List[Shipment]:
+        cancelled = await self._repo.cancel_many(reasons)
+        for shipment in cancelled:
+            await self._cache.delete(self._history_key(shipment.shipment_id))
+        return cancelled
+
+    async def archive_cancelled(self, cancelled_before: datetime, limit: int = 200) -> List[UUID]:
+        archived = await self._repo.archive_cancelled(cancelled_before, limit=limit)
+        for shipment_id in archived:
+            await self._cache.delete(self._history_key(shipment_id))
+        return archived
+
+    async def get_all(self, limit: int = 50, offset: int = 0) -> List[Shipment]:
+        return await self._repo.get_all(limit=limit, offset=offset)
+
+    async def find(self, **filters) -> List[Shipment]:
+        return await self._repo.find(**filters)
+
+    async def get_updated_at(self, shipment_id: UUID) -> Optional[datetime]:
+        return await self._repo.get_updated_at(shipment_id)
+
+    async def get_aggregate(self, shipment_id: UUID) -> Optional[ShipmentAggregate]:
+        return await self._repo.get_aggregate(shipment_id)
+
+    async def get_statistics(self, **filters) -> List[StatusStatistics]:
+        return await self._repo.get_statistics(**filters)
+
+    async def get_history(self, shipment_ids: Sequence[UUID]) -> Dict[UUID, List[StatusChange]]:
+        history: Dict[UUID, List[StatusChange]] = {}
+        missing: List[UUID] = []
+
+        for shipment_id in dict.fromkeys(shipment_ids):
+            cached = await self._cache.get(self._history_key(shipment_id))
+            if isinstance(cached, list):
+                history[shipment_id] = [self._from_cache(shipment_id, entry) for entry in cached]
+            else:
+                missing.append(shipment_id)
+
+        if missing:
+            loaded = await self._repo.get_history(missing)
+            for shipment_id, changes in loaded.items():
+                if changes:
+                    await self._cache.set(
+                        self._history_key(shipment_id),
+                        [self._to_cache(change) for change in changes],
+                        ttl=self._ttl
+                    )
+            history.update(loaded)
+
+        return history
+
+    @staticmethod
+    def _to_cache(change: StatusChange) -> dict:
+        return {
+            "old_status": change.old_status.value if change.old_status else None,
+            "new_status": change.new_status.value,
+            "changed_at": change.changed_at.isoformat(),
+            "changed_by": change.changed_by,
+        }
+
+    @staticmethod
+    def _from_cache(shipment_id: UUID, data: dict) -> StatusChange:
+        return StatusChange(
+            shipment_id=shipment_id,
+            old_status=ShipmentStatus(data["old_status"]) if data["old_status"] else None,
+            new_status=ShipmentStatus(data["new_status"]),
+            changed_at=datetime.fromisoformat(data["changed_at"]),
+            changed_by=data["changed_by"],
+        )
@@ -1,17 +1,23 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 import asyncpg
 
 from src.domain.entities.item import Item
 from src.domain.ports import ItemRepositoryPort
 from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.shipment_totals import ShipmentTotals
 from src.domain.value_objects.weight import Weight
-from src.domain.errors import ItemNotFoundError
+from src.domain.errors import ItemNotFoundError, ShipmentNotFoundError
+
+_ITEM_COLUMNS = ["item_id", "shipment_id", "name", "quantity", "weight"]
 
 
 class AsyncPostgresItemRepository(ItemRepositoryPort):
     """Асинхронный репозиторий для Items"""
 
+    # С этого размера партия идет через COPY: unnest-параметры кодируются целиком в один Bind
+    COPY_THRESHOLD = 5_000
+
     def __init__(self, pool: asyncpg.Pool):
         self._pool = pool
 
@@ -33,6 +39,62 @@ class AsyncPostgresItemRepository(ItemRepositoryPort):
 
             return self._row_to_entity(row)
 
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        """
+        UPSERT партии items в одной транзакции и одном INSERT ... SELECT.
+        Маленькие партии передаются массивами в unnest, большие заливаются COPY во временную таблицу.
+        Повторы item_id схлопываются до последнего; item чужой отгрузки не перемещается и не возвращается.
+        """
+        unique = list({item.item_id: item for item in items}.values())
+        if not unique:
+            return []
+
+        rows = [
+            (i.item_id, i.shipment_id, i.name, i.quantity.value, i.weight.value)
+            for i in unique
+        ]
+
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    if len(rows) >= self.COPY_THRESHOLD:
+                        await conn.execute("""
+                            CREATE TEMP TABLE IF NOT EXISTS items_staging (
+                                item_id UUID NOT NULL,
+                                shipment_id UUID NOT NULL,
+                                name VARCHAR(255) NOT NULL,
+                                quantity INTEGER NOT NULL,
+                                weight DECIMAL(10, 2) NOT NULL
+                            ) ON COMMIT DELETE ROWS
+                        """)
+                        await conn.copy_records_to_table("items_staging", records=rows, columns=_ITEM_COLUMNS)
+                        source = "SELECT item_id, shipment_id, name, quantity, weight FROM items_staging"
+                        args = ()
+                    else:
+                        source = """
+                            SELECT * FROM unnest(
+                                $1::uuid[], $2::uuid[], $3::varchar[], $4::integer[], $5::numeric[]
+                            )
+                        """
+                        args = tuple(list(column) for column in zip(*rows))
+
+                    saved = await conn.fetch(f"""
+                        INSERT INTO items (item_id, shipment_id, name, quantity, weight)
+                        {source}
+                        ON CONFLICT (item_id)
+                        DO UPDATE SET
+                            name = EXCLUDED.name,
+                            quantity = EXCLUDED.quantity,
+                            weight = EXCLUDED.weight
+                        WHERE items.shipment_id = EXCLUDED.shipment_id
+                        RETURNING item_id, shipment_id, name, quantity, weight
+                    """, *args)
+        except asyncpg.ForeignKeyViolationError as e:
+            shipment_ids = ", ".join(sorted({str(i.shipment_id) for i in unique}))
+            raise ShipmentNotFoundError(f"Shipment {shipment_ids} not found") from e
+
+        return [self._row_to_entity(row) for row in saved]
+
     async def get(self, item_id: UUID) -> Optional[Item]:
         """Получить item по ID"""
         async with self._pool.acquire() as conn:
@@ -56,15 +118,16 @@ class AsyncPostgresItemRepository(ItemRepositoryPort):
 
             return [self._row_to_entity(row) for row in rows]
 
-    async def delete(self, item_id: UUID) -> None:
-        """Удалить item"""
+    async def delete(self, item_id: UUID) -> UUID:
+        """Удалить item; возвращает shipment_id для инвалидации агрегатов"""
         async with self._pool.acquire() as conn:
-            result = await conn.execute(
-                "DELETE FROM items WHERE item_id = $1",
+            shipment_id = await conn.fetchval(
+                "DELETE FROM items WHERE item_id = $1 RETURNING shipment_id",
                 item_id
             )
-            if result == "DELETE 0":
+            if shipment_id is None:
                 raise ItemNotFoundError(f"Item {item_id} not found")
+            return shipment_id
 
     async def get_all(self) -> List[Item]:
         """Получить все items"""
@@ -76,6 +139,33 @@ class AsyncPostgresItemRepository(ItemRepositoryPort):
             """)
             return [self._row_to_entity(row) for row in rows]
 
+    async def get_totals(self, shipment_ids: Sequence[UUID]) -> Dict[UUID, ShipmentTotals]:
+        """
+        Агрегаты по нескольким отгрузкам одним запросом (index-only scan по idx_items_shipment_totals).
+        Отгрузки без items возвращаются с нулями.
+        """
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT
+                    s.shipment_id,
+                    COUNT(i.item_id) AS items_count,
+                    COALESCE(SUM(i.quantity), 0) AS total_quantity,
+                    COALESCE(SUM(i.weight * i.quantity), 0)::float8 AS total_weight
+                FROM unnest($1::uuid[]) AS s(shipment_id)
+                LEFT JOIN items i ON i.shipment_id = s.shipment_id
+                GROUP BY s.shipment_id
+            """, list(dict.fromkeys(shipment_ids)))
+
+            return {
+                row['shipment_id']: ShipmentTotals(
+                    shipment_id=row['shipment_id'],
+                    items_count=row['items_count'],
+                    total_quantity=row['total_quantity'],
+                    total_weight=row['total_weight'],
+                )
+                for row in rows
+            }
+
     @staticmethod
     def _row_to_entity(row) -> Item:
         """Преобразовать row в entity"""
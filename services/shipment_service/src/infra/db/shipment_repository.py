@@ -1,12 +1,49 @@
-from typing import List, Optional
+import json
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Collection, Dict, List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
 
 import asyncpg
 
+from libs.value_objects.location import Location
+from libs.value_objects.timestamp import Timestamp
+
+from src.domain.entities.item import Item
 from src.domain.entities.shipment import Shipment
+from src.domain.entities.shipment_aggregate import ShipmentAggregate
 from src.domain.errors import ShipmentNotFoundError
 from src.domain.ports import ShipmentRepositoryPort
+from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.shipment_status import (
+    ACTIVE_STATUSES,
+    ShipmentStatus,
+    allowed_sources,
+)
+from src.domain.value_objects.shipment_totals import ShipmentTotals
+from src.domain.value_objects.status_change import StatusChange
+from src.domain.value_objects.status_statistics import StatusStatistics
+from src.domain.value_objects.weight import Weight
+
+_COLUMNS = """
+    shipment_id,
+    origin_country,
+    origin_city,
+    origin_address,
+    destination_country,
+    destination_city,
+    destination_address,
+    departure_date,
+    arrival_date,
+    status,
+    cancelled_reason,
+    created_at,
+    updated_at
+"""
+
 
+# Дословно повторяет предикат частичного индекса idx_shipments_active
+_ACTIVE_PREDICATE = "status NOT IN ('completed', 'cancelled')"
 
 class PostgresShipmentRepository(ShipmentRepositoryPort):
     """Асинхронный репозиторий для Shipments через asyncpg"""
@@ -19,27 +56,112 @@ class PostgresShipmentRepository(ShipmentRepositoryPort):
         self._pool = pool
 
     async def save(self, shipment: Shipment) -> Shipment:
-        """Создать или обновить shipment через UPSERT"""
+        """Создать или обновить поля shipment через UPSERT; статус существующей отгрузки не меняется"""
         async with self._pool.acquire() as conn:
-            row = await conn.fetchrow("""
-                INSERT INTO shipments (shipment_id, origin, destination, status, created_at, updated_at)
-                VALUES ($1, $2, $3, $4, NOW(), NOW())
-                ON CONFLICT (shipment_id) 
-                DO UPDATE SET
-                    origin = EXCLUDED.origin,
-                    destination = EXCLUDED.destination,
-                    status = EXCLUDED.status,
-                    updated_at = NOW()
-                RETURNING shipment_id, origin, destination, status, created_at, updated_at
-            """, shipment.shipment_id, shipment.origin, shipment.destination, shipment.status)
+            return await self._upsert(conn, shipment)
+
+    async def create_with_items(self, shipment: Shipment, items: Sequence[Item]) -> ShipmentAggregate:
+        """
+        Отгрузка и ее items в одной транзакции. Агрегат собирается из RETURNING обеих вставок,
+        поэтому снимок для ShipmentCreated совпадает с тем, что закоммичено.
+        """
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                created = await self._upsert(conn, shipment)
+                rows = []
+                if items:
+                    rows = await conn.fetch("""
+                        INSERT INTO items (item_id, shipment_id, name, quantity, weight)
+                        SELECT * FROM unnest(
+                            $1::uuid[], $2::uuid[], $3::varchar[], $4::integer[], $5::numeric[]
+                        )
+                        RETURNING item_id, shipment_id, name, quantity, weight
+                    """,
+                        [item.item_id for item in items],
+                        [created.shipment_id] * len(items),
+                        [item.name for item in items],
+                        [item.quantity.value for item in items],
+                        [item.weight.value for item in items],
+                    )
 
-            return self._row_to_entity(row)
+        created_items = sorted(
+            (
+                Item(
+                    item_id=row['item_id'],
+                    shipment_id=row['shipment_id'],
+                    name=row['name'],
+                    quantity=Quantity(row['quantity']),
+                    weight=Weight(float(row['weight'])),
+                )
+                for row in rows
+            ),
+            key=lambda item: item.name,
+        )
+        return ShipmentAggregate(
+            shipment=created,
+            items=created_items,
+            totals=ShipmentTotals(
+                shipment_id=created.shipment_id,
+                items_count=len(created_items),
+                total_quantity=sum(item.quantity.value for item in created_items),
+                total_weight=sum(item.weight.value * item.quantity.value for item in created_items),
+            ),
+        )
+
+    async def _upsert(self, conn, shipment: Shipment) -> Shipment:
+        row = await conn.fetchrow(f"""
+            INSERT INTO shipments (
+                shipment_id,
+                origin_country,
+                origin_city,
+                origin_address,
+                destination_country,
+                destination_city,
+                destination_address,
+                departure_date,
+                arrival_date,
+                status,
+                cancelled_reason,
+                created_at,
+                updated_at
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, NOW())
+            ON CONFLICT (shipment_id)
+            -- status и cancelled_reason меняются только через transition_status/cancel_many:
+            -- запись прочитанного ранее статуса откатила бы параллельный переход
+            DO UPDATE SET
+                origin_country = EXCLUDED.origin_country,
+                origin_city = EXCLUDED.origin_city,
+                origin_address = EXCLUDED.origin_address,
+                destination_country = EXCLUDED.destination_country,
+                destination_city = EXCLUDED.destination_city,
+                destination_address = EXCLUDED.destination_address,
+                departure_date = EXCLUDED.departure_date,
+                arrival_date = EXCLUDED.arrival_date,
+                updated_at = NOW()
+            RETURNING {_COLUMNS}
+        """,
+            shipment.shipment_id,
+            shipment.origin.country,
+            shipment.origin.city,
+            shipment.origin.address,
+            shipment.destination.country,
+            shipment.destination.city,
+            shipment.destination.address,
+            shipment.departure_date,
+            shipment.arrival_date,
+            shipment.status.value,
+            shipment.cancelled_reason,
+            shipment.created_at.value,
+        )
+
+        return self._row_to_entity(row)
 
     async def get(self, shipment_id: UUID) -> Optional[Shipment]:
         """Получить shipment по ID"""
         async with self._pool.acquire() as conn:
-            row = await conn.fetchrow("""
-                SELECT shipment_id, origin, destination, status, created_at, updated_at
+            row = await conn.fetchrow(f"""
+                SELECT {_COLUMNS}
                 FROM shipments
                 WHERE shipment_id = $1
             """, shipment_id)
@@ -57,23 +179,339 @@ class PostgresShipmentRepository(ShipmentRepositoryPort):
             if result == "DELETE 0":
                 raise ShipmentNotFoundError(f"Shipment {shipment_id} not found")
 
+    async def transition_status(
+        self,
+        shipment_id: UUID,
+        new_status: ShipmentStatus,
+        from_statuses: Collection[ShipmentStatus],
+        arrival_date: Optional[date] = None,
+    ) -> Optional[Shipment]:
+        """
+        Условный переход статуса одним UPDATE: строка меняется, только если текущий статус
+        входит в from_statuses. None — отгрузки нет или ее статус уже другой.
+        """
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(f"""
+                UPDATE shipments
+                SET status = $2,
+                    arrival_date = COALESCE($4, arrival_date),
+                    updated_at = NOW()
+                WHERE shipment_id = $1 AND status = ANY($3::text[])
+                RETURNING {_COLUMNS}
+            """,
+                shipment_id,
+                ShipmentStatus(new_status).value,
+                sorted(ShipmentStatus(s).value for s in from_statuses),
+                arrival_date,
+            )
+            return self._row_to_entity(row) if row else None
+
+    async def cancel_many(self, reasons: Mapping[UUID, str]) -> List[Shipment]:
+        """
+        Отмена пачки отгрузок одним UPDATE ... FROM unnest: причина у каждой своя.
+        Отгрузки в статусах, из которых отмена запрещена, и несуществующие пропускаются.
+        """
+        if not reasons:
+            return []
+
+        shipment_ids = list(reasons)
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(f"""
+                UPDATE shipments
+                SET status = $3,
+                    cancelled_reason = c.reason,
+                    cancelled_at = NOW(),
+                    updated_at = NOW()
+                FROM unnest($1::uuid[], $2::text[]) AS c(id, reason)
+                WHERE shipment_id = c.id
+                  AND status = ANY($4::text[])
+                RETURNING {_COLUMNS}
+            """,
+                shipment_ids,
+                [reasons[shipment_id] for shipment_id in shipment_ids],
+                ShipmentStatus.CANCELLED.value,
+                sorted(s.value for s in allowed_sources(ShipmentStatus.CANCELLED)),
+            )
+            return [self._row_to_entity(row) for row in rows]
+
+    async def archive_cancelled(self, cancelled_before: datetime, limit: int = 200) -> List[UUID]:
+        """
+        Перенос отмененных отгрузок в shipments_archive вместе с items и историей.
+        Пачка ограничена limit и берется с SKIP LOCKED, чтобы не ждать и не держать
+        долгих блокировок на горячих таблицах; удаление каскадно чистит items и историю.
+        """
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                archived = await conn.fetch("""
+                    WITH victims AS (
+                        SELECT shipment_id
+                        FROM shipments
+                        WHERE status = 'cancelled' AND cancelled_at < $1
+                        ORDER BY cancelled_at
+                        LIMIT $2
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    INSERT INTO shipments_archive (shipment_id, cancelled_reason, cancelled_at, payload)
+                    SELECT
+                        s.shipment_id,
+                        s.cancelled_reason,
+                        s.cancelled_at,
+                        jsonb_build_object(
+                            'shipment', to_jsonb(s),
+                            'items', COALESCE(
+                                (SELECT jsonb_agg(to_jsonb(i)) FROM items i WHERE i.shipment_id = s.shipment_id),
+                                '[]'::jsonb
+                            ),
+                            'history', COALESCE(
+                                (SELECT jsonb_agg(to_jsonb(h) ORDER BY h.changed_at)
+                                 FROM shipment_status_history h WHERE h.shipment_id = s.shipment_id),
+                                '[]'::jsonb
+                            )
+                        )
+                    FROM shipments s
+                    JOIN victims v ON v.shipment_id = s.shipment_id
+                    ON CONFLICT (shipment_id) DO UPDATE SET
+                        cancelled_reason = EXCLUDED.cancelled_reason,
+                        cancelled_at = EXCLUDED.cancelled_at,
+                        archived_at = NOW(),
+                        payload = EXCLUDED.payload
+                    RETURNING shipment_id
+                """, cancelled_before, limit)
+
+                shipment_ids = [row['shipment_id'] for row in archived]
+                if shipment_ids:
+                    await conn.execute("DELETE FROM shipments WHERE shipment_id = ANY($1::uuid[])", shipment_ids)
+                return shipment_ids
+
     async def get_all(self, limit: int = 50, offset: int = 0) -> List[Shipment]:
         """Получить все shipments"""
         async with self._pool.acquire() as conn:
-            rows = await conn.fetch("""
-                SELECT shipment_id, origin, destination, status, created_at, updated_at
+            rows = await conn.fetch(f"""
+                SELECT {_COLUMNS}
                 FROM shipments
                 ORDER BY created_at DESC
                 LIMIT $1 OFFSET $2
             """, limit, offset)
             return [self._row_to_entity(row) for row in rows]
 
+    async def find(
+        self,
+        status_in: Optional[Collection[ShipmentStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        origin_city: Optional[str] = None,
+        destination_city: Optional[str] = None,
+        departure_from: Optional[date] = None,
+        departure_to: Optional[date] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50,
+    ) -> List[Shipment]:
+        """
+        Отгрузки с фильтрами в SQL и keyset-пагинацией по (created_at, shipment_id), новые первыми.
+        Для выборки только активных статусов условие частичного индекса idx_shipments_active
+        повторяется дословно: из status = ANY($n) generic-план его не выведет.
+        """
+        conditions = []
+        args: list = []
+
+        if status_in is not None:
+            statuses = {ShipmentStatus(s) for s in status_in}
+            if not statuses:
+                return []
+            args.append(sorted(s.value for s in statuses))
+            conditions.append(f"status = ANY(${len(args)}::text[])")
+            if statuses <= ACTIVE_STATUSES:
+                conditions.append(_ACTIVE_PREDICATE)
+
+        if created_from is not None:
+            args.append(created_from)
+            conditions.append(f"created_at >= ${len(args)}")
+
+        if created_to is not None:
+            args.append(created_to)
+            conditions.append(f"created_at < ${len(args)}")
+
+        if origin_city is not None:
+            args.append(origin_city)
+            conditions.append(f"origin_city = ${len(args)}")
+
+        if destination_city is not None:
+            args.append(destination_city)
+            conditions.append(f"destination_city = ${len(args)}")
+
+        if departure_from is not None:
+            args.append(departure_from)
+            conditions.append(f"departure_date >= ${len(args)}")
+
+        if departure_to is not None:
+            args.append(departure_to)
+            conditions.append(f"departure_date <= ${len(args)}")
+
+        if after is not None:
+            args.extend(after)
+            conditions.append(f"(created_at, shipment_id) < (${len(args) - 1}, ${len(args)})")
+
+        args.append(limit)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT {_COLUMNS}
+                FROM shipments
+                {where}
+                ORDER BY created_at DESC, shipment_id DESC
+                LIMIT ${len(args)}
+                """,
+                *args,
+            )
+            return [self._row_to_entity(row) for row in rows]
+
+    async def get_history(self, shipment_ids: Sequence[UUID]) -> Dict[UUID, List[StatusChange]]:
+        """История статусов нескольких отгрузок одним запросом, по возрастанию времени"""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT shipment_id, old_status, new_status, changed_at, changed_by
+                FROM shipment_status_history
+                WHERE shipment_id = ANY($1::uuid[])
+                ORDER BY shipment_id, changed_at
+            """, list(dict.fromkeys(shipment_ids)))
+
+        history: Dict[UUID, List[StatusChange]] = defaultdict(list)
+        for row in rows:
+            history[row['shipment_id']].append(StatusChange(
+                shipment_id=row['shipment_id'],
+                old_status=ShipmentStatus(row['old_status']) if row['old_status'] else None,
+                new_status=ShipmentStatus(row['new_status']),
+                changed_at=row['changed_at'],
+                changed_by=row['changed_by'],
+            ))
+        return dict(history)
+
+    async def get_updated_at(self, shipment_id: UUID) -> Optional[datetime]:
+        """Версия отгрузки для ETag: один lookup по первичному ключу"""
+        async with self._pool.acquire() as conn:
+            return await conn.fetchval(
+                "SELECT updated_at FROM shipments WHERE shipment_id = $1",
+                shipment_id
+            )
+
+    async def get_aggregate(self, shipment_id: UUID) -> Optional[ShipmentAggregate]:
+        """Отгрузка, ее items и агрегаты одним запросом: items собираются json_agg в LATERAL"""
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(f"""
+                SELECT {_COLUMNS}, i.items, i.items_count, i.total_quantity, i.total_weight
+                FROM shipments
+                CROSS JOIN LATERAL (
+                    SELECT
+                        COALESCE(
+                            json_agg(
+                                json_build_object(
+                                    'item_id', item_id,
+                                    'name', name,
+                                    'quantity', quantity,
+                                    'weight', weight
+                                )
+                                ORDER BY name
+                            ),
+                            '[]'::json
+                        ) AS items,
+                        COUNT(*) AS items_count,
+                        COALESCE(SUM(quantity), 0) AS total_quantity,
+                        COALESCE(SUM(weight * quantity), 0)::float8 AS total_weight
+                    FROM items
+                    WHERE items.shipment_id = shipments.shipment_id
+                ) i
+                WHERE shipments.shipment_id = $1
+            """, shipment_id)
+
+        if row is None:
+            return None
+
+        return ShipmentAggregate(
+            shipment=self._row_to_entity(row),
+            items=[
+                Item(
+                    item_id=UUID(item['item_id']),
+                    shipment_id=shipment_id,
+                    name=item['name'],
+                    quantity=Quantity(item['quantity']),
+                    weight=Weight(item['weight']),
+                )
+                for item in json.loads(row['items'])
+            ],
+            totals=ShipmentTotals(
+                shipment_id=shipment_id,
+                items_count=row['items_count'],
+                total_quantity=row['total_quantity'],
+                total_weight=row['total_weight'],
+            ),
+        )
+
+    async def get_statistics(
+        self,
+        origin_city: Optional[str] = None,
+        destination_city: Optional[str] = None,
+    ) -> List[StatusStatistics]:
+        """
+        Сводка по статусам из shipment_statistics. Таблица поддерживается триггерами
+        на shipments и items, поэтому данные актуальны без REFRESH и без JOIN с items.
+        """
+        conditions = []
+        args: list = []
+
+        if origin_city is not None:
+            args.append(origin_city)
+            conditions.append(f"origin_city = ${len(args)}")
+        if destination_city is not None:
+            args.append(destination_city)
+            conditions.append(f"destination_city = ${len(args)}")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(f"""
+                SELECT
+                    status,
+                    COUNT(*) AS shipments_count,
+                    COALESCE(SUM(total_items), 0) AS total_items,
+                    COALESCE(SUM(total_quantity), 0) AS total_quantity,
+                    COALESCE(SUM(total_weight), 0)::float8 AS total_weight
+                FROM shipment_statistics
+                {where}
+                GROUP BY status
+            """, *args)
+
+            return [
+                StatusStatistics(
+                    status=ShipmentStatus(row['status']),
+                    shipments_count=row['shipments_count'],
+                    total_items=row['total_items'],
+                    total_quantity=row['total_quantity'],
+                    total_weight=row['total_weight'],
+                )
+                for row in rows
+            ]
+
     @staticmethod
     def _row_to_entity(row) -> Shipment:
         """Преобразовать asyncpg.Record в entity"""
         return Shipment(
             shipment_id=row['shipment_id'],
-            origin=row['origin'],
-            destination=row['destination'],
-            status=row['status'],
+            origin=Location(
+                country=row['origin_country'],
+                city=row['origin_city'],
+                address=row['origin_address'],
+            ),
+            destination=Location(
+                country=row['destination_country'],
+                city=row['destination_city'],
+                address=row['destination_address'],
+            ),
+            departure_date=row['departure_date'],
+            arrival_date=row['arrival_date'],
+            status=ShipmentStatus(row['status']),
+            cancelled_reason=row['cancelled_reason'],
+            created_at=Timestamp(row['created_at']),
+            updated_at=Timestamp(row['updated_at']),
         )
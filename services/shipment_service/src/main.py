@@ -1,4 +1,5 @@
 import asyncio
+from datetime import timedelta
 
 import uvicorn
 from contextlib import asynccontextmanager
@@ -10,11 +11,13 @@ from libs.observability.logger import set_service_name, set_environment, get_jso
 from libs.observability.metrics import PrometheusMiddleware, metrics_endpoint
 
 from src.api.router import router
-from src.api.deps.getters import db_provider, event_queue_provider
+from src.api.deps.getters import cache_provider, db_provider, event_queue_provider
 from src.app.services.shipment import ShipmentService
+from src.app.workers.archiver import CancelledShipmentArchiver
 from src.app.workers.command_worker import ShipmentCommandWorker
 from src.config import settings
-from src.domain.errors import ShipmentNotFoundError
+from src.domain.errors import ShipmentNotFoundError, ShipmentStatusTransitionError
+from src.infra.cached_shipment_repository import CachedShipmentRepository
 from src.infra.db.shipment_repository import PostgresShipmentRepository
 
 set_service_name(settings.SERVICE_NAME)
@@ -28,26 +31,44 @@ async def lifespan(app: FastAPI):
 
     await db_provider.startup()
     await event_queue_provider.startup()
+    cache = await cache_provider()
 
-    shipment_repo = PostgresShipmentRepository(db_provider._pool)
+    shipment_repo = CachedShipmentRepository(
+        repository=PostgresShipmentRepository(db_provider._pool),
+        cache=cache,
+        ttl_seconds=settings.SHIPMENT_HISTORY_CACHE_TTL_SECONDS,
+    )
     shipment_service = ShipmentService(repository=shipment_repo)
     command_worker = ShipmentCommandWorker(
         event_queue=event_queue_provider._adapter,
         shipment_service=shipment_service,
+        batch_size=settings.CANCEL_BATCH_SIZE,
+        batch_window_seconds=settings.CANCEL_BATCH_WINDOW_MS / 1000,
+    )
+    archiver = CancelledShipmentArchiver(
+        shipment_service=shipment_service,
+        retention=timedelta(hours=settings.CANCELLED_RETENTION_HOURS),
+        interval_seconds=settings.ARCHIVE_INTERVAL_SECONDS,
+        batch_size=settings.ARCHIVE_BATCH_SIZE,
     )
 
     worker_task = asyncio.create_task(command_worker.run(), name="shipment_command_worker")
+    archiver_task = asyncio.create_task(archiver.run(), name="cancelled_shipment_archiver")
 
     logger.info(f"Service '{settings.SERVICE_NAME}' ready on port {settings.PORT}.")
     yield
 
     logger.info("Shutting down Shipment Service...")
-    worker_task.cancel()
-    try:
-        await worker_task
-    except asyncio.CancelledError:
-        logger.info("Command worker stopped gracefully.")
-
+    await archiver.stop()
+    for task in (worker_task, archiver_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    logger.info("Background workers stopped gracefully.")
+
+    await cache.close()
     await event_queue_provider.shutdown()
     await db_provider.shutdown()
     logger.info("Shutdown complete.")
@@ -77,6 +98,10 @@ def create_app() -> FastAPI:
     async def handle_shipment_not_found(request: Request, exc: ShipmentNotFoundError) -> JSONResponse:
         return JSONResponse(status_code=404, content={"detail": str(exc)})
 
+    @app.exception_handler(ShipmentStatusTransitionError)
+    async def handle_status_transition(request: Request, exc: ShipmentStatusTransitionError) -> JSONResponse:
+        return JSONResponse(status_code=409, content={"detail": str(exc)})
+
     return app
 
 
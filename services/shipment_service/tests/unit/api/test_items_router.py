@@ -9,6 +9,8 @@ from src.api.deps.getters import get_item_service, get_current_user, get_event_q
 from src.api.dto.item import ItemDTO
 from src.domain.errors import ItemNotFoundError
 from src.api.handlers.item import shipment_items_router, items_router
+from src.config import settings
+from src.domain.value_objects.shipment_totals import ShipmentTotals
 
 app = FastAPI()
 
@@ -262,3 +264,69 @@ def test_get_shipment_items_count(mock_mapper, client, mock_item_service):
     assert data["shipment_id"] == str(shipment_id)
 
     mock_item_service.get_items_count.assert_awaited_once_with(shipment_id)
+
+
+def test_get_shipments_totals(client, mock_item_service):
+    first, second = uuid4(), uuid4()
+
+    mock_item_service.get_totals.return_value = [
+        ShipmentTotals(shipment_id=first, items_count=3, total_quantity=10, total_weight=42.5),
+        ShipmentTotals(shipment_id=second),
+    ]
+
+    response = client.post("/items/totals", json={"shipment_ids": [str(first), str(second)]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0] == {
+        "shipment_id": str(first),
+        "items_count": 3,
+        "total_quantity": 10,
+        "total_weight": 42.5,
+    }
+    assert data[1]["items_count"] == 0
+    mock_item_service.get_totals.assert_awaited_once_with([first, second])
+
+
+def test_get_shipments_totals_rejects_too_many_ids(client, mock_item_service):
+    shipment_ids = [str(uuid4()) for _ in range(settings.ITEM_TOTALS_MAX_SHIPMENTS + 1)]
+
+    response = client.post("/items/totals", json={"shipment_ids": shipment_ids})
+
+    assert response.status_code == 400
+    mock_item_service.get_totals.assert_not_called()
+
+
+def test_upsert_items_bulk(client, mock_item_service, mock_event_queue):
+    shipment_id = uuid4()
+    existing_id = uuid4()
+    mock_item_service.create_many.side_effect = lambda items: items
+
+    payload = [
+        {"name": "Box", "quantity": 2, "weight": 1.5},
+        {"item_id": str(existing_id), "name": "Crate", "quantity": 1, "weight": 10.0},
+    ]
+
+    response = client.post(f"/shipments/{shipment_id}/items/bulk", json=payload)
+
+    assert response.status_code == 201
+    data = response.json()
+    assert [item["name"] for item in data] == ["Box", "Crate"]
+    assert data[1]["item_id"] == str(existing_id)
+    assert all(item["shipment_id"] == str(shipment_id) for item in data)
+
+    mock_item_service.create_many.assert_awaited_once()
+    mock_event_queue.publish_event.assert_awaited_once()
+
+
+def test_upsert_items_bulk_rejects_invalid_line(client, mock_item_service):
+    payload = [
+        {"name": "Box", "quantity": 2, "weight": 1.5},
+        {"name": "Empty", "quantity": 0, "weight": 1.0},
+    ]
+
+    response = client.post(f"/shipments/{uuid4()}/items/bulk", json=payload)
+
+    assert response.status_code == 422
+    assert "Invalid item 2" in response.json()["detail"]
+    mock_item_service.create_many.assert_not_called()
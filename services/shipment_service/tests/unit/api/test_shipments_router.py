@@ -7,10 +7,18 @@ from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
 from libs.auth.models import UserInDB
+from libs.messaging.events import ShipmentCreated
 from src.api.deps.getters import get_shipment_service, get_current_user, get_event_queue
-from src.api.dto.shipment import ShipmentDTO, LocationDTO
-from src.domain.errors import ShipmentNotFoundError
+from src.api.dto.shipment import ShipmentDTO, ShipmentUpdateDTO, LocationDTO
+from src.domain.errors import ShipmentNotFoundError, ShipmentStatusTransitionError
 from src.api.handlers.shipment import shipments_router
+from libs.value_objects.location import Location
+from libs.value_objects.timestamp import Timestamp
+from src.api.mappers import ShipmentMapper
+from src.domain.entities import Item, Shipment, ShipmentAggregate
+from src.domain.value_objects import Quantity, ShipmentTotals, StatusStatistics, Weight
+from src.domain.value_objects.shipment_status import ShipmentStatus
+from src.domain.value_objects.status_change import StatusChange
 
 _ADMIN_USER = UserInDB(username="admin", hashed_password="", role="admin")
 
@@ -22,6 +30,11 @@ async def shipment_not_found_handler(request: Request, exc: ShipmentNotFoundErro
     return JSONResponse(status_code=404, content={"detail": str(exc)})
 
 
+@app.exception_handler(ShipmentStatusTransitionError)
+async def status_transition_handler(request: Request, exc: ShipmentStatusTransitionError):
+    return JSONResponse(status_code=409, content={"detail": str(exc)})
+
+
 app.include_router(shipments_router)
 
 
@@ -107,7 +120,13 @@ def test_create_shipment_success(mock_mapper, client, mock_shipment_service, moc
     )
 
     mock_mapper.create_dto_to_entity.return_value = fake_entity
-    mock_shipment_service.create.return_value = fake_entity
+    mock_shipment_service.create_with_items.return_value = MagicMock(shipment=fake_entity)
+    mock_mapper.aggregate_to_created_event.return_value = ShipmentCreated(
+        shipment_id=shipment_id,
+        origin={"country": "Russia", "city": "Moscow", "address": "Red Square"},
+        destination={"country": "UK", "city": "London", "address": "Trafalgar Square"},
+        items=[],
+    )
     mock_mapper.entity_to_dto.return_value = ShipmentDTO(
         shipment_id=shipment_id,
         origin=LocationDTO(country="Russia", city="Moscow", address="Red Square"),
@@ -127,7 +146,7 @@ def test_create_shipment_success(mock_mapper, client, mock_shipment_service, moc
     assert data["status"] == "CREATED"
 
     mock_mapper.create_dto_to_entity.assert_called_once()
-    mock_shipment_service.create.assert_awaited_once_with(fake_entity)
+    mock_shipment_service.create_with_items.assert_awaited_once_with(fake_entity, [])
     mock_event_queue.publish_event.assert_called_once()
 
 
@@ -212,13 +231,12 @@ def test_update_shipment_success(mock_mapper, client, mock_shipment_service, moc
     shipment_id = uuid4()
 
     payload = {
-        "status": "RECEIVED"
+        "status": "received"
     }
 
-    fake_entity = create_fake_shipment_entity(shipment_id=shipment_id)
     updated_entity = create_fake_shipment_entity(shipment_id=shipment_id, status="RECEIVED")
 
-    mock_shipment_service.get.return_value = fake_entity
+    mock_shipment_service.get.return_value = updated_entity
     mock_mapper.update_entity_from_dto.return_value = updated_entity
     mock_shipment_service.update.return_value = updated_entity
     mock_mapper.entity_to_dto.return_value = ShipmentDTO(
@@ -239,9 +257,56 @@ def test_update_shipment_success(mock_mapper, client, mock_shipment_service, moc
     assert data["status"] == "RECEIVED"
 
     mock_shipment_service.update.assert_awaited_once()
+    mock_shipment_service.update_status.assert_awaited_once_with(
+        shipment_id, ShipmentStatus.RECEIVED, arrival_date=None
+    )
     mock_event_queue.publish_event.assert_called_once()
 
 
+@patch("src.api.handlers.shipment.ShipmentMapper")
+def test_update_shipment_invalid_transition_returns_409(mock_mapper, client, mock_shipment_service, mock_event_queue):
+    shipment_id = uuid4()
+
+    fake_entity = create_fake_shipment_entity(shipment_id=shipment_id, status="DELIVERED")
+    mock_shipment_service.get.return_value = fake_entity
+    mock_mapper.update_entity_from_dto.return_value = fake_entity
+    mock_shipment_service.update.return_value = fake_entity
+    mock_shipment_service.update_status.side_effect = ShipmentStatusTransitionError(
+        f"Shipment {shipment_id} cannot move from DELIVERED to CREATED"
+    )
+
+    response = client.patch(f"/shipments/{shipment_id}", json={"status": "created"})
+
+    assert response.status_code == 409
+    mock_shipment_service.update.assert_not_called()
+    mock_event_queue.publish_event.assert_not_called()
+
+
+def test_update_shipment_unknown_status_returns_422(client, mock_shipment_service, mock_event_queue):
+    shipment_id = uuid4()
+    mock_shipment_service.get.return_value = create_fake_shipment_entity(shipment_id=shipment_id)
+
+    response = client.patch(f"/shipments/{shipment_id}", json={"status": "TELEPORTED"})
+
+    assert response.status_code == 422
+    mock_shipment_service.update.assert_not_called()
+    mock_shipment_service.update_status.assert_not_called()
+
+
+def test_update_entity_from_dto_leaves_status_untouched():
+    shipment = Shipment(
+        origin=Location(country="Russia", city="Moscow"),
+        destination=Location(country="UK", city="London"),
+        departure_date=date(2025, 12, 10),
+    )
+    dto = ShipmentUpdateDTO(departure_date=date(2025, 12, 12), status="delivered")
+
+    updated = ShipmentMapper.update_entity_from_dto(shipment, dto)
+
+    assert updated.departure_date == date(2025, 12, 12)
+    assert updated.status == ShipmentStatus.CREATED
+
+
 @patch("src.api.handlers.shipment.ShipmentMapper")
 def test_delete_shipment_success(mock_mapper, client, mock_shipment_service, mock_event_queue):
     shipment_id = uuid4()
@@ -462,3 +527,288 @@ def test_list_in_transit_shipments(mock_mapper, client, mock_shipment_service):
     assert all(s["status"] == "IN_TRANSIT" for s in data)
 
     mock_shipment_service.get_in_transit_shipments.assert_awaited_once()
+
+
+@patch.object(ShipmentMapper, "entity_to_dto")
+def test_list_active_shipments_returns_next_cursor(mock_entity_to_dto, client, mock_shipment_service):
+    created_at = datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)
+    shipments = [create_fake_shipment_entity(shipment_id=uuid4(), created_at=created_at) for _ in range(2)]
+    for shipment in shipments:
+        shipment.created_at.isoformat.return_value = created_at.isoformat()
+
+    mock_shipment_service.get_active_shipments.return_value = shipments
+    mock_entity_to_dto.return_value = ShipmentDTO(
+        shipment_id=shipments[0].shipment_id,
+        origin=LocationDTO(country="Russia", city="Moscow"),
+        destination=LocationDTO(country="UK", city="London"),
+        departure_date=date(2025, 12, 10),
+        arrival_date=None,
+        status="in_transit",
+        created_at=created_at.isoformat(),
+        updated_at=created_at.isoformat()
+    )
+
+    response = client.get("/shipments/status/active", params={"limit": 2})
+
+    assert response.status_code == 200
+    cursor = response.headers["X-Next-Cursor"]
+    assert ShipmentMapper.decode_cursor(cursor) == (created_at, shipments[-1].shipment_id)
+
+    mock_shipment_service.get_active_shipments.reset_mock()
+    mock_shipment_service.get_active_shipments.return_value = []
+
+    response = client.get("/shipments/status/active", params={"limit": 2, "cursor": cursor})
+
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+    mock_shipment_service.get_active_shipments.assert_awaited_once_with(
+        created_from=None,
+        created_to=None,
+        after=(created_at, shipments[-1].shipment_id),
+        limit=2,
+    )
+
+
+def test_list_in_transit_shipments_rejects_invalid_cursor(client, mock_shipment_service):
+    response = client.get("/shipments/status/in-transit", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    mock_shipment_service.get_in_transit_shipments.assert_not_called()
+
+
+def test_list_route_shipments_passes_filters(client, mock_shipment_service):
+    mock_shipment_service.find.return_value = []
+
+    response = client.get(
+        "/shipments/routes",
+        params={"origin_city": "Moscow", "departure_from": "2025-12-01", "departure_to": "2025-12-31"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == []
+    mock_shipment_service.find.assert_awaited_once_with(
+        origin_city="Moscow",
+        destination_city=None,
+        departure_from=date(2025, 12, 1),
+        departure_to=date(2025, 12, 31),
+        after=None,
+        limit=50,
+    )
+
+
+def test_get_shipment_history(client, mock_shipment_service):
+    shipment_id = uuid4()
+    changed_at = datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)
+    mock_shipment_service.get_history.return_value = [
+        StatusChange(shipment_id=shipment_id, new_status=ShipmentStatus.CREATED, changed_at=changed_at),
+        StatusChange(
+            shipment_id=shipment_id,
+            old_status=ShipmentStatus.CREATED,
+            new_status=ShipmentStatus.RECEIVED,
+            changed_at=changed_at,
+        ),
+    ]
+
+    response = client.get(f"/shipments/{shipment_id}/history")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["shipment_id"] == str(shipment_id)
+    assert [c["new_status"] for c in data["changes"]] == ["created", "received"]
+    assert data["changes"][0]["old_status"] is None
+
+
+def test_get_shipment_history_not_found(client, mock_shipment_service):
+    shipment_id = uuid4()
+    mock_shipment_service.get_history.side_effect = ShipmentNotFoundError(f"Shipment {shipment_id} not found")
+
+    response = client.get(f"/shipments/{shipment_id}/history")
+
+    assert response.status_code == 404
+
+
+def test_get_shipments_history_batch(client, mock_shipment_service):
+    first, second = uuid4(), uuid4()
+    changed_at = datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)
+    mock_shipment_service.get_histories.return_value = {
+        first: [StatusChange(shipment_id=first, new_status=ShipmentStatus.CREATED, changed_at=changed_at)],
+        second: [],
+    }
+
+    response = client.post("/shipments/history", json={"shipment_ids": [str(first), str(second)]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [h["shipment_id"] for h in data] == [str(first), str(second)]
+    assert data[1]["changes"] == []
+    mock_shipment_service.get_histories.assert_awaited_once_with([first, second])
+
+
+def make_aggregate(shipment_id, updated_at):
+    shipment = Shipment(
+        shipment_id=shipment_id,
+        origin=Location(country="Russia", city="Moscow"),
+        destination=Location(country="UK", city="London"),
+        departure_date=date(2025, 12, 10),
+        updated_at=Timestamp(updated_at),
+    )
+    item = Item(name="Box", quantity=Quantity(2), weight=Weight(1.5), shipment_id=shipment_id)
+    totals = ShipmentTotals(shipment_id=shipment_id, items_count=1, total_quantity=2, total_weight=3.0)
+    return ShipmentAggregate(shipment=shipment, items=[item], totals=totals)
+
+
+def test_get_shipment_aggregate_sets_etag(client, mock_shipment_service):
+    shipment_id = uuid4()
+    updated_at = datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)
+    mock_shipment_service.get_aggregate.return_value = make_aggregate(shipment_id, updated_at)
+
+    response = client.get(f"/shipments/{shipment_id}/aggregate")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == ShipmentMapper.etag(updated_at)
+    data = response.json()
+    assert data["shipment"]["shipment_id"] == str(shipment_id)
+    assert data["items"][0]["name"] == "Box"
+    assert data["totals"]["total_weight"] == 3.0
+    mock_shipment_service.get_version.assert_not_called()
+
+
+def test_get_shipment_aggregate_not_modified(client, mock_shipment_service):
+    shipment_id = uuid4()
+    updated_at = datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)
+    mock_shipment_service.get_version.return_value = updated_at
+
+    response = client.get(
+        f"/shipments/{shipment_id}/aggregate",
+        headers={"If-None-Match": f"W/{ShipmentMapper.etag(updated_at)}"},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    mock_shipment_service.get_aggregate.assert_not_called()
+
+
+def test_get_shipment_aggregate_stale_etag_returns_body(client, mock_shipment_service):
+    shipment_id = uuid4()
+    old = datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)
+    new = datetime(2025, 12, 8, 11, 0, tzinfo=timezone.utc)
+    mock_shipment_service.get_version.return_value = new
+    mock_shipment_service.get_aggregate.return_value = make_aggregate(shipment_id, new)
+
+    response = client.get(
+        f"/shipments/{shipment_id}/aggregate",
+        headers={"If-None-Match": ShipmentMapper.etag(old)},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == ShipmentMapper.etag(new)
+
+
+def test_get_shipment_statistics_by_route(client, mock_shipment_service):
+    mock_shipment_service.get_statistics.return_value = [
+        StatusStatistics(status=ShipmentStatus.CREATED),
+        StatusStatistics(
+            status=ShipmentStatus.IN_TRANSIT,
+            shipments_count=2,
+            total_items=5,
+            total_quantity=12,
+            total_weight=40.5,
+        ),
+    ]
+
+    response = client.get("/shipments/statistics", params={"origin_city": "Moscow"})
+
+    assert response.status_code == 200
+    assert response.json()[1] == {
+        "status": "in_transit",
+        "shipments_count": 2,
+        "total_items": 5,
+        "total_quantity": 12,
+        "total_weight": 40.5,
+    }
+    mock_shipment_service.get_statistics.assert_awaited_once_with(origin_city="Moscow", destination_city=None)
+
+
+def test_mark_shipment_received_conflict(client, mock_shipment_service, mock_event_queue):
+    shipment_id = uuid4()
+    mock_shipment_service.mark_as_received.side_effect = ShipmentStatusTransitionError(
+        f"Shipment {shipment_id} cannot move from in_transit to received"
+    )
+
+    response = client.post(f"/shipments/{shipment_id}/receive")
+
+    assert response.status_code == 409
+    mock_shipment_service.update.assert_not_called()
+    mock_event_queue.publish_event.assert_not_called()
+
+
+def test_cancel_shipment_publishes_cancelled_event(client, mock_shipment_service, mock_event_queue):
+    shipment_id = uuid4()
+    shipment = Shipment(
+        shipment_id=shipment_id,
+        origin=Location(country="Russia", city="Moscow"),
+        destination=Location(country="UK", city="London"),
+        departure_date=date(2025, 12, 10),
+    )
+    shipment.cancel("customer request")
+    mock_shipment_service.cancel.return_value = shipment
+
+    response = client.post(f"/shipments/{shipment_id}/cancel", json={"reason": "customer request"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "cancelled"
+    assert data["cancelled_reason"] == "customer request"
+    mock_shipment_service.cancel.assert_awaited_once_with(shipment_id, "customer request")
+    mock_event_queue.publish_event.assert_awaited_once()
+
+
+def test_create_shipment_publishes_snapshot_with_items(client, mock_shipment_service, mock_event_queue):
+    async def create_with_items(shipment, items):
+        totals = ShipmentTotals(
+            shipment_id=shipment.shipment_id,
+            items_count=len(items),
+            total_quantity=sum(i.quantity.value for i in items),
+            total_weight=sum(i.weight.value * i.quantity.value for i in items),
+        )
+        return ShipmentAggregate(shipment=shipment, items=items, totals=totals)
+
+    mock_shipment_service.create_with_items.side_effect = create_with_items
+    payload = {
+        "origin": {"country": "Russia", "city": "Moscow", "address": "Red Square"},
+        "destination": {"country": "UK", "city": "London"},
+        "departure_date": "2025-12-10",
+        "items": [
+            {"name": "Box", "quantity": 2, "weight": 1.5},
+            {"name": "Crate", "quantity": 1, "weight": 10.0},
+        ],
+    }
+
+    response = client.post("/shipments", json=payload)
+
+    assert response.status_code == 201
+    event = mock_event_queue.publish_event.call_args.args[0]
+    assert event.event_type == "shipment.created"
+    assert event.payload["origin"] == {"country": "Russia", "city": "Moscow", "address": "Red Square"}
+    assert [item["name"] for item in event.payload["items"]] == ["Box", "Crate"]
+    assert event.payload["items"][0]["quantity"] == 2
+    assert isinstance(event.payload["items"][0]["item_id"], str)
+    assert event.payload["total_quantity"] == 3
+    assert event.payload["total_weight"] == 13.0
+    assert event.payload["departure_date"] == "2025-12-10"
+
+
+def test_create_shipment_rejects_invalid_item(client, mock_shipment_service, mock_event_queue):
+    payload = {
+        "origin": {"country": "Russia", "city": "Moscow"},
+        "destination": {"country": "UK", "city": "London"},
+        "departure_date": "2025-12-10",
+        "items": [{"name": "Box", "quantity": 1, "weight": 1.0}, {"name": "Bad", "quantity": 0, "weight": 1.0}],
+    }
+
+    response = client.post("/shipments", json=payload)
+
+    assert response.status_code == 422
+    assert "Invalid item 2" in response.json()["detail"]
+    mock_shipment_service.create_with_items.assert_not_called()
+    mock_event_queue.publish_event.assert_not_called()
@@ -0,0 +1,101 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from libs.cache.memory import InMemoryCacheAdapter
+
+from src.app.services.item import ItemService
+from src.domain.entities.item import Item
+from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.shipment_totals import ShipmentTotals
+from src.domain.value_objects.weight import Weight
+from src.infra.cached_item_repository import CachedItemRepository
+
+
+@pytest.fixture
+def mock_repository():
+    repo = AsyncMock()
+    repo.save.side_effect = lambda item: item
+    repo.get_totals.side_effect = lambda ids: {
+        shipment_id: ShipmentTotals(shipment_id=shipment_id, items_count=2, total_quantity=5, total_weight=12.5)
+        for shipment_id in ids
+    }
+    return repo
+
+
+@pytest.fixture
+def cached_repo(mock_repository):
+    return CachedItemRepository(mock_repository, InMemoryCacheAdapter())
+
+
+@pytest.mark.asyncio
+async def test_totals_are_served_from_cache(cached_repo, mock_repository):
+    shipment_id = uuid4()
+
+    first = await cached_repo.get_totals([shipment_id])
+    second = await cached_repo.get_totals([shipment_id])
+
+    assert first == second
+    assert second[shipment_id].total_weight == 12.5
+    mock_repository.get_totals.assert_awaited_once_with([shipment_id])
+
+
+@pytest.mark.asyncio
+async def test_only_missing_totals_are_loaded(cached_repo, mock_repository):
+    cached_id, new_id = uuid4(), uuid4()
+    await cached_repo.get_totals([cached_id])
+
+    totals = await cached_repo.get_totals([cached_id, new_id, new_id])
+
+    assert set(totals) == {cached_id, new_id}
+    mock_repository.get_totals.assert_awaited_with([new_id])
+
+
+@pytest.mark.asyncio
+async def test_totals_use_one_cache_read_and_one_cache_write(mock_repository):
+    cache = InMemoryCacheAdapter()
+    cached_repo = CachedItemRepository(mock_repository, cache)
+    cached_id = uuid4()
+    await cached_repo.get_totals([cached_id])
+    new_ids = [uuid4() for _ in range(50)]
+
+    with patch.object(cache, "get_many", wraps=cache.get_many) as get_many, \
+            patch.object(cache, "set_many", wraps=cache.set_many) as set_many:
+        totals = await cached_repo.get_totals([cached_id, *new_ids])
+
+    assert len(totals) == 51
+    assert get_many.await_count == 1
+    assert set_many.await_count == 1
+    assert len(set_many.await_args.args[0]) == 50
+    mock_repository.get_totals.assert_awaited_with(new_ids)
+
+
+@pytest.mark.asyncio
+async def test_item_writes_invalidate_shipment_totals(cached_repo, mock_repository):
+    shipment_id = uuid4()
+    item = Item(name="Box", quantity=Quantity(1), weight=Weight(2.0), shipment_id=shipment_id)
+    mock_repository.delete.return_value = shipment_id
+
+    await cached_repo.get_totals([shipment_id])
+    await cached_repo.save(item)
+    await cached_repo.get_totals([shipment_id])
+    await cached_repo.delete(item.item_id)
+    await cached_repo.get_totals([shipment_id])
+
+    assert mock_repository.get_totals.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_service_fills_zero_totals_and_keeps_request_order(mock_repository):
+    empty_id, loaded_id = uuid4(), uuid4()
+    mock_repository.get_totals.side_effect = None
+    mock_repository.get_totals.return_value = {
+        loaded_id: ShipmentTotals(shipment_id=loaded_id, items_count=1, total_quantity=4, total_weight=8.0)
+    }
+    service = ItemService(repository=mock_repository)
+
+    totals = await service.get_totals([empty_id, loaded_id, empty_id])
+
+    assert [t.shipment_id for t in totals] == [empty_id, loaded_id]
+    assert totals[0] == ShipmentTotals(shipment_id=empty_id)
+    assert await service.get_items_count(loaded_id) == 1
@@ -0,0 +1,61 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from libs.cache.memory import InMemoryCacheAdapter
+
+from src.domain.value_objects.shipment_status import ShipmentStatus
+from src.domain.value_objects.status_change import StatusChange
+from src.infra.cached_shipment_repository import CachedShipmentRepository
+
+
+def make_history(shipment_id):
+    changed_at = datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)
+    return [
+        StatusChange(shipment_id=shipment_id, new_status=ShipmentStatus.CREATED, changed_at=changed_at),
+        StatusChange(
+            shipment_id=shipment_id,
+            old_status=ShipmentStatus.CREATED,
+            new_status=ShipmentStatus.RECEIVED,
+            changed_at=changed_at,
+            changed_by="operator",
+        ),
+    ]
+
+
+@pytest.fixture
+def mock_repository():
+    repo = AsyncMock()
+    repo.get_history.side_effect = lambda ids: {shipment_id: make_history(shipment_id) for shipment_id in ids}
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_history_is_served_from_cache_until_shipment_is_saved(mock_repository):
+    shipment_id = uuid4()
+    shipment = MagicMock(shipment_id=shipment_id)
+    mock_repository.save.return_value = shipment
+    cached_repo = CachedShipmentRepository(mock_repository, InMemoryCacheAdapter())
+
+    first = await cached_repo.get_history([shipment_id])
+    second = await cached_repo.get_history([shipment_id])
+    assert first == second
+    assert mock_repository.get_history.await_count == 1
+
+    await cached_repo.save(shipment)
+    await cached_repo.get_history([shipment_id])
+
+    assert mock_repository.get_history.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_history_is_not_cached(mock_repository):
+    shipment_id = uuid4()
+    mock_repository.get_history.side_effect = lambda ids: {}
+    cached_repo = CachedShipmentRepository(mock_repository, InMemoryCacheAdapter())
+
+    await cached_repo.get_history([shipment_id])
+    await cached_repo.get_history([shipment_id])
+
+    assert mock_repository.get_history.await_count == 2
@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from libs.messaging.base import Command
+
+from src.app.workers.command_worker import ShipmentCommandWorker
+
+
+def make_queue(commands):
+    queue = MagicMock()
+
+    async def consume_command(*topics):
+        for command in commands:
+            yield command
+
+    queue.consume_command = consume_command
+    return queue
+
+
+def cancel_command(shipment_id, reason="Saga compensation"):
+    return Command(command_type="shipment.cancel", aggregate_id=shipment_id, payload={"reason": reason})
+
+
+@pytest.mark.asyncio
+async def test_cancel_commands_are_applied_in_one_batch():
+    ids = [uuid4() for _ in range(5)]
+    service = AsyncMock()
+    service.cancel_many.side_effect = lambda reasons: [MagicMock(shipment_id=i) for i in reasons]
+    worker = ShipmentCommandWorker(
+        event_queue=make_queue([cancel_command(i, reason=f"r{n}") for n, i in enumerate(ids)]),
+        shipment_service=service,
+    )
+
+    await worker.run()
+
+    service.cancel_many.assert_awaited_once_with({i: f"r{n}" for n, i in enumerate(ids)})
+    service.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_by_batch_size():
+    ids = [uuid4() for _ in range(5)]
+    service = AsyncMock()
+    service.cancel_many.return_value = []
+    worker = ShipmentCommandWorker(
+        event_queue=make_queue([cancel_command(i) for i in ids]),
+        shipment_service=service,
+        batch_size=2,
+    )
+
+    await worker.run()
+
+    batches = [list(call.args[0]) for call in service.cancel_many.await_args_list]
+    assert batches == [ids[0:2], ids[2:4], ids[4:5]]
+
+
+@pytest.mark.asyncio
+async def test_invalid_and_unknown_commands_do_not_break_batch():
+    shipment_id = uuid4()
+    service = AsyncMock()
+    service.cancel_many.return_value = []
+    commands = [
+        Command(command_type="shipment.cancel", aggregate_id=uuid4(), payload={"shipment_id": "not-a-uuid"}),
+        Command(command_type="shipment.unknown", aggregate_id=uuid4(), payload={}),
+        cancel_command(shipment_id),
+    ]
+    worker = ShipmentCommandWorker(event_queue=make_queue(commands), shipment_service=service)
+
+    await worker.run()
+
+    service.cancel_many.assert_awaited_once_with({shipment_id: "Saga compensation"})
@@ -0,0 +1,85 @@
+from uuid import uuid4
+
+import pytest
+
+from libs.testing.postgres import FakePool, RecordingConnection
+
+from src.domain.entities.item import Item
+from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.weight import Weight
+from src.infra.db.item_repository import AsyncPostgresItemRepository
+
+ITEM_COLUMNS = ["item_id", "shipment_id", "name", "quantity", "weight"]
+
+
+class FakeConnection(RecordingConnection):
+    """Возвращает переданные строки items; COPY запоминает залитые записи."""
+
+    def __init__(self):
+        super().__init__()
+        self.copied = []
+
+    async def fetchrow(self, query, *args):
+        self.record(query, args)
+        return dict(zip(ITEM_COLUMNS, args))
+
+    async def fetch(self, query, *args):
+        self.record(query, args)
+        rows = zip(*args) if args else self.copied
+        return [dict(zip(ITEM_COLUMNS, row)) for row in rows]
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.record(table)
+        self.copied = list(records)
+
+
+def make_items(count: int, shipment_id=None):
+    shipment_id = shipment_id or uuid4()
+    return [
+        Item(name=f"SKU-{n}", quantity=Quantity(n % 10 + 1), weight=Weight(1.5), shipment_id=shipment_id)
+        for n in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_save_many_collapses_duplicate_item_ids():
+    conn = FakeConnection()
+    repository = AsyncPostgresItemRepository(FakePool(conn))
+    items = make_items(3)
+    items[2].item_id = items[0].item_id
+
+    saved = await repository.save_many(items)
+
+    assert conn.round_trips == 1
+    assert "unnest" in conn.queries[0][0]
+    assert [item.name for item in saved] == ["SKU-2", "SKU-1"]
+
+
+@pytest.mark.asyncio
+async def test_save_many_switches_to_copy_for_large_batches(monkeypatch):
+    monkeypatch.setattr(AsyncPostgresItemRepository, "COPY_THRESHOLD", 10)
+    conn = FakeConnection()
+    repository = AsyncPostgresItemRepository(FakePool(conn))
+
+    saved = await repository.save_many(make_items(10))
+
+    assert len(saved) == 10
+    assert "items_staging" in conn.queries[-1][0]
+    assert conn.queries[-1][1] == ()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [100, 500])
+async def test_save_many_round_trips_do_not_grow_with_item_count(count):
+    single_conn, bulk_conn = FakeConnection(), FakeConnection()
+    single_repo = AsyncPostgresItemRepository(FakePool(single_conn))
+    bulk_repo = AsyncPostgresItemRepository(FakePool(bulk_conn))
+    items = make_items(count)
+
+    for item in items:
+        await single_repo.save(item)
+    saved = await bulk_repo.save_many(items)
+
+    assert single_conn.round_trips == count
+    assert bulk_conn.round_trips == 1
+    assert len(saved) == count
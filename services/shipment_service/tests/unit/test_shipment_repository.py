@@ -0,0 +1,248 @@
+import json
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from libs.value_objects.location import Location
+
+from src.domain.entities.item import Item
+from src.domain.entities.shipment import Shipment
+from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.weight import Weight
+from src.domain.value_objects.shipment_status import ShipmentStatus, allowed_sources
+from src.infra.db.shipment_repository import PostgresShipmentRepository
+
+SAVE_COLUMNS = [
+    "shipment_id",
+    "origin_country",
+    "origin_city",
+    "origin_address",
+    "destination_country",
+    "destination_city",
+    "destination_address",
+    "departure_date",
+    "arrival_date",
+    "status",
+    "cancelled_reason",
+    "created_at",
+]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.queries = []
+
+    async def fetchrow(self, query, *args):
+        self.queries.append((query, args))
+        row = dict(zip(SAVE_COLUMNS, args))
+        row["updated_at"] = row["created_at"]
+        return row
+
+    async def fetch(self, query, *args):
+        self.queries.append((query, args))
+        if "INSERT INTO items" in query:
+            return [dict(zip(("item_id", "shipment_id", "name", "quantity", "weight"), row)) for row in zip(*args)]
+        return []
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions = getattr(self, "transactions", 0) + 1
+        yield
+
+
+class FakePool:
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+@pytest.mark.asyncio
+async def test_save_round_trips_all_shipment_fields():
+    repository = PostgresShipmentRepository(FakePool(FakeConnection()))
+    shipment = Shipment(
+        origin=Location(country="Russia", city="Moscow", address="Red Square"),
+        destination=Location(country="UK", city="London"),
+        departure_date=date(2025, 12, 10),
+    )
+    shipment.mark_delivered(date(2025, 12, 15))
+
+    saved = await repository.save(shipment)
+
+    assert saved.origin == shipment.origin
+    assert saved.destination == shipment.destination
+    assert saved.departure_date == date(2025, 12, 10)
+    assert saved.arrival_date == date(2025, 12, 15)
+    assert saved.status == ShipmentStatus.DELIVERED
+    assert saved.created_at == shipment.created_at
+
+
+@pytest.mark.asyncio
+async def test_save_does_not_overwrite_status_of_existing_shipment():
+    conn = FakeConnection()
+    repository = PostgresShipmentRepository(FakePool(conn))
+    shipment = Shipment(
+        origin=Location(country="Russia", city="Moscow"),
+        destination=Location(country="UK", city="London"),
+        departure_date=date(2025, 12, 10),
+    )
+
+    await repository.save(shipment)
+
+    query, _ = conn.queries[0]
+    on_conflict = query[query.index("DO UPDATE SET"):]
+    assert "departure_date = EXCLUDED.departure_date" in on_conflict
+    assert "status = EXCLUDED.status" not in on_conflict
+    assert "cancelled_reason = EXCLUDED.cancelled_reason" not in on_conflict
+
+
+@pytest.mark.asyncio
+async def test_find_filters_route_and_departure_range_in_sql():
+    conn = FakeConnection()
+    repository = PostgresShipmentRepository(FakePool(conn))
+
+    await repository.find(
+        origin_city="Moscow",
+        destination_city="London",
+        departure_from=date(2025, 12, 1),
+        departure_to=date(2025, 12, 31),
+        limit=20,
+    )
+
+    query, args = conn.queries[0]
+    assert "origin_city = $1" in query
+    assert "destination_city = $2" in query
+    assert "departure_date >= $3" in query
+    assert "departure_date <= $4" in query
+    assert args == ("Moscow", "London", date(2025, 12, 1), date(2025, 12, 31), 20)
+
+
+@pytest.mark.asyncio
+async def test_get_aggregate_builds_items_and_totals_from_single_row():
+    shipment_id = uuid4()
+    item_id = uuid4()
+    now = datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)
+    row = {
+        "shipment_id": shipment_id,
+        "origin_country": "Russia",
+        "origin_city": "Moscow",
+        "origin_address": "",
+        "destination_country": "UK",
+        "destination_city": "London",
+        "destination_address": "",
+        "departure_date": date(2025, 12, 10),
+        "arrival_date": None,
+        "status": "created",
+        "cancelled_reason": None,
+        "created_at": now,
+        "updated_at": now,
+        "items": json.dumps([{"item_id": str(item_id), "name": "Box", "quantity": 2, "weight": 1.5}]),
+        "items_count": 1,
+        "total_quantity": 2,
+        "total_weight": 3.0,
+    }
+    conn = FakeConnection()
+
+    async def fetchrow(query, *args):
+        conn.queries.append((query, args))
+        return row
+
+    conn.fetchrow = fetchrow
+    repository = PostgresShipmentRepository(FakePool(conn))
+
+    aggregate = await repository.get_aggregate(shipment_id)
+
+    assert len(conn.queries) == 1
+    assert "json_agg" in conn.queries[0][0]
+    assert aggregate.shipment.shipment_id == shipment_id
+    assert [item.item_id for item in aggregate.items] == [item_id]
+    assert aggregate.items[0].shipment_id == shipment_id
+    assert aggregate.totals.total_weight == 3.0
+
+
+@pytest.mark.asyncio
+async def test_get_statistics_reads_summary_table_without_joining_items():
+    conn = FakeConnection()
+    repository = PostgresShipmentRepository(FakePool(conn))
+
+    await repository.get_statistics(destination_city="London")
+
+    query, args = conn.queries[0]
+    assert "FROM shipment_statistics" in query
+    assert "items" not in query.replace("total_items", "")
+    assert "destination_city = $1" in query
+    assert args == ("London",)
+
+
+@pytest.mark.asyncio
+async def test_transition_status_is_single_conditional_update():
+    conn = FakeConnection()
+    shipment_id = uuid4()
+
+    async def fetchrow(query, *args):
+        conn.queries.append((query, args))
+        return None
+
+    conn.fetchrow = fetchrow
+    repository = PostgresShipmentRepository(FakePool(conn))
+
+    updated = await repository.transition_status(
+        shipment_id,
+        ShipmentStatus.DELIVERED,
+        from_statuses=allowed_sources(ShipmentStatus.DELIVERED),
+        arrival_date=date(2025, 12, 15),
+    )
+
+    assert updated is None
+    assert len(conn.queries) == 1
+    query, args = conn.queries[0]
+    assert query.strip().startswith("UPDATE shipments")
+    assert "status = ANY($3::text[])" in query
+    assert args == (shipment_id, "delivered", ["in_transit"], date(2025, 12, 15))
+
+
+@pytest.mark.asyncio
+async def test_cancel_many_updates_batch_in_one_statement():
+    conn = FakeConnection()
+    repository = PostgresShipmentRepository(FakePool(conn))
+    first, second = uuid4(), uuid4()
+
+    await repository.cancel_many({first: "payment failed", second: "out of stock"})
+
+    assert len(conn.queries) == 1
+    query, args = conn.queries[0]
+    assert query.strip().startswith("UPDATE shipments")
+    assert "unnest($1::uuid[], $2::text[])" in query
+    assert args[0] == [first, second]
+    assert args[1] == ["payment failed", "out of stock"]
+    assert args[2] == "cancelled"
+    assert "delivered" not in args[3] and "completed" not in args[3]
+
+
+@pytest.mark.asyncio
+async def test_create_with_items_builds_snapshot_in_one_transaction():
+    conn = FakeConnection()
+    repository = PostgresShipmentRepository(FakePool(conn))
+    shipment = Shipment(
+        origin=Location(country="Russia", city="Moscow"),
+        destination=Location(country="UK", city="London"),
+        departure_date=date(2025, 12, 10),
+    )
+    items = [
+        Item(shipment_id=shipment.shipment_id, name="Crate", quantity=Quantity(1), weight=Weight(10.0)),
+        Item(shipment_id=shipment.shipment_id, name="Box", quantity=Quantity(2), weight=Weight(1.5)),
+    ]
+
+    aggregate = await repository.create_with_items(shipment, items)
+
+    assert conn.transactions == 1
+    assert len(conn.queries) == 2
+    assert "unnest(" in conn.queries[1][0]
+    assert [item.name for item in aggregate.items] == ["Box", "Crate"]
+    assert aggregate.totals.items_count == 2
+    assert aggregate.totals.total_quantity == 3
+    assert aggregate.totals.total_weight == 13.0
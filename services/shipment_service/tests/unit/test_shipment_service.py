@@ -0,0 +1,75 @@
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.app.services.shipment import ShipmentService
+from src.domain.errors import ShipmentNotFoundError, ShipmentStatusTransitionError
+from src.domain.value_objects.shipment_status import ShipmentStatus
+
+
+@pytest.fixture
+def mock_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(mock_repository):
+    return ShipmentService(repository=mock_repository)
+
+
+@pytest.mark.asyncio
+async def test_transition_is_one_repository_call(service, mock_repository):
+    shipment_id = uuid4()
+    updated = MagicMock(status=ShipmentStatus.RECEIVED)
+    mock_repository.transition_status.return_value = updated
+
+    result = await service.mark_as_received(shipment_id)
+
+    assert result is updated
+    mock_repository.transition_status.assert_awaited_once_with(
+        shipment_id,
+        ShipmentStatus.RECEIVED,
+        from_statuses=frozenset({ShipmentStatus.CREATED}),
+        arrival_date=None,
+    )
+    mock_repository.get.assert_not_called()
+    mock_repository.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delivered_passes_arrival_date(service, mock_repository):
+    shipment_id = uuid4()
+
+    await service.mark_as_delivered(shipment_id, arrival_date=date(2025, 12, 15))
+
+    kwargs = mock_repository.transition_status.call_args.kwargs
+    assert kwargs["from_statuses"] == frozenset({ShipmentStatus.IN_TRANSIT})
+    assert kwargs["arrival_date"] == date(2025, 12, 15)
+
+
+@pytest.mark.asyncio
+async def test_rejected_transition_raises_conflict(service, mock_repository):
+    mock_repository.transition_status.return_value = None
+    mock_repository.get.return_value = MagicMock(status=ShipmentStatus.COMPLETED)
+
+    with pytest.raises(ShipmentStatusTransitionError):
+        await service.mark_as_in_transit(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_transition_of_missing_shipment_raises_not_found(service, mock_repository):
+    mock_repository.transition_status.return_value = None
+    mock_repository.get.return_value = None
+
+    with pytest.raises(ShipmentNotFoundError):
+        await service.mark_as_completed(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_cancel_of_completed_shipment_raises_conflict(service, mock_repository):
+    mock_repository.cancel_many.return_value = []
+    mock_repository.get.return_value = MagicMock(status=ShipmentStatus.COMPLETED)
+
+    with pytest.raises(ShipmentStatusTransitionError):
+        await service.cancel(uuid4(), "customer request")
@@ -0,0 +1,71 @@
+"""
+Замер задержки компенсации саги (освобождение инвентаря отгрузки) при 1/50/500 записях:
+прежний путь get + upsert на каждую запись против одного release_by_shipment.
+База заменена соединением с фиксированной задержкой на каждый запрос, поэтому
+цифры показывают цену round-trip'ов, а не работу Postgres.
+Запуск из каталога сервиса: python -m benchmarks.release_benchmark [round_trip_ms]
+"""
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from libs.testing.postgres import FakePool, RecordingConnection
+
+from src.domain.entities.inventory_record import InventoryStatus
+from src.infra.db.inventory_repository import AsyncPostgresInventoryRepository
+
+RECORD_COUNTS = (1, 50, 500)
+
+
+class LatencyConnection(RecordingConnection):
+
+    def __init__(self, round_trip_seconds: float, records_per_shipment: int):
+        super().__init__()
+        self.round_trip_seconds = round_trip_seconds
+        now = datetime.now(timezone.utc)
+        shipment_id, warehouse_id = uuid4(), uuid4()
+        self.rows = [
+            {"record_id": uuid4(), "shipment_id": shipment_id, "warehouse_id": warehouse_id,
+             "status": InventoryStatus.READY_FOR_DELIVERY.value, "received_at": now, "updated_at": now}
+            for _ in range(records_per_shipment)
+        ]
+
+    async def _round_trip(self, query, args=()):
+        self.record(query, args)
+        await asyncio.sleep(self.round_trip_seconds)
+
+    async def fetch(self, query, *args):
+        await self._round_trip(query, args)
+        return self.rows
+
+    async def fetchrow(self, query, *args):
+        await self._round_trip(query, args)
+        return self.rows[0]
+
+
+async def main(round_trip_ms: float) -> None:
+    for count in RECORD_COUNTS:
+        for name, release in (
+            ("per-record", _release_one_by_one),
+            ("single", lambda repo, shipment_id: repo.release_by_shipment(shipment_id)),
+        ):
+            conn = LatencyConnection(round_trip_ms / 1000, count)
+            repository = AsyncPostgresInventoryRepository(FakePool(conn))
+            started = time.perf_counter()
+            await release(repository, conn.rows[0]["shipment_id"])
+            elapsed = time.perf_counter() - started
+            print(f"{count:>4} records, {name:>10}: {elapsed * 1000:8.1f} ms, {conn.round_trips} round-trip(s)")
+
+
+async def _release_one_by_one(repository: AsyncPostgresInventoryRepository, shipment_id) -> None:
+    """Прежняя компенсация: список записей, затем get и upsert каждой."""
+    for record in await repository.list_by_shipment(shipment_id):
+        current = await repository.get(record.record_id)
+        current.update_status(InventoryStatus.RECEIVED)
+        await repository.save(current)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(float(sys.argv[1]) if len(sys.argv) > 1 else 2.0))
@@ -0,0 +1,42 @@
+
+from yoyo import step
+
+__depends__ = {'003_add_indexes'}
+
+steps = [
+    step(
+        """
+        CREATE TABLE IF NOT EXISTS stock_levels (
+            warehouse_id UUID NOT NULL REFERENCES warehouses(warehouse_id) ON DELETE CASCADE,
+            sku VARCHAR(100) NOT NULL,
+            on_hand INTEGER NOT NULL DEFAULT 0,
+            reserved INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+
+            PRIMARY KEY (warehouse_id, sku),
+            CONSTRAINT ck_stock_reserved_non_negative CHECK (reserved >= 0),
+            CONSTRAINT ck_stock_reserved_within_on_hand CHECK (on_hand >= reserved)
+        );
+
+        CREATE TABLE IF NOT EXISTS inventory_record_items (
+            record_id UUID NOT NULL,
+            warehouse_id UUID NOT NULL,
+            sku VARCHAR(100) NOT NULL,
+            quantity INTEGER NOT NULL CHECK (quantity > 0),
+
+            PRIMARY KEY (record_id, sku),
+            FOREIGN KEY (warehouse_id, sku) REFERENCES stock_levels(warehouse_id, sku) ON DELETE CASCADE
+        );
+
+        COMMENT ON TABLE stock_levels IS 'Остатки склада по SKU';
+        COMMENT ON COLUMN stock_levels.on_hand IS 'Физически на складе';
+        COMMENT ON COLUMN stock_levels.reserved IS 'Зарезервировано под отгрузки; доступно = on_hand - reserved';
+        COMMENT ON TABLE inventory_record_items IS 'Строки резерва записи инвентаря; по ним резерв снимается или списывается';
+        """,
+
+        """
+        DROP TABLE IF EXISTS inventory_record_items;
+        DROP TABLE IF EXISTS stock_levels;
+        """
+    )
+]
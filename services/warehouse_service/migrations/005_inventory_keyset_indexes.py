@@ -0,0 +1,28 @@
+from yoyo import step
+
+__depends__ = {'004_create_stock_levels'}
+
+steps = [
+    step(
+        """
+        -- Фильтр по складу и статусу сразу в порядке keyset-пагинации
+        DROP INDEX IF EXISTS idx_inventory_warehouse_status;
+        CREATE INDEX idx_inventory_warehouse_status
+        ON inventory_records(warehouse_id, status, received_at, record_id);
+
+        -- Листинг склада без фильтра статуса; record_id разрешает равные received_at
+        DROP INDEX IF EXISTS idx_inventory_warehouse_received;
+        CREATE INDEX idx_inventory_warehouse_received
+        ON inventory_records(warehouse_id, received_at, record_id);
+        """,
+
+        """
+        DROP INDEX IF EXISTS idx_inventory_warehouse_status;
+        CREATE INDEX idx_inventory_warehouse_status ON inventory_records(warehouse_id, status);
+
+        DROP INDEX IF EXISTS idx_inventory_warehouse_received;
+        CREATE INDEX idx_inventory_warehouse_received
+        ON inventory_records(warehouse_id, received_at DESC);
+        """
+    )
+]
@@ -0,0 +1,56 @@
+from yoyo import step
+
+__depends__ = {'005_inventory_keyset_indexes'}
+
+steps = [
+    step(
+        """
+        ALTER TABLE warehouses
+            ADD COLUMN country VARCHAR(100),
+            ADD COLUMN city VARCHAR(100),
+            ADD COLUMN address TEXT NOT NULL DEFAULT '',
+            ADD COLUMN latitude DOUBLE PRECISION,
+            ADD COLUMN longitude DOUBLE PRECISION;
+
+        -- Перенос адреса из JSON-строки в колонки
+        UPDATE warehouses
+        SET country = location::jsonb ->> 'country',
+            city = location::jsonb ->> 'city',
+            address = COALESCE(location::jsonb ->> 'address', '');
+
+        ALTER TABLE warehouses
+            ALTER COLUMN country SET NOT NULL,
+            ALTER COLUMN city SET NOT NULL,
+            ADD CONSTRAINT ck_warehouses_latitude CHECK (latitude BETWEEN -90 AND 90),
+            ADD CONSTRAINT ck_warehouses_longitude CHECK (longitude BETWEEN -180 AND 180),
+            ADD CONSTRAINT ck_warehouses_coordinates_pair CHECK ((latitude IS NULL) = (longitude IS NULL));
+
+        DROP INDEX IF EXISTS idx_warehouses_location;
+        ALTER TABLE warehouses DROP COLUMN location;
+
+        CREATE INDEX idx_warehouses_country_city ON warehouses(country, city);
+
+        COMMENT ON COLUMN warehouses.latitude IS 'Широта склада; ближайшие склады ищутся по индексу в памяти сервиса';
+        COMMENT ON COLUMN warehouses.longitude IS 'Долгота склада';
+        """,
+
+        """
+        ALTER TABLE warehouses ADD COLUMN location TEXT;
+
+        UPDATE warehouses
+        SET location = json_build_object('country', country, 'city', city, 'address', address)::text;
+
+        ALTER TABLE warehouses ALTER COLUMN location SET NOT NULL;
+
+        DROP INDEX IF EXISTS idx_warehouses_country_city;
+        ALTER TABLE warehouses
+            DROP COLUMN country,
+            DROP COLUMN city,
+            DROP COLUMN address,
+            DROP COLUMN latitude,
+            DROP COLUMN longitude;
+
+        CREATE INDEX idx_warehouses_location ON warehouses USING GIN(to_tsvector('english', location));
+        """
+    )
+]
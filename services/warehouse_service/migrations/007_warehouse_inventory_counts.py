@@ -0,0 +1,89 @@
+from yoyo import step
+
+__depends__ = {'006_structured_warehouse_location'}
+
+steps = [
+    step(
+        """
+        CREATE TABLE IF NOT EXISTS warehouse_inventory_counts (
+            warehouse_id UUID NOT NULL,
+            status VARCHAR(50) NOT NULL,
+            record_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+
+            PRIMARY KEY (warehouse_id, status)
+        );
+
+        -- Без FK на warehouses: при каскадном удалении склада триггер еще обновляет счетчики
+        INSERT INTO warehouse_inventory_counts (warehouse_id, status, record_count)
+        SELECT warehouse_id, status, COUNT(*)
+        FROM inventory_records
+        GROUP BY warehouse_id, status;
+
+        -- Statement-level триггеры с transition tables: массовые UPDATE (release_by_shipment)
+        -- дают одну агрегированную запись в счетчики вместо строки на каждую запись
+        CREATE OR REPLACE FUNCTION apply_inventory_count_deltas() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO warehouse_inventory_counts (warehouse_id, status, record_count)
+                SELECT warehouse_id, status, COUNT(*)
+                FROM new_rows
+                GROUP BY warehouse_id, status
+                ON CONFLICT (warehouse_id, status) DO UPDATE
+                SET record_count = warehouse_inventory_counts.record_count + EXCLUDED.record_count,
+                    updated_at = NOW();
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE warehouse_inventory_counts c
+                SET record_count = c.record_count - d.cnt,
+                    updated_at = NOW()
+                FROM (
+                    SELECT warehouse_id, status, COUNT(*) AS cnt
+                    FROM old_rows
+                    GROUP BY warehouse_id, status
+                ) d
+                WHERE c.warehouse_id = d.warehouse_id AND c.status = d.status;
+            ELSE
+                INSERT INTO warehouse_inventory_counts (warehouse_id, status, record_count)
+                SELECT warehouse_id, status, SUM(delta)
+                FROM (
+                    SELECT warehouse_id, status, 1 AS delta FROM new_rows
+                    UNION ALL
+                    SELECT warehouse_id, status, -1 AS delta FROM old_rows
+                ) d
+                GROUP BY warehouse_id, status
+                HAVING SUM(delta) <> 0
+                ON CONFLICT (warehouse_id, status) DO UPDATE
+                SET record_count = warehouse_inventory_counts.record_count + EXCLUDED.record_count,
+                    updated_at = NOW();
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER trg_inventory_counts_insert
+        AFTER INSERT ON inventory_records
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION apply_inventory_count_deltas();
+
+        CREATE TRIGGER trg_inventory_counts_update
+        AFTER UPDATE ON inventory_records
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION apply_inventory_count_deltas();
+
+        CREATE TRIGGER trg_inventory_counts_delete
+        AFTER DELETE ON inventory_records
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION apply_inventory_count_deltas();
+
+        COMMENT ON TABLE warehouse_inventory_counts IS 'Число записей инвентаря по складу и статусу; ведется триггерами';
+        """,
+
+        """
+        DROP TRIGGER IF EXISTS trg_inventory_counts_insert ON inventory_records;
+        DROP TRIGGER IF EXISTS trg_inventory_counts_update ON inventory_records;
+        DROP TRIGGER IF EXISTS trg_inventory_counts_delete ON inventory_records;
+        DROP FUNCTION IF EXISTS apply_inventory_count_deltas();
+        DROP TABLE IF EXISTS warehouse_inventory_counts;
+        """
+    )
+]
@@ -7,8 +7,12 @@ from libs.auth import JWTAuthProvider
 
 from src.config import settings
 from src.app.services.inventory_record import InventoryService
+from src.app.services.stock import StockService
+from src.app.services.utilization import UtilizationMirror, UtilizationService
 from src.app.services.warehouse import WarehouseService
+from src.app.services.warehouse_directory import WarehouseDirectory
 from src.infra.db.inventory_repository import AsyncPostgresInventoryRepository
+from src.infra.db.stock_repository import AsyncPostgresStockRepository
 from src.infra.db.warehouse_repository import AsyncPostgresWarehouseRepository
 
 
@@ -34,6 +38,10 @@ auth_provider = JWTAuthProvider(
 
 get_current_user = auth_provider()
 
+warehouse_directory = WarehouseDirectory()
+
+utilization_mirror = UtilizationMirror()
+
 
 async def get_inventory_repository(
     pool: asyncpg.Pool = Depends(db_provider),
@@ -47,13 +55,32 @@ async def get_warehouse_repository(
     return AsyncPostgresWarehouseRepository(pool)
 
 
+async def get_stock_repository(
+    pool: asyncpg.Pool = Depends(db_provider),
+) -> AsyncPostgresStockRepository:
+    return AsyncPostgresStockRepository(pool)
+
+
 async def get_inventory_service(
     repository: AsyncPostgresInventoryRepository = Depends(get_inventory_repository),
+    stock_repository: AsyncPostgresStockRepository = Depends(get_stock_repository),
 ) -> InventoryService:
-    return InventoryService(repository=repository)
+    return InventoryService(repository=repository, stock_repository=stock_repository)
+
+
+async def get_stock_service(
+    repository: AsyncPostgresStockRepository = Depends(get_stock_repository),
+) -> StockService:
+    return StockService(repository=repository)
 
 
 async def get_warehouse_service(
     repository: AsyncPostgresWarehouseRepository = Depends(get_warehouse_repository),
 ) -> WarehouseService:
-    return WarehouseService(repository=repository)
+    return WarehouseService(repository=repository, directory=warehouse_directory)
+
+
+async def get_utilization_service(
+    repository: AsyncPostgresInventoryRepository = Depends(get_inventory_repository),
+) -> UtilizationService:
+    return UtilizationService(repository=repository, mirror=utilization_mirror)
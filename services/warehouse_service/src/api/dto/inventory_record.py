@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+from src.api.dto.stock import StockLineDTO
 from src.domain.entities.inventory_record import InventoryStatus
 
 
@@ -11,6 +12,7 @@ class InventoryRecordCreateDTO:
     shipment_id: UUID
     warehouse_id: Optional[UUID] = field(default=None)
     status: Optional[InventoryStatus] = InventoryStatus.RECEIVED
+    items: List[StockLineDTO] = field(default_factory=list)
 
 
 @dataclass
@@ -26,3 +28,17 @@ class InventoryRecordDTO:
 @dataclass
 class InventoryRecordUpdateDTO:
     status: Optional[InventoryStatus] = None
+
+
+@dataclass
+class InventoryReceiptLineDTO:
+    shipment_id: UUID
+    record_id: Optional[UUID] = None
+    status: Optional[InventoryStatus] = InventoryStatus.RECEIVED
+
+
+@dataclass
+class BulkReceiptResultDTO:
+    received: int
+    skipped: int
+    shipments: int
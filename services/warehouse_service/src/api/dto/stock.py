@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class StockLineDTO:
+    sku: str
+    quantity: int
+
+
+@dataclass
+class StockLevelDTO:
+    warehouse_id: UUID
+    sku: str
+    on_hand: int
+    reserved: int
+    available: int
+    updated_at: datetime
+
+
+@dataclass
+class StockAdjustDTO:
+    delta: int
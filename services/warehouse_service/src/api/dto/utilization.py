@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Dict
+from uuid import UUID
+
+
+@dataclass
+class WarehouseUtilizationDTO:
+    warehouse_id: UUID
+    counts: Dict[str, int]
+    total: int
+    active: int
@@ -9,6 +9,8 @@ class WarehouseCreateDTO:
     country: str
     city: str
     address: str = ""
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
 
 @dataclass
@@ -18,6 +20,8 @@ class WarehouseDTO:
     country: str
     city: str
     address: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
 
 @dataclass
@@ -26,3 +30,11 @@ class WarehouseUpdateDTO:
     country: Optional[str] = None
     city: Optional[str] = None
     address: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+
+@dataclass
+class NearestWarehouseDTO:
+    warehouse: WarehouseDTO
+    distance_km: float
@@ -1,18 +1,31 @@
+import json
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter, ValidationError
 from libs.auth import require_role
-from libs.messaging.events import InventoryReserved, DomainEventConverter, InventoryUpdated, InventoryReleased
+from libs.messaging.events import (
+    InventoryReserved, DomainEventConverter, InventoryUpdated, InventoryReleased, InventoryInsufficient,
+    InventoryReceived,
+)
 from libs.messaging.ports import EventQueuePort
 from starlette import status
 
 from src.api.deps.getters import get_event_queue, get_inventory_service, get_current_user
-from src.api.dto.inventory_record import InventoryRecordDTO, InventoryRecordCreateDTO, InventoryRecordUpdateDTO
+from src.api.dto.inventory_record import (
+    InventoryRecordDTO, InventoryRecordCreateDTO, InventoryRecordUpdateDTO, InventoryReceiptLineDTO, BulkReceiptResultDTO
+)
 from src.api.mappers.inventory_record import InventoryRecordMapper
+from src.api.mappers.stock import StockMapper
 from src.app.services.inventory_record import InventoryService
+from src.app.workers.utilization_worker import INVENTORY_TOPIC
 from src.domain.entities import InventoryRecord
+from src.domain.entities.inventory_record import InventoryStatus
+from src.config import settings
+from src.domain.errors.stock import InsufficientStockError
 
 inventory_router = APIRouter(
     prefix="/warehouses/{warehouse_id}/inventory",
@@ -34,31 +47,111 @@ async def create_inventory_record(
     dto.warehouse_id = warehouse_id
 
     entity: InventoryRecord = InventoryRecordMapper.create_dto_to_entity(dto)
-    created: InventoryRecord = await service.create_record(entity)
+    items = StockMapper.line_dtos_to_lines(dto.items)
+
+    try:
+        created: InventoryRecord = await service.create_record(entity, items=items)
+    except InsufficientStockError as e:
+        domain_event = InventoryInsufficient(
+            warehouse_id=warehouse_id,
+            shipment_id=entity.shipment_id,
+            missing_items=e.missing_items,
+        )
+        event = DomainEventConverter.to_event(domain_event)
+        await event_queue.publish_event(event, INVENTORY_TOPIC)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "missing_items": e.missing_items},
+        )
 
     domain_event = InventoryReserved(
         warehouse_id=warehouse_id,
         shipment_id=created.shipment_id,
-        items=[],
+        items=[item.to_dict() for item in created.items],
         reserved_at=datetime.now(timezone.utc),
     )
     event = DomainEventConverter.to_event(domain_event)
-    await event_queue.publish_event(event, topic="inventory-events")
+    await event_queue.publish_event(event, INVENTORY_TOPIC)
 
     return InventoryRecordMapper.entity_to_dto(created)
 
 
+@inventory_router.post(
+    "/bulk",
+    response_model=BulkReceiptResultDTO,
+    status_code=status.HTTP_201_CREATED,
+)
+async def receive_inventory_bulk(
+    warehouse_id: UUID,
+    request: Request,
+    service: InventoryService = Depends(get_inventory_service),
+    event_queue: EventQueuePort = Depends(get_event_queue),
+):
+    """
+    Приемка партии записей: JSON-массив или NDJSON (application/x-ndjson), по строке на запись.
+    Строки уходят в COPY по мере чтения тела, без накопления партии в памяти.
+    Публикуется одно InventoryReceived на отгрузку вместо события на каждую запись.
+    """
+    received_at = datetime.now(timezone.utc)
+    total = 0
+
+    async def receipt_records() -> AsyncIterator[InventoryRecord]:
+        nonlocal total
+        async for line in _read_receipt_lines(request):
+            total += 1
+            yield InventoryRecordMapper.receipt_line_to_entity(line, warehouse_id, received_at)
+
+    created = await service.receive_bulk(warehouse_id, receipt_records())
+
+    by_shipment: Dict[UUID, List[InventoryRecord]] = defaultdict(list)
+    for record in created:
+        by_shipment[record.shipment_id].append(record)
+
+    for shipment_id, shipment_records in by_shipment.items():
+        domain_event = InventoryReceived(
+            warehouse_id=warehouse_id,
+            shipment_id=shipment_id,
+            records=[{"record_id": str(r.record_id), "status": r.status.value} for r in shipment_records],
+            received_at=received_at,
+        )
+        await event_queue.publish_event(DomainEventConverter.to_event(domain_event), INVENTORY_TOPIC)
+
+    return BulkReceiptResultDTO(
+        received=len(created),
+        skipped=total - len(created),
+        shipments=len(by_shipment),
+    )
+
+
 @inventory_router.get(
     "",
     response_model=List[InventoryRecordDTO],
 )
-async def list_inventory_records_for_shipment(
+async def list_inventory_records(
     warehouse_id: UUID,
-    shipment_id: UUID,
+    response: Response,
+    shipment_id: Optional[UUID] = None,
+    record_status: Optional[InventoryStatus] = Query(None, alias="status"),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
     service: InventoryService = Depends(get_inventory_service),
 ):
-    records = await service.list_records_by_shipment(shipment_id)
-    records = [r for r in records if r.warehouse_id == warehouse_id]
+    """Следующая страница передается через заголовок X-Next-Cursor."""
+    try:
+        after = InventoryRecordMapper.decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    records = await service.list_records(
+        warehouse_id,
+        shipment_id=shipment_id,
+        status=record_status,
+        after=after,
+        limit=limit,
+    )
+    if len(records) == limit:
+        response.headers["X-Next-Cursor"] = InventoryRecordMapper.encode_cursor(records[-1])
+
     return [InventoryRecordMapper.entity_to_dto(r) for r in records]
 
 
@@ -108,11 +201,11 @@ async def update_inventory_record(
     domain_event = InventoryUpdated(
         warehouse_id=saved.warehouse_id,
         item_id=str(saved.record_id),
-        new_quantity=0,
+        new_quantity=saved.total_quantity,
         updated_at=datetime.now(timezone.utc),
     )
     event = DomainEventConverter.to_event(domain_event)
-    await event_queue.publish_event(event, topic="inventory-events")
+    await event_queue.publish_event(event, INVENTORY_TOPIC)
 
     return InventoryRecordMapper.entity_to_dto(saved)
 
@@ -136,16 +229,82 @@ async def delete_inventory_record(
         )
 
     shipment_id = record.shipment_id
-    await service.delete_record(record_id)
+    released = await service.delete_record(record_id)
 
     domain_event = InventoryReleased(
         warehouse_id=warehouse_id,
         shipment_id=shipment_id,
-        items=[],
+        items=[item.to_dict() for item in released],
         released_at=datetime.now(timezone.utc),
         reason="record_deleted",
     )
     event = DomainEventConverter.to_event(domain_event)
-    await event_queue.publish_event(event, topic="inventory-events")
+    await event_queue.publish_event(event, INVENTORY_TOPIC)
 
     return None
+
+
+_receipt_line_adapter = TypeAdapter(InventoryReceiptLineDTO)
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+async def _read_receipt_lines(request: Request) -> AsyncIterator[InventoryReceiptLineDTO]:
+    """NDJSON читается потоком, без буферизации всего тела запроса."""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if content_type in NDJSON_CONTENT_TYPES:
+        raw_lines = _iter_ndjson(request)
+    else:
+        try:
+            body = await request.json()
+        except json.JSONDecodeError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be a JSON array")
+        if not isinstance(body, list):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be a JSON array")
+        raw_lines = _iter_list(body)
+
+    count = 0
+    async for number, raw in raw_lines:
+        count += 1
+        if count > settings.BULK_RECEIPT_MAX_RECORDS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Bulk receipt is limited to {settings.BULK_RECEIPT_MAX_RECORDS} records",
+            )
+        try:
+            yield _receipt_line_adapter.validate_python(raw)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid receipt line {number}: {e.errors()[0]['msg']}",
+            )
+
+
+async def _iter_list(body: list):
+    for number, raw in enumerate(body, start=1):
+        yield number, raw
+
+
+async def _iter_ndjson(request: Request):
+    buffer = b""
+    number = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for line in complete:
+            number += 1
+            if line.strip():
+                yield number, _parse_ndjson_line(line, number)
+    if buffer.strip():
+        yield number + 1, _parse_ndjson_line(buffer, number + 1)
+
+
+def _parse_ndjson_line(line: bytes, number: int) -> dict:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid JSON on line {number}",
+        )
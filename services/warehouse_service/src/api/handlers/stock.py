@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from libs.messaging.events import DomainEventConverter, InventoryUpdated
+from libs.messaging.ports import EventQueuePort
+from starlette import status
+
+from src.api.deps.getters import get_event_queue, get_stock_service, get_current_user
+from src.api.dto.stock import StockLevelDTO, StockAdjustDTO
+from src.api.mappers.stock import StockMapper
+from src.app.services.stock import StockService
+from src.app.workers.utilization_worker import INVENTORY_TOPIC
+
+stock_router = APIRouter(
+    prefix="/warehouses/{warehouse_id}/stock",
+    tags=["stock"],
+    dependencies=[Depends(get_current_user)],
+)
+
+
+@stock_router.get(
+    "",
+    response_model=List[StockLevelDTO],
+)
+async def list_stock_levels(
+    warehouse_id: UUID,
+    service: StockService = Depends(get_stock_service),
+):
+    levels = await service.list_by_warehouse(warehouse_id)
+    return [StockMapper.entity_to_dto(level) for level in levels]
+
+
+@stock_router.get(
+    "/{sku}",
+    response_model=StockLevelDTO,
+)
+async def get_stock_level(
+    warehouse_id: UUID,
+    sku: str,
+    service: StockService = Depends(get_stock_service),
+):
+    level = await service.get(warehouse_id, sku)
+    if level is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"SKU {sku} not found in warehouse {warehouse_id}",
+        )
+    return StockMapper.entity_to_dto(level)
+
+
+@stock_router.patch(
+    "/{sku}",
+    response_model=StockLevelDTO,
+)
+async def adjust_stock_level(
+    warehouse_id: UUID,
+    sku: str,
+    dto: StockAdjustDTO,
+    service: StockService = Depends(get_stock_service),
+    event_queue: EventQueuePort = Depends(get_event_queue),
+):
+    level = await service.adjust(warehouse_id, sku, dto.delta)
+
+    domain_event = InventoryUpdated(
+        warehouse_id=warehouse_id,
+        item_id=sku,
+        new_quantity=level.on_hand,
+        updated_at=datetime.now(timezone.utc),
+    )
+    event = DomainEventConverter.to_event(domain_event)
+    await event_queue.publish_event(event, INVENTORY_TOPIC)
+
+    return StockMapper.entity_to_dto(level)
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from uuid import UUID
 from typing import List
 
@@ -5,10 +6,17 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from starlette import status
 
 from libs.auth import require_role
-from src.api.deps.getters import get_warehouse_service, get_current_user
-from src.api.dto.warehouse import WarehouseDTO, WarehouseCreateDTO, WarehouseUpdateDTO
+from libs.messaging.events import DomainEventConverter, WarehouseCreated, WarehouseUpdated, WarehouseDeleted
+from libs.messaging.ports import EventQueuePort
+from src.api.deps.getters import get_warehouse_service, get_current_user, get_event_queue, get_utilization_service
+from src.api.dto.utilization import WarehouseUtilizationDTO
+from src.api.dto.warehouse import WarehouseDTO, WarehouseCreateDTO, WarehouseUpdateDTO, NearestWarehouseDTO
 from src.api.mappers.warehouse import WarehouseMapper
+from src.api.mappers.utilization import UtilizationMapper
+from src.app.services.utilization import UtilizationService
 from src.app.services.warehouse import WarehouseService
+from src.app.workers.directory_worker import WAREHOUSE_TOPIC
+from src.domain.value_objects import GeoPoint
 
 warehouse_router = APIRouter(
     prefix="/warehouses",
@@ -24,9 +32,18 @@ warehouse_router = APIRouter(
 async def create_warehouse(
     dto: WarehouseCreateDTO,
     service: WarehouseService = Depends(get_warehouse_service),
+    event_queue: EventQueuePort = Depends(get_event_queue),
 ):
     entity = WarehouseMapper.create_dto_to_entity(dto)
     created = await service.create(entity)
+
+    domain_event = WarehouseCreated(
+        warehouse_id=created.warehouse_id,
+        name=created.name,
+        created_at=datetime.now(timezone.utc),
+    )
+    await event_queue.publish_event(DomainEventConverter.to_event(domain_event), WAREHOUSE_TOPIC)
+
     return WarehouseMapper.entity_to_dto(created)
 
 
@@ -43,6 +60,20 @@ async def list_warehouses(
     return [WarehouseMapper.entity_to_dto(w) for w in warehouses]
 
 
+@warehouse_router.get(
+    "/nearest",
+    response_model=List[NearestWarehouseDTO],
+)
+async def find_nearest_warehouses(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    limit: int = Query(5, ge=1, le=100),
+    service: WarehouseService = Depends(get_warehouse_service),
+):
+    nearest = service.find_nearest(GeoPoint(latitude=latitude, longitude=longitude), limit=limit)
+    return [WarehouseMapper.nearest_to_dto(warehouse, distance) for warehouse, distance in nearest]
+
+
 @warehouse_router.get(
     "/{warehouse_id}",
     response_model=WarehouseDTO,
@@ -60,6 +91,18 @@ async def get_warehouse(
     return WarehouseMapper.entity_to_dto(warehouse)
 
 
+@warehouse_router.get(
+    "/{warehouse_id}/utilization",
+    response_model=WarehouseUtilizationDTO,
+)
+async def get_warehouse_utilization(
+    warehouse_id: UUID,
+    service: UtilizationService = Depends(get_utilization_service),
+):
+    counts = await service.get_counts(warehouse_id)
+    return UtilizationMapper.counts_to_dto(warehouse_id, counts)
+
+
 @warehouse_router.patch(
     "/{warehouse_id}",
     response_model=WarehouseDTO,
@@ -68,6 +111,7 @@ async def update_warehouse(
     warehouse_id: UUID,
     dto: WarehouseUpdateDTO,
     service: WarehouseService = Depends(get_warehouse_service),
+    event_queue: EventQueuePort = Depends(get_event_queue),
 ):
     warehouse = await service.get(warehouse_id)
     if warehouse is None:
@@ -78,6 +122,10 @@ async def update_warehouse(
 
     updated_entity = WarehouseMapper.update_entity_from_dto(warehouse, dto)
     saved = await service.update(updated_entity)
+
+    domain_event = WarehouseUpdated(warehouse_id=saved.warehouse_id, updated_at=datetime.now(timezone.utc))
+    await event_queue.publish_event(DomainEventConverter.to_event(domain_event), WAREHOUSE_TOPIC)
+
     return WarehouseMapper.entity_to_dto(saved)
 
 
@@ -89,6 +137,7 @@ async def update_warehouse(
 async def delete_warehouse(
     warehouse_id: UUID,
     service: WarehouseService = Depends(get_warehouse_service),
+    event_queue: EventQueuePort = Depends(get_event_queue),
 ):
     warehouse = await service.get(warehouse_id)
     if warehouse is None:
@@ -98,4 +147,8 @@ async def delete_warehouse(
         )
 
     await service.delete(warehouse_id)
+
+    domain_event = WarehouseDeleted(warehouse_id=warehouse_id, deleted_at=datetime.now(timezone.utc))
+    await event_queue.publish_event(DomainEventConverter.to_event(domain_event), WAREHOUSE_TOPIC)
+
     return None
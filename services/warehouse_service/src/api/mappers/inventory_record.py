@@ -1,4 +1,11 @@
-from src.api.dto.inventory_record import InventoryRecordCreateDTO, InventoryRecordUpdateDTO, InventoryRecordDTO
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+from src.api.dto.inventory_record import (
+    InventoryRecordCreateDTO, InventoryRecordUpdateDTO, InventoryRecordDTO, InventoryReceiptLineDTO
+)
 from src.domain.entities.inventory_record import InventoryStatus, InventoryRecord
 
 
@@ -11,6 +18,21 @@ class InventoryRecordMapper:
             status=dto.status or InventoryStatus.RECEIVED,
         )
 
+    @staticmethod
+    def receipt_line_to_entity(
+        dto: InventoryReceiptLineDTO,
+        warehouse_id: UUID,
+        received_at: datetime,
+    ) -> InventoryRecord:
+        return InventoryRecord(
+            shipment_id=dto.shipment_id,
+            warehouse_id=warehouse_id,
+            status=dto.status or InventoryStatus.RECEIVED,
+            record_id=dto.record_id,
+            received_at=received_at,
+            updated_at=received_at,
+        )
+
     @staticmethod
     def update_entity_from_dto(entity: InventoryRecord, dto: InventoryRecordUpdateDTO) -> InventoryRecord:
         if dto.status is not None:
@@ -27,3 +49,17 @@ class InventoryRecordMapper:
             received_at=entity.received_at,
             updated_at=entity.updated_at,
         )
+
+    @staticmethod
+    def encode_cursor(entity: InventoryRecord) -> str:
+        raw = f"{entity.received_at.isoformat()}|{entity.record_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        """Поднимает ValueError, если курсор поврежден."""
+        try:
+            received_at, record_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        except (UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+        return datetime.fromisoformat(received_at), UUID(record_id)
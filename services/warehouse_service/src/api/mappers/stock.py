@@ -0,0 +1,22 @@
+from typing import List
+
+from src.api.dto.stock import StockLevelDTO, StockLineDTO
+from src.domain.entities import StockLevel
+from src.domain.value_objects import StockLine
+
+
+class StockMapper:
+    @staticmethod
+    def line_dtos_to_lines(dtos: List[StockLineDTO]) -> List[StockLine]:
+        return [StockLine(sku=dto.sku, quantity=dto.quantity) for dto in dtos]
+
+    @staticmethod
+    def entity_to_dto(entity: StockLevel) -> StockLevelDTO:
+        return StockLevelDTO(
+            warehouse_id=entity.warehouse_id,
+            sku=entity.sku,
+            on_hand=entity.on_hand,
+            reserved=entity.reserved,
+            available=entity.available,
+            updated_at=entity.updated_at,
+        )
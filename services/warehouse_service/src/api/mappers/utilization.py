@@ -0,0 +1,17 @@
+from typing import Dict
+from uuid import UUID
+
+from src.api.dto.utilization import WarehouseUtilizationDTO
+from src.domain.entities.inventory_record import InventoryStatus
+
+
+class UtilizationMapper:
+    @staticmethod
+    def counts_to_dto(warehouse_id: UUID, counts: Dict[InventoryStatus, int]) -> WarehouseUtilizationDTO:
+        total = sum(counts.values())
+        return WarehouseUtilizationDTO(
+            warehouse_id=warehouse_id,
+            counts={status.value: counts.get(status, 0) for status in InventoryStatus},
+            total=total,
+            active=total - counts.get(InventoryStatus.SHIPPED, 0),
+        )
@@ -1,7 +1,11 @@
+from typing import Optional
+
 from libs.value_objects.location import Location
 
-from src.api.dto.warehouse import WarehouseCreateDTO, WarehouseUpdateDTO, WarehouseDTO
+from src.api.dto.warehouse import WarehouseCreateDTO, WarehouseUpdateDTO, WarehouseDTO, NearestWarehouseDTO
 from src.domain.entities import Warehouse
+from src.domain.errors.warehouse import InvalidCoordinatesError
+from src.domain.value_objects import GeoPoint
 
 
 class WarehouseMapper:
@@ -15,6 +19,7 @@ class WarehouseMapper:
         return Warehouse(
             name=dto.name,
             location=location,
+            coordinates=WarehouseMapper._coordinates(dto.latitude, dto.longitude),
         )
 
     @staticmethod
@@ -22,7 +27,9 @@ class WarehouseMapper:
         if dto.name is not None:
             entity.name = dto.name
 
-        if dto.country is not None or dto.city is not None or dto.address is not None:
+        coordinates = WarehouseMapper._coordinates(dto.latitude, dto.longitude)
+
+        if dto.country is not None or dto.city is not None or dto.address is not None or coordinates is not None:
             new_country = dto.country if dto.country is not None else entity.location.country
             new_city = dto.city if dto.city is not None else entity.location.city
             new_address = dto.address if dto.address is not None else entity.location.address
@@ -32,7 +39,8 @@ class WarehouseMapper:
                     country=new_country,
                     city=new_city,
                     address=new_address or "",
-                )
+                ),
+                coordinates,
             )
 
         return entity
@@ -45,4 +53,21 @@ class WarehouseMapper:
             country=entity.location.country,
             city=entity.location.city,
             address=entity.location.address,
+            latitude=entity.coordinates.latitude if entity.coordinates else None,
+            longitude=entity.coordinates.longitude if entity.coordinates else None,
         )
+
+    @staticmethod
+    def nearest_to_dto(entity: Warehouse, distance_km: float) -> NearestWarehouseDTO:
+        return NearestWarehouseDTO(
+            warehouse=WarehouseMapper.entity_to_dto(entity),
+            distance_km=round(distance_km, 3),
+        )
+
+    @staticmethod
+    def _coordinates(latitude: Optional[float], longitude: Optional[float]) -> Optional[GeoPoint]:
+        if latitude is None and longitude is None:
+            return None
+        if latitude is None or longitude is None:
+            raise InvalidCoordinatesError("Latitude and longitude must be provided together")
+        return GeoPoint(latitude=latitude, longitude=longitude)
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from libs.health.router import create_health_router
 from src.api.handlers.inventory_record import inventory_router
+from src.api.handlers.stock import stock_router
 from src.api.handlers.warehouse import warehouse_router
 from src.config import settings
 
@@ -14,3 +15,4 @@ router = APIRouter(prefix="/api/v1")
 router.include_router(health_router)
 router.include_router(warehouse_router)
 router.include_router(inventory_router)
+router.include_router(stock_router)
@@ -1,19 +1,38 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterable, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities import InventoryRecord
 from src.domain.entities.inventory_record import InventoryStatus
 from src.domain.errors.inventory_record import InventoryRecordNotFoundError, InvalidInventoryStatusTransitionError
-from src.domain.ports import InventoryRepositoryPort
+from src.domain.ports import InventoryRepositoryPort, StockRepositoryPort
+from src.domain.value_objects import StockLine
 
 
 class InventoryService:
 
-    def __init__(self, repository: InventoryRepositoryPort):
+    def __init__(self, repository: InventoryRepositoryPort, stock_repository: StockRepositoryPort):
         self._repository = repository
+        self._stock = stock_repository
 
-    async def create_record(self, record: InventoryRecord) -> InventoryRecord:
-        return await self._repository.save(record)
+    async def create_record(self, record: InventoryRecord, items: Optional[List[StockLine]] = None) -> InventoryRecord:
+        """Резервирует остаток под строки записи; при нехватке поднимается InsufficientStockError и запись не создается."""
+        if items:
+            await self._stock.reserve(record.warehouse_id, record.record_id, items)
+
+        try:
+            saved = await self._repository.save(record)
+        except Exception:
+            if items:
+                await self._stock.release(record.record_id)
+            raise
+
+        saved.items = await self._stock.list_reserved(saved.record_id) if items else []
+        return saved
+
+    async def receive_bulk(self, warehouse_id: UUID, records: AsyncIterable[InventoryRecord]) -> List[InventoryRecord]:
+        """Массовая приемка без резервирования остатков; дубликаты record_id пропускаются."""
+        return await self._repository.save_many(warehouse_id, records)
 
     async def get_record(self, record_id: UUID) -> Optional[InventoryRecord]:
         return await self._repository.get(record_id)
@@ -21,12 +40,35 @@ class InventoryService:
     async def list_records_by_shipment(self, shipment_id: UUID) -> List[InventoryRecord]:
         return await self._repository.list_by_shipment(shipment_id)
 
-    async def delete_record(self, record_id: UUID) -> None:
+    async def list_records(
+        self,
+        warehouse_id: UUID,
+        shipment_id: Optional[UUID] = None,
+        status: Optional[InventoryStatus] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50,
+    ) -> List[InventoryRecord]:
+        return await self._repository.find(
+            warehouse_id,
+            shipment_id=shipment_id,
+            status=status,
+            after=after,
+            limit=limit,
+        )
+
+    async def release_by_shipment(self, shipment_id: UUID) -> List[UUID]:
+        """Возвращает неотгруженные записи отгрузки в RECEIVED и снимает резерв одним запросом."""
+        return await self._repository.release_by_shipment(shipment_id)
+
+    async def delete_record(self, record_id: UUID) -> List[StockLine]:
+        """Удаляет запись и снимает ее резерв. Возвращает освобожденные строки."""
         existing = await self._repository.get(record_id)
         if existing is None:
             raise InventoryRecordNotFoundError(f"Inventory record {record_id} not found")
 
+        released = await self._stock.release(record_id)
         await self._repository.delete(record_id)
+        return released
 
     async def update_status(self, record_id: UUID, new_status: InventoryStatus) -> InventoryRecord:
         record = await self._repository.get(record_id)
@@ -38,5 +80,12 @@ class InventoryService:
                 f"Cannot change status from {record.status} to {new_status}"
             )
 
+        if new_status == InventoryStatus.SHIPPED and record.status != InventoryStatus.SHIPPED:
+            items = await self._stock.consume(record_id)
+        else:
+            items = await self._stock.list_reserved(record_id)
+
         record.update_status(new_status)
-        return await self._repository.save(record)
+        saved = await self._repository.save(record)
+        saved.items = items
+        return saved
@@ -0,0 +1,98 @@
+import heapq
+import math
+from typing import Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from src.domain.value_objects import GeoPoint
+from src.domain.value_objects.geo_point import EARTH_RADIUS_KM
+
+T = TypeVar("T")
+
+Vector = Tuple[float, float, float]
+
+
+class _Node:
+    __slots__ = ("point", "item", "axis", "left", "right")
+
+    def __init__(self, point: Vector, item, axis: int, left: Optional["_Node"], right: Optional["_Node"]):
+        self.point = point
+        self.item = item
+        self.axis = axis
+        self.left = left
+        self.right = right
+
+
+class GeoKDTree(Generic[T]):
+    """
+    Статическое k-d дерево по точкам на единичной сфере.
+    Координаты переводятся в 3D-векторы, поэтому поиск корректен у полюсов и через 180-й меридиан:
+    ближайший по хорде вектор является ближайшим и по дуге большого круга.
+    """
+
+    def __init__(self, entries: Sequence[Tuple[GeoPoint, T]]):
+        points = [(point.to_unit_vector(), item) for point, item in entries]
+        self._root = self._build(points, depth=0)
+        self._size = len(points)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def nearest(self, point: GeoPoint, k: int = 1) -> List[Tuple[T, float]]:
+        """k ближайших элементов с расстоянием в километрах, по возрастанию расстояния."""
+        if k <= 0 or self._root is None:
+            return []
+
+        target = point.to_unit_vector()
+        # max-куча по квадрату хорды: (-dist2, tiebreak, item)
+        best: List[Tuple[float, int, T]] = []
+        counter = 0
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            dist2 = _squared_distance(node.point, target)
+            if len(best) < k:
+                heapq.heappush(best, (-dist2, counter, node.item))
+                counter += 1
+            elif dist2 < -best[0][0]:
+                heapq.heapreplace(best, (-dist2, counter, node.item))
+                counter += 1
+
+            diff = target[node.axis] - node.point[node.axis]
+            near, far = (node.left, node.right) if diff < 0 else (node.right, node.left)
+
+            # Дальнее поддерево нужно, только если секущая плоскость ближе худшего найденного
+            if len(best) < k or diff * diff < -best[0][0]:
+                stack.append(far)
+            stack.append(near)
+
+        best.sort(key=lambda entry: (-entry[0], entry[1]))
+        return [(item, _chord_to_km(math.sqrt(-neg_dist2))) for neg_dist2, _, item in best]
+
+    @classmethod
+    def _build(cls, points: List[Tuple[Vector, T]], depth: int) -> Optional[_Node]:
+        if not points:
+            return None
+
+        axis = depth % 3
+        points.sort(key=lambda entry: entry[0][axis])
+        median = len(points) // 2
+        vector, item = points[median]
+
+        return _Node(
+            point=vector,
+            item=item,
+            axis=axis,
+            left=cls._build(points[:median], depth + 1),
+            right=cls._build(points[median + 1:], depth + 1),
+        )
+
+
+def _squared_distance(a: Vector, b: Vector) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def _chord_to_km(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
@@ -0,0 +1,24 @@
+from typing import List, Optional
+from uuid import UUID
+
+from src.domain.entities import StockLevel
+from src.domain.errors.stock import InvalidStockAdjustmentError
+from src.domain.ports import StockRepositoryPort
+
+
+class StockService:
+
+    def __init__(self, repository: StockRepositoryPort):
+        self._repository = repository
+
+    async def get(self, warehouse_id: UUID, sku: str) -> Optional[StockLevel]:
+        return await self._repository.get(warehouse_id, sku)
+
+    async def list_by_warehouse(self, warehouse_id: UUID) -> List[StockLevel]:
+        return await self._repository.list_by_warehouse(warehouse_id)
+
+    async def adjust(self, warehouse_id: UUID, sku: str, delta: int) -> StockLevel:
+        if delta == 0:
+            raise InvalidStockAdjustmentError("Stock adjustment delta cannot be zero")
+
+        return await self._repository.adjust(warehouse_id, sku, delta)
@@ -0,0 +1,54 @@
+from typing import Dict
+from uuid import UUID
+
+from libs.observability.metrics import WAREHOUSE_INVENTORY_RECORDS
+
+from src.domain.entities.inventory_record import InventoryStatus
+from src.domain.ports import InventoryRepositoryPort
+
+StatusCounts = Dict[InventoryStatus, int]
+
+
+class UtilizationMirror:
+    """
+    Копия сводной таблицы warehouse_inventory_counts в памяти.
+    Каждое изменение сразу выставляется в Prometheus-гейдж warehouse_inventory_records.
+    """
+
+    def __init__(self):
+        self._counts: Dict[UUID, StatusCounts] = {}
+
+    def __contains__(self, warehouse_id: UUID) -> bool:
+        return warehouse_id in self._counts
+
+    def load(self, counts: Dict[UUID, StatusCounts]) -> None:
+        for warehouse_id, warehouse_counts in counts.items():
+            self.set(warehouse_id, warehouse_counts)
+
+    def set(self, warehouse_id: UUID, counts: StatusCounts) -> None:
+        normalized = {status: counts.get(status, 0) for status in InventoryStatus}
+        self._counts[warehouse_id] = normalized
+        for status, count in normalized.items():
+            WAREHOUSE_INVENTORY_RECORDS.labels(warehouse_id=str(warehouse_id), status=status.value).set(count)
+
+    def get(self, warehouse_id: UUID) -> StatusCounts:
+        return dict(self._counts.get(warehouse_id, {}))
+
+
+class UtilizationService:
+
+    def __init__(self, repository: InventoryRepositoryPort, mirror: UtilizationMirror):
+        self._repository = repository
+        self._mirror = mirror
+
+    async def get_counts(self, warehouse_id: UUID) -> StatusCounts:
+        """Отдает счетчики из памяти; склад, которого еще нет в зеркале, подгружается из сводной таблицы."""
+        if warehouse_id not in self._mirror:
+            await self.refresh(warehouse_id)
+        return self._mirror.get(warehouse_id)
+
+    async def refresh(self, warehouse_id: UUID) -> None:
+        self._mirror.set(warehouse_id, await self._repository.count_by_status(warehouse_id))
+
+    async def refresh_all(self) -> None:
+        self._mirror.load(await self._repository.count_all_by_status())
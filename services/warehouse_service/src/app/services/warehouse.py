@@ -1,20 +1,25 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from libs.value_objects.location import Location
 
+from src.app.services.warehouse_directory import WarehouseDirectory
 from src.domain.entities import Warehouse
 from src.domain.errors.warehouse import WarehouseNotFoundError
 from src.domain.ports.warehouse_repository import WarehouseRepositoryPort
+from src.domain.value_objects import GeoPoint
 
 
 class WarehouseService:
 
-    def __init__(self, repository: WarehouseRepositoryPort):
+    def __init__(self, repository: WarehouseRepositoryPort, directory: Optional[WarehouseDirectory] = None):
         self._repository = repository
+        self._directory = directory
 
     async def create(self, warehouse: Warehouse) -> Warehouse:
-        return await self._repository.save(warehouse)
+        saved = await self._repository.save(warehouse)
+        self._put_to_directory(saved)
+        return saved
 
     async def get(self, warehouse_id: UUID) -> Optional[Warehouse]:
         return await self._repository.get(warehouse_id)
@@ -27,7 +32,9 @@ class WarehouseService:
         if existing is None:
             raise WarehouseNotFoundError(f"Warehouse {warehouse.warehouse_id} not found")
 
-        return await self._repository.save(warehouse)
+        saved = await self._repository.save(warehouse)
+        self._put_to_directory(saved)
+        return saved
 
     async def delete(self, warehouse_id: UUID) -> None:
         existing = await self._repository.get(warehouse_id)
@@ -35,11 +42,30 @@ class WarehouseService:
             raise WarehouseNotFoundError(f"Warehouse {warehouse_id} not found")
 
         await self._repository.delete(warehouse_id)
+        if self._directory is not None:
+            self._directory.remove(warehouse_id)
 
-    async def update_location(self, warehouse_id: UUID, new_location: Location) -> Warehouse:
+    async def update_location(
+        self,
+        warehouse_id: UUID,
+        new_location: Location,
+        coordinates: Optional[GeoPoint] = None,
+    ) -> Warehouse:
         warehouse = await self._repository.get(warehouse_id)
         if warehouse is None:
             raise WarehouseNotFoundError(f"Warehouse {warehouse_id} not found")
 
-        warehouse.update_location(new_location)
-        return await self._repository.save(warehouse)
+        warehouse.update_location(new_location, coordinates)
+        saved = await self._repository.save(warehouse)
+        self._put_to_directory(saved)
+        return saved
+
+    def find_nearest(self, point: GeoPoint, limit: int = 5) -> List[Tuple[Warehouse, float]]:
+        """Поиск по справочнику в памяти, без обращения к БД."""
+        if self._directory is None:
+            return []
+        return self._directory.nearest(point, limit=limit)
+
+    def _put_to_directory(self, warehouse: Warehouse) -> None:
+        if self._directory is not None:
+            self._directory.put(warehouse)
@@ -0,0 +1,44 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from src.app.services.spatial_index import GeoKDTree
+from src.domain.entities import Warehouse
+from src.domain.value_objects import GeoPoint
+
+
+class WarehouseDirectory:
+    """
+    Справочник складов в памяти процесса. Наполняется при старте и обновляется
+    по событиям изменения складов; пространственный индекс перестраивается лениво
+    при первом поиске после изменения.
+    """
+
+    def __init__(self):
+        self._warehouses: Dict[UUID, Warehouse] = {}
+        self._index: Optional[GeoKDTree[Warehouse]] = None
+
+    def __len__(self) -> int:
+        return len(self._warehouses)
+
+    def load(self, warehouses: Iterable[Warehouse]) -> None:
+        self._warehouses = {w.warehouse_id: w for w in warehouses}
+        self._index = None
+
+    def put(self, warehouse: Warehouse) -> None:
+        self._warehouses[warehouse.warehouse_id] = warehouse
+        self._index = None
+
+    def remove(self, warehouse_id: UUID) -> None:
+        if self._warehouses.pop(warehouse_id, None) is not None:
+            self._index = None
+
+    def get(self, warehouse_id: UUID) -> Optional[Warehouse]:
+        return self._warehouses.get(warehouse_id)
+
+    def nearest(self, point: GeoPoint, limit: int = 5) -> List[Tuple[Warehouse, float]]:
+        """Ближайшие склады с расстоянием в км. Склады без координат не участвуют."""
+        if self._index is None:
+            self._index = GeoKDTree(
+                [(w.coordinates, w) for w in self._warehouses.values() if w.coordinates is not None]
+            )
+        return self._index.nearest(point, k=limit)
@@ -5,8 +5,6 @@ from libs.messaging.ports import EventQueuePort
 from libs.observability.logger import get_json_logger, set_correlation_id
 
 from src.app.services.inventory_record import InventoryService
-from src.domain.entities.inventory_record import InventoryStatus
-from src.domain.errors.inventory_record import InventoryRecordNotFoundError
 
 COMMAND_TOPIC = "inventory.commands"
 
@@ -62,33 +60,21 @@ class WarehouseCommandWorker:
             self.logger.error("Invalid shipment_id in command payload", extra={"payload": command.payload})
             return
 
-        records = await self.service.list_records_by_shipment(shipment_id)
+        released_ids = await self.service.release_by_shipment(shipment_id)
 
-        if not records:
+        if not released_ids:
             self.logger.warning(
-                "No inventory records found for shipment during compensation",
+                "No releasable inventory records found for shipment during compensation",
                 extra={"shipment_id": str(shipment_id)},
             )
             return
 
-        released_count = 0
-        for record in records:
-            try:
-                await self.service.update_status(record.record_id, InventoryStatus.RECEIVED)
-                released_count += 1
-            except InventoryRecordNotFoundError:
-                self.logger.warning(
-                    "Inventory record not found during compensation",
-                    extra={"record_id": str(record.record_id)},
-                )
-            except Exception as e:
-                self.logger.error(
-                    "Failed to release inventory record",
-                    exc_info=e,
-                    extra={"record_id": str(record.record_id)},
-                )
-
         self.logger.info(
             "Inventory released as compensation",
-            extra={"shipment_id": str(shipment_id), "released_count": released_count, "reason": reason},
+            extra={
+                "shipment_id": str(shipment_id),
+                "released_count": len(released_ids),
+                "record_ids": [str(record_id) for record_id in released_ids],
+                "reason": reason,
+            },
         )
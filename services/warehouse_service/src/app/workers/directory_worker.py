@@ -0,0 +1,86 @@
+import asyncio
+from typing import Optional
+from uuid import UUID
+
+from libs.messaging.base import Event
+from libs.messaging.ports import EventQueuePort
+from libs.observability.logger import get_json_logger
+
+from src.app.services.warehouse_directory import WarehouseDirectory
+from src.domain.ports.warehouse_repository import WarehouseRepositoryPort
+
+WAREHOUSE_TOPIC = "warehouse-events"
+
+WAREHOUSE_EVENTS = frozenset({"warehouse.created", "warehouse.updated", "warehouse.deleted"})
+
+
+class WarehouseDirectoryWorker:
+    """
+    Поддерживает справочник складов актуальным по событиям warehouse.* от всех реплик.
+    Каждая реплика читает топик своей группой (group_id), иначе Kafka раздает события
+    между репликами и справочники расходятся. Пропущенные события (рестарт консьюмера,
+    ребалансировка) закрывает полная перезагрузка раз в refresh_interval_seconds.
+    """
+
+    def __init__(
+        self,
+        event_queue: EventQueuePort,
+        repository: WarehouseRepositoryPort,
+        directory: WarehouseDirectory,
+        group_id: Optional[str] = None,
+        refresh_interval_seconds: int = 300,
+    ):
+        self.queue = event_queue
+        self.repository = repository
+        self.directory = directory
+        self.group_id = group_id
+        self.refresh_interval = refresh_interval_seconds
+        self.logger = get_json_logger("warehouse_directory_worker")
+
+    async def run(self):
+        self.directory.load(await self.repository.list_all())
+        self.logger.info(
+            "Warehouse directory loaded",
+            extra={"topic": WAREHOUSE_TOPIC, "warehouses": len(self.directory), "group_id": self.group_id},
+        )
+
+        await asyncio.gather(self._consume(), self._reload_periodically())
+
+    async def _consume(self):
+        # Справочник только что загружен целиком, история топика не нужна
+        events = self.queue.consume_event(
+            WAREHOUSE_TOPIC,
+            event_types=WAREHOUSE_EVENTS,
+            group_id=self.group_id,
+            auto_offset_reset="latest",
+        )
+        async for event in events:
+            try:
+                await self._handle_event(event)
+            except Exception as e:
+                self.logger.error(
+                    f"Error applying {event.event_type} to warehouse directory",
+                    exc_info=e,
+                    extra={"event_id": str(event.event_id)},
+                )
+
+    async def _reload_periodically(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                self.directory.load(await self.repository.list_all())
+            except Exception as e:
+                self.logger.error("Error reloading warehouse directory", exc_info=e)
+
+    async def _handle_event(self, event: Event) -> None:
+        warehouse_id = UUID(str(event.aggregate_id))
+
+        if event.event_type == "warehouse.deleted":
+            self.directory.remove(warehouse_id)
+            return
+
+        warehouse = await self.repository.get(warehouse_id)
+        if warehouse is None:
+            self.directory.remove(warehouse_id)
+        else:
+            self.directory.put(warehouse)
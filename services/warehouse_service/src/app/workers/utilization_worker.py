@@ -0,0 +1,66 @@
+import asyncio
+from typing import Optional
+from uuid import UUID
+
+from libs.messaging.ports import EventQueuePort
+from libs.observability.logger import get_json_logger
+
+from src.app.services.utilization import UtilizationService
+
+INVENTORY_TOPIC = "inventory-events"
+
+INVENTORY_EVENTS = frozenset({"inventory.reserved", "inventory.received", "inventory.released", "inventory.updated"})
+
+
+class UtilizationWorker:
+    """
+    Обновляет зеркало счетчиков склада по событиям inventory.*.
+    Зеркало у каждой реплики свое, поэтому топик читается группой этой реплики (group_id).
+    Компенсации саги идут мимо API и событий не публикуют, поэтому
+    зеркало дополнительно полностью перечитывается раз в refresh_interval_seconds.
+    """
+
+    def __init__(
+        self,
+        event_queue: EventQueuePort,
+        service: UtilizationService,
+        refresh_interval_seconds: int = 60,
+        group_id: Optional[str] = None,
+    ):
+        self.queue = event_queue
+        self.service = service
+        self.group_id = group_id
+        self.refresh_interval = refresh_interval_seconds
+        self.logger = get_json_logger("utilization_worker")
+
+    async def run(self):
+        await self.service.refresh_all()
+        self.logger.info("Utilization mirror loaded", extra={"topic": INVENTORY_TOPIC, "group_id": self.group_id})
+
+        await asyncio.gather(self._consume(), self._refresh_periodically())
+
+    async def _consume(self):
+        # Зеркало только что перечитано целиком, история топика не нужна
+        events = self.queue.consume_event(
+            INVENTORY_TOPIC,
+            event_types=INVENTORY_EVENTS,
+            group_id=self.group_id,
+            auto_offset_reset="latest",
+        )
+        async for event in events:
+            try:
+                await self.service.refresh(UUID(str(event.aggregate_id)))
+            except Exception as e:
+                self.logger.error(
+                    f"Error refreshing utilization on {event.event_type}",
+                    exc_info=e,
+                    extra={"event_id": str(event.event_id)},
+                )
+
+    async def _refresh_periodically(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.service.refresh_all()
+            except Exception as e:
+                self.logger.error("Error refreshing utilization mirror", exc_info=e)
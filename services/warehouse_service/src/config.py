@@ -1,3 +1,4 @@
+import socket
 from pathlib import Path
 
 from pydantic import Field
@@ -21,11 +22,22 @@ class Settings(BaseSettings):
     USE_KAFKA: bool = False
     KAFKA_BOOTSTRAP_SERVERS: str = "kafka:9092"
     KAFKA_GROUP_ID: str = "warehouse-service"
+    REPLICA_ID: str = Field(default_factory=socket.gethostname)
+
+    WAREHOUSE_DIRECTORY_REFRESH_SECONDS: int = 300
+
+    UTILIZATION_REFRESH_SECONDS: int = 60
+    BULK_RECEIPT_MAX_RECORDS: int = 50_000
 
     JWT_SECRET_KEY: str = Field(default="dev-secret-key-change-in-production")
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    @property
+    def replica_group_id(self) -> str:
+        """Группа Kafka только этой реплики: локальные кэши должны получать все события топика."""
+        return f"{self.KAFKA_GROUP_ID}-{self.REPLICA_ID}"
+
     model_config = SettingsConfigDict(
         env_file=ENV_FILE_PATH,
         env_file_encoding="utf-8",
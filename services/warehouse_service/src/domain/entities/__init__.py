@@ -1,2 +1,3 @@
 from .warehouse import Warehouse
-from .inventory_record import InventoryRecord
\ No newline at end of file
+from .inventory_record import InventoryRecord
+from .stock_level import StockLevel
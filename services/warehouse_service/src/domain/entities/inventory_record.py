@@ -1,6 +1,9 @@
 from uuid import UUID, uuid4
 from datetime import datetime
 from enum import Enum
+from typing import List
+
+from src.domain.value_objects import StockLine
 
 
 class InventoryStatus(str, Enum):
@@ -16,14 +19,22 @@ class InventoryRecord:
         shipment_id: UUID,
         warehouse_id: UUID,
         status: InventoryStatus = InventoryStatus.RECEIVED,
-        record_id: UUID = None
+        record_id: UUID = None,
+        items: List[StockLine] | None = None,
+        received_at: datetime | None = None,
+        updated_at: datetime | None = None
     ):
         self.record_id: UUID = record_id or uuid4()
         self.shipment_id: UUID = shipment_id
         self.warehouse_id: UUID = warehouse_id
         self.status: InventoryStatus = status
-        self.received_at: datetime = datetime.utcnow()
-        self.updated_at: datetime = datetime.utcnow()
+        self.received_at: datetime = received_at or datetime.utcnow()
+        self.updated_at: datetime = updated_at or datetime.utcnow()
+        self.items: List[StockLine] = list(items or [])
+
+    @property
+    def total_quantity(self) -> int:
+        return sum(item.quantity for item in self.items)
 
     def update_status(self, new_status: InventoryStatus):
         self.status = new_status
@@ -37,6 +48,7 @@ class InventoryRecord:
             "status": self.status.value,
             "received_at": self.received_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
+            "items": [item.to_dict() for item in self.items],
         }
 
     def __repr__(self):
@@ -0,0 +1,25 @@
+from datetime import datetime
+from uuid import UUID
+
+
+class StockLevel:
+    def __init__(
+        self,
+        warehouse_id: UUID,
+        sku: str,
+        on_hand: int = 0,
+        reserved: int = 0,
+        updated_at: datetime | None = None,
+    ):
+        self.warehouse_id: UUID = warehouse_id
+        self.sku: str = sku
+        self.on_hand: int = on_hand
+        self.reserved: int = reserved
+        self.updated_at: datetime = updated_at or datetime.utcnow()
+
+    @property
+    def available(self) -> int:
+        return self.on_hand - self.reserved
+
+    def __repr__(self) -> str:
+        return f"<StockLevel {self.sku} @ {self.warehouse_id} on_hand={self.on_hand} reserved={self.reserved}>"
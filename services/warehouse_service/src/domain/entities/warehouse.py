@@ -1,6 +1,8 @@
 from uuid import UUID, uuid4
 from libs.value_objects.location import Location
 
+from src.domain.value_objects import GeoPoint
+
 
 class Warehouse:
     def __init__(
@@ -8,13 +10,17 @@ class Warehouse:
         name: str,
         location: Location,
         warehouse_id: UUID | None = None,
+        coordinates: GeoPoint | None = None,
     ):
         self.warehouse_id: UUID = warehouse_id or uuid4()
         self.name: str = name
         self.location: Location = location
+        self.coordinates: GeoPoint | None = coordinates
 
-    def update_location(self, new_location: Location) -> None:
+    def update_location(self, new_location: Location, coordinates: GeoPoint | None = None) -> None:
         self.location = new_location
+        if coordinates is not None:
+            self.coordinates = coordinates
 
     def __repr__(self) -> str:
-        return f"<Warehouse {self.name} ({self.warehouse_id}) @ {self.location.value}>"
+        return f"<Warehouse {self.name} ({self.warehouse_id}) @ {self.location.city}, {self.location.country}>"
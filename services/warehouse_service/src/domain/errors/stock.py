@@ -0,0 +1,20 @@
+from typing import List
+
+
+class StockError(Exception):
+    pass
+
+
+class InvalidStockLineError(StockError):
+    pass
+
+
+class InvalidStockAdjustmentError(StockError):
+    pass
+
+
+class InsufficientStockError(StockError):
+    def __init__(self, missing_items: List[dict]):
+        self.missing_items = missing_items
+        skus = ", ".join(item["sku"] for item in missing_items)
+        super().__init__(f"Insufficient stock for: {skus}")
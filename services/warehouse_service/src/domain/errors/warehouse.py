@@ -12,3 +12,7 @@ class WarehouseAlreadyExistsError(WarehouseError):
 
 class WarehouseLocationUpdateError(WarehouseError):
     pass
+
+
+class InvalidCoordinatesError(WarehouseError):
+    pass
@@ -1 +1,2 @@
-from .inventory_repository import InventoryRepositoryPort
\ No newline at end of file
+from .inventory_repository import InventoryRepositoryPort
+from .stock_repository import StockRepositoryPort
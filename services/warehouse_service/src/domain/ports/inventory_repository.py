@@ -1,7 +1,9 @@
-from typing import Protocol, List, Optional
+from datetime import datetime
+from typing import AsyncIterable, Dict, Protocol, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities import InventoryRecord
+from src.domain.entities.inventory_record import InventoryStatus
 
 
 class InventoryRepositoryPort(Protocol):
@@ -9,11 +11,33 @@ class InventoryRepositoryPort(Protocol):
     async def save(self, record: InventoryRecord) -> InventoryRecord:
         ...
 
+    async def save_many(self, warehouse_id: UUID, records: AsyncIterable[InventoryRecord]) -> List[InventoryRecord]:
+        ...
+
     async def get(self, record_id: UUID) -> Optional[InventoryRecord]:
         ...
 
     async def list_by_shipment(self, shipment_id: UUID) -> List[InventoryRecord]:
         ...
 
+    async def find(
+        self,
+        warehouse_id: UUID,
+        shipment_id: Optional[UUID] = None,
+        status: Optional[InventoryStatus] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50,
+    ) -> List[InventoryRecord]:
+        ...
+
+    async def count_by_status(self, warehouse_id: UUID) -> Dict[InventoryStatus, int]:
+        ...
+
+    async def count_all_by_status(self) -> Dict[UUID, Dict[InventoryStatus, int]]:
+        ...
+
+    async def release_by_shipment(self, shipment_id: UUID) -> List[UUID]:
+        ...
+
     async def delete(self, record_id: UUID) -> None:
         ...
@@ -0,0 +1,29 @@
+from typing import Protocol, List, Optional
+from uuid import UUID
+
+from src.domain.entities import StockLevel
+from src.domain.value_objects import StockLine
+
+
+class StockRepositoryPort(Protocol):
+
+    async def get(self, warehouse_id: UUID, sku: str) -> Optional[StockLevel]:
+        ...
+
+    async def list_by_warehouse(self, warehouse_id: UUID) -> List[StockLevel]:
+        ...
+
+    async def adjust(self, warehouse_id: UUID, sku: str, delta: int) -> StockLevel:
+        ...
+
+    async def reserve(self, warehouse_id: UUID, record_id: UUID, items: List[StockLine]) -> List[StockLevel]:
+        ...
+
+    async def release(self, record_id: UUID) -> List[StockLine]:
+        ...
+
+    async def consume(self, record_id: UUID) -> List[StockLine]:
+        ...
+
+    async def list_reserved(self, record_id: UUID) -> List[StockLine]:
+        ...
@@ -15,5 +15,8 @@ class WarehouseRepositoryPort(Protocol):
     async def get_all(self, limit: int = 50, offset: int = 0) -> List[Warehouse]:
         ...
 
+    async def list_all(self) -> List[Warehouse]:
+        ...
+
     async def delete(self, warehouse_id: UUID) -> None:
         ...
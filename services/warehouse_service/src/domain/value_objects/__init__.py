@@ -0,0 +1,2 @@
+from .geo_point import GeoPoint
+from .stock_line import StockLine
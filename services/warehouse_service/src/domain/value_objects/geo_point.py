@@ -0,0 +1,33 @@
+import math
+from dataclasses import dataclass
+from typing import Tuple
+
+from src.domain.errors.warehouse import InvalidCoordinatesError
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+@dataclass(frozen=True)
+class GeoPoint:
+    latitude: float
+    longitude: float
+
+    def __post_init__(self):
+        if not -90 <= self.latitude <= 90:
+            raise InvalidCoordinatesError(f"Latitude must be within [-90, 90], got {self.latitude}")
+        if not -180 <= self.longitude <= 180:
+            raise InvalidCoordinatesError(f"Longitude must be within [-180, 180], got {self.longitude}")
+
+    def to_unit_vector(self) -> Tuple[float, float, float]:
+        """Точка на единичной сфере: евклидово расстояние между векторами монотонно по дуге."""
+        lat = math.radians(self.latitude)
+        lon = math.radians(self.longitude)
+        return math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat)
+
+    def distance_km(self, other: "GeoPoint") -> float:
+        """Расстояние по большому кругу (haversine)."""
+        lat1, lat2 = math.radians(self.latitude), math.radians(other.latitude)
+        d_lat = lat2 - lat1
+        d_lon = math.radians(other.longitude - self.longitude)
+        h = math.sin(d_lat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(d_lon / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from src.domain.errors.stock import InvalidStockLineError
+
+
+@dataclass(frozen=True)
+class StockLine:
+    sku: str
+    quantity: int
+
+    def __post_init__(self):
+        if not self.sku:
+            raise InvalidStockLineError("SKU cannot be empty.")
+        if self.quantity < 1:
+            raise InvalidStockLineError(f"Quantity must be at least 1, got {self.quantity}")
+
+    def to_dict(self) -> dict:
+        return {"sku": self.sku, "quantity": self.quantity}
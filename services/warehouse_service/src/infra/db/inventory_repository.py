@@ -1,9 +1,11 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import asyncpg
 
 from src.domain.entities import InventoryRecord
+from src.domain.errors.warehouse import WarehouseNotFoundError
 from src.domain.entities.inventory_record import InventoryStatus
 from src.domain.ports import InventoryRepositoryPort
 
@@ -54,6 +56,71 @@ class AsyncPostgresInventoryRepository(InventoryRepositoryPort):
 
         return self._row_to_entity(row)
 
+    async def save_many(self, warehouse_id: UUID, records: AsyncIterable[InventoryRecord]) -> List[InventoryRecord]:
+        """
+        Массовая приемка: записи заливаются через COPY во временную staging-таблицу по мере
+        поступления и переносятся в inventory_records одним INSERT ... SELECT.
+        Уже существующие record_id пропускаются; возвращаются только вставленные записи.
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        """
+                        CREATE TEMP TABLE IF NOT EXISTS inventory_receipt_staging (
+                            record_id UUID NOT NULL,
+                            shipment_id UUID NOT NULL,
+                            status VARCHAR(50) NOT NULL,
+                            received_at TIMESTAMPTZ NOT NULL,
+                            updated_at TIMESTAMPTZ NOT NULL
+                        ) ON COMMIT DELETE ROWS
+                        """
+                    )
+                    await conn.copy_records_to_table(
+                        "inventory_receipt_staging",
+                        records=self._receipt_rows(records),
+                        columns=["record_id", "shipment_id", "status", "received_at", "updated_at"],
+                    )
+                    inserted = await conn.fetch(
+                        """
+                        INSERT INTO inventory_records (
+                            record_id,
+                            shipment_id,
+                            warehouse_id,
+                            status,
+                            received_at,
+                            updated_at
+                        )
+                        SELECT DISTINCT ON (record_id)
+                            record_id,
+                            shipment_id,
+                            $1,
+                            status,
+                            received_at,
+                            updated_at
+                        FROM inventory_receipt_staging
+                        ORDER BY record_id
+                        ON CONFLICT (record_id) DO NOTHING
+                        RETURNING
+                            record_id,
+                            shipment_id,
+                            warehouse_id,
+                            status,
+                            received_at,
+                            updated_at
+                        """,
+                        warehouse_id,
+                    )
+        except asyncpg.ForeignKeyViolationError as e:
+            raise WarehouseNotFoundError(f"Warehouse {warehouse_id} not found") from e
+
+        return [self._row_to_entity(row) for row in inserted]
+
+    @staticmethod
+    async def _receipt_rows(records: AsyncIterable[InventoryRecord]) -> AsyncIterator[tuple]:
+        async for r in records:
+            yield r.record_id, r.shipment_id, r.status.value, r.received_at, r.updated_at
+
     async def get(self, record_id: UUID) -> Optional[InventoryRecord]:
         """Получить запись инвентаря по ID."""
         async with self._pool.acquire() as conn:
@@ -95,6 +162,125 @@ class AsyncPostgresInventoryRepository(InventoryRepositoryPort):
 
         return [self._row_to_entity(row) for row in rows]
 
+    async def find(
+        self,
+        warehouse_id: UUID,
+        shipment_id: Optional[UUID] = None,
+        status: Optional[InventoryStatus] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50,
+    ) -> List[InventoryRecord]:
+        """
+        Записи склада с фильтрами в SQL и keyset-пагинацией по (received_at, record_id).
+        Условия собираются только из заданных фильтров, чтобы планировщик выбирал
+        idx_inventory_warehouse_status или idx_inventory_warehouse_received, а не общий план с OR.
+        """
+        conditions = ["warehouse_id = $1"]
+        args: list = [warehouse_id]
+
+        if shipment_id is not None:
+            args.append(shipment_id)
+            conditions.append(f"shipment_id = ${len(args)}")
+
+        if status is not None:
+            args.append(status.value)
+            conditions.append(f"status = ${len(args)}")
+
+        if after is not None:
+            args.extend(after)
+            conditions.append(f"(received_at, record_id) > (${len(args) - 1}, ${len(args)})")
+
+        args.append(limit)
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT
+                    record_id,
+                    shipment_id,
+                    warehouse_id,
+                    status,
+                    received_at,
+                    updated_at
+                FROM inventory_records
+                WHERE {" AND ".join(conditions)}
+                ORDER BY received_at, record_id
+                LIMIT ${len(args)}
+                """,
+                *args,
+            )
+
+        return [self._row_to_entity(row) for row in rows]
+
+    async def count_by_status(self, warehouse_id: UUID) -> Dict[InventoryStatus, int]:
+        """Счетчики склада из сводной таблицы, без COUNT(*) по inventory_records."""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT status, record_count
+                FROM warehouse_inventory_counts
+                WHERE warehouse_id = $1
+                """,
+                warehouse_id,
+            )
+
+        return {InventoryStatus(row["status"]): row["record_count"] for row in rows}
+
+    async def count_all_by_status(self) -> Dict[UUID, Dict[InventoryStatus, int]]:
+        """Счетчики всех складов для загрузки зеркала в память."""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT warehouse_id, status, record_count FROM warehouse_inventory_counts"
+            )
+
+        counts: Dict[UUID, Dict[InventoryStatus, int]] = {}
+        for row in rows:
+            counts.setdefault(row["warehouse_id"], {})[InventoryStatus(row["status"])] = row["record_count"]
+        return counts
+
+    async def release_by_shipment(self, shipment_id: UUID) -> List[UUID]:
+        """
+        Компенсация саги одним запросом: все неотгруженные записи отгрузки
+        возвращаются в RECEIVED, их резерв снимается. Отгруженные записи не трогаются.
+        Возвращает ID измененных записей.
+        """
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                WITH released AS (
+                    UPDATE inventory_records
+                    SET status = $2,
+                        updated_at = NOW()
+                    WHERE shipment_id = $1
+                      AND status <> $3
+                    RETURNING record_id
+                ),
+                lines AS (
+                    DELETE FROM inventory_record_items i
+                    USING released r
+                    WHERE i.record_id = r.record_id
+                    RETURNING i.warehouse_id, i.sku, i.quantity
+                ),
+                stock AS (
+                    UPDATE stock_levels s
+                    SET reserved = s.reserved - l.quantity,
+                        updated_at = NOW()
+                    FROM (
+                        SELECT warehouse_id, sku, SUM(quantity) AS quantity
+                        FROM lines
+                        GROUP BY warehouse_id, sku
+                    ) l
+                    WHERE s.warehouse_id = l.warehouse_id AND s.sku = l.sku
+                )
+                SELECT record_id FROM released
+                """,
+                shipment_id,
+                InventoryStatus.RECEIVED.value,
+                InventoryStatus.SHIPPED.value,
+            )
+
+        return [row["record_id"] for row in rows]
+
     async def delete(self, record_id: UUID) -> None:
         """Удалить запись инвентаря по ID."""
         async with self._pool.acquire() as conn:
@@ -111,4 +297,6 @@ class AsyncPostgresInventoryRepository(InventoryRepositoryPort):
             shipment_id=row["shipment_id"],
             warehouse_id=row["warehouse_id"],
             status=InventoryStatus(row["status"]),
+            received_at=row["received_at"],
+            updated_at=row["updated_at"],
         )
@@ -0,0 +1,235 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+
+import asyncpg
+
+from src.domain.entities import StockLevel
+from src.domain.errors.stock import InsufficientStockError, InvalidStockAdjustmentError
+from src.domain.ports import StockRepositoryPort
+from src.domain.value_objects import StockLine
+
+
+class AsyncPostgresStockRepository(StockRepositoryPort):
+    """Асинхронный репозиторий остатков склада по SKU"""
+
+    def __init__(self, pool: asyncpg.Pool):
+        self._pool = pool
+
+    async def get(self, warehouse_id: UUID, sku: str) -> Optional[StockLevel]:
+        """Получить остаток SKU на складе."""
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT warehouse_id, sku, on_hand, reserved, updated_at
+                FROM stock_levels
+                WHERE warehouse_id = $1 AND sku = $2
+                """,
+                warehouse_id,
+                sku,
+            )
+
+        return self._row_to_entity(row) if row else None
+
+    async def list_by_warehouse(self, warehouse_id: UUID) -> List[StockLevel]:
+        """Получить все остатки склада."""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT warehouse_id, sku, on_hand, reserved, updated_at
+                FROM stock_levels
+                WHERE warehouse_id = $1
+                ORDER BY sku
+                """,
+                warehouse_id,
+            )
+
+        return [self._row_to_entity(row) for row in rows]
+
+    async def adjust(self, warehouse_id: UUID, sku: str, delta: int) -> StockLevel:
+        """
+        Изменить физический остаток на delta (приемка или списание).
+        Остаток не может стать отрицательным или меньше зарезервированного.
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    """
+                    INSERT INTO stock_levels (warehouse_id, sku, on_hand)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (warehouse_id, sku)
+                    DO UPDATE SET
+                        on_hand = stock_levels.on_hand + EXCLUDED.on_hand,
+                        updated_at = NOW()
+                    RETURNING warehouse_id, sku, on_hand, reserved, updated_at
+                    """,
+                    warehouse_id,
+                    sku,
+                    delta,
+                )
+        except asyncpg.CheckViolationError as e:
+            raise InvalidStockAdjustmentError(
+                f"Cannot adjust stock of {sku} by {delta}: on hand would drop below reserved"
+            ) from e
+
+        return self._row_to_entity(row)
+
+    async def reserve(self, warehouse_id: UUID, record_id: UUID, items: List[StockLine]) -> List[StockLevel]:
+        """
+        Резервирует все строки одним UPDATE по массивам unnest.
+        Условие available >= quantity проверяется на заблокированной строке, поэтому
+        параллельные саги не могут перепродать остаток. Если хотя бы одна строка не прошла,
+        транзакция откатывается целиком и поднимается InsufficientStockError.
+        """
+        requested = self._merge_lines(items)
+        if not requested:
+            return []
+
+        skus = list(requested)
+        quantities = list(requested.values())
+
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(
+                    """
+                    WITH requested AS (
+                        SELECT sku, quantity
+                        FROM unnest($2::text[], $3::int[]) AS r(sku, quantity)
+                    ),
+                    locked AS (
+                        -- Блокируем строки в порядке SKU, чтобы встречные резервы не взаимоблокировались
+                        SELECT s.sku
+                        FROM stock_levels s
+                        JOIN requested r ON r.sku = s.sku
+                        WHERE s.warehouse_id = $1
+                        ORDER BY s.sku
+                        FOR UPDATE OF s
+                    ),
+                    reserved AS (
+                        UPDATE stock_levels s
+                        SET reserved = s.reserved + r.quantity,
+                            updated_at = NOW()
+                        FROM requested r
+                        JOIN locked l ON l.sku = r.sku
+                        WHERE s.warehouse_id = $1
+                          AND s.sku = r.sku
+                          AND s.on_hand - s.reserved >= r.quantity
+                        RETURNING s.warehouse_id, s.sku, s.on_hand, s.reserved, s.updated_at
+                    ),
+                    lines AS (
+                        INSERT INTO inventory_record_items (record_id, warehouse_id, sku, quantity)
+                        SELECT $4, $1, r.sku, r.quantity
+                        FROM requested r
+                        JOIN reserved USING (sku)
+                        WHERE (SELECT COUNT(*) FROM reserved) = cardinality($2::text[])
+                        ON CONFLICT (record_id, sku)
+                        DO UPDATE SET quantity = inventory_record_items.quantity + EXCLUDED.quantity
+                    )
+                    SELECT warehouse_id, sku, on_hand, reserved, updated_at FROM reserved
+                    """,
+                    warehouse_id,
+                    skus,
+                    quantities,
+                    record_id,
+                )
+
+                if len(rows) != len(skus):
+                    missing = await conn.fetch(
+                        """
+                        SELECT r.sku, r.quantity, COALESCE(s.on_hand - s.reserved, 0) AS available
+                        FROM unnest($2::text[], $3::int[]) AS r(sku, quantity)
+                        LEFT JOIN stock_levels s ON s.warehouse_id = $1 AND s.sku = r.sku
+                        WHERE COALESCE(s.on_hand - s.reserved, 0) < r.quantity
+                        """,
+                        warehouse_id,
+                        skus,
+                        quantities,
+                    )
+                    raise InsufficientStockError([
+                        {"sku": row["sku"], "requested": row["quantity"], "available": row["available"]}
+                        for row in missing
+                    ])
+
+        return [self._row_to_entity(row) for row in rows]
+
+    async def release(self, record_id: UUID) -> List[StockLine]:
+        """Снять резерв записи: строки удаляются, reserved уменьшается. Возвращает снятые строки."""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                WITH released AS (
+                    DELETE FROM inventory_record_items
+                    WHERE record_id = $1
+                    RETURNING warehouse_id, sku, quantity
+                ),
+                updated AS (
+                    UPDATE stock_levels s
+                    SET reserved = s.reserved - r.quantity,
+                        updated_at = NOW()
+                    FROM released r
+                    WHERE s.warehouse_id = r.warehouse_id AND s.sku = r.sku
+                )
+                SELECT sku, quantity FROM released ORDER BY sku
+                """,
+                record_id,
+            )
+
+        return [StockLine(sku=row["sku"], quantity=row["quantity"]) for row in rows]
+
+    async def consume(self, record_id: UUID) -> List[StockLine]:
+        """Списать резерв при отгрузке: уменьшаются и on_hand, и reserved. Возвращает списанные строки."""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                WITH consumed AS (
+                    DELETE FROM inventory_record_items
+                    WHERE record_id = $1
+                    RETURNING warehouse_id, sku, quantity
+                ),
+                updated AS (
+                    UPDATE stock_levels s
+                    SET on_hand = s.on_hand - c.quantity,
+                        reserved = s.reserved - c.quantity,
+                        updated_at = NOW()
+                    FROM consumed c
+                    WHERE s.warehouse_id = c.warehouse_id AND s.sku = c.sku
+                )
+                SELECT sku, quantity FROM consumed ORDER BY sku
+                """,
+                record_id,
+            )
+
+        return [StockLine(sku=row["sku"], quantity=row["quantity"]) for row in rows]
+
+    async def list_reserved(self, record_id: UUID) -> List[StockLine]:
+        """Получить строки резерва записи."""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT sku, quantity
+                FROM inventory_record_items
+                WHERE record_id = $1
+                ORDER BY sku
+                """,
+                record_id,
+            )
+
+        return [StockLine(sku=row["sku"], quantity=row["quantity"]) for row in rows]
+
+    @staticmethod
+    def _merge_lines(items: List[StockLine]) -> Dict[str, int]:
+        """Сложить повторяющиеся SKU, чтобы одна строка склада обновлялась один раз."""
+        merged: Dict[str, int] = {}
+        for item in items:
+            merged[item.sku] = merged.get(item.sku, 0) + item.quantity
+        return merged
+
+    @staticmethod
+    def _row_to_entity(row: asyncpg.Record) -> StockLevel:
+        """Преобразовать row в StockLevel."""
+        return StockLevel(
+            warehouse_id=row["warehouse_id"],
+            sku=row["sku"],
+            on_hand=row["on_hand"],
+            reserved=row["reserved"],
+            updated_at=row["updated_at"],
+        )
@@ -1,4 +1,3 @@
-import json
 from typing import List, Optional
 from uuid import UUID
 
@@ -8,6 +7,17 @@ from libs.value_objects.location import Location
 
 from src.domain.entities import Warehouse
 from src.domain.ports.warehouse_repository import WarehouseRepositoryPort
+from src.domain.value_objects import GeoPoint
+
+_COLUMNS = """
+    warehouse_id,
+    name,
+    country,
+    city,
+    address,
+    latitude,
+    longitude
+"""
 
 
 class AsyncPostgresWarehouseRepository(WarehouseRepositoryPort):
@@ -20,27 +30,38 @@ class AsyncPostgresWarehouseRepository(WarehouseRepositoryPort):
         """
         UPSERT склада по warehouse_id.
         """
+        coordinates = warehouse.coordinates
         async with self._pool.acquire() as conn:
             row = await conn.fetchrow(
-                """
+                f"""
                 INSERT INTO warehouses (
                     warehouse_id,
                     name,
-                    location
+                    country,
+                    city,
+                    address,
+                    latitude,
+                    longitude
                 )
-                VALUES ($1, $2, $3)
+                VALUES ($1, $2, $3, $4, $5, $6, $7)
                 ON CONFLICT (warehouse_id)
                 DO UPDATE SET
                     name = EXCLUDED.name,
-                    location = EXCLUDED.location
-                RETURNING
-                    warehouse_id,
-                    name,
-                    location
+                    country = EXCLUDED.country,
+                    city = EXCLUDED.city,
+                    address = EXCLUDED.address,
+                    latitude = EXCLUDED.latitude,
+                    longitude = EXCLUDED.longitude,
+                    updated_at = NOW()
+                RETURNING {_COLUMNS}
                 """,
                 warehouse.warehouse_id,
                 warehouse.name,
-                json.dumps({"country": warehouse.location.country, "city": warehouse.location.city, "address": warehouse.location.address}),
+                warehouse.location.country,
+                warehouse.location.city,
+                warehouse.location.address,
+                coordinates.latitude if coordinates else None,
+                coordinates.longitude if coordinates else None,
             )
 
         return self._row_to_entity(row)
@@ -49,11 +70,8 @@ class AsyncPostgresWarehouseRepository(WarehouseRepositoryPort):
         """Получить склад по ID."""
         async with self._pool.acquire() as conn:
             row = await conn.fetchrow(
-                """
-                SELECT
-                    warehouse_id,
-                    name,
-                    location
+                f"""
+                SELECT {_COLUMNS}
                 FROM warehouses
                 WHERE warehouse_id = $1
                 """,
@@ -66,11 +84,8 @@ class AsyncPostgresWarehouseRepository(WarehouseRepositoryPort):
         """Получить все склады."""
         async with self._pool.acquire() as conn:
             rows = await conn.fetch(
-                """
-                SELECT
-                    warehouse_id,
-                    name,
-                    location
+                f"""
+                SELECT {_COLUMNS}
                 FROM warehouses
                 ORDER BY name
                 LIMIT $1 OFFSET $2
@@ -81,6 +96,13 @@ class AsyncPostgresWarehouseRepository(WarehouseRepositoryPort):
 
         return [self._row_to_entity(row) for row in rows]
 
+    async def list_all(self) -> List[Warehouse]:
+        """Полный список складов для загрузки справочника в память."""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(f"SELECT {_COLUMNS} FROM warehouses")
+
+        return [self._row_to_entity(row) for row in rows]
+
     async def delete(self, warehouse_id: UUID) -> None:
         """Удалить склад по ID."""
         async with self._pool.acquire() as conn:
@@ -92,9 +114,13 @@ class AsyncPostgresWarehouseRepository(WarehouseRepositoryPort):
     @staticmethod
     def _row_to_entity(row: asyncpg.Record) -> Warehouse:
         """Преобразовать row в Warehouse."""
-        location_data = json.loads(row["location"])
+        coordinates = None
+        if row["latitude"] is not None:
+            coordinates = GeoPoint(latitude=row["latitude"], longitude=row["longitude"])
+
         return Warehouse(
             warehouse_id=row["warehouse_id"],
             name=row["name"],
-            location=Location(**location_data),
+            location=Location(country=row["country"], city=row["city"], address=row["address"]),
+            coordinates=coordinates,
         )
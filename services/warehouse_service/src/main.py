@@ -10,13 +10,19 @@ from libs.observability.logger import set_service_name, set_environment, get_jso
 from libs.observability.metrics import PrometheusMiddleware, metrics_endpoint
 
 from src.api.router import router
-from src.api.deps.getters import db_provider, event_queue_provider
+from src.api.deps.getters import db_provider, event_queue_provider, warehouse_directory, utilization_mirror
 from src.app.services.inventory_record import InventoryService
+from src.app.services.utilization import UtilizationService
 from src.app.workers.command_worker import WarehouseCommandWorker
+from src.app.workers.directory_worker import WarehouseDirectoryWorker
+from src.app.workers.utilization_worker import UtilizationWorker
 from src.config import settings
-from src.domain.errors.warehouse import WarehouseNotFoundError, WarehouseAlreadyExistsError
+from src.domain.errors.warehouse import WarehouseNotFoundError, WarehouseAlreadyExistsError, InvalidCoordinatesError
 from src.domain.errors.inventory_record import InventoryRecordNotFoundError
+from src.domain.errors.stock import InvalidStockAdjustmentError, InvalidStockLineError
 from src.infra.db.inventory_repository import AsyncPostgresInventoryRepository
+from src.infra.db.stock_repository import AsyncPostgresStockRepository
+from src.infra.db.warehouse_repository import AsyncPostgresWarehouseRepository
 
 set_service_name(settings.SERVICE_NAME)
 set_environment(settings.ENVIRONMENT)
@@ -31,23 +37,43 @@ async def lifespan(app: FastAPI):
     await event_queue_provider.startup()
 
     inventory_repo = AsyncPostgresInventoryRepository(db_provider._pool)
-    inventory_service = InventoryService(repository=inventory_repo)
+    inventory_service = InventoryService(
+        repository=inventory_repo,
+        stock_repository=AsyncPostgresStockRepository(db_provider._pool),
+    )
     command_worker = WarehouseCommandWorker(
         event_queue=event_queue_provider._adapter,
         inventory_service=inventory_service,
     )
 
+    directory_worker = WarehouseDirectoryWorker(
+        event_queue=event_queue_provider._adapter,
+        repository=AsyncPostgresWarehouseRepository(db_provider._pool),
+        directory=warehouse_directory,
+        group_id=settings.replica_group_id,
+        refresh_interval_seconds=settings.WAREHOUSE_DIRECTORY_REFRESH_SECONDS,
+    )
+    utilization_worker = UtilizationWorker(
+        event_queue=event_queue_provider._adapter,
+        service=UtilizationService(repository=inventory_repo, mirror=utilization_mirror),
+        refresh_interval_seconds=settings.UTILIZATION_REFRESH_SECONDS,
+        group_id=settings.replica_group_id,
+    )
+
     worker_task = asyncio.create_task(command_worker.run(), name="warehouse_command_worker")
+    directory_task = asyncio.create_task(directory_worker.run(), name="warehouse_directory_worker")
+    utilization_task = asyncio.create_task(utilization_worker.run(), name="utilization_worker")
 
     logger.info(f"Service '{settings.SERVICE_NAME}' ready on port {settings.PORT}.")
     yield
 
     logger.info("Shutting down Warehouse Service...")
-    worker_task.cancel()
-    try:
-        await worker_task
-    except asyncio.CancelledError:
-        logger.info("Command worker stopped gracefully.")
+    for task in (worker_task, directory_task, utilization_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            logger.info(f"{task.get_name()} stopped gracefully.")
 
     await event_queue_provider.shutdown()
     await db_provider.shutdown()
@@ -86,6 +112,18 @@ def create_app() -> FastAPI:
     async def handle_inventory_not_found(request: Request, exc: InventoryRecordNotFoundError) -> JSONResponse:
         return JSONResponse(status_code=404, content={"detail": str(exc)})
 
+    @app.exception_handler(InvalidCoordinatesError)
+    async def handle_invalid_coordinates(request: Request, exc: InvalidCoordinatesError) -> JSONResponse:
+        return JSONResponse(status_code=422, content={"detail": str(exc)})
+
+    @app.exception_handler(InvalidStockLineError)
+    async def handle_invalid_stock_line(request: Request, exc: InvalidStockLineError) -> JSONResponse:
+        return JSONResponse(status_code=422, content={"detail": str(exc)})
+
+    @app.exception_handler(InvalidStockAdjustmentError)
+    async def handle_invalid_stock_adjustment(request: Request, exc: InvalidStockAdjustmentError) -> JSONResponse:
+        return JSONResponse(status_code=409, content={"detail": str(exc)})
+
     return app
 
 
@@ -0,0 +1,263 @@
+import asyncio
+import random
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from prometheus_client import REGISTRY
+
+from libs.messaging.base import Command, Event
+from libs.testing.postgres import FakePool, RecordingConnection
+from libs.value_objects.location import Location
+
+from src.app.services.inventory_record import InventoryService
+from src.app.services.spatial_index import GeoKDTree
+from src.app.services.utilization import UtilizationMirror, UtilizationService
+from src.app.services.warehouse_directory import WarehouseDirectory
+from src.app.workers.command_worker import WarehouseCommandWorker
+from src.app.workers.directory_worker import WarehouseDirectoryWorker
+from src.app.workers.utilization_worker import UtilizationWorker
+from src.domain.entities import InventoryRecord, Warehouse
+from src.domain.entities.inventory_record import InventoryStatus
+from src.domain.value_objects import GeoPoint
+from src.infra.db.inventory_repository import AsyncPostgresInventoryRepository
+
+
+class FakeConnection(RecordingConnection):
+    """Соединение, считающее запросы к базе (round-trip'ы)."""
+
+    def __init__(self, records_per_shipment: int):
+        super().__init__()
+        self.records_per_shipment = records_per_shipment
+
+    async def fetch(self, query, *args):
+        self.record(query, args)
+        return [{"record_id": uuid4()} for _ in range(self.records_per_shipment)]
+
+
+def make_worker(conn: FakeConnection) -> WarehouseCommandWorker:
+    repository = AsyncPostgresInventoryRepository(FakePool(conn))
+    service = InventoryService(repository=repository, stock_repository=None)
+    return WarehouseCommandWorker(event_queue=None, inventory_service=service)
+
+
+def make_release_command(shipment_id) -> Command:
+    return Command(
+        command_type="inventory.release",
+        aggregate_id=shipment_id,
+        payload={"shipment_id": str(shipment_id), "reason": "Saga compensation"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_release_by_shipment_guards_shipped_records():
+    conn = FakeConnection(records_per_shipment=1)
+    repository = AsyncPostgresInventoryRepository(FakePool(conn))
+    shipment_id = uuid4()
+
+    released = await repository.release_by_shipment(shipment_id)
+
+    query, args = conn.queries[0]
+    assert "status <> $3" in query
+    assert args == (shipment_id, "received", "shipped")
+    assert len(released) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("records_per_shipment", [1, 50, 500])
+async def test_release_round_trips_do_not_grow_with_record_count(records_per_shipment):
+    conn = FakeConnection(records_per_shipment)
+    worker = make_worker(conn)
+
+    await worker._handle_release_inventory(make_release_command(uuid4()))
+
+    assert conn.round_trips == 1
+
+
+class CopyConnection(RecordingConnection):
+    """Соединение для COPY: строки вычитываются из переданного итератора, как это делает asyncpg."""
+
+    def __init__(self):
+        super().__init__()
+        self.copied = []
+
+    async def copy_records_to_table(self, table_name, *, records, columns):
+        self.record(table_name)
+        async for row in records:
+            self.copied.append(row)
+
+    async def fetch(self, query, *args):
+        self.record(query, args)
+        return [
+            {"record_id": r[0], "shipment_id": r[1], "warehouse_id": args[0], "status": r[2],
+             "received_at": r[3], "updated_at": r[4]}
+            for r in self.copied
+        ]
+
+
+@pytest.mark.asyncio
+async def test_save_many_streams_records_into_copy():
+    conn = CopyConnection()
+    repository = AsyncPostgresInventoryRepository(FakePool(conn))
+    warehouse_id = uuid4()
+    produced = []
+
+    async def records():
+        for _ in range(3):
+            record = InventoryRecord(shipment_id=uuid4(), warehouse_id=warehouse_id)
+            produced.append(record)
+            yield record
+
+    saved = await repository.save_many(warehouse_id, records())
+
+    assert [row[0] for row in conn.copied] == [r.record_id for r in produced]
+    assert [r.record_id for r in saved] == [r.record_id for r in produced]
+
+
+def make_warehouse(latitude: float, longitude: float) -> Warehouse:
+    return Warehouse(
+        name=f"WH {latitude:.2f},{longitude:.2f}",
+        location=Location(country="Country", city="City"),
+        coordinates=GeoPoint(latitude=latitude, longitude=longitude),
+    )
+
+
+def test_kd_tree_matches_brute_force_nearest():
+    rng = random.Random(42)
+    warehouses = [make_warehouse(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(500)]
+    tree = GeoKDTree([(w.coordinates, w) for w in warehouses])
+
+    for _ in range(50):
+        target = GeoPoint(latitude=rng.uniform(-90, 90), longitude=rng.uniform(-180, 180))
+        expected = sorted(warehouses, key=lambda w: w.coordinates.distance_km(target))[:5]
+
+        found = tree.nearest(target, k=5)
+
+        assert [w.warehouse_id for w, _ in found] == [w.warehouse_id for w in expected]
+        for warehouse, distance in found:
+            assert distance == pytest.approx(warehouse.coordinates.distance_km(target), rel=1e-6)
+
+
+def test_kd_tree_handles_antimeridian():
+    east = make_warehouse(0, 179.9)
+    west = make_warehouse(0, -179.9)
+    far = make_warehouse(0, 170)
+    tree = GeoKDTree([(w.coordinates, w) for w in (east, west, far)])
+
+    found = tree.nearest(GeoPoint(latitude=0, longitude=-179.95), k=2)
+
+    assert {w.warehouse_id for w, _ in found} == {east.warehouse_id, west.warehouse_id}
+
+
+def test_directory_reflects_changes_and_skips_warehouses_without_coordinates():
+    directory = WarehouseDirectory()
+    moscow = make_warehouse(55.75, 37.62)
+    kazan = make_warehouse(55.79, 49.12)
+    unknown = Warehouse(name="No coords", location=Location(country="Russia", city="Tver"))
+    directory.load([moscow, kazan, unknown])
+
+    target = GeoPoint(latitude=56.0, longitude=38.0)
+    assert [w.warehouse_id for w, _ in directory.nearest(target, limit=3)] == [moscow.warehouse_id, kazan.warehouse_id]
+
+    directory.remove(moscow.warehouse_id)
+    assert [w.warehouse_id for w, _ in directory.nearest(target, limit=3)] == [kazan.warehouse_id]
+
+
+@pytest.mark.asyncio
+async def test_directory_worker_applies_warehouse_events():
+    directory = WarehouseDirectory()
+    warehouse = make_warehouse(59.93, 30.33)
+    repository = AsyncMock()
+    repository.list_all.return_value = []
+    repository.get.return_value = warehouse
+    events = [
+        Event(event_type="warehouse.created", aggregate_id=warehouse.warehouse_id, aggregate_type="warehouse", payload={}),
+    ]
+
+    consumed = {}
+
+    async def consume_event(*topics, event_types=None, group_id=None, auto_offset_reset="earliest"):
+        consumed.update(group_id=group_id, auto_offset_reset=auto_offset_reset)
+        for event in events:
+            yield event
+
+    queue = AsyncMock()
+    queue.consume_event = consume_event
+    worker = WarehouseDirectoryWorker(
+        event_queue=queue, repository=repository, directory=directory, group_id="warehouse-service-replica-1"
+    )
+
+    await worker._consume()
+
+    assert directory.get(warehouse.warehouse_id) is warehouse
+    assert consumed == {"group_id": "warehouse-service-replica-1", "auto_offset_reset": "latest"}
+
+
+@pytest.mark.asyncio
+async def test_directory_worker_reload_picks_up_missed_changes():
+    directory = WarehouseDirectory()
+    warehouse = make_warehouse(59.93, 30.33)
+    repository = AsyncMock()
+    repository.list_all.return_value = [warehouse]
+    worker = WarehouseDirectoryWorker(
+        event_queue=AsyncMock(), repository=repository, directory=directory, refresh_interval_seconds=0
+    )
+
+    task = asyncio.create_task(worker._reload_periodically())
+    for _ in range(100):
+        if directory.get(warehouse.warehouse_id) is not None:
+            break
+        await asyncio.sleep(0)
+    task.cancel()
+
+    assert directory.get(warehouse.warehouse_id) is warehouse
+
+
+@pytest.mark.asyncio
+async def test_utilization_mirror_serves_counts_and_updates_gauges():
+    warehouse_id = uuid4()
+    repository = AsyncMock()
+    repository.count_by_status.return_value = {InventoryStatus.RECEIVED: 2}
+    service = UtilizationService(repository=repository, mirror=UtilizationMirror())
+
+    first = await service.get_counts(warehouse_id)
+    second = await service.get_counts(warehouse_id)
+
+    assert first == second
+    assert first[InventoryStatus.RECEIVED] == 2
+    assert first[InventoryStatus.SHIPPED] == 0
+    repository.count_by_status.assert_awaited_once_with(warehouse_id)
+    gauge = REGISTRY.get_sample_value(
+        "warehouse_inventory_records", {"warehouse_id": str(warehouse_id), "status": "received"}
+    )
+    assert gauge == 2
+
+
+@pytest.mark.asyncio
+async def test_utilization_worker_refreshes_warehouse_on_inventory_event():
+    warehouse_id = uuid4()
+    repository = AsyncMock()
+    repository.count_all_by_status.return_value = {}
+    repository.count_by_status.return_value = {InventoryStatus.STORED: 5}
+    mirror = UtilizationMirror()
+    events = [
+        Event(event_type="inventory.updated", aggregate_id=warehouse_id, aggregate_type="warehouse", payload={}),
+    ]
+
+    consumed = {}
+
+    async def consume_event(*topics, event_types=None, group_id=None, auto_offset_reset="earliest"):
+        consumed.update(group_id=group_id, auto_offset_reset=auto_offset_reset)
+        for event in events:
+            yield event
+
+    queue = AsyncMock()
+    queue.consume_event = consume_event
+    worker = UtilizationWorker(
+        event_queue=queue, service=UtilizationService(repository, mirror), group_id="warehouse-service-replica-1"
+    )
+
+    await worker._consume()
+
+    assert mirror.get(warehouse_id)[InventoryStatus.STORED] == 5
+    assert consumed == {"group_id": "warehouse-service-replica-1", "auto_offset_reset": "latest"}
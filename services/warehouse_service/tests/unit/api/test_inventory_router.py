@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -9,7 +10,10 @@ from libs.auth.models import UserInDB
 from src.api.deps.getters import get_inventory_service, get_event_queue, get_current_user
 from src.api.dto.inventory_record import InventoryRecordDTO
 from src.api.handlers.inventory_record import inventory_router
+from src.api.mappers.inventory_record import InventoryRecordMapper
+from src.domain.entities import InventoryRecord
 from src.domain.entities.inventory_record import InventoryStatus
+from src.domain.errors.stock import InsufficientStockError
 
 _ADMIN_USER = UserInDB(username="admin", hashed_password="", role="admin")
 
@@ -118,12 +122,44 @@ def test_get_inventory_record_not_found(mock_mapper, client, mock_inventory_serv
 def test_list_inventory_records_empty(mock_mapper, client, mock_inventory_service):
     warehouse_id = uuid4()
     shipment_id = uuid4()
-    mock_inventory_service.list_records_by_shipment.return_value = []
+    mock_inventory_service.list_records.return_value = []
 
     response = client.get(f"/warehouses/{warehouse_id}/inventory", params={"shipment_id": str(shipment_id)})
 
     assert response.status_code == 200
     assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+    mock_inventory_service.list_records.assert_awaited_once_with(
+        warehouse_id, shipment_id=shipment_id, status=None, after=None, limit=50
+    )
+
+
+def test_list_inventory_records_by_warehouse_paginates(client, mock_inventory_service):
+    warehouse_id = uuid4()
+    records = [InventoryRecord(shipment_id=uuid4(), warehouse_id=warehouse_id) for _ in range(2)]
+    mock_inventory_service.list_records.return_value = records
+
+    response = client.get(f"/warehouses/{warehouse_id}/inventory", params={"status": "stored", "limit": 2})
+
+    assert response.status_code == 200
+    cursor = response.headers["X-Next-Cursor"]
+    assert InventoryRecordMapper.decode_cursor(cursor) == (records[-1].received_at, records[-1].record_id)
+
+    client.get(f"/warehouses/{warehouse_id}/inventory", params={"cursor": cursor, "limit": 2})
+
+    mock_inventory_service.list_records.assert_awaited_with(
+        warehouse_id,
+        shipment_id=None,
+        status=None,
+        after=(records[-1].received_at, records[-1].record_id),
+        limit=2,
+    )
+
+
+def test_list_inventory_records_invalid_cursor(client, mock_inventory_service):
+    response = client.get(f"/warehouses/{uuid4()}/inventory", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
 
 
 @patch("src.api.handlers.inventory_record.InventoryRecordMapper")
@@ -190,3 +226,100 @@ def test_delete_inventory_record_not_found(mock_mapper, client, mock_inventory_s
     response = client.delete(f"/warehouses/{uuid4()}/inventory/{uuid4()}")
 
     assert response.status_code == 404
+
+
+def test_create_inventory_record_reserves_items(client, mock_inventory_service, mock_event_queue):
+    warehouse_id = uuid4()
+    shipment_id = uuid4()
+
+    async def create_record(entity, items):
+        entity.items = items
+        return entity
+
+    mock_inventory_service.create_record.side_effect = create_record
+
+    response = client.post(
+        f"/warehouses/{warehouse_id}/inventory",
+        json={"shipment_id": str(shipment_id), "items": [{"sku": "SKU-1", "quantity": 3}]},
+    )
+
+    assert response.status_code == 201
+    event = mock_event_queue.publish_event.call_args[0][0]
+    assert event.event_type == "inventory.reserved"
+    assert event.payload["items"] == [{"sku": "SKU-1", "quantity": 3}]
+
+
+def test_create_inventory_record_insufficient_stock(client, mock_inventory_service, mock_event_queue):
+    missing = [{"sku": "SKU-1", "requested": 5, "available": 2}]
+    mock_inventory_service.create_record.side_effect = InsufficientStockError(missing)
+
+    response = client.post(
+        f"/warehouses/{uuid4()}/inventory",
+        json={"shipment_id": str(uuid4()), "items": [{"sku": "SKU-1", "quantity": 5}]},
+    )
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["missing_items"] == missing
+    event = mock_event_queue.publish_event.call_args[0][0]
+    assert event.event_type == "inventory.insufficient"
+
+
+def _echo_bulk(mock_inventory_service):
+    """Как репозиторий: читает поток записей до конца, последнюю считает дубликатом."""
+    consumed = []
+
+    async def receive_bulk(warehouse_id, records):
+        consumed.extend([r async for r in records])
+        return consumed[:-1]
+
+    mock_inventory_service.receive_bulk.side_effect = receive_bulk
+    return consumed
+
+
+def test_bulk_receipt_json_publishes_one_event_per_shipment(client, mock_inventory_service, mock_event_queue):
+    _echo_bulk(mock_inventory_service)
+    warehouse_id = uuid4()
+    first, second = uuid4(), uuid4()
+    lines = [{"shipment_id": str(first)}, {"shipment_id": str(first)}, {"shipment_id": str(second)},
+             {"shipment_id": str(second), "status": "stored"}]
+
+    response = client.post(f"/warehouses/{warehouse_id}/inventory/bulk", json=lines)
+
+    assert response.status_code == 201
+    assert response.json() == {"received": 3, "skipped": 1, "shipments": 2}
+    assert mock_event_queue.publish_event.await_count == 2
+    first_event = mock_event_queue.publish_event.call_args_list[0][0][0]
+    assert first_event.event_type == "inventory.received"
+    assert len(first_event.payload["records"]) == 2
+    assert datetime.fromisoformat(first_event.payload["received_at"]).tzinfo is not None
+
+
+def test_bulk_receipt_ndjson_stream(client, mock_inventory_service, mock_event_queue):
+    records = _echo_bulk(mock_inventory_service)
+    shipment_id = uuid4()
+    body = "\n".join(json.dumps({"shipment_id": str(shipment_id), "record_id": str(uuid4())}) for _ in range(3))
+
+    response = client.post(
+        f"/warehouses/{uuid4()}/inventory/bulk",
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 201
+    assert len(records) == 3
+    assert {r.shipment_id for r in records} == {shipment_id}
+    assert all(r.received_at.tzinfo is not None for r in records)
+    assert mock_event_queue.publish_event.await_count == 1
+
+
+def test_bulk_receipt_rejects_invalid_line(client, mock_inventory_service, mock_event_queue):
+    _echo_bulk(mock_inventory_service)
+
+    response = client.post(
+        f"/warehouses/{uuid4()}/inventory/bulk",
+        json=[{"shipment_id": str(uuid4())}, {"shipment_id": "not-a-uuid"}],
+    )
+
+    assert response.status_code == 422
+    assert "line 2" in response.json()["detail"]
+    mock_event_queue.publish_event.assert_not_called()
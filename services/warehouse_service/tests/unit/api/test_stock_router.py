@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.deps.getters import get_stock_service, get_event_queue, get_current_user
+from src.api.handlers.stock import stock_router
+from src.domain.entities import StockLevel
+
+app = FastAPI()
+app.include_router(stock_router)
+
+
+@pytest.fixture
+def mock_stock_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_event_queue():
+    return AsyncMock()
+
+
+@pytest.fixture
+def client(mock_stock_service, mock_event_queue):
+    app.dependency_overrides[get_stock_service] = lambda: mock_stock_service
+    app.dependency_overrides[get_event_queue] = lambda: mock_event_queue
+    app.dependency_overrides[get_current_user] = lambda: MagicMock()
+
+    with TestClient(app) as c:
+        yield c
+
+    app.dependency_overrides.clear()
+
+
+def test_list_stock_levels(client, mock_stock_service):
+    warehouse_id = uuid4()
+    mock_stock_service.list_by_warehouse.return_value = [
+        StockLevel(warehouse_id=warehouse_id, sku="SKU-1", on_hand=10, reserved=4),
+    ]
+
+    response = client.get(f"/warehouses/{warehouse_id}/stock")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["sku"] == "SKU-1"
+    assert data[0]["available"] == 6
+
+
+def test_get_stock_level_not_found(client, mock_stock_service):
+    mock_stock_service.get.return_value = None
+
+    response = client.get(f"/warehouses/{uuid4()}/stock/SKU-404")
+
+    assert response.status_code == 404
+
+
+def test_adjust_stock_level_publishes_new_quantity(client, mock_stock_service, mock_event_queue):
+    warehouse_id = uuid4()
+    mock_stock_service.adjust.return_value = StockLevel(warehouse_id=warehouse_id, sku="SKU-1", on_hand=15, reserved=0)
+
+    response = client.patch(f"/warehouses/{warehouse_id}/stock/SKU-1", json={"delta": 5})
+
+    assert response.status_code == 200
+    assert response.json()["on_hand"] == 15
+    mock_stock_service.adjust.assert_awaited_once_with(warehouse_id, "SKU-1", 5)
+    event = mock_event_queue.publish_event.call_args[0][0]
+    assert event.event_type == "inventory.updated"
+    assert event.payload["new_quantity"] == 15
@@ -5,9 +5,13 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from libs.auth.models import UserInDB
-from src.api.deps.getters import get_warehouse_service, get_current_user
+from src.api.deps.getters import get_warehouse_service, get_current_user, get_event_queue, get_utilization_service
 from src.api.dto.warehouse import WarehouseDTO
 from src.api.handlers.warehouse import warehouse_router
+from src.domain.entities import Warehouse
+from src.domain.entities.inventory_record import InventoryStatus
+from src.domain.value_objects import GeoPoint
+from libs.value_objects.location import Location
 
 _ADMIN_USER = UserInDB(username="admin", hashed_password="", role="admin")
 
@@ -21,8 +25,14 @@ def mock_warehouse_service():
 
 
 @pytest.fixture
-def client(mock_warehouse_service):
+def mock_event_queue():
+    return AsyncMock()
+
+
+@pytest.fixture
+def client(mock_warehouse_service, mock_event_queue):
     app.dependency_overrides[get_warehouse_service] = lambda: mock_warehouse_service
+    app.dependency_overrides[get_event_queue] = lambda: mock_event_queue
     app.dependency_overrides[get_current_user] = lambda: MagicMock()
 
     with TestClient(app) as c:
@@ -154,7 +164,7 @@ def test_update_warehouse_not_found(mock_mapper, client, mock_warehouse_service)
 
 
 @patch("src.api.handlers.warehouse.WarehouseMapper")
-def test_delete_warehouse_success(mock_mapper, client, mock_warehouse_service):
+def test_delete_warehouse_success(mock_mapper, client, mock_warehouse_service, mock_event_queue):
     warehouse_id = uuid4()
     app.dependency_overrides[get_current_user] = lambda: _ADMIN_USER
     mock_warehouse_service.get.return_value = create_fake_warehouse_entity(warehouse_id=warehouse_id)
@@ -163,6 +173,7 @@ def test_delete_warehouse_success(mock_mapper, client, mock_warehouse_service):
 
     assert response.status_code == 204
     mock_warehouse_service.delete.assert_awaited_once_with(warehouse_id)
+    mock_event_queue.publish_event.assert_awaited_once()
 
 
 @patch("src.api.handlers.warehouse.WarehouseMapper")
@@ -173,3 +184,42 @@ def test_delete_warehouse_not_found(mock_mapper, client, mock_warehouse_service)
     response = client.delete(f"/warehouses/{uuid4()}")
 
     assert response.status_code == 404
+
+
+def test_find_nearest_warehouses(client, mock_warehouse_service):
+    warehouse = Warehouse(
+        name="Kazan Hub",
+        location=Location(country="Russia", city="Kazan"),
+        coordinates=GeoPoint(latitude=55.79, longitude=49.12),
+    )
+    mock_warehouse_service.find_nearest = MagicMock(return_value=[(warehouse, 718.4567)])
+
+    response = client.get("/warehouses/nearest", params={"latitude": 55.75, "longitude": 37.62, "limit": 1})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["warehouse"]["name"] == "Kazan Hub"
+    assert data[0]["warehouse"]["latitude"] == 55.79
+    assert data[0]["distance_km"] == 718.457
+    mock_warehouse_service.find_nearest.assert_called_once_with(GeoPoint(latitude=55.75, longitude=37.62), limit=1)
+
+
+def test_find_nearest_warehouses_rejects_invalid_latitude(client):
+    response = client.get("/warehouses/nearest", params={"latitude": 120, "longitude": 0})
+
+    assert response.status_code == 422
+
+
+def test_get_warehouse_utilization(client):
+    warehouse_id = uuid4()
+    utilization_service = AsyncMock()
+    utilization_service.get_counts.return_value = {InventoryStatus.STORED: 7, InventoryStatus.SHIPPED: 3}
+    app.dependency_overrides[get_utilization_service] = lambda: utilization_service
+
+    response = client.get(f"/warehouses/{warehouse_id}/utilization")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["counts"] == {"received": 0, "stored": 7, "ready_for_delivery": 0, "shipped": 3}
+    assert data["total"] == 10
+    assert data["active"] == 7
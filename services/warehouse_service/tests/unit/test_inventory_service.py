@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.app.services.inventory_record import InventoryService
+from src.domain.entities import InventoryRecord
+from src.domain.entities.inventory_record import InventoryStatus
+from src.domain.errors.stock import InsufficientStockError
+from src.domain.value_objects import StockLine
+
+
+@pytest.fixture
+def mock_repository():
+    repo = AsyncMock()
+    repo.save.side_effect = lambda record: record
+    return repo
+
+
+@pytest.fixture
+def mock_stock_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(mock_repository, mock_stock_repository):
+    return InventoryService(repository=mock_repository, stock_repository=mock_stock_repository)
+
+
+@pytest.mark.asyncio
+async def test_create_record_reserves_before_saving(service, mock_repository, mock_stock_repository):
+    record = InventoryRecord(shipment_id=uuid4(), warehouse_id=uuid4())
+    items = [StockLine(sku="SKU-1", quantity=2)]
+    mock_stock_repository.list_reserved.return_value = items
+
+    created = await service.create_record(record, items=items)
+
+    mock_stock_repository.reserve.assert_awaited_once_with(record.warehouse_id, record.record_id, items)
+    assert created.items == items
+    assert created.total_quantity == 2
+
+
+@pytest.mark.asyncio
+async def test_create_record_is_not_saved_when_stock_is_insufficient(service, mock_repository, mock_stock_repository):
+    record = InventoryRecord(shipment_id=uuid4(), warehouse_id=uuid4())
+    mock_stock_repository.reserve.side_effect = InsufficientStockError([{"sku": "SKU-1", "requested": 2, "available": 0}])
+
+    with pytest.raises(InsufficientStockError):
+        await service.create_record(record, items=[StockLine(sku="SKU-1", quantity=2)])
+
+    mock_repository.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_shipping_consumes_reserved_stock(service, mock_repository, mock_stock_repository):
+    record = InventoryRecord(shipment_id=uuid4(), warehouse_id=uuid4(), status=InventoryStatus.READY_FOR_DELIVERY)
+    mock_repository.get.return_value = record
+    mock_stock_repository.consume.return_value = [StockLine(sku="SKU-1", quantity=4)]
+
+    saved = await service.update_status(record.record_id, InventoryStatus.SHIPPED)
+
+    mock_stock_repository.consume.assert_awaited_once_with(record.record_id)
+    assert saved.status == InventoryStatus.SHIPPED
+    assert saved.total_quantity == 4